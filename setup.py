@@ -405,6 +405,12 @@ statespace_ext_data = dict(
               "libraries": npymath_info['libraries'],
               "library_dirs": npymath_info['library_dirs'],
               "sources": []},
+    _kalman_filter_square_root = {"name" : "statsmodels/tsa/statespace/_filters/_square_root.c",
+              "filename": "_square_root",
+              "include_dirs": ['statsmodels/src'] + npymath_info['include_dirs'],
+              "libraries": npymath_info['libraries'],
+              "library_dirs": npymath_info['library_dirs'],
+              "sources": []},
     _kalman_smoother = {"name" : "statsmodels/tsa/statespace/_kalman_smoother.c",
               "include_dirs": ['statsmodels/src'] + npymath_info['include_dirs'],
               "libraries": npymath_info['libraries'],
@@ -440,6 +446,12 @@ statespace_ext_data = dict(
               "libraries": npymath_info['libraries'],
               "library_dirs": npymath_info['library_dirs'],
               "sources": []},
+    _kalman_batch = {"name" : "statsmodels/tsa/statespace/_batch.c",
+              "filename": "_batch",
+              "include_dirs": ['statsmodels/src'] + npymath_info['include_dirs'],
+              "libraries": npymath_info['libraries'],
+              "library_dirs": npymath_info['library_dirs'],
+              "sources": []},
     _kalman_tools = {"name" : "statsmodels/tsa/statespace/_tools.c",
               "filename": "_tools",
               "sources": []},
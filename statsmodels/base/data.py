@@ -6,6 +6,7 @@ from statsmodels.compat.python import reduce, iteritems, lmap, zip, range
 from statsmodels.compat.numpy import np_matrix_rank
 import numpy as np
 from pandas import DataFrame, Series, isnull
+from scipy import sparse
 from statsmodels.tools.decorators import (resettable_cache, cache_readonly,
                                           cache_writable)
 import statsmodels.tools.data as data_util
@@ -47,6 +48,64 @@ def _nan_rows(*arrs):
     return reduce(_nan_row_maybe_two_inputs, arrs).squeeze()
 
 
+def _sparse_nan_rows(x):
+    """
+    Returns a boolean array which is True for the rows of the sparse matrix x
+    that have a NaN among the stored values.
+    """
+    x = x.tocoo()
+    nan_rows = np.zeros(x.shape[0], bool)
+    nan_rows[x.row[np.isnan(x.data)]] = True
+    return nan_rows
+
+
+def _sparse_column_ptp(x):
+    """
+    Range of the columns of a sparse matrix, including the implicit zeros.
+    """
+    return (x.max(axis=0).toarray().ravel() -
+            x.min(axis=0).toarray().ravel())
+
+
+def _rank_tol(singular_values, nobs):
+    """
+    Rank tolerance of matrix_rank, ``S.max() * max(nobs, k) * eps``, for the
+    singular values of a nobs x k matrix.
+    """
+    k = len(singular_values)
+    return singular_values.max() * max(nobs, k) * np.finfo(np.float64).eps
+
+
+def _r_factor(x, y=None, chunksize=10000):
+    """
+    R factor of the QR decomposition of x computed over blocks of rows.
+
+    x can be a scipy.sparse matrix.  Only blocks of ``chunksize`` rows are
+    converted to dense arrays, the full Q is never formed.  If y is given,
+    then the R factor of ``[x, y]`` is returned, the first k rows of its last
+    column are ``Q' y``.
+    """
+    nobs = x.shape[0]
+    r = np.zeros((0, x.shape[1] + (y is not None)))
+    for start in range(0, nobs, chunksize):
+        block = x[start:start + chunksize]
+        if sparse.issparse(block):
+            block = block.toarray()
+        if y is not None:
+            block = np.column_stack((block, y[start:start + chunksize]))
+        r = np.linalg.qr(np.vstack((r, block)), mode='r')
+    return r
+
+
+def _sparse_rank(x):
+    """
+    Rank of the sparse matrix x from the singular values of its R factor.
+    """
+    singular_values = np.linalg.svd(_r_factor(x), compute_uv=False)
+    return int((singular_values >
+                _rank_tol(singular_values, x.shape[0])).sum())
+
+
 class ModelData(object):
     """
     Class responsible for handling input data and extracting metadata into the
@@ -128,7 +187,11 @@ class ModelData(object):
         else:
             # detect where the constant is
             check_implicit = False
-            const_idx = np.where(self.exog.ptp(axis=0) == 0)[0].squeeze()
+            if sparse.issparse(self.exog):
+                exog_ptp = _sparse_column_ptp(self.exog)
+            else:
+                exog_ptp = self.exog.ptp(axis=0)
+            const_idx = np.where(exog_ptp == 0)[0].squeeze()
             self.k_constant = const_idx.size
 
             if self.k_constant == 1:
@@ -167,10 +230,16 @@ class ModelData(object):
             if check_implicit:
                 # look for implicit constant
                 # Compute rank of augmented matrix
-                augmented_exog = np.column_stack(
-                            (np.ones(self.exog.shape[0]), self.exog))
-                rank_augm = np_matrix_rank(augmented_exog)
-                rank_orig = np_matrix_rank(self.exog)
+                if sparse.issparse(self.exog):
+                    augmented_exog = sparse.hstack(
+                        (np.ones((self.exog.shape[0], 1)), self.exog))
+                    rank_augm = _sparse_rank(augmented_exog.tocsr())
+                    rank_orig = _sparse_rank(self.exog)
+                else:
+                    augmented_exog = np.column_stack(
+                                (np.ones(self.exog.shape[0]), self.exog))
+                    rank_augm = np_matrix_rank(augmented_exog)
+                    rank_orig = np_matrix_rank(self.exog)
                 self.k_constant = int(rank_orig == rank_augm)
                 self.const_idx = None
 
@@ -189,6 +258,19 @@ class ModelData(object):
         This returns a dictionary with keys endog, exog and the keys of
         kwargs. It preserves Nones.
         """
+        if sparse.issparse(exog):
+            # check the stored values of a sparse exog and let a dense
+            # column with NaNs in the same rows stand in for it
+            exog = exog.tocsr()
+            exog_nan = np.zeros(exog.shape[0])
+            exog_nan[_sparse_nan_rows(exog)] = np.nan
+            combined, nan_idx = cls.handle_missing(endog, exog_nan, missing,
+                                                   **kwargs)
+            keep = np.ones(exog.shape[0], bool)
+            keep[nan_idx] = False
+            combined['exog'] = exog[keep] if len(nan_idx) else exog
+            return combined, nan_idx
+
         none_array_names = []
 
         # patsy's already dropped NaNs in y/X
@@ -393,13 +475,15 @@ class ModelData(object):
         return endog.squeeze()
 
     def _get_xarr(self, exog):
+        if sparse.issparse(exog):
+            return sparse.csr_matrix(exog, dtype=np.float64)
         if data_util._is_structured_ndarray(exog):
             exog = data_util.struct_to_ndarray(exog)
         return np.asarray(exog)
 
     def _check_integrity(self):
         if self.exog is not None:
-            if len(self.exog) != len(self.endog):
+            if self.exog.shape[0] != len(self.endog):
                 raise ValueError("endog and exog matrices are different sizes")
 
     def wrap_output(self, obj, how='columns', names=None):
@@ -466,7 +550,8 @@ class PandasData(ModelData):
     def _convert_endog_exog(self, endog, exog=None):
         #TODO: remove this when we handle dtype systematically
         endog = np.asarray(endog)
-        exog = exog if exog is None else np.asarray(exog)
+        if exog is not None and not sparse.issparse(exog):
+            exog = np.asarray(exog)
         if endog.dtype == object or exog is not None and exog.dtype == object:
             raise ValueError("Pandas data cast to numpy dtype of object. "
                              "Check input data with np.asarray(data).")
@@ -577,7 +662,10 @@ def _make_endog_names(endog):
 
 
 def _make_exog_names(exog):
-    exog_var = exog.var(0)
+    if sparse.issparse(exog):
+        exog_var = _sparse_column_ptp(exog)
+    else:
+        exog_var = exog.var(0)
     if (exog_var == 0).any():
         # assumes one constant in first or last position
         # avoid exception if more than one constant
@@ -609,6 +697,8 @@ def handle_data_class_factory(endog, exog):
         klass = PandasData
     elif data_util._is_using_patsy(endog, exog):
         klass = PatsyData
+    elif data_util._is_using_sparse(endog, exog):
+        klass = ModelData
     # keep this check last
     elif data_util._is_using_ndarray(endog, exog):
         klass = ModelData
@@ -2,6 +2,7 @@ from __future__ import print_function
 from statsmodels.compat.python import iterkeys, lzip, range, reduce
 import numpy as np
 from scipy import stats
+from scipy import sparse
 from statsmodels.base.data import handle_data
 from statsmodels.tools.data import _is_using_pandas
 from statsmodels.tools.tools import recipr, nan_dot
@@ -779,7 +780,7 @@ class Results(object):
                     import warnings
                     warnings.warn("nan rows have been dropped", ValueWarning)
 
-        if exog is not None:
+        if exog is not None and not sparse.issparse(exog):
             exog = np.asarray(exog)
             if exog.ndim == 1 and (self.model.exog.ndim == 1 or
                                    self.model.exog.shape[1] == 1):
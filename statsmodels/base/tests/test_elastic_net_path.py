@@ -0,0 +1,141 @@
+"""
+Tests for elastic net fits along a sequence of penalty weights
+"""
+from __future__ import division
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_
+
+from statsmodels.discrete.discrete_model import Logit, Poisson
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.regression.linear_model import OLS
+from statsmodels.tools.tools import add_constant
+
+
+def _gen_exog(nobs=300, k=8, seed=987125):
+    np.random.seed(seed)
+    exog = np.random.randn(nobs, k)
+    exog[:, 1] += 0.5 * exog[:, 0]
+    return exog
+
+
+def _check_kkt(path_rslt, atol=1e-5, **kwds):
+    # the optimality conditions of the penalized objective function
+    model = path_rslt.model
+    nobs = model.exog.shape[0]
+    L1_wt = path_rslt.L1_wt
+    for alpha, params in zip(path_rslt.alphas, path_rslt.params):
+        pen_wt = alpha * path_rslt.alpha_wt
+        grad = -model.score(params, **kwds) / nobs
+        nz = params != 0
+        grad_pen = grad + pen_wt * (1 - L1_wt) * params
+        assert_allclose(grad_pen[nz], -L1_wt * pen_wt[nz] * np.sign(params[nz]),
+                        atol=atol)
+        assert_(np.all(np.abs(grad[~nz]) <= L1_wt * pen_wt[~nz] + atol))
+
+
+def _ols_objective(model, params, alpha, L1_wt):
+    # the function minimized by OLS.fit_regularized
+    nobs = model.exog.shape[0]
+    resid = model.endog - np.dot(model.exog, params)
+    penalty = ((1 - L1_wt) * np.sum(params**2) / 2 +
+               L1_wt * np.sum(np.abs(params)))
+    return 0.5 * np.sum(resid**2) / nobs + alpha * penalty
+
+
+class TestOLSPath(object):
+
+    @classmethod
+    def setupClass(cls):
+        exog = _gen_exog()
+        endog = exog[:, :3].sum(1) + np.random.randn(exog.shape[0])
+        cls.model = OLS(endog, exog)
+        # the smallest lasso penalty weight with all coefficients zero
+        alpha_max = np.max(np.abs(np.dot(exog.T, endog))) / exog.shape[0]
+        cls.alphas = np.r_[0.02, 1.5 * alpha_max, 0.3, 0.1, 0.005, 0.]
+
+    def test_fit_regularized(self):
+        for L1_wt in 1., 0.5:
+            rslt = self.model.fit_regularized_path(self.alphas, L1_wt=L1_wt)
+            assert_(np.all(rslt.converged))
+            for alpha, params in zip(self.alphas, rslt.params):
+                params2 = self.model.fit_regularized(alpha=alpha,
+                                                     L1_wt=L1_wt).params
+                # the path can converge to a lower objective function
+                # value than fit_regularized, the minimizers can differ
+                # more than the objective function values
+                obj = _ols_objective(self.model, params, alpha, L1_wt)
+                obj2 = _ols_objective(self.model, params2, alpha, L1_wt)
+                assert_(obj <= obj2 + 1e-10)
+                assert_allclose(obj, obj2, rtol=1e-5)
+            _check_kkt(rslt, scale=1)
+
+    def test_path(self):
+        rslt = self.model.fit_regularized_path(self.alphas)
+        # a large penalty removes all coefficients, no penalty gives OLS
+        assert_equal(rslt.df[1], 0)
+        assert_allclose(rslt.params[-1], self.model.fit().params, rtol=1e-8)
+        assert_allclose(rslt.get_fit(2).params, rslt.params[2])
+
+        rslt2 = self.model.fit_regularized_path(self.alphas, screen=False)
+        assert_allclose(rslt.params, rslt2.params, rtol=1e-8, atol=1e-10)
+
+    def test_alpha_wt(self):
+        alpha_wt = np.ones(self.model.exog.shape[1])
+        alpha_wt[0] = 0
+        rslt = self.model.fit_regularized_path(self.alphas,
+                                               alpha_wt=alpha_wt)
+        assert_(np.all(rslt.params[:, 0] != 0))
+        _check_kkt(rslt, scale=1)
+
+
+class CheckGLMPath(object):
+
+    def test_kkt(self):
+        for L1_wt in 1., 0.5:
+            rslt = self.model.fit_regularized_path(
+                self.alphas, L1_wt=L1_wt, alpha_wt=self.alpha_wt)
+            assert_(np.all(rslt.converged))
+            _check_kkt(rslt)
+
+    def test_screen(self):
+        rslt1 = self.model.fit_regularized_path(self.alphas,
+                                                alpha_wt=self.alpha_wt)
+        rslt2 = self.model.fit_regularized_path(self.alphas,
+                                                alpha_wt=self.alpha_wt,
+                                                screen=False)
+        assert_allclose(rslt1.params, rslt2.params, rtol=1e-6, atol=1e-8)
+
+    def test_glm(self):
+        rslt1 = self.model.fit_regularized_path(self.alphas,
+                                                alpha_wt=self.alpha_wt)
+        rslt2 = self.model_glm.fit_regularized_path(self.alphas,
+                                                    alpha_wt=self.alpha_wt)
+        assert_allclose(rslt1.params, rslt2.params, rtol=1e-6, atol=1e-8)
+
+
+class TestLogitPath(CheckGLMPath):
+
+    @classmethod
+    def setupClass(cls):
+        exog = add_constant(_gen_exog())
+        lin_pred = 0.5 * exog[:, :4].sum(1)
+        endog = (np.random.rand(exog.shape[0]) <
+                 1 / (1 + np.exp(-lin_pred))) * 1.
+        cls.model = Logit(endog, exog)
+        cls.model_glm = GLM(endog, exog, family=families.Binomial())
+        cls.alphas = np.linspace(0.2, 0.001, 10)
+        cls.alpha_wt = np.r_[0, np.ones(exog.shape[1] - 1)]
+
+
+class TestPoissonPath(CheckGLMPath):
+
+    @classmethod
+    def setupClass(cls):
+        exog = add_constant(_gen_exog())
+        endog = np.random.poisson(np.exp(0.2 * exog[:, :4].sum(1)))
+        cls.model = Poisson(endog, exog)
+        cls.model_glm = GLM(endog, exog, family=families.Poisson())
+        cls.alphas = np.linspace(0.5, 0.001, 10)
+        cls.alpha_wt = np.r_[0, np.ones(exog.shape[1] - 1)]
@@ -0,0 +1,431 @@
+"""
+Conditional logistic and Poisson regression for panel data with
+group fixed effects.
+
+The group effects are eliminated by conditioning on the sufficient
+statistics for them, the number of events (logit) or the total count
+(Poisson) in each group.  No parameters are estimated for the groups,
+so that there is no incidental parameters problem and the size of the
+optimization problem does not grow with the number of groups.
+
+All computations are vectorized across groups.  Groups with the same
+number of observations are stacked into 2d arrays, so that the number
+of Python level operations grows with the number of distinct group
+sizes and not with the number of groups.
+
+References
+----------
+Chamberlain, G. (1980).  Analysis of covariance with qualitative data.
+The Review of Economic Studies 47(1), 225-238.
+
+Hausman, J., Hall, B. and Griliches, Z. (1984).  Econometric models for
+count data with an application to the patents-R&D relationship.
+Econometrica 52(4), 909-938.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import gammaln
+
+import statsmodels.base.model as base
+import statsmodels.base.wrapper as wrap
+from statsmodels.compat.numpy import np_matrix_rank
+from statsmodels.tools.decorators import cache_readonly
+
+
+_conditional_doc = """
+    %(description)s
+
+    %(params)s
+    groups : array-like
+        1d array of group labels, the group effects are eliminated from
+        the model.
+    %(extra_params)s
+
+    Attributes
+    ----------
+    n_groups : int
+        The number of groups that contribute to the conditional
+        likelihood.
+    n_groups_dropped : int
+        The number of groups that are dropped because they do not
+        contribute to the conditional likelihood.
+
+    Notes
+    -----
+    `exog` must not include a constant, it is eliminated together with
+    the group effects.  Variables that are constant within groups are
+    not identified.
+
+    %(notes)s
+"""
+
+
+class _ConditionalModel(base.LikelihoodModel):
+
+    def __init__(self, endog, exog, groups, missing='none', **kwargs):
+        super(_ConditionalModel, self).__init__(endog, exog, groups=groups,
+                                                missing=missing, **kwargs)
+        if self.k_constant > 0:
+            raise ValueError("exog must not include a constant, it is "
+                             "eliminated together with the group effects")
+        self._setup_groups()
+        self.df_model = float(np_matrix_rank(self.exog))
+        self.df_resid = self.nobs - self.df_model
+
+    def _setup_groups(self):
+        codes = pd.factorize(np.asarray(self.groups))[0]
+        sizes = np.bincount(codes)
+        totals = np.bincount(codes, weights=self.endog)
+        keep = self._informative(totals, sizes)
+        self.n_groups_dropped = int((~keep).sum())
+
+        # the informative observations, sorted by group
+        ii = np.flatnonzero(keep[codes])
+        ii = ii[np.argsort(codes[ii], kind="mergesort")]
+        self._endog = self.endog[ii]
+        self._exog = self.exog[ii]
+        group_ix = pd.factorize(codes[ii])[0]
+        self._group_ix = group_ix
+        self._sizes = np.bincount(group_ix)
+        self._totals = np.bincount(group_ix, weights=self._endog)
+        self._starts = np.r_[0, np.cumsum(self._sizes)[:-1]]
+        self.n_groups = len(self._sizes)
+        self.nobs = float(len(ii))
+
+        # groups of equal size are stacked, rows[i, j] is the position
+        # of observation j of the i'th group of the given size
+        self._buckets = []
+        for size in np.unique(self._sizes):
+            gix = np.flatnonzero(self._sizes == size)
+            rows = self._starts[gix][:, None] + np.arange(size)
+            self._buckets.append((gix, rows))
+
+    def _informative(self, totals, sizes):
+        raise NotImplementedError
+
+    def _group_sums(self, x):
+        """
+        Sums of the rows of x within each group.
+        """
+        return np.add.reduceat(x, self._starts, axis=0)
+
+    def _group_logsumexp(self, lin_pred):
+        """
+        log(sum(exp(lin_pred))) within each group.
+        """
+        gmax = np.maximum.reduceat(lin_pred, self._starts)
+        expval = np.exp(lin_pred - gmax[self._group_ix])
+        return np.log(np.bincount(self._group_ix, weights=expval)) + gmax
+
+    def fit(self, start_params=None, method='newton', maxiter=100,
+            full_output=True, disp=False, **kwargs):
+        """
+        Fit the model by maximizing the conditional likelihood.
+
+        Parameters
+        ----------
+        start_params : array-like, optional
+            The default is zero for all parameters.
+        method : string
+            The optimization method, see `LikelihoodModel.fit`.
+        maxiter : int
+            The maximum number of iterations.
+        full_output : bool
+            Set to True to have all available output in the results
+            `mle_retvals`.
+        disp : bool
+            Set to True to print convergence messages.
+        kwargs : keywords
+            Passed to `LikelihoodModel.fit`.
+
+        Returns
+        -------
+        A ConditionalResults instance.
+        """
+        if start_params is None:
+            start_params = np.zeros(self.exog.shape[1])
+
+        rslt = super(_ConditionalModel, self).fit(start_params=start_params,
+                                                  method=method,
+                                                  maxiter=maxiter,
+                                                  full_output=full_output,
+                                                  disp=disp, **kwargs)
+        results = ConditionalResults(self, rslt.params,
+                                     rslt.normalized_cov_params)
+        results.mle_retvals = rslt.mle_retvals
+        results.mle_settings = rslt.mle_settings
+        return ConditionalResultsWrapper(results)
+
+
+class ConditionalLogit(_ConditionalModel):
+    __doc__ = _conditional_doc % {
+        'description': 'Conditional (fixed effects) logistic regression',
+        'params': base._model_params_doc,
+        'extra_params': base._missing_param_doc + base._extra_param_doc,
+        'notes': """The likelihood of a group is conditional on the number of
+    events in the group.  Its denominator sums over all subsets of the
+    observations of the group with that number of events, it is
+    computed in log space with the recursion for elementary symmetric
+    polynomials, whose cost grows with the product of the group size and
+    the number of events.  Groups where all or no observations have an event are
+    dropped."""}
+
+    def __init__(self, endog, exog, groups, missing='none', **kwargs):
+        super(ConditionalLogit, self).__init__(endog, exog, groups=groups,
+                                               missing=missing, **kwargs)
+        if np.any((self.endog != 0) & (self.endog != 1)):
+            raise ValueError("endog must be binary, 0 or 1")
+
+    def _informative(self, totals, sizes):
+        return (totals > 0) & (totals < sizes)
+
+    # bound on the number of elements of the arrays of the recursion for
+    # one chunk of groups
+    _chunk_elements = 2 ** 20
+
+    def _denominator(self, params, deriv=0):
+        """
+        Sum over the groups of the log denominator of the conditional
+        likelihood and optionally of its first (deriv=1) and second
+        (deriv=2) derivatives.
+
+        The result of the last call is cached, so that the log-likelihood,
+        score and Hessian at the same parameters share the recursion.
+        """
+        params = np.asarray(params, dtype=np.float64)
+        cache = getattr(self, '_denominator_cache', None)
+        if (cache is not None and cache[1] >= deriv and
+                np.array_equal(cache[0], params)):
+            return cache[2]
+
+        exog = self._exog
+        k_vars = exog.shape[1]
+        lin_pred = np.dot(exog, params)
+        events = self._totals.astype(np.int64)
+
+        logden = 0.
+        dlogden = np.zeros(k_vars)
+        d2logden = np.zeros((k_vars, k_vars))
+        for gix, rows in self._buckets:
+            kmax = events[gix].max()
+            chunksize = max(1, self._chunk_elements //
+                            ((kmax + 1) * k_vars ** deriv))
+            for start in range(0, len(gix), chunksize):
+                den = self._denominator_chunk(
+                    lin_pred, events[gix[start:start + chunksize]],
+                    rows[start:start + chunksize], deriv)
+                logden += den[0]
+                if deriv > 0:
+                    dlogden += den[1]
+                if deriv > 1:
+                    d2logden += den[2]
+
+        result = logden, dlogden, d2logden
+        self._denominator_cache = (params.copy(), deriv, result)
+        return result
+
+    def _denominator_chunk(self, lin_pred, k, rows, deriv):
+        """
+        Sums of the log denominator and its derivatives for groups of equal
+        size, rows[i] are the observations and k[i] the number of events of
+        group i.
+        """
+        exog = self._exog
+        k_vars = exog.shape[1]
+        n_chunk, size = rows.shape
+        kmax = k.max()
+        lp = lin_pred[rows]
+        # lden[:, s] is the log of the sum over the subsets of size s
+        # of the observations processed so far.  The sums grow
+        # combinatorially with the group size and are kept in log
+        # space.  The derivatives are kept relative to the sums,
+        # dden[:, s] and d2den[:, s] are the first and second moments
+        # of the subset totals of exog under the subset weights.
+        lden = np.full((n_chunk, kmax + 1), -np.inf)
+        lden[:, 0] = 0
+        if deriv > 0:
+            dden = np.zeros((n_chunk, kmax + 1, k_vars))
+        if deriv > 1:
+            d2den = np.zeros((n_chunk, kmax + 1, k_vars, k_vars))
+        for t in range(size):
+            # only the sizes that can be reached after this step
+            m = min(t + 1, kmax)
+            lnew = lp[:, t, None] + lden[:, :m]
+            lupd = np.logaddexp(lden[:, 1:m + 1], lnew)
+            if deriv > 0:
+                # weight of the subsets that include observation t
+                wt = np.exp(lnew - lupd)[:, :, None]
+                xt = exog[rows[:, t]][:, None, :]
+                dprev = dden[:, :m] + xt
+            if deriv > 1:
+                dx = dden[:, :m, :, None] * xt[:, :, None, :]
+                d2prev = (d2den[:, :m] + dx + dx.swapaxes(2, 3) +
+                          xt[:, :, :, None] * xt[:, :, None, :])
+                d2den[:, 1:m + 1] += wt[:, :, :, None] * (
+                    d2prev - d2den[:, 1:m + 1])
+            if deriv > 0:
+                dden[:, 1:m + 1] += wt * (dprev - dden[:, 1:m + 1])
+            lden[:, 1:m + 1] = lupd
+
+        ix = np.arange(n_chunk)
+        logden = lden[ix, k].sum()
+        dlogden = d2logden = None
+        if deriv > 0:
+            dlog = dden[ix, k]
+            dlogden = dlog.sum(0)
+        if deriv > 1:
+            d2logden = d2den[ix, k].sum(0) - np.dot(dlog.T, dlog)
+        return logden, dlogden, d2logden
+
+    def loglike(self, params):
+        """
+        Conditional log-likelihood of the logit model.
+        """
+        logden = self._denominator(params)[0]
+        return np.dot(self._endog, np.dot(self._exog, params)) - logden
+
+    def score(self, params):
+        """
+        Score vector of the conditional log-likelihood.
+        """
+        dlogden = self._denominator(params, deriv=1)[1]
+        return np.dot(self._endog, self._exog) - dlogden
+
+    def hessian(self, params):
+        """
+        Hessian of the conditional log-likelihood.
+        """
+        d2logden = self._denominator(params, deriv=2)[2]
+        return -d2logden
+
+
+class ConditionalPoisson(_ConditionalModel):
+    __doc__ = _conditional_doc % {
+        'description': 'Conditional (fixed effects) Poisson regression',
+        'params': base._model_params_doc,
+        'extra_params': base._missing_param_doc + base._extra_param_doc,
+        'notes': """The likelihood of a group is conditional on the total count
+    of the group, it is a multinomial likelihood.  The estimates are the
+    same as those of a Poisson regression with a dummy variable for each
+    group.  Groups with a total count of zero are dropped."""}
+
+    def _informative(self, totals, sizes):
+        return totals > 0
+
+    def _probs(self, params):
+        lin_pred = np.dot(self._exog, params)
+        lse = self._group_logsumexp(lin_pred)
+        return lin_pred, lse, np.exp(lin_pred - lse[self._group_ix])
+
+    def loglike(self, params):
+        """
+        Conditional log-likelihood of the Poisson model.
+        """
+        lin_pred, lse, _ = self._probs(params)
+        endog = self._endog
+        llf = np.dot(endog, lin_pred) - np.dot(self._totals, lse)
+        llf += gammaln(self._totals + 1).sum() - gammaln(endog + 1).sum()
+        return llf
+
+    def score(self, params):
+        """
+        Score vector of the conditional log-likelihood.
+        """
+        prob = self._probs(params)[2]
+        resid = self._endog - self._totals[self._group_ix] * prob
+        return np.dot(resid, self._exog)
+
+    def hessian(self, params):
+        """
+        Hessian of the conditional log-likelihood.
+        """
+        prob = self._probs(params)[2]
+        exog = self._exog
+        wts = self._totals[self._group_ix] * prob
+        pmean = self._group_sums(prob[:, None] * exog)
+        return -(np.dot(exog.T * wts, exog) -
+                 np.dot(pmean.T * self._totals, pmean))
+
+
+class ConditionalResults(base.LikelihoodModelResults):
+    """
+    Results of a conditional logit or Poisson regression.
+
+    Attributes
+    ----------
+    n_groups : int
+        The number of groups that contribute to the likelihood.
+    """
+
+    def __init__(self, model, params, normalized_cov_params):
+        super(ConditionalResults, self).__init__(
+            model, params, normalized_cov_params=normalized_cov_params,
+            scale=1.)
+        self.nobs = model.nobs
+        self.n_groups = model.n_groups
+        self.df_model = model.df_model
+        self.df_resid = model.df_resid
+
+    @cache_readonly
+    def llf(self):
+        return self.model.loglike(self.params)
+
+    def summary(self, yname=None, xname=None, title=None, alpha=.05):
+        """Summarize the Regression Results
+
+        Parameters
+        -----------
+        yname : string, optional
+            Default is `y`
+        xname : list of strings, optional
+            Default is `var_##` for ## in p the number of regressors
+        title : string, optional
+            Title for the top table. If not None, then this replaces the
+            default title
+        alpha : float
+            significance level for the confidence intervals
+
+        Returns
+        -------
+        smry : Summary instance
+            this holds the summary tables and text, which can be printed or
+            converted to various output formats.
+
+        See Also
+        --------
+        statsmodels.iolib.summary.Summary : class to hold summary
+            results
+        """
+        sizes = self.model._sizes
+        top_left = [('Dep. Variable:', None),
+                    ('Model:', [self.model.__class__.__name__]),
+                    ('Method:', ['MLE']),
+                    ('Date:', None),
+                    ('Time:', None),
+                    ('converged:', ["%s" % self.mle_retvals['converged']])
+                    ]
+
+        top_right = [('No. Observations:', None),
+                     ('No. groups:', ["%d" % self.n_groups]),
+                     ('Min group size:', ["%d" % sizes.min()]),
+                     ('Max group size:', ["%d" % sizes.max()]),
+                     ('Mean group size:', ["%.1f" % sizes.mean()]),
+                     ('Log-Likelihood:', None),
+                     ]
+
+        if title is None:
+            title = self.model.__class__.__name__ + ' ' + "Regression Results"
+
+        from statsmodels.iolib.summary import Summary
+        smry = Summary()
+        smry.add_table_2cols(self, gleft=top_left, gright=top_right,
+                             yname=yname, xname=xname, title=title)
+        smry.add_table_params(self, yname=yname, xname=xname, alpha=alpha,
+                              use_t=False)
+        return smry
+
+
+class ConditionalResultsWrapper(base.LikelihoodResultsWrapper):
+    pass
+wrap.populate_wrapper(ConditionalResultsWrapper, ConditionalResults)
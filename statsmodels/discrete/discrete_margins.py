@@ -149,12 +149,14 @@ def _get_count_effects(effects, exog, count_ind, method, model, params):
     subtracting one and adding one to exog then averaging the difference
     """
     # this is the index for the effect and the index for count col in exog
+    # exog is copied only once, the count column is restored after use
+    exog0 = exog.copy()
     for i in count_ind:
-        exog0 = exog.copy()
         exog0[:, i] -= 1
         effect0 = model.predict(params, exog0)
         exog0[:, i] += 2
         effect1 = model.predict(params, exog0)
+        exog0[:, i] = exog[:, i]
         #NOTE: done by analogy with dummy effects but untested bc
         # stata doesn't handle both count and eydx anywhere
         if 'ey' in method:
@@ -169,19 +171,78 @@ def _get_dummy_effects(effects, exog, dummy_ind, method, model, params):
     0 and 1
     """
     # this is the index for the effect and the index for dummy col in exog
+    # exog is copied only once, the dummy column is restored after use
+    exog0 = exog.copy()
     for i in dummy_ind:
-        exog0 = exog.copy() # only copy once, can we avoid a copy?
         exog0[:,i] = 0
         effect0 = model.predict(params, exog0)
-        #fittedvalues0 = np.dot(exog0,params)
         exog0[:,i] = 1
         effect1 = model.predict(params, exog0)
+        exog0[:, i] = exog[:, i]
         if 'ey' in method:
             effect0 = np.log(effect0)
             effect1 = np.log(effect1)
         effects[:, i] = (effect1 - effect0)
     return effects
 
+def _row_chunks(nobs, chunksize=None):
+    """
+    Slices of at most `chunksize` consecutive rows that cover `nobs` rows.
+    """
+    if chunksize is None:
+        chunksize = nobs
+    chunksize = max(int(chunksize), 1)
+    return [slice(start, start + chunksize)
+            for start in range(0, nobs, chunksize)]
+
+def _default_chunksize(exog, J=1):
+    """
+    The number of rows for which the marginal effects and their
+    derivatives are evaluated at once, about 2**20 elements per array.
+    """
+    return max(2**20 // (exog.shape[1] * max(J, 1)**2), 1)
+
+def _effects_overall(model, params, exog, method, dummy_idx, count_idx,
+                     chunksize=None, cov=False):
+    """
+    Average marginal effects evaluated in chunks of rows.
+
+    If cov is True, then the covariance of the marginal effects of the
+    observations is also returned, otherwise None.
+    """
+    nobs = len(exog)
+    effects_sum = 0
+    outer_sum = 0
+    for rows in _row_chunks(nobs, chunksize):
+        effects = model._derivative_exog(params, exog[rows], method,
+                                         dummy_idx, count_idx)
+        effects_sum = effects_sum + effects.sum(0)
+        if cov:
+            outer_sum = outer_sum + np.dot(effects.T, effects)
+    effects_mean = effects_sum / nobs
+    if not cov:
+        return effects_mean, None
+    effects_cov = ((outer_sum - nobs * np.outer(effects_mean, effects_mean)) /
+                   (nobs - 1))
+    return effects_mean, effects_cov
+
+def _index_margeff_jacobian(params, exog, g, dg, transform):
+    """
+    Jacobian of the marginal effects of a single index model with
+    respect to params, summed over the rows of exog.
+
+    The marginal effects are g(exog * params) * params, multiplied by
+    exog if 'ex' is in transform.  `g` and its derivative `dg` are
+    evaluated at the linear predictor of each row.
+    """
+    if 'ex' in transform:
+        jac = params[:, None] * np.dot(exog.T * dg, exog)
+        jac[np.diag_indices_from(jac)] += np.dot(g, exog)
+    else:
+        jac = np.outer(params, np.dot(dg, exog))
+        jac[np.diag_indices_from(jac)] += g.sum()
+    return jac
+
 def _effects_at(effects, at):
     if at == 'all':
         effects = effects
@@ -192,7 +253,7 @@ def _effects_at(effects, at):
     return effects
 
 def _margeff_cov_params_dummy(model, cov_margins, params, exog, dummy_ind,
-        method, J):
+        method, J, chunksize=None):
     """
     Returns the Jacobian for discrete regressors for use in margeff_cov_params.
 
@@ -204,27 +265,31 @@ def _margeff_cov_params_dummy(model, cov_margins, params, exog, dummy_ind,
 
     f(XB)*X | d = 1 - f(XB)*X | d = 0
 
-    Where F is the default prediction of the model.
+    Where F is the default prediction of the model.  The rows of exog are
+    processed in chunks of at most `chunksize` rows.
     """
+    dfdb = dict((i, 0) for i in dummy_ind)
+    for rows in _row_chunks(len(exog), chunksize):
+        exog_rows = exog[rows]
+        exog0 = exog_rows.copy()
+        for i in dummy_ind:
+            exog0[:,i] = 0
+            dfdb0 = model._derivative_predict(params, exog0, method)
+            exog0[:,i] = 1
+            dfdb1 = model._derivative_predict(params, exog0, method)
+            exog0[:,i] = exog_rows[:,i]
+            dfdb[i] = dfdb[i] + (dfdb1 - dfdb0).sum(0)
     for i in dummy_ind:
-        exog0 = exog.copy()
-        exog1 = exog.copy()
-        exog0[:,i] = 0
-        exog1[:,i] = 1
-        dfdb0 = model._derivative_predict(params, exog0, method)
-        dfdb1 = model._derivative_predict(params, exog1, method)
-        dfdb = (dfdb1 - dfdb0)
-        if dfdb.ndim >= 2: # for overall
-            dfdb = dfdb.mean(0)
+        dfdb_i = dfdb[i] / len(exog) # for overall
         if J > 1:
-            K = dfdb.shape[1] // (J-1)
-            cov_margins[i::K, :] = dfdb
+            K = dfdb_i.shape[1] // (J-1)
+            cov_margins[i::K, :] = dfdb_i
         else:
-            cov_margins[i, :] = dfdb # how each F changes with change in B
+            cov_margins[i, :] = dfdb_i # how each F changes with change in B
     return cov_margins
 
 def _margeff_cov_params_count(model, cov_margins, params, exog, count_ind,
-                             method, J):
+                             method, J, chunksize=None):
     """
     Returns the Jacobian for discrete regressors for use in margeff_cov_params.
 
@@ -236,26 +301,49 @@ def _margeff_cov_params_count(model, cov_margins, params, exog, count_ind,
 
     (f(XB)*X | d += 1 - f(XB)*X | d -= 1) / 2
 
-    where F is the default prediction for the model.
+    where F is the default prediction for the model.  The rows of exog are
+    processed in chunks of at most `chunksize` rows.
     """
+    dfdb = dict((i, 0) for i in count_ind)
+    for rows in _row_chunks(len(exog), chunksize):
+        exog_rows = exog[rows]
+        exog0 = exog_rows.copy()
+        for i in count_ind:
+            exog0[:,i] -= 1
+            dfdb0 = model._derivative_predict(params, exog0, method)
+            exog0[:,i] += 2
+            dfdb1 = model._derivative_predict(params, exog0, method)
+            exog0[:,i] = exog_rows[:,i]
+            dfdb[i] = dfdb[i] + (dfdb1 - dfdb0).sum(0)
     for i in count_ind:
-        exog0 = exog.copy()
-        exog0[:,i] -= 1
-        dfdb0 = model._derivative_predict(params, exog0, method)
-        exog0[:,i] += 2
-        dfdb1 = model._derivative_predict(params, exog0, method)
-        dfdb = (dfdb1 - dfdb0)
-        if dfdb.ndim >= 2: # for overall
-            dfdb = dfdb.mean(0) / 2
+        dfdb_i = dfdb[i] / len(exog) / 2 # for overall
         if J > 1:
-            K = dfdb.shape[1] / (J-1)
-            cov_margins[i::K, :] = dfdb
+            K = dfdb_i.shape[1] // (J-1)
+            cov_margins[i::K, :] = dfdb_i
         else:
-            cov_margins[i, :] = dfdb # how each F changes with change in B
+            cov_margins[i, :] = dfdb_i # how each F changes with change in B
     return cov_margins
 
+def _numeric_margeff_jacobian(derivative, params, exog, method):
+    """
+    Numerical Jacobian of the marginal effects with respect to params,
+    summed over the rows of exog.
+    """
+    from statsmodels.tools.numdiff import approx_fprime_cs
+    try:
+        jacobian_mat = approx_fprime_cs(params, derivative,
+                                        args=(exog,method))
+    except TypeError:  # norm.cdf doesn't take complex values
+        from statsmodels.tools.numdiff import approx_fprime
+        jacobian_mat = approx_fprime(params, derivative,
+                                        args=(exog,method))
+    if jacobian_mat.ndim == 3:
+        jacobian_mat = jacobian_mat.sum(1)
+    # else exog was 2d row vector and has been squeezed out
+    return jacobian_mat
+
 def margeff_cov_params(model, params, exog, cov_params, at, derivative,
-                       dummy_ind, count_ind, method, J):
+                       dummy_ind, count_ind, method, J, chunksize=None):
     """
     Computes the variance-covariance of marginal effects by the delta method.
 
@@ -293,6 +381,10 @@ def margeff_cov_params(model, params, exog, cov_params, at, derivative,
         Indices of the columns of exog that contain dummy variables
     count_ind : array-like
         Indices of the columns of exog that contain count variables
+    chunksize : int or None
+        The Jacobian is averaged over chunks of at most chunksize rows of
+        exog, so that the memory does not grow with the number of rows.
+        If None, all rows are used at once.
 
     Notes
     -----
@@ -302,29 +394,34 @@ def margeff_cov_params(model, params, exog, cov_params, at, derivative,
 
     where V is the parameter variance-covariance.
 
-    The outer Jacobians are computed via numerical differentiation if
-    derivative is a function.
+    If derivative is the `_derivative_exog` method of a model that also
+    has a `_derivative_exog_params` method, then the outer Jacobian is
+    computed analytically.  Otherwise, the outer Jacobians are computed
+    via numerical differentiation if derivative is a function.
     """
     if callable(derivative):
-        from statsmodels.tools.numdiff import approx_fprime_cs
         params = params.ravel('F')  # for Multinomial
-        try:
-            jacobian_mat = approx_fprime_cs(params, derivative,
-                                            args=(exog,method))
-        except TypeError:  # norm.cdf doesn't take complex values
-            from statsmodels.tools.numdiff import approx_fprime
-            jacobian_mat = approx_fprime(params, derivative,
-                                            args=(exog,method))
-        if at == 'overall':
-            jacobian_mat = np.mean(jacobian_mat, axis=1)
-        else:
-            jacobian_mat = jacobian_mat.squeeze()  # exog was 2d row vector
+        analytic = getattr(model, '_derivative_exog_params', None)
+        if derivative != getattr(model, '_derivative_exog', None):
+            analytic = None
+        jacobian_mat = 0
+        for rows in _row_chunks(len(exog), chunksize):
+            if analytic is not None:
+                jac = analytic(params, exog[rows], method)
+            else:
+                jac = _numeric_margeff_jacobian(derivative, params,
+                                                exog[rows], method)
+            jacobian_mat = jacobian_mat + jac
+        # average over the rows for overall, exog has one row otherwise
+        jacobian_mat = jacobian_mat / len(exog)
         if dummy_ind is not None:
             jacobian_mat = _margeff_cov_params_dummy(model, jacobian_mat,
-                                params, exog, dummy_ind, method, J)
+                                params, exog, dummy_ind, method, J,
+                                chunksize=chunksize)
         if count_ind is not None:
             jacobian_mat = _margeff_cov_params_count(model, jacobian_mat,
-                                params, exog, count_ind, method, J)
+                                params, exog, count_ind, method, J,
+                                chunksize=chunksize)
     else:
         jacobian_mat = derivative
 
@@ -332,7 +429,7 @@ def margeff_cov_params(model, params, exog, cov_params, at, derivative,
     return np.dot(np.dot(jacobian_mat, cov_params), jacobian_mat.T)
 
 def margeff_cov_with_se(model, params, exog, cov_params, at, derivative,
-                        dummy_ind, count_ind, method, J):
+                        dummy_ind, count_ind, method, J, chunksize=None):
     """
     See margeff_cov_params.
 
@@ -341,7 +438,8 @@ def margeff_cov_with_se(model, params, exog, cov_params, at, derivative,
     """
     cov_me = margeff_cov_params(model, params, exog, cov_params, at,
                                               derivative, dummy_ind,
-                                              count_ind, method, J)
+                                              count_ind, method, J,
+                                              chunksize=chunksize)
     return cov_me, np.sqrt(np.diag(cov_me))
 
 def margeff():
@@ -569,7 +667,8 @@ class DiscreteMargins(object):
         return smry
 
     def get_margeff(self, at='overall', method='dydx', atexog=None,
-                          dummy=False, count=False):
+                          dummy=False, count=False, subsample=None, seed=None,
+                          chunksize=None):
         """Get marginal effects of the fitted model.
 
         Parameters
@@ -617,6 +716,19 @@ class DiscreteMargins(object):
             If False, treats count variables (if present) as continuous.  This
             is the default.  Else if True, the marginal effect is the
             change in probabilities when each observation is increased by one.
+        subsample : int, optional
+            Only available if `at` is 'overall'.  If not None, the marginal
+            effects are averaged over a random sample of `subsample`
+            observations drawn without replacement.  The standard errors
+            include the variation due to the sampling of the observations.
+        seed : int, optional
+            Seed for the random sample of observations if `subsample` is
+            not None.
+        chunksize : int, optional
+            The number of observations for which the marginal effects and
+            their derivatives are evaluated at once.  The default depends
+            on the number of variables and keeps the size of the temporary
+            arrays at about 2**20 elements.
 
         Returns
         -------
@@ -627,6 +739,13 @@ class DiscreteMargins(object):
         -----
         When using after Poisson, returns the expected number of events
         per period, assuming that the model is loglinear.
+
+        For Logit, Probit, Poisson and MNLogit the derivatives of the
+        marginal effects with respect to the parameters, which are needed
+        for the standard errors, are computed analytically.  If `at` is
+        'overall', the marginal effects and these derivatives are averaged
+        over chunks of observations, so that the memory does not grow with
+        the number of observations.
         """
         self._reset() # always reset the cache when this is called
         #TODO: if at is not all or overall, we can also put atexog values
@@ -638,7 +757,10 @@ class DiscreteMargins(object):
         results = self.results
         model = results.model
         params = results.params
-        exog = model.exog.copy() # copy because values are changed
+        if isinstance(atexog, dict):
+            exog = model.exog.copy() # copy because values are changed
+        else:
+            exog = model.exog
         effects_idx, const_idx =  _get_const_index(exog)
 
         if dummy:
@@ -656,15 +778,36 @@ class DiscreteMargins(object):
         # get the exogenous variables
         exog = _get_margeff_exog(exog, at, atexog, effects_idx)
 
+        J = getattr(model, 'J', 1)
+        if chunksize is None:
+            chunksize = _default_chunksize(exog, J)
+
+        nobs = len(exog)
+        if subsample is not None:
+            if at != 'overall':
+                raise ValueError("subsample is only available if at is "
+                                 "'overall'")
+            if subsample < nobs:
+                rs = np.random.RandomState(seed)
+                sample_idx = np.sort(rs.choice(nobs, int(subsample),
+                                               replace=False))
+                exog = exog[sample_idx]
+            else:
+                subsample = None
+
         # get base marginal effects, handled by sub-classes
-        effects = model._derivative_exog(params, exog, method,
-                                                    dummy_idx, count_idx)
+        if at == 'overall':
+            effects, effects_cov = _effects_overall(model, params, exog,
+                                                    method, dummy_idx,
+                                                    count_idx, chunksize,
+                                                    cov=subsample is not None)
+        else:
+            effects = model._derivative_exog(params, exog, method,
+                                             dummy_idx, count_idx)
+            effects = _effects_at(effects, at)
 
-        J = getattr(model, 'J', 1)
         effects_idx = np.tile(effects_idx, J) # adjust for multi-equation.
 
-        effects = _effects_at(effects, at)
-
         if at == 'all':
             if J > 1:
                 K = model.K - np.any(~effects_idx) # subtract constant
@@ -674,11 +817,17 @@ class DiscreteMargins(object):
                 self.margeff = effects[:, effects_idx]
         else:
             # Set standard error of the marginal effects by Delta method.
-            margeff_cov, margeff_se = margeff_cov_with_se(model, params, exog,
-                                                results.cov_params(), at,
-                                                model._derivative_exog,
-                                                dummy_idx, count_idx,
-                                                method, J)
+            margeff_cov = margeff_cov_params(model, params, exog,
+                                             results.cov_params(), at,
+                                             model._derivative_exog,
+                                             dummy_idx, count_idx,
+                                             method, J, chunksize=chunksize)
+            if subsample is not None:
+                # variance of the mean over a sample without replacement
+                n_sample = len(exog)
+                fpc = 1 - n_sample / float(nobs)
+                margeff_cov = margeff_cov + fpc * effects_cov / n_sample
+            margeff_se = np.sqrt(np.diag(margeff_cov))
 
             # reshape for multi-equation
             if J > 1:
@@ -32,7 +32,7 @@ from scipy import stats, special, optimize  # opt just for nbin
 from scipy.stats import nbinom
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
 from statsmodels.tools.numdiff import (approx_fprime, approx_hess,
-                                       approx_hess_cs, approx_fprime_cs)
+                                       approx_hess_cs)
 import statsmodels.base.model as base
 from statsmodels.base.data import handle_data  # for mnlogit
 import statsmodels.regression.linear_model as lm
@@ -57,6 +57,39 @@ FLOAT_EPS = np.finfo(float).eps
 _discrete_models_docs = """
 """
 
+_fit_regularized_path_doc = """
+        Return elastic net regularized fits for a sequence of penalties.
+
+        Parameters
+        ----------
+        alphas : array-like
+            1d array of penalty weights.
+        L1_wt : float
+            Must be in [0, 1].  The L1 penalty has weight L1_wt and the
+            L2 penalty has weight 1 - L1_wt.
+        start_params : array-like
+            Starting values for ``params`` of the largest penalty weight.
+        kwargs : keywords
+            `alpha_wt`, `maxiter`, `cnvrg_tol`, `zero_tol` and `screen`
+            are passed to `fit_elasticnet_path`.
+
+        Returns
+        -------
+        A RegularizedPathResults instance.
+
+        Notes
+        -----
+        The function that is minimized for each penalty weight is
+
+            -loglike/n + alpha*((1-L1_wt)*|params|_2^2/2 + L1_wt*|params|_1)
+
+        Unlike `fit_regularized`, the penalty is scaled by the number of
+        observations.  Use `alpha_wt` to leave the constant unpenalized.
+        The fits are computed with warm starts along the decreasing
+        penalty weights, see
+        `statsmodels.base.elastic_net.fit_elasticnet_path`.
+"""
+
 _discrete_results_docs = """
     %(one_line_description)s
 
@@ -631,7 +664,7 @@ class MultinomialModel(BinaryModel):
         eXB = np.exp(np.dot(exog, params))
         sum_eXB = (1 + eXB.sum(1))[:,None]
         J, K = lmap(int, [self.J, self.K])
-        repeat_eXB = np.repeat(eXB, J, axis=1)
+        repeat_eXB = np.repeat(eXB, K, axis=1)
         X = np.tile(exog, J-1)
         # this is the derivative wrt the base level
         F0 = -repeat_eXB * X / sum_eXB ** 2
@@ -689,7 +722,7 @@ class MultinomialModel(BinaryModel):
         margeff = np.transpose(margeff, (1,2,0))
         # swap the axes to make sure margeff are in order nobs, K, J
         if 'ex' in transform:
-            margeff *= exog
+            margeff *= exog[:, :, None]
         if 'ey' in transform:
             margeff /= self.predict(params, exog)[:,None,:]
 
@@ -1017,6 +1050,14 @@ class Poisson(CountModel):
 
     fit_regularized.__doc__ = DiscreteModel.fit_regularized.__doc__
 
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             **kwargs):
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                   start_params=start_params, **kwargs)
+    fit_regularized_path.__doc__ = _fit_regularized_path_doc
+
 
     def fit_constrained(self, constraints, start_params=None, **fit_kwds):
         """fit the model subject to linear equality constraints
@@ -1175,6 +1216,63 @@ class Poisson(CountModel):
         L = np.exp(np.dot(X,params) + exposure + offset)
         return -np.dot(L*X.T, X)
 
+    def score_factor(self, params):
+        """
+        Poisson model derivative of the loglikelihood with respect to linpred
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        score_factor : ndarray, 1-D
+            A 1d weight vector used in the calculation of the score_obs.
+            The score_obs are obtained by `score_factor[:, None] * exog`
+        """
+        offset = getattr(self, "offset", 0)
+        exposure = getattr(self, "exposure", 0)
+        L = np.exp(np.dot(self.exog, params) + offset + exposure)
+        return self.endog - L
+
+    def hessian_factor(self, params):
+        """
+        Poisson model weights for calculating the Hessian
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        hessian_factor : ndarray, 1-D
+            A 1d weight vector used in the calculation of the Hessian.
+            The hessian is obtained by `-(exog.T * hessian_factor).dot(exog)`
+        """
+        offset = getattr(self, "offset", 0)
+        exposure = getattr(self, "exposure", 0)
+        return np.exp(np.dot(self.exog, params) + offset + exposure)
+
+    def _derivative_exog_params(self, params, exog, transform='dydx'):
+        """
+        Jacobian of the marginal effects with respect to params summed over
+        the rows of exog, used for the standard errors of the marginal
+        effects.
+
+        The marginal effects are exp(XB) * params, their derivative with
+        respect to the linear predictor is the marginal effect itself.
+        """
+        from statsmodels.discrete.discrete_margins import (
+                _index_margeff_jacobian)
+        if 'ey' in transform:
+            g = np.ones(len(exog))
+            dg = np.zeros(len(exog))
+        else:
+            g = dg = self.predict(params, exog)
+        return _index_margeff_jacobian(params, exog, g, dg, transform)
+
 class Logit(BinaryModel):
     __doc__ = """
     Binary choice logit model
@@ -1370,6 +1468,63 @@ class Logit(BinaryModel):
         L = self.cdf(np.dot(X,params))
         return -np.dot(L*(1-L)*X.T,X)
 
+    def score_factor(self, params):
+        """
+        Logit model derivative of the loglikelihood with respect to linpred
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        score_factor : ndarray, 1-D
+            A 1d weight vector used in the calculation of the score_obs.
+            The score_obs are obtained by `score_factor[:, None] * exog`
+        """
+        L = self.cdf(np.dot(self.exog, params))
+        return self.endog - L
+
+    def hessian_factor(self, params):
+        """
+        Logit model weights for calculating the Hessian
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        hessian_factor : ndarray, 1-D
+            A 1d weight vector used in the calculation of the Hessian.
+            The hessian is obtained by `-(exog.T * hessian_factor).dot(exog)`
+        """
+        L = self.cdf(np.dot(self.exog, params))
+        return L * (1 - L)
+
+    def _derivative_exog_params(self, params, exog, transform='dydx'):
+        """
+        Jacobian of the marginal effects with respect to params summed over
+        the rows of exog, used for the standard errors of the marginal
+        effects.
+
+        The marginal effects are pdf(XB) * params, and the derivative of
+        the pdf is pdf(XB) * (1 - 2 * cdf(XB)).
+        """
+        from statsmodels.discrete.discrete_margins import (
+                _index_margeff_jacobian)
+        cdf = self.cdf(np.dot(exog, params))
+        if 'ey' in transform:
+            # pdf / cdf = 1 - cdf
+            g = 1 - cdf
+            dg = -cdf * g
+        else:
+            g = cdf * (1 - cdf)
+            dg = g * (1 - 2 * cdf)
+        return _index_margeff_jacobian(params, exog, g, dg, transform)
+
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
         bnryfit = super(Logit, self).fit(start_params=start_params,
@@ -1380,6 +1535,14 @@ class Logit(BinaryModel):
         return BinaryResultsWrapper(discretefit)
     fit.__doc__ = DiscreteModel.fit.__doc__
 
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             **kwargs):
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                   start_params=start_params, **kwargs)
+    fit_regularized_path.__doc__ = _fit_regularized_path_doc
+
 class Probit(BinaryModel):
     __doc__ = """
     Binary choice Probit model
@@ -1593,6 +1756,68 @@ class Probit(BinaryModel):
         L = q*self.pdf(q*XB)/self.cdf(q*XB)
         return np.dot(-L*(L+XB)*X.T,X)
 
+    def score_factor(self, params):
+        """
+        Probit model derivative of the loglikelihood with respect to linpred
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        score_factor : ndarray, 1-D
+            A 1d weight vector used in the calculation of the score_obs.
+            The score_obs are obtained by `score_factor[:, None] * exog`
+        """
+        XB = np.dot(self.exog, params)
+        q = 2*self.endog - 1
+        # clip to get rid of invalid divide complaint
+        return q*self.pdf(q*XB)/np.clip(self.cdf(q*XB), FLOAT_EPS,
+                                        1 - FLOAT_EPS)
+
+    def hessian_factor(self, params):
+        """
+        Probit model weights for calculating the Hessian
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        hessian_factor : ndarray, 1-D
+            A 1d weight vector used in the calculation of the Hessian.
+            The hessian is obtained by `-(exog.T * hessian_factor).dot(exog)`
+        """
+        XB = np.dot(self.exog, params)
+        L = self.score_factor(params)
+        return L * (L + XB)
+
+    def _derivative_exog_params(self, params, exog, transform='dydx'):
+        """
+        Jacobian of the marginal effects with respect to params summed over
+        the rows of exog, used for the standard errors of the marginal
+        effects.
+
+        The marginal effects are pdf(XB) * params, and the derivative of
+        the pdf is -XB * pdf(XB).
+        """
+        from statsmodels.discrete.discrete_margins import (
+                _index_margeff_jacobian)
+        XB = np.dot(exog, params)
+        pdf = self.pdf(XB)
+        if 'ey' in transform:
+            # inverse Mills ratio and its derivative
+            g = pdf / self.cdf(XB)
+            dg = -g * (XB + g)
+        else:
+            g = pdf
+            dg = -XB * pdf
+        return _index_margeff_jacobian(params, exog, g, dg, transform)
+
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
         bnryfit = super(Probit, self).fit(start_params=start_params,
@@ -1835,27 +2060,74 @@ class MNLogit(MultinomialModel):
         The actual Hessian matrix has J**2 * K x K elements. Our Hessian
         is reshaped to be square (J*K, J*K) so that the solvers can use it.
 
-        This implementation does not take advantage of the symmetry of
-        the Hessian and could probably be refactored for speed.
+        The part of the Hessian that is common to all blocks is computed
+        as one cross product ``Z'Z``, where the columns of ``Z`` are the
+        products of the predicted probabilities and the columns of
+        `exog`.  The observations are processed in chunks to limit the
+        size of ``Z``.
         """
         params = params.reshape(self.K, -1, order='F')
         X = self.exog
-        pr = self.cdf(np.dot(X,params))
-        partials = []
+        pr = self.cdf(np.dot(X,params))[:,1:]
+        nobs = X.shape[0]
         J = self.wendog.shape[1] - 1
         K = self.exog.shape[1]
-        for i in range(J):
-            for j in range(J): # this loop assumes we drop the first col.
-                if i == j:
-                    partials.append(\
-                        -np.dot(((pr[:,i+1]*(1-pr[:,j+1]))[:,None]*X).T,X))
-                else:
-                    partials.append(-np.dot(((pr[:,i+1]*-pr[:,j+1])[:,None]*X).T,X))
-        H = np.array(partials)
-        # the developer's notes on multinomial should clear this math up
-        H = np.transpose(H.reshape(J,J,K,K), (0,2,1,3)).reshape(J*K,J*K)
+        H = np.zeros((J*K, J*K))
+        chunksize = max(1, 2**22 // (J*K))
+        for start in range(0, nobs, chunksize):
+            sl = slice(start, start + chunksize)
+            Z = (pr[sl,:,None] * X[sl,None,:]).reshape(-1, J*K)
+            H += np.dot(Z.T, Z)
+        for j in range(J):
+            H[j*K:(j+1)*K, j*K:(j+1)*K] -= np.dot(X.T * pr[:,j], X)
         return H
 
+    def _derivative_exog_params(self, params, exog, transform='dydx'):
+        """
+        Jacobian of the marginal effects with respect to params summed over
+        the rows of exog, used for the standard errors of the marginal
+        effects.
+
+        The rows correspond to the columns of `_derivative_exog`, the
+        columns to the parameters flattened in Fortran order, the shape is
+        (K*J, K*(J-1)).
+
+        Notes
+        -----
+        With the marginal effects P[j] * D[k, j], where
+        D[k, j] = params[k, j] - sum_m P[m] * params[k, m], the derivative
+        with respect to params[l, r] is
+
+        x[l] * (A[j, r] * D[k, j] - P[j] * P[r] * D[k, r]) + 1(k=l) * A[j, r]
+
+        where A[j, r] = P[j] * (1(j=r) - P[r]) is the derivative of P[j]
+        with respect to the linear predictor of choice r.
+        """
+        J = int(self.J)
+        K = int(self.K)
+        params = params.reshape(K, J-1, order='F')
+        zeroparams = np.c_[np.zeros(K), params] # add base in
+        prob = self.cdf(np.dot(exog, params))
+        dev = zeroparams[None, :, :] - np.dot(prob, zeroparams.T)[:, :, None]
+        if 'ex' in transform:
+            scale = exog
+        else:
+            scale = np.ones_like(exog)
+        dev *= scale[:, :, None]
+        deriv_prob = np.eye(J)[None, :, 1:] - prob[:, None, 1:]
+        dev_r = dev[:, :, 1:] * prob[:, None, 1:]
+        if 'ey' in transform:
+            # marginal effects divided by P[j]
+            jac = -np.einsum('ikr,il->klr', dev_r, exog)[:, None, :, :]
+            jac = np.repeat(jac, J, axis=1)
+        else:
+            deriv_prob *= prob[:, :, None]
+            jac = np.einsum('ikj,ijr,il->kjlr', dev, deriv_prob, exog)
+            jac -= np.einsum('ikr,ij,il->kjlr', dev_r, prob, exog)
+        idx = np.arange(K)
+        jac[idx, :, idx, :] += np.einsum('ik,ijr->kjr', scale, deriv_prob)
+        return jac.transpose(1, 0, 3, 2).reshape(J*K, (J-1)*K)
+
 
 #TODO: Weibull can replaced by a survival analsysis function
 # like stat's streg (The cox model as well)
@@ -2069,16 +2341,24 @@ class NegativeBinomial(CountModel):
         return llf
 
     def _score_geom(self, params):
+        return self._score_obs_geom(params).sum(0)
+
+    def _score_obs_geom(self, params):
         exog = self.exog
         y = self.endog[:,None]
         mu = self.predict(params)[:,None]
-        dparams = exog * (y-mu)/(mu+1)
-        return dparams.sum(0)
+        return exog * (y-mu)/(mu+1)
 
     def _score_nbin(self, params, Q=0):
         """
         Score vector for NB2 model
         """
+        return self._score_obs_nbin(params, Q=Q).sum(0)
+
+    def _score_obs_nbin(self, params, Q=0):
+        """
+        Score of the observations for the NB1 and NB2 models
+        """
         if self._transparams: # lnalpha came in during fit
             alpha = np.exp(params[-1])
         else:
@@ -2089,28 +2369,25 @@ class NegativeBinomial(CountModel):
         mu = self.predict(params)[:,None]
         a1 = 1/alpha * mu**Q
         if Q: # nb1
-            dparams = exog*mu/alpha*(np.log(1/(alpha + 1)) +
-                       special.digamma(y + mu/alpha) -
-                       special.digamma(mu/alpha))
+            dgpart = (np.log(1/(alpha + 1)) +
+                      special.digamma(y + mu/alpha) -
+                      special.digamma(mu/alpha))
+            dparams = exog*mu/alpha*dgpart
             dalpha = ((alpha*(y - mu*np.log(1/(alpha + 1)) -
                               mu*(special.digamma(y + mu/alpha) -
                               special.digamma(mu/alpha) + 1)) -
-                       mu*(np.log(1/(alpha + 1)) +
-                           special.digamma(y + mu/alpha) -
-                           special.digamma(mu/alpha)))/
-                       (alpha**2*(alpha + 1))).sum()
+                       mu*dgpart)/
+                       (alpha**2*(alpha + 1)))
 
         else: # nb2
             dparams = exog*a1 * (y-mu)/(mu+a1)
             da1 = -alpha**-2
             dalpha = (special.digamma(a1+y) - special.digamma(a1) + np.log(a1)
-                        - np.log(a1+mu) - (a1+y)/(a1+mu) + 1).sum()*da1
+                        - np.log(a1+mu) - (a1+y)/(a1+mu) + 1)*da1
 
-        #multiply above by constant outside sum to reduce rounding error
         if self._transparams:
-            return np.r_[dparams.sum(0), dalpha*alpha]
-        else:
-            return np.r_[dparams.sum(0), dalpha]
+            dalpha = dalpha*alpha
+        return np.column_stack((dparams, dalpha))
 
     def _score_nb1(self, params):
         return self._score_nbin(params, Q=1)
@@ -2121,18 +2398,8 @@ class NegativeBinomial(CountModel):
         mu = self.predict(params)[:,None]
 
         # for dl/dparams dparams
-        dim = exog.shape[1]
-        hess_arr = np.empty((dim, dim))
         const_arr = mu*(1+y)/(mu+1)**2
-        for i in range(dim):
-            for j in range(dim):
-                if j > i:
-                    continue
-                hess_arr[i,j] = np.sum(-exog[:,i,None] * exog[:,j,None] *
-                                       const_arr, axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
-        return hess_arr
+        return -np.dot(exog.T * const_arr.T, exog)
 
 
     def _hessian_nb1(self, params):
@@ -2154,25 +2421,17 @@ class NegativeBinomial(CountModel):
         # for dl/dparams dparams
         dim = exog.shape[1]
         hess_arr = np.empty((dim+1,dim+1))
-        #const_arr = a1*mu*(a1+y)/(mu+a1)**2
         # not all of dparams
-        dparams = exog/alpha*(np.log(1/(alpha + 1)) +
-                              special.digamma(y + mu/alpha) -
-                              special.digamma(mu/alpha))
+        dgpart = (np.log(1/(alpha + 1)) +
+                  special.digamma(y + mu/alpha) -
+                  special.digamma(mu/alpha))
+        dparams = exog/alpha*dgpart
 
-        dmudb = exog*mu
-        xmu_alpha = exog*mu/alpha
         trigamma = (special.polygamma(1, mu/alpha + y) -
                     special.polygamma(1, mu/alpha))
-        for i in range(dim):
-            for j in range(dim):
-                if j > i:
-                    continue
-                hess_arr[i,j] = np.sum(dparams[:,i,None] * dmudb[:,j,None] +
-                                 xmu_alpha[:,i,None] * xmu_alpha[:,j,None] *
-                                 trigamma, axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        # both terms are x_i x_j times a weight for each observation
+        wts = mu/alpha*dgpart + (mu/alpha)**2*trigamma
+        hess_arr[:-1,:-1] = np.dot(exog.T * wts.T, exog)
 
         # for dl/dparams dalpha
         da1 = -alpha**-2
@@ -2220,14 +2479,7 @@ class NegativeBinomial(CountModel):
         dim = exog.shape[1]
         hess_arr = np.empty((dim+1,dim+1))
         const_arr = a1*mu*(a1+y)/(mu+a1)**2
-        for i in range(dim):
-            for j in range(dim):
-                if j > i:
-                    continue
-                hess_arr[i,j] = np.sum(-exog[:,i,None] * exog[:,j,None] *
-                                       const_arr, axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        hess_arr[:-1,:-1] = -np.dot(exog.T * const_arr.T, exog)
 
         # for dl/dparams dalpha
         da1 = -alpha**-2
@@ -2247,10 +2499,29 @@ class NegativeBinomial(CountModel):
 
         return hess_arr
 
-    #TODO: replace this with analytic where is it used?
     def score_obs(self, params):
-        sc = approx_fprime_cs(params, self.loglikeobs)
-        return sc
+        """
+        Score of the observations, the derivative of `loglikeobs`
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model. If `loglike_method` is nb1 or
+            nb2, then the ancillary parameter is expected to be the
+            last element.
+
+        Returns
+        -------
+        score : ndarray, (nobs, k_params)
+            The derivative of the loglikelihood for each observation
+            evaluated at `params`.
+        """
+        if self.loglike_method == 'geometric':
+            return self._score_obs_geom(params)
+        elif self.loglike_method == 'nb1':
+            return self._score_obs_nbin(params, Q=1)
+        else:
+            return self._score_obs_nbin(params, Q=0)
 
     jac = np.deprecate(score_obs, 'jac', 'score_obs', "Use score_obs method."
                        " jac will be removed in 0.7")
@@ -2438,7 +2709,8 @@ class DiscreteResults(base.LikelihoodModelResults):
         return yname, yname_list
 
     def get_margeff(self, at='overall', method='dydx', atexog=None,
-            dummy=False, count=False):
+            dummy=False, count=False, subsample=None, seed=None,
+            chunksize=None):
         """Get marginal effects of the fitted model.
 
         Parameters
@@ -2486,6 +2758,19 @@ class DiscreteResults(base.LikelihoodModelResults):
             If False, treats count variables (if present) as continuous.  This
             is the default.  Else if True, the marginal effect is the
             change in probabilities when each observation is increased by one.
+        subsample : int, optional
+            Only available if `at` is 'overall'.  If not None, the marginal
+            effects are averaged over a random sample of `subsample`
+            observations drawn without replacement.  The standard errors
+            include the variation due to the sampling of the observations.
+        seed : int, optional
+            Seed for the random sample of observations if `subsample` is
+            not None.
+        chunksize : int, optional
+            The number of observations for which the marginal effects and
+            their derivatives are evaluated at once.  The default depends
+            on the number of variables and keeps the size of the temporary
+            arrays at about 2**20 elements.
 
         Returns
         -------
@@ -2501,7 +2786,9 @@ class DiscreteResults(base.LikelihoodModelResults):
         per period, assuming that the model is loglinear.
         """
         from statsmodels.discrete.discrete_margins import DiscreteMargins
-        return DiscreteMargins(self, (at, method, atexog, dummy, count))
+        return DiscreteMargins(self, (at, method, atexog, dummy, count),
+                               dict(subsample=subsample, seed=seed,
+                                    chunksize=chunksize))
 
     def summary(self, yname=None, xname=None, title=None, alpha=.05,
                 yname_list=None):
@@ -2717,6 +3004,23 @@ class PoissonResults(CountResults):
         # uses broadcasting
         return stats.poisson.pmf(counts, mu)
 
+    def get_influence(self):
+        """
+        get an instance of GLMInfluence with influence and outlier measures
+
+        Returns
+        -------
+        infl : GLMInfluence instance
+            the instance has methods to calculate the main influence and
+            outlier measures based on one-step IRLS approximations
+
+        See also
+        --------
+        statsmodels.stats.outliers_influence.GLMInfluence
+        """
+        from statsmodels.stats.outliers_influence import GLMInfluence
+        return GLMInfluence(self)
+
 class L1PoissonResults(L1CountResults, PoissonResults):
     pass
 
@@ -2878,6 +3182,12 @@ class LogitResults(BinaryResults):
         # Generalized residuals
         return self.model.endog - self.predict()
 
+    def get_influence(self):
+        from statsmodels.stats.outliers_influence import GLMInfluence
+        return GLMInfluence(self)
+
+    get_influence.__doc__ = PoissonResults.get_influence.__doc__
+
 class ProbitResults(BinaryResults):
     __doc__ = _discrete_results_docs % {
         "one_line_description" : "A results class for Probit Model",
@@ -2901,6 +3211,12 @@ class ProbitResults(BinaryResults):
         cdf = model.cdf(XB)
         return endog * pdf/cdf - (1-endog)*pdf/(1-cdf)
 
+    def get_influence(self):
+        from statsmodels.stats.outliers_influence import GLMInfluence
+        return GLMInfluence(self)
+
+    get_influence.__doc__ = PoissonResults.get_influence.__doc__
+
 class L1BinaryResults(BinaryResults):
     __doc__ = _discrete_results_docs % {"one_line_description" :
     "Results instance for binary data fit by l1 regularization",
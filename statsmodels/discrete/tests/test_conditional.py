@@ -0,0 +1,153 @@
+"""
+Tests for conditional logit and Poisson regression
+"""
+from __future__ import division
+
+from itertools import combinations
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+from scipy.special import gammaln
+
+from statsmodels.discrete.conditional_models import (ConditionalLogit,
+                                                     ConditionalPoisson)
+from statsmodels.discrete.discrete_model import Poisson
+from statsmodels.tools.numdiff import approx_fprime, approx_hess
+from statsmodels.tools.tools import add_constant
+
+
+def _gen_groups(n_groups=60, seed=987125):
+    np.random.seed(seed)
+    sizes = np.random.randint(2, 7, size=n_groups)
+    groups = np.repeat(np.arange(n_groups), sizes)
+    # the observations of a group do not need to be adjacent
+    groups = groups[np.random.permutation(len(groups))]
+    exog = np.random.randn(len(groups), 2)
+    effects = np.random.randn(n_groups)[groups]
+    return groups, exog, effects
+
+
+def _loglike_logit(model, params, groups, endog, exog):
+    # conditional likelihood by enumeration of all subsets
+    llf = 0.
+    for g in np.unique(groups):
+        ii = groups == g
+        y, x = endog[ii], exog[ii]
+        k = int(y.sum())
+        if k == 0 or k == len(y):
+            continue
+        lin_pred = np.dot(x, params)
+        den = sum(np.exp(lin_pred[list(s)].sum())
+                  for s in combinations(range(len(y)), k))
+        llf += np.dot(y, lin_pred) - np.log(den)
+    return llf
+
+
+class TestConditionalLogit(object):
+
+    @classmethod
+    def setupClass(cls):
+        groups, exog, effects = _gen_groups()
+        lin_pred = np.dot(exog, [1., -0.5]) + effects
+        endog = (np.random.rand(len(groups)) <
+                 1 / (1 + np.exp(-lin_pred))) * 1.
+        cls.groups, cls.exog, cls.endog = groups, exog, endog
+        cls.model = ConditionalLogit(endog, exog, groups=groups)
+        cls.res = cls.model.fit()
+
+    def test_loglike(self):
+        for params in [np.r_[0., 0.], np.r_[0.5, -1.], np.r_[3., 2.]]:
+            llf = _loglike_logit(self.model, params, self.groups,
+                                 self.endog, self.exog)
+            assert_allclose(self.model.loglike(params), llf, rtol=1e-10)
+
+    def test_score(self):
+        params = np.r_[0.5, -1.]
+        assert_allclose(self.model.score(params),
+                        approx_fprime(params, self.model.loglike,
+                                      centered=True), rtol=1e-6)
+        assert_allclose(self.model.hessian(params),
+                        approx_fprime(params, self.model.score,
+                                      centered=True), rtol=1e-6)
+
+    def test_fit(self):
+        res = self.res
+        assert res.mle_retvals['converged']
+        assert_allclose(self.model.score(res.params), 0, atol=1e-4)
+        n_groups = len(np.unique(self.groups))
+        assert_equal(res.n_groups + self.model.n_groups_dropped, n_groups)
+        txt = res.summary().as_text()
+        assert "No. groups" in txt
+
+    def test_chunks(self):
+        # groups of equal size processed in several chunks, the recursion
+        # is cached for the same parameters
+        params = np.r_[0.3, -0.2]
+        model = ConditionalLogit(self.endog, self.exog, groups=self.groups)
+        model._chunk_elements = 20
+        hess = model.hessian(params)
+        assert_allclose(hess, self.model.hessian(params), rtol=1e-12)
+        den = model._denominator_cache[2]
+        assert_allclose(model.score(params), self.model.score(params),
+                        rtol=1e-12)
+        assert_allclose(model.loglike(params), self.model.loglike(params),
+                        rtol=1e-12)
+        assert model._denominator_cache[2] is den
+
+    def test_constant(self):
+        assert_raises(ValueError, ConditionalLogit, self.endog,
+                      add_constant(self.exog), groups=self.groups)
+
+    def test_endog_binary(self):
+        endog = self.endog.copy()
+        endog[0] = 2
+        assert_raises(ValueError, ConditionalLogit, endog, self.exog,
+                      groups=self.groups)
+
+    def test_large_groups(self):
+        # the subset sums overflow without rescaling
+        np.random.seed(987125)
+        groups = np.repeat([0, 1], [2000, 1500])
+        exog = np.random.randn(len(groups), 2)
+        endog = (np.random.rand(len(groups)) < 0.5) * 1.
+        model = ConditionalLogit(endog, exog, groups=groups)
+        # at zero the denominator is the number of subsets
+        k = np.bincount(groups, weights=endog)
+        n = np.bincount(groups)
+        llf = -(gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)).sum()
+        assert_allclose(model.loglike(np.zeros(2)), llf, rtol=1e-10)
+        params = np.r_[0.5, -1.]
+        assert_allclose(model.score(params),
+                        approx_fprime(params, model.loglike, centered=True),
+                        rtol=1e-5)
+        assert np.all(np.isfinite(model.hessian(params)))
+
+
+class TestConditionalPoisson(object):
+
+    @classmethod
+    def setupClass(cls):
+        groups, exog, effects = _gen_groups()
+        endog = np.random.poisson(np.exp(np.dot(exog, [0.5, -0.3]) +
+                                         0.5 * effects))
+        cls.model = ConditionalPoisson(endog, exog, groups=groups)
+        cls.res1 = cls.model.fit()
+
+        # unconditional Poisson with a dummy for each group
+        dummies = (groups[:, None] == np.unique(groups)).astype(np.float64)
+        keep = np.bincount(groups, weights=endog)[groups] > 0
+        dummies = dummies[keep][:, dummies[keep].sum(0) > 0]
+        exog2 = np.column_stack((exog[keep], dummies))
+        cls.res2 = Poisson(endog[keep], exog2).fit(disp=0)
+
+    def test_params(self):
+        assert_allclose(self.res1.params, self.res2.params[:2], rtol=1e-5)
+        assert_allclose(self.res1.bse, self.res2.bse[:2], rtol=1e-5)
+
+    def test_derivatives(self):
+        params = np.r_[0.2, 0.1]
+        assert_allclose(self.model.score(params),
+                        approx_fprime(params, self.model.loglike,
+                                      centered=True), rtol=1e-6)
+        assert_allclose(self.model.hessian(params),
+                        approx_hess(params, self.model.loglike), rtol=1e-4)
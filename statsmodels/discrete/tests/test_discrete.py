@@ -1423,6 +1423,107 @@ def test_binary_pred_table_zeros():
     assert_equal(res.pred_table(), expected)
 
 
+def test_analytic_derivatives():
+    # compare score_obs and hessian with numerical derivatives
+    from statsmodels.tools.numdiff import approx_fprime
+    np.random.seed(987125)
+    nobs = 300
+    exog = sm.add_constant(np.random.randn(nobs, 3))
+    mu = np.exp(0.3 * exog.sum(1))
+    endog = np.random.negative_binomial(2, 2 / (2 + mu))
+    for method in ['nb1', 'nb2', 'geometric']:
+        mod = NegativeBinomial(endog, exog, loglike_method=method)
+        params = np.r_[0.1, 0.2, -0.1, 0.3]
+        if method != 'geometric':
+            params = np.r_[params, 0.7]
+        for transparams in [False, True]:
+            mod._transparams = transparams and method != 'geometric'
+            sc_obs = mod.score_obs(params)
+            assert_allclose(sc_obs, approx_fprime(params, mod.loglikeobs,
+                                                  centered=True),
+                            rtol=1e-5, atol=1e-7)
+            assert_allclose(sc_obs.sum(0), mod.score(params), rtol=1e-10)
+        mod._transparams = False
+        assert_allclose(mod.hessian(params),
+                        approx_fprime(params, mod.score, centered=True),
+                        rtol=1e-5, atol=1e-5)
+
+    endog = np.random.randint(0, 4, size=nobs)
+    mod = MNLogit(endog, exog)
+    params = np.random.uniform(-0.5, 0.5, size=4 * 3)
+    assert_allclose(mod.hessian(params),
+                    approx_fprime(params, mod.score, centered=True),
+                    rtol=1e-5, atol=1e-5)
+
+
+def _margeff_data(nobs=150, seed=987125):
+    np.random.seed(seed)
+    # positive regressors so that elasticities are defined
+    exog = np.random.uniform(0.5, 1.5, size=(nobs, 3))
+    exog = np.column_stack((exog, np.random.randint(0, 2, size=nobs)))
+    exog = sm.add_constant(exog, prepend=False)
+    linpred = np.dot(exog, [0.5, -1., 0.8, 0.5, -0.4])
+    endog = (np.random.rand(nobs) < 1 / (1 + np.exp(-linpred))) * 1.
+    endog_count = np.random.poisson(np.exp(linpred / 2))
+    endog_multi = endog + (np.random.rand(nobs) < 0.3)
+    return endog, endog_count, endog_multi, exog
+
+
+def test_margeff_jacobian():
+    # analytic Jacobian of the marginal effects against numerical derivatives
+    from statsmodels.discrete.discrete_margins import (
+        _numeric_margeff_jacobian)
+    endog, endog_count, endog_multi, exog = _margeff_data()
+    models = [Logit(endog, exog), Probit(endog, exog),
+              Poisson(endog_count, exog), MNLogit(endog_multi, exog)]
+    for mod in models:
+        k_params = exog.shape[1] * (getattr(mod, 'J', 2) - 1)
+        params = np.random.uniform(-0.5, 0.5, size=k_params)
+        for method in ['dydx', 'eyex', 'dyex', 'eydx']:
+            jac = mod._derivative_exog_params(params, exog, method)
+            jac_num = _numeric_margeff_jacobian(mod._derivative_exog, params,
+                                                exog, method)
+            assert_allclose(jac, jac_num, rtol=1e-5, atol=1e-6)
+
+
+def test_margeff_chunks():
+    endog, endog_count, endog_multi, exog = _margeff_data()
+    results = [Logit(endog, exog).fit(disp=0),
+               Poisson(endog_count, exog).fit(disp=0),
+               MNLogit(endog_multi, exog).fit(disp=0)]
+    for res in results:
+        for kwds in [{}, {'dummy': True}, {'method': 'eydx'}]:
+            me1 = res.get_margeff(**kwds)
+            me2 = res.get_margeff(chunksize=16, **kwds)
+            assert_allclose(me2.margeff, me1.margeff, rtol=1e-12)
+            assert_allclose(me2.margeff_cov, me1.margeff_cov, rtol=1e-10)
+
+
+def test_margeff_subsample():
+    endog, _, _, exog = _margeff_data(nobs=400)
+    res = Logit(endog, exog).fit(disp=0)
+    me = res.get_margeff()
+    me_all = res.get_margeff(at='all')
+
+    n_sample = 100
+    me1 = res.get_margeff(subsample=n_sample, seed=1234, chunksize=16)
+    ix = np.sort(np.random.RandomState(1234).choice(len(endog), n_sample,
+                                                    replace=False))
+    assert_allclose(me1.margeff, me_all.margeff[ix].mean(0), rtol=1e-12)
+    # the sampling variance is added to the delta method variance
+    me3 = res.get_margeff(atexog=exog[ix])
+    cov_sample = (np.cov(me_all.margeff[ix].T) *
+                  (1 - n_sample / float(len(endog))) / n_sample)
+    assert_allclose(me1.margeff_cov, me3.margeff_cov + cov_sample,
+                    rtol=1e-8)
+
+    # no sampling if the sample is not smaller than the data
+    me2 = res.get_margeff(subsample=len(endog))
+    assert_allclose(me2.margeff, me.margeff, rtol=1e-12)
+    assert_allclose(me2.margeff_se, me.margeff_se, rtol=1e-12)
+    assert_raises(ValueError, res.get_margeff, at='mean', subsample=n_sample)
+
+
 if __name__ == "__main__":
     import nose
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb'],
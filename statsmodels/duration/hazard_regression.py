@@ -137,12 +137,11 @@ class PHSurvivalTime(object):
                              "after event or censoring times")
 
         # Get the row indices for the cases in each stratum
-        stu = np.unique(strata)
-        #sth = {x: [] for x in stu} # needs >=2.7
-        sth = dict([(x, []) for x in stu])
-        for i,k in enumerate(strata):
-            sth[k].append(i)
-        stratum_rows = [np.asarray(sth[k], dtype=np.int32) for k in stu]
+        stu, strata_codes = np_new_unique(strata, return_inverse=True)
+        order = np.argsort(strata_codes, kind="mergesort").astype(np.int32)
+        bounds = np.searchsorted(strata_codes[order],
+                                 np.arange(1, len(stu)))
+        stratum_rows = np.split(order, bounds)
         stratum_names = stu
 
         # Remove strata with no events
@@ -161,18 +160,13 @@ class PHSurvivalTime(object):
             last_failure = max(time[ix][status[ix] == 1])
 
             # Stata uses < here, R uses <=
-            ii = [i for i,t in enumerate(entry[ix]) if
-                  t <= last_failure]
-            stratum_rows[stx] = stratum_rows[stx][ii]
+            stratum_rows[stx] = ix[entry[ix] <= last_failure]
 
         # Remove subjects who are censored before the first event in
         # their stratum.
         for stx,ix in enumerate(stratum_rows):
             first_failure = min(time[ix][status[ix] == 1])
-
-            ii = [i for i,t in enumerate(time[ix]) if
-                  t >= first_failure]
-            stratum_rows[stx] = stratum_rows[stx][ii]
+            stratum_rows[stx] = ix[time[ix] >= first_failure]
 
         # Order by time within each stratum
         for stx,ix in enumerate(stratum_rows):
@@ -220,43 +214,192 @@ class PHSurvivalTime(object):
         self.ufailt_ix, self.risk_enter, self.risk_exit, self.ufailt =\
             [], [], [], []
 
+        # The same information in the form that is used for computing
+        # the risk set sums with cumulative sums, see `risk_set_sums`.
+        #
+        # fail_rows[stx] are the indices of the failures sorted by
+        # time, fail_starts[stx][k] is the position in fail_rows of the
+        # first failure at the k^th unique failure time and n_fail[stx][k]
+        # is the number of failures at that time.
+        #
+        # enter_pos[stx][k] is the first row (in time order) that is
+        # in the risk set at the k^th unique failure time.
+        #
+        # exit_order[stx] orders the rows by the unique failure time at
+        # which they exit the risk set and exit_pos[stx][k] is the
+        # position in that order of the first row that exits after the
+        # k^th unique failure time.  Both are None if there is no left
+        # truncation.
+        self.fail_rows, self.fail_starts, self.n_fail = [], [], []
+        self.enter_pos, self.exit_order, self.exit_pos = [], [], []
+
         for stx in range(self.nstrat):
 
-            # All failure times
-            ift = np.flatnonzero(self.status_s[stx] == 1)
-            ft = self.time_s[stx][ift]
+            time_s = self.time_s[stx]
+            n_s = len(time_s)
+
+            # All failure times, sorted since time_s is sorted
+            ift = np.flatnonzero(self.status_s[stx] == 1).astype(np.int32)
+            ft = time_s[ift]
 
             # Unique failure times
             uft = np.unique(ft)
             nuft = len(uft)
+            kx = np.arange(nuft)
 
             # Indices of cases that fail at each unique failure time
-            #uft_map = {x:i for i,x in enumerate(uft)} # requires >=2.7
-            uft_map = dict([(x, i) for i,x in enumerate(uft)]) # 2.6
-            uft_ix = [[] for k in range(nuft)]
-            for ix,ti in zip(ift,ft):
-                uft_ix[uft_map[ti]].append(ix)
+            fail_k = np.searchsorted(uft, ft)
+            fail_starts = np.searchsorted(fail_k, kx)
+            uft_ix = np.split(ift, fail_starts[1:])
 
             # Indices of cases (failed or censored) that enter the
-            # risk set at each unique failure time.
-            risk_enter1 = [[] for k in range(nuft)]
-            for i,t in enumerate(self.time_s[stx]):
-                ix = np.searchsorted(uft, t, "right") - 1
-                if ix >= 0:
-                    risk_enter1[ix].append(i)
+            # risk set at each unique failure time.  All cases are
+            # at risk at the first failure time.
+            enter_k = np.searchsorted(uft, time_s, "right") - 1
+            enter_pos = np.searchsorted(enter_k, kx)
+            risk_enter1 = np.split(np.arange(n_s, dtype=np.int32),
+                                   enter_pos[1:])
 
             # Indices of cases (failed or censored) that exit the
             # risk set at each unique failure time.
-            risk_exit1 = [[] for k in range(nuft)]
-            for i,t in enumerate(self.entry_s[stx]):
-                ix = np.searchsorted(uft, t)
-                risk_exit1[ix].append(i)
+            exit_k = np.searchsorted(uft, self.entry_s[stx])
+            exit_order = np.argsort(exit_k, kind="mergesort")
+            exit_order = exit_order.astype(np.int32)
+            exit_sorted = exit_k[exit_order]
+            risk_exit1 = np.split(exit_order,
+                                  np.searchsorted(exit_sorted, kx[1:]))
 
             self.ufailt.append(uft)
-            self.ufailt_ix.append([np.asarray(x, dtype=np.int32) for x in uft_ix])
-            self.risk_enter.append([np.asarray(x, dtype=np.int32) for x in risk_enter1])
-            self.risk_exit.append([np.asarray(x, dtype=np.int32) for x in risk_exit1])
+            self.ufailt_ix.append(uft_ix)
+            self.risk_enter.append(risk_enter1)
+            self.risk_exit.append(risk_exit1)
+
+            self.fail_rows.append(ift)
+            self.fail_starts.append(fail_starts)
+            self.n_fail.append(np.diff(np.r_[fail_starts, len(ift)]))
+            self.enter_pos.append(enter_pos)
+            if np.any(exit_k > 0):
+                self.exit_order.append(exit_order)
+                self.exit_pos.append(np.searchsorted(exit_sorted, kx,
+                                                     "right"))
+            else:
+                self.exit_order.append(None)
+                self.exit_pos.append(None)
+
+    def risk_set_sums(self, stx, values):
+        """
+        Sums of `values` over the risk set at each unique failure time.
+
+        Parameters
+        ----------
+        stx : int
+            The stratum.
+        values : ndarray
+            1d or 2d array with one row for each case of the stratum,
+            in the order of `exog_s[stx]`.
+
+        Returns
+        -------
+        sums : ndarray
+            The sums over the cases at risk, the first axis corresponds
+            to the unique failure times of the stratum.
+
+        Notes
+        -----
+        The cases are sorted by time, so that the cases that are at
+        risk at a failure time, apart from left truncation, are a tail
+        of the rows.  The sums are differences of reverse cumulative
+        sums, they cost O(n) operations for all failure times.
+        """
+        shape = (values.shape[0] + 1,) + values.shape[1:]
+        rcumsum = np.zeros(shape)
+        rcumsum[:-1] = np.cumsum(values[::-1], axis=0)[::-1]
+        sums = rcumsum[self.enter_pos[stx]]
+
+        exit_order = self.exit_order[stx]
+        if exit_order is not None:
+            rcumsum[:-1] = np.cumsum(values[exit_order[::-1]], axis=0)[::-1]
+            sums -= rcumsum[self.exit_pos[stx]]
+
+        return sums
+
 
+def _stratum_derivatives(surv, stx, params, ties, deriv):
+    """
+    Contribution of one stratum to the log partial likelihood (deriv=0),
+    its gradient (deriv=1) or its Hessian (deriv=2).
+    """
+    exog_s = surv.exog_s[stx]
+    linpred = np.dot(exog_s, params)
+    if surv.offset_s is not None:
+        linpred += surv.offset_s[stx]
+    linpred -= linpred.max()
+    e_linpred = np.exp(linpred)
+
+    fail_rows = surv.fail_rows[stx]
+    fail_starts = surv.fail_starts[stx]
+    n_fail = surv.n_fail[stx]
+    nuft = len(n_fail)
+
+    xp0 = surv.risk_set_sums(stx, e_linpred)
+    if ties == "efron":
+        # The failures at a time are removed one at a time from the
+        # risk set, frac is j / m for the j^th of m failures.
+        fail_k = np.repeat(np.arange(nuft), n_fail)
+        frac = (np.arange(len(fail_rows)) - fail_starts[fail_k]) / \
+            n_fail[fail_k].astype(np.float64)
+        xp0f = np.add.reduceat(e_linpred[fail_rows], fail_starts)
+        c0 = xp0[fail_k] - frac * xp0f[fail_k]
+
+    if deriv == 0:
+        if ties == "breslow":
+            return linpred[fail_rows].sum() - np.dot(n_fail, np.log(xp0))
+        return linpred[fail_rows].sum() - np.log(c0).sum()
+
+    elx = e_linpred[:, None] * exog_s
+    xp1 = surv.risk_set_sums(stx, elx)
+    if ties == "breslow":
+        # weight of the risk set sums at each failure time
+        w_risk = n_fail / xp0
+    else:
+        xp1f = np.add.reduceat(elx[fail_rows], fail_starts)
+        w_risk = np.bincount(fail_k, weights=1 / c0, minlength=nuft)
+        w_fail = np.bincount(fail_k, weights=frac / c0, minlength=nuft)
+
+    if deriv == 1:
+        grad = exog_s[fail_rows].sum(0) - np.dot(w_risk, xp1)
+        if ties == "efron":
+            grad += np.dot(w_fail, xp1f)
+        return grad
+
+    # The risk set sums of the outer products are not formed, instead
+    # each case is weighted by the sum of w_risk over the failure times
+    # at which it is at risk.
+    cw = np.r_[0, np.cumsum(w_risk)]
+    n_s = len(e_linpred)
+    case_wt = cw[np.searchsorted(surv.enter_pos[stx], np.arange(n_s),
+                                 "right")]
+    exit_order = surv.exit_order[stx]
+    if exit_order is not None:
+        ii = np.searchsorted(surv.exit_pos[stx], np.arange(n_s), "right")
+        case_wt[exit_order] -= cw[ii]
+    case_wt *= e_linpred
+    if ties == "efron":
+        case_wt[fail_rows] -= e_linpred[fail_rows] * w_fail[fail_k]
+    hess = np.dot(exog_s.T * case_wt, exog_s)
+
+    if ties == "breslow":
+        hess -= np.dot(xp1.T * (n_fail / xp0**2), xp1)
+    else:
+        q0 = np.bincount(fail_k, weights=1 / c0**2, minlength=nuft)
+        q1 = np.bincount(fail_k, weights=frac / c0**2, minlength=nuft)
+        q2 = np.bincount(fail_k, weights=frac**2 / c0**2, minlength=nuft)
+        hess -= np.dot(xp1.T * q0, xp1)
+        mat = np.dot(xp1.T * q1, xp1f)
+        hess += mat + mat.T
+        hess -= np.dot(xp1f.T * q2, xp1f)
+
+    return -hess
 
 
 class PHReg(model.LikelihoodModel):
@@ -287,6 +430,10 @@ class PHReg(model.LikelihoodModel):
         Array of offset values
     missing : string
         The method used to handle missing data
+    n_jobs : int
+        The number of threads that are used to process the strata in
+        the log partial likelihood and its derivatives, -1 uses all
+        cores.
 
     Notes
     -----
@@ -294,13 +441,18 @@ class PHReg(model.LikelihoodModel):
     explicit or implicit intercept.  The effect of an intercept is
     not identified using the partial likelihood approach.
 
+    The risk set sums of the partial likelihood are computed for all
+    failure times at once with cumulative sums over the cases sorted
+    by time.  The sort order is computed once when the model is
+    created.
+
     `endog`, `event`, `strata`, `entry`, and the first dimension
     of `exog` all must have the same length
     """
 
     def __init__(self, endog, exog, status=None, entry=None,
                  strata=None, offset=None, ties='breslow',
-                 missing='drop', **kwargs):
+                 missing='drop', n_jobs=1, **kwargs):
 
         # Default is no censoring
         if status is None:
@@ -341,6 +493,8 @@ class PHReg(model.LikelihoodModel):
                              "`breslow`")
 
         self.ties = ties
+        self.n_jobs = n_jobs
+        self._init_keys.append("n_jobs")
 
     @classmethod
     def from_formula(cls, formula, data, status=None, entry=None,
@@ -557,48 +711,47 @@ class PHReg(model.LikelihoodModel):
         else:
             return self.efron_hessian(params)
 
-    def breslow_loglike(self, params):
+    def _partial_likelihood(self, params, ties, deriv):
         """
-        Returns the value of the log partial likelihood function
-        evaluated at `params`, using the Breslow method to handle tied
-        times.
+        Sum of the stratum contributions to the log partial likelihood
+        or its derivatives, see `_stratum_derivatives`.
+
+        The strata are processed in `n_jobs` threads, the work within
+        a stratum is done by numpy functions that release the GIL.
         """
 
         surv = self.surv
+        params = np.asarray(params, dtype=np.float64)
+
+        def func(stx):
+            return _stratum_derivatives(surv, stx, params, ties, deriv)
+
+        n_jobs = self.n_jobs
+        if n_jobs < 0:
+            import multiprocessing
+            n_jobs = multiprocessing.cpu_count()
+        n_jobs = min(n_jobs, surv.nstrat)
+
+        if n_jobs > 1:
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(n_jobs)
+            try:
+                vals = pool.map(func, range(surv.nstrat))
+            finally:
+                pool.close()
+        else:
+            vals = [func(stx) for stx in range(surv.nstrat)]
 
-        like = 0.
-
-        # Loop over strata
-        for stx in range(surv.nstrat):
-
-            uft_ix = surv.ufailt_ix[stx]
-            exog_s = surv.exog_s[stx]
-            nuft = len(uft_ix)
-
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0 = 0.
-
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                xp0 += e_linpred[ix].sum()
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                like += (linpred[ix] - np.log(xp0)).sum()
+        return sum(vals)
 
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                xp0 -= e_linpred[ix].sum()
+    def breslow_loglike(self, params):
+        """
+        Returns the value of the log partial likelihood function
+        evaluated at `params`, using the Breslow method to handle tied
+        times.
+        """
 
-        return like
+        return self._partial_likelihood(params, "breslow", 0)
 
     def efron_loglike(self, params):
         """
@@ -607,46 +760,7 @@ class PHReg(model.LikelihoodModel):
         times.
         """
 
-        surv = self.surv
-
-        like = 0.
-
-        # Loop over strata
-        for stx in range(surv.nstrat):
-
-            # exog and linear predictor for this stratum
-            exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0 = 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                xp0 += e_linpred[ix].sum()
-                xp0f = e_linpred[uft_ix[i]].sum()
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                like += linpred[ix].sum()
-
-                m = len(ix)
-                J = np.arange(m, dtype=np.float64) / m
-                like -= np.log(xp0 - J*xp0f).sum()
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                xp0 -= e_linpred[ix].sum()
-
-        return like
+        return self._partial_likelihood(params, "efron", 0)
 
     def breslow_gradient(self, params):
         """
@@ -654,52 +768,7 @@ class PHReg(model.LikelihoodModel):
         Breslow method to handle tied times.
         """
 
-        surv = self.surv
-
-        grad = 0.
-
-        # Loop over strata
-        for stx in range(surv.nstrat):
-
-            # Indices of subjects in the stratum
-            strat_ix = surv.stratum_rows[stx]
-
-            # Unique failure times in the stratum
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-
-            # exog and linear predictor for the stratum
-            exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1 = 0., 0.
-
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 += e_linpred[ix].sum()
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                grad += (exog_s[ix,:] - xp1 / xp0).sum(0)
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 -= e_linpred[ix].sum()
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-
-        return grad
+        return self._partial_likelihood(params, "breslow", 1)
 
     def efron_gradient(self, params):
         """
@@ -707,62 +776,7 @@ class PHReg(model.LikelihoodModel):
         at `params`, using the Efron method to handle tied times.
         """
 
-        surv = self.surv
-
-        grad = 0.
-
-        # Loop over strata
-        for stx in range(surv.nstrat):
-
-            # Indices of cases in the stratum
-            strat_ix = surv.stratum_rows[stx]
-
-            # exog and linear predictor of the stratum
-            exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1 = 0., 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 += e_linpred[ix].sum()
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                ixf = uft_ix[i]
-                if len(ixf) > 0:
-                    v = exog_s[ixf,:]
-                    xp0f = e_linpred[ixf].sum()
-                    xp1f = (e_linpred[ixf][:,None] * v).sum(0)
-
-                    # Consider all cases that fail at this point.
-                    grad += v.sum(0)
-
-                    m = len(ixf)
-                    J = np.arange(m, dtype=np.float64) / m
-                    numer = xp1 - np.outer(J, xp1f)
-                    denom = xp0 - np.outer(J, xp0f)
-                    ratio = numer / denom
-                    rsum = ratio.sum(0)
-                    grad -= rsum
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 -= e_linpred[ix].sum()
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-
-        return grad
+        return self._partial_likelihood(params, "efron", 1)
 
     def breslow_hessian(self, params):
         """
@@ -770,51 +784,7 @@ class PHReg(model.LikelihoodModel):
         `params`, using the Breslow method to handle tied times.
         """
 
-        surv = self.surv
-
-        hess = 0.
-
-        # Loop over strata
-        for stx in range(surv.nstrat):
-
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-
-            exog_s = surv.exog_s[stx]
-
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1, xp2 = 0., 0., 0.
-
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    xp0 += e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 += np.einsum("ij,ik,i->jk", v, v, elx)
-
-                # Account for all cases that fail at this point.
-                m = len(uft_ix[i])
-                hess += m*(xp2 / xp0  - np.outer(xp1, xp1) / xp0**2)
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    xp0 -= e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 -= np.einsum("ij,ik,i->jk", v, v, elx)
-        return -hess
+        return self._partial_likelihood(params, "breslow", 2)
 
     def efron_hessian(self, params):
         """
@@ -823,64 +793,7 @@ class PHReg(model.LikelihoodModel):
         times.
         """
 
-        surv = self.surv
-
-        hess = 0.
-
-        # Loop over strata
-        for stx in range(surv.nstrat):
-
-            exog_s = surv.exog_s[stx]
-
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1, xp2 = 0., 0., 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    xp0 += e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 += np.einsum("ij,ik,i->jk", v, v, elx)
-
-                ixf = uft_ix[i]
-                if len(ixf) > 0:
-                    v = exog_s[ixf,:]
-                    xp0f = e_linpred[ixf].sum()
-                    xp1f = (e_linpred[ixf][:,None] * v).sum(0)
-                    elx = e_linpred[ixf]
-                    xp2f = np.einsum("ij,ik,i->jk", v, v, elx)
-
-                # Account for all cases that fail at this point.
-                m = len(uft_ix[i])
-                J = np.arange(m, dtype=np.float64) / m
-                c0 = xp0 - J*xp0f
-                hess += xp2 * np.sum(1 / c0)
-                hess -= xp2f * np.sum(J / c0)
-                mat = (xp1[None, :] - np.outer(J, xp1f)) / c0[:, None]
-                hess -= np.einsum("ij,ik->jk", mat, mat)
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    xp0 -= e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 -= np.einsum("ij,ik,i->jk", v, v, elx)
-
-        return -hess
+        return self._partial_likelihood(params, "efron", 2)
 
     def robust_covariance(self, params):
         """
@@ -412,6 +412,63 @@ class TestPHReg(object):
                 assert_equal(np.sign(llf_sm - llf_r), 1)
 
 
+def _direct_loglike(params, time, status, exog, entry, strata, offset,
+                    ties):
+    # the partial likelihood, summing over the risk set of each
+    # failure time directly
+    lp = np.dot(exog, params) + offset
+    llf = 0.
+    for t, st in set(zip(time[status == 1], strata[status == 1])):
+        risk = (time >= t) & (entry <= t) & (strata == st)
+        fail = (time == t) & (status == 1) & (strata == st)
+        m = fail.sum()
+        s0 = np.exp(lp[risk]).sum()
+        llf += lp[fail].sum()
+        if ties == "breslow":
+            llf -= m * np.log(s0)
+        else:
+            s0f = np.exp(lp[fail]).sum()
+            llf -= np.log(s0 - np.arange(m) / float(m) * s0f).sum()
+    return llf
+
+
+def test_derivatives():
+    from statsmodels.tools.numdiff import approx_fprime
+
+    np.random.seed(8234)
+    n = 300
+    # rounded times give many ties
+    time = np.round(10 * np.random.uniform(size=n))
+    status = np.random.randint(0, 2, n).astype(np.float64)
+    entry = np.round(time * np.random.uniform(size=n) *
+                     (np.random.uniform(size=n) < 0.3))
+    strata = np.random.randint(0, 4, n)
+    offset = np.random.normal(scale=0.2, size=n)
+    exog = np.random.normal(size=(n, 3))
+    params = np.r_[0.2, -0.3, 0.1]
+
+    for ties in "breslow", "efron":
+        mod = PHReg(time, exog, status, entry=entry, strata=strata,
+                    offset=offset, ties=ties)
+        llf = _direct_loglike(params, time, status, exog, entry, strata,
+                              offset, ties)
+        assert_allclose(mod.loglike(params), llf, rtol=1e-10)
+        assert_allclose(mod.score(params),
+                        approx_fprime(params, mod.loglike, centered=True),
+                        rtol=1e-6, atol=1e-6)
+        assert_allclose(mod.hessian(params),
+                        approx_fprime(params, mod.score, centered=True),
+                        rtol=1e-6, atol=1e-6)
+
+        # strata processed in threads
+        mod2 = PHReg(time, exog, status, entry=entry, strata=strata,
+                     offset=offset, ties=ties, n_jobs=2)
+        assert_allclose(mod2.loglike(params), mod.loglike(params),
+                        rtol=1e-12)
+        assert_allclose(mod2.hessian(params), mod.hessian(params),
+                        rtol=1e-12)
+
+
 if  __name__=="__main__":
 
     import nose
@@ -0,0 +1,81 @@
+"""Wall time of Newton fits of MNLogit and NegativeBinomial
+
+For each model the time of one evaluation of the analytic Hessian and of
+the numerical Hessian of the log-likelihood is reported, together with
+the time and the number of iterations of a Newton fit that uses the
+analytic Hessian.  Both models have more than 100 parameters.
+
+usage: python ex_discrete_hessian_benchmark.py [nobs]
+
+The default is a moderately sized problem, the large case in the
+benchmarks uses nobs=10**6.  The numerical Hessian is only evaluated for
+nobs <= 10**5, it needs O(k**2) evaluations of the log-likelihood.
+"""
+from __future__ import print_function
+import sys
+import time
+
+import numpy as np
+from statsmodels.discrete.discrete_model import MNLogit, NegativeBinomial
+from statsmodels.tools.numdiff import approx_hess
+
+
+def _time(func, *args):
+    t0 = time.time()
+    func(*args)
+    return time.time() - t0
+
+
+def _gen_data(nobs, k_vars, seed=0):
+    np.random.seed(seed)
+    exog = np.random.randn(nobs, k_vars) / np.sqrt(k_vars)
+    exog[:, 0] = 1
+    return exog
+
+
+def _report(name, mod, params, nobs, fit_kwds):
+    t_analytic = _time(mod.hessian, params)
+    if nobs <= 10**5:
+        t_numeric = '%10.3f' % _time(approx_hess, params, mod.loglike)
+    else:
+        t_numeric = '%10s' % '-'
+    t0 = time.time()
+    res = mod.fit(method='newton', disp=0, **fit_kwds)
+    t_fit = time.time() - t0
+    print('%-18s %8d %10.3f %s %10.3f %6d' % (name, len(params), t_analytic,
+                                              t_numeric, t_fit,
+                                              res.mle_retvals['iterations']))
+
+
+if __name__ == '__main__':
+    nobs = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+
+    print('nobs = %d' % nobs)
+    print('%-18s %8s %10s %10s %10s %6s' % ('model', 'k_params',
+                                            'hess (s)', 'numdiff (s)',
+                                            'fit (s)', 'iter'))
+
+    # MNLogit with 5 outcomes and 26 variables, 104 parameters
+    exog = _gen_data(nobs, 26)
+    params = np.random.uniform(-1, 1, size=(26, 4))
+    linpred = np.column_stack((np.zeros(nobs), np.dot(exog, params)))
+    prob = np.exp(linpred)
+    prob /= prob.sum(1)[:, None]
+    endog = (np.random.rand(nobs)[:, None] > prob.cumsum(1)).sum(1)
+    mod = MNLogit(endog, exog)
+    _report('MNLogit', mod, params.ravel(order='F'), nobs, {})
+
+    # NegativeBinomial with 101 variables and the dispersion parameter
+    exog = _gen_data(nobs, 101)
+    mu = np.exp(0.5 + 0.5 * exog[:, 1:].sum(1) / 3)
+    endog = np.random.negative_binomial(2, 2 / (2 + mu))
+    for method in ['nb2', 'nb1', 'geometric']:
+        mod = NegativeBinomial(endog, exog, loglike_method=method)
+        start_params = np.r_[np.log(endog.mean() + 0.5), np.zeros(100)]
+        params = start_params + 0.01
+        if method != 'geometric':
+            start_params = np.r_[start_params, 0.5]
+            params = np.r_[params, 0.5]
+        mod._transparams = False
+        _report('NegBin ' + method, mod, params, nobs,
+                {'start_params': start_params, 'maxiter': 100})
@@ -0,0 +1,56 @@
+"""Wall time and peak memory of GLM IRLS for the two WLS methods
+
+Each case is run in a separate process and the peak resident set size of
+that process is reported.  The memory of the data arrays themselves is
+reported as baseline.
+
+usage: python ex_glm_irls_benchmark.py [nobs] [k_vars]
+
+The default is a moderately sized problem, the large case in the
+benchmarks uses nobs=10**7.  "pinv" creates a new WLS model with the
+nobs x k pseudoinverse in each iteration, "cholesky" reuses preallocated
+nobs sized arrays and only factorizes the k x k cross-product.
+"""
+from __future__ import print_function
+import sys
+import subprocess
+
+code = """
+import resource, time
+import numpy as np
+import statsmodels.api as sm
+nobs, k_vars, family, wls_method = %d, %d, %r, %r
+np.random.seed(0)
+exog = np.random.randn(nobs, k_vars) / np.sqrt(k_vars)
+exog[:, 0] = 1
+linpred = 0.5 * exog.sum(1)
+if family == 'Poisson':
+    endog = np.random.poisson(np.exp(linpred))
+else:
+    endog = (np.random.rand(nobs) < 1 / (1 + np.exp(-linpred))) * 1.
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.time()
+if wls_method != 'data':
+    mod = sm.GLM(endog, exog, family=getattr(sm.families, family)())
+    res = mod.fit(wls_method=wls_method)
+    res.bse
+t1 = time.time()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(rss0 / 1024., rss1 / 1024., t1 - t0)
+"""
+
+if __name__ == '__main__':
+    nobs = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    k_vars = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    print('nobs = %d, k_vars = %d' % (nobs, k_vars))
+    print('%-10s %-10s %14s %14s %10s' % ('family', 'method', 'data (MB)',
+                                          'peak (MB)', 'time (s)'))
+    for family in ['Poisson', 'Binomial']:
+        for wls_method in ['data', 'pinv', 'cholesky']:
+            out = subprocess.check_output(
+                [sys.executable, '-c',
+                 code % (nobs, k_vars, family, wls_method)])
+            rss0, rss1, seconds = map(float, out.split())
+            print('%-10s %-10s %14.1f %14.1f %10.3f' % (family, wls_method,
+                                                       rss0, rss1, seconds))
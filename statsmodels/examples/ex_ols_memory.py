@@ -0,0 +1,47 @@
+"""Peak memory of OLS.fit for the different solver methods
+
+Each method is run in a separate process and the peak resident set size of
+that process is reported.  The memory of the data arrays themselves is
+reported as baseline.
+
+usage: python ex_ols_memory.py [nobs] [k_vars]
+
+The default is a moderately sized problem.  For nobs=10**7 and k_vars=50
+the data alone uses 4GB, and the "pinv" and "qr" methods need more than
+three times that amount.
+"""
+from __future__ import print_function
+import sys
+import subprocess
+
+code = """
+import resource, time
+import numpy as np
+from statsmodels.regression.linear_model import OLS
+nobs, k_vars, method = %d, %d, %r
+np.random.seed(0)
+exog = np.random.randn(nobs, k_vars)
+exog[:, 0] = 1
+endog = exog.sum(1) + np.random.randn(nobs)
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.time()
+if method != 'data':
+    res = OLS(endog, exog).fit(method=method, cov_type='HC1')
+    res.bse
+t1 = time.time()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(rss0 / 1024., rss1 / 1024., t1 - t0)
+"""
+
+if __name__ == '__main__':
+    nobs = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+    k_vars = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    print('nobs = %d, k_vars = %d' % (nobs, k_vars))
+    print('%-10s %14s %14s %10s' % ('method', 'data (MB)', 'peak (MB)',
+                                    'time (s)'))
+    for method in ['data', 'pinv', 'qr', 'cholesky']:
+        out = subprocess.check_output([sys.executable, '-c',
+                                       code % (nobs, k_vars, method)])
+        rss0, rss1, seconds = map(float, out.split())
+        print('%-10s %14.1f %14.1f %10.3f' % (method, rss0, rss1, seconds))
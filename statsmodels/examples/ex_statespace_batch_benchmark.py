@@ -0,0 +1,46 @@
+"""Wall time of the loglikelihood of many independent ARMA series
+
+The loglikelihood of `n_series` ARMA(1, 1) series is evaluated once with a
+`SARIMAX` model for each series and once with a `BatchModel`, which runs
+the Kalman filter of all series in a single call. The models are created
+before the timing starts, so that only the loglikelihood evaluations are
+compared.
+
+usage: python ex_statespace_batch_benchmark.py [n_series] [nobs]
+
+The default is 1000 series with 200 periods.
+"""
+from __future__ import print_function
+import sys
+import time
+
+import numpy as np
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.batch import BatchModel
+
+
+if __name__ == '__main__':
+    n_series = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    nobs = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    np.random.seed(0)
+    eps = np.random.normal(size=(nobs + 1, n_series))
+    endog = np.zeros((nobs, n_series))
+    phi = np.random.uniform(-0.8, 0.8, size=n_series)
+    for t in range(1, nobs):
+        endog[t] = phi * endog[t - 1] + eps[t + 1] + 0.3 * eps[t]
+    params = np.column_stack([phi, 0.3 * np.ones(n_series),
+                              np.ones(n_series)])
+
+    print('n_series = %d, nobs = %d' % (n_series, nobs))
+    models = [SARIMAX(endog[:, s], order=(1, 0, 1)) for s in range(n_series)]
+    batch = BatchModel(SARIMAX, endog, order=(1, 0, 1))
+
+    t0 = time.time()
+    llf1 = np.array([mod.loglike(params[s]) for s, mod in enumerate(models)])
+    print('%-14s %10.3f' % ('models', time.time() - t0))
+
+    t0 = time.time()
+    llf2 = batch.loglike(params)
+    print('%-14s %10.3f' % ('batch', time.time() - t0))
+    print('max abs. difference of llf: %g' % np.max(np.abs(llf1 - llf2)))
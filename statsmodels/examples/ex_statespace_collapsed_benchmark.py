@@ -0,0 +1,58 @@
+"""Wall time of the Kalman filter of a large dynamic factor model
+
+The log-likelihood of a dynamic factor model with many observed series
+and a few factors is evaluated with the conventional, the univariate and
+the collapsed Kalman filter.  The collapsed filter projects the
+observations onto the factors in each period, so that the filter
+recursions have the dimension of the factors instead of the number of
+series.  With a VAR(2) for the factors only the current factors enter the
+observation equation and the observations are collapsed to dimension
+`k_factors`.
+
+usage: python ex_statespace_collapsed_benchmark.py [k_endog] [nobs]
+
+The default is 200 series and 200 periods.
+"""
+from __future__ import print_function
+import sys
+import time
+
+import numpy as np
+from statsmodels.tsa.statespace.dynamic_factor import DynamicFactor
+
+
+def _gen_data(nobs, k_endog, k_factors, seed=0):
+    np.random.seed(seed)
+    factors = np.zeros((nobs + 2, k_factors))
+    for t in range(2, nobs + 2):
+        factors[t] = (0.5 * factors[t - 1] + 0.2 * factors[t - 2] +
+                      np.random.normal(size=k_factors))
+    loadings = np.random.uniform(0.5, 1.5, size=(k_endog, k_factors))
+    endog = (np.dot(factors[2:], loadings.T) +
+             np.random.normal(scale=0.5, size=(nobs, k_endog)))
+    return endog, loadings
+
+
+if __name__ == '__main__':
+    k_endog = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    nobs = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    k_factors = 2
+
+    endog, loadings = _gen_data(nobs, k_endog, k_factors)
+    transition = np.c_[0.5 * np.eye(k_factors), 0.2 * np.eye(k_factors)]
+    params = np.r_[loadings.ravel(), 0.25 * np.ones(k_endog),
+                   transition.ravel()]
+
+    print('k_endog = %d, nobs = %d, k_factors = %d' % (k_endog, nobs,
+                                                       k_factors))
+    print('%-14s %10s %16s' % ('filter', 'time (s)', 'llf'))
+    for name, kwds in [('conventional', {}),
+                       ('univariate', {'filter_univariate': True}),
+                       ('collapsed', {'filter_collapsed': True})]:
+        mod = DynamicFactor(endog, k_factors=k_factors, factor_order=2,
+                            **kwds)
+        # the first evaluation allocates the filter arrays
+        mod.loglike(params)
+        t0 = time.time()
+        llf = mod.loglike(params)
+        print('%-14s %10.3f %16.4f' % (name, time.time() - t0, llf))
@@ -16,6 +16,40 @@ http://www.stata.com/manuals13/xtxtgee.pdf
 """
 
 
+def _cluster_resid(model, scale=1.):
+    """
+    Returns the Pearson residuals of all clusters of a GEE model,
+    concatenated in the order of the clusters.
+
+    Parameters
+    ----------
+    model : GEE class
+        The model with up to date `cached_means`.
+    scale : float
+        The scale parameter used to standardize the residuals.
+
+    Returns
+    -------
+    resid : ndarray
+        The concatenated residuals.
+    group : ndarray
+        The cluster index of each residual.
+    """
+
+    cached_means = model.cached_means
+    if hasattr(cached_means, "expval"):
+        order = model._cluster_order
+        endog = model.endog[order]
+        expval = cached_means.expval[order]
+    else:
+        endog = np.concatenate(model.endog_li)
+        expval = np.concatenate([x[0] for x in cached_means])
+    resid = endog - expval
+    resid /= np.sqrt(scale * model.family.variance(expval))
+    group = np.repeat(np.arange(model.num_group), model._cluster_sizes)
+    return resid, group
+
+
 class CovStruct(object):
     """
     A base class for correlation and covariance structures of grouped
@@ -180,6 +214,39 @@ class CovStruct(object):
         raise NotImplementedError
 
 
+_batch_solve_doc = """
+        Solves the matrix equations `covmat * soln = rhs` for a
+        stack of clusters of the same size.
+
+        Parameters
+        ----------
+        expval: array-like
+           The expected values of endog, a 2d array with one row per
+           cluster.
+        index: array-like
+           The group indices of the clusters.
+        stdev : array-like
+            The standard deviations of endog, with the same shape as
+            `expval`.
+        rhs : list/tuple of array-like
+            A set of right-hand sides, each is a 2d array with the
+            shape of `expval` or a 3d array with one column matrix
+            for each cluster in the last two axes.
+
+        Returns
+        -------
+        soln : list/tuple of array-like
+            The solutions to the matrix equations.
+
+        Notes
+        -----
+        Dependence structures that implement this method are used by
+        GEE to process all clusters of the same size together.  The
+        results agree with calling `covariance_matrix_solve` for each
+        cluster.
+        """
+
+
 class Independence(CovStruct):
     """
     An independence working dependence structure.
@@ -203,9 +270,20 @@ class Independence(CovStruct):
                 rslt.append(x / v[:, None])
         return rslt
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        v = stdev ** 2
+        rslt = []
+        for x in rhs:
+            if x.ndim == 2:
+                rslt.append(x / v)
+            else:
+                rslt.append(x / v[:, :, None])
+        return rslt
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = _batch_solve_doc
 
     def summary(self):
         return ("Observations within a cluster are modeled "
@@ -226,34 +304,27 @@ class Exchangeable(CovStruct):
 
     def update(self, params):
 
-        endog = self.model.endog_li
-
         nobs = self.model.nobs
+        num_group = self.model.num_group
+        ngrp = self.model._cluster_sizes
 
-        varfunc = self.model.family.variance
-
-        cached_means = self.model.cached_means
-
-        has_weights = self.model.weights is not None
-        weights_li = self.model.weights
+        if self.model.weights is not None:
+            f = self.model.weights_li
+        else:
+            f = np.ones(num_group)
 
-        residsq_sum, scale = 0, 0
-        fsum1, fsum2, n_pairs = 0., 0., 0.
-        for i in range(self.model.num_group):
-            expval, _ = cached_means[i]
-            stdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - expval) / stdev
-            f = weights_li[i] if has_weights else 1.
+        # Sums over the residuals within each cluster
+        resid, group = _cluster_resid(self.model)
+        ssr = np.bincount(group, resid * resid, minlength=num_group)
+        rsum = np.bincount(group, resid, minlength=num_group)
 
-            ssr = np.sum(resid * resid)
-            scale += f * ssr
-            fsum1 += f * len(endog[i])
+        scale = np.dot(f, ssr)
+        fsum1 = np.dot(f, ngrp)
 
-            residsq_sum += f * (resid.sum() ** 2 - ssr) / 2
-            ngrp = len(resid)
-            npr = 0.5 * ngrp * (ngrp - 1)
-            fsum2 += f * npr
-            n_pairs += npr
+        residsq_sum = np.dot(f, rsum ** 2 - ssr) / 2
+        npr = 0.5 * ngrp * (ngrp - 1)
+        fsum2 = np.dot(f, npr)
+        n_pairs = npr.sum()
 
         ddof = self.model.ddof_scale
         scale /= (fsum1 * (nobs - ddof) / float(nobs))
@@ -289,9 +360,32 @@ class Exchangeable(CovStruct):
 
         return rslt
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        c = self.dep_params / (1. - self.dep_params)
+        c /= 1. + self.dep_params * (k - 1)
+
+        rslt = []
+        for x in rhs:
+            if x.ndim == 2:
+                x1 = x / stdev
+                y = x1 / (1. - self.dep_params)
+                y -= c * x1.sum(1)[:, None]
+                y /= stdev
+            else:
+                x1 = x / stdev[:, :, None]
+                y = x1 / (1. - self.dep_params)
+                y -= c * x1.sum(1)[:, None, :]
+                y /= stdev[:, :, None]
+            rslt.append(y)
+
+        return rslt
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = _batch_solve_doc
 
     def summary(self):
         return ("The correlation between two observations in the " +
@@ -670,12 +764,14 @@ class Autoregressive(CovStruct):
         super(Autoregressive, self).__init__()
 
         # The function for determining distances based on time
+        self._default_dist = dist_func is None
         if dist_func is None:
             self.dist_func = lambda x, y: np.abs(x - y).sum()
         else:
             self.dist_func = dist_func
 
         self.designx = None
+        self._pairs = None
 
         # The autocorrelation parameter
         self.dep_params = 0.
@@ -687,32 +783,37 @@ class Autoregressive(CovStruct):
                           "cov_struct, using unweighted covariance estimate",
                           NotImplementedWarning)
 
-        endog = self.model.endog_li
-        time = self.model.time_li
-
         # Only need to compute this once
+        if self._pairs is None:
+            # Positions of the pairs of observations within a cluster
+            # in the concatenated cluster data
+            sizes = self.model._cluster_sizes
+            starts = np.cumsum(sizes) - sizes
+            pair1, pair2 = [np.zeros(0, dtype=np.int64)], \
+                [np.zeros(0, dtype=np.int64)]
+            for size in np.unique(sizes[sizes > 1]):
+                base = starts[sizes == size][:, None]
+                j1, j2 = np.tril_indices(size, -1)
+                pair1.append((base + j1).ravel())
+                pair2.append((base + j2).ravel())
+            pair1, pair2 = np.concatenate(pair1), np.concatenate(pair2)
+            # Same order as looping over the clusters and pairs
+            ii = np.lexsort((pair2, pair1))
+            self._pairs = (pair1[ii], pair2[ii])
+
         if self.designx is not None:
             designx = self.designx
         else:
-            designx = []
-            for i in range(self.model.num_group):
-
-                ngrp = len(endog[i])
-                if ngrp == 0:
-                    continue
-
-                # Loop over pairs of observations within a cluster
-                for j1 in range(ngrp):
-                    for j2 in range(j1):
-                        designx.append(self.dist_func(time[i][j1, :],
-                                                      time[i][j2, :]))
-
-            designx = np.array(designx)
+            time = np.concatenate(self.model.time_li)
+            time1, time2 = time[self._pairs[0]], time[self._pairs[1]]
+            if self._default_dist:
+                designx = np.abs(time1 - time2).sum(1)
+            else:
+                designx = np.array([self.dist_func(t1, t2) for t1, t2
+                                    in zip(time1, time2)])
             self.designx = designx
 
         scale = self.model.estimate_scale()
-        varfunc = self.model.family.variance
-        cached_means = self.model.cached_means
 
         # Weights
         var = 1. - self.dep_params ** (2 * designx)
@@ -720,19 +821,9 @@ class Autoregressive(CovStruct):
         wts = 1. / var
         wts /= wts.sum()
 
-        residmat = []
-        for i in range(self.model.num_group):
-
-            expval, _ = cached_means[i]
-            stdev = np.sqrt(scale * varfunc(expval))
-            resid = (endog[i] - expval) / stdev
-
-            ngrp = len(resid)
-            for j1 in range(ngrp):
-                for j2 in range(j1):
-                    residmat.append([resid[j1], resid[j2]])
-
-        residmat = np.array(residmat)
+        resid, _ = _cluster_resid(self.model, scale)
+        residmat = np.column_stack((resid[self._pairs[0]],
+                                    resid[self._pairs[1]]))
 
         # Need to minimize this
         def fitfunc(a):
@@ -830,9 +921,65 @@ class Autoregressive(CovStruct):
 
         return soln
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        # Same as covariance_matrix_solve, with the clusters stacked in
+        # the first axis.
+
+        k = expval.shape[1]
+        soln = []
+
+        if k == 1:
+            for x in rhs:
+                if x.ndim == 2:
+                    soln.append(x / stdev ** 2)
+                else:
+                    soln.append(x / stdev[:, :, None] ** 2)
+            return soln
+
+        if k == 2:
+            mat = np.array([[1, -self.dep_params], [-self.dep_params, 1]])
+            mat /= (1. - self.dep_params ** 2)
+            for x in rhs:
+                flatten = False
+                if x.ndim == 2:
+                    x = x[:, :, None]
+                    flatten = True
+                x1 = x / stdev[:, :, None]
+                x1 = np.einsum("ij,gjp->gip", mat, x1)
+                x1 /= stdev[:, :, None]
+                if flatten:
+                    x1 = x1[:, :, 0]
+                soln.append(x1)
+            return soln
+
+        c0 = (1. + self.dep_params ** 2) / (1. - self.dep_params ** 2)
+        c1 = 1. / (1. - self.dep_params ** 2)
+        c2 = -self.dep_params / (1. - self.dep_params ** 2)
+        for x in rhs:
+            flatten = False
+            if x.ndim == 2:
+                x = x[:, :, None]
+                flatten = True
+
+            y = c0 * x
+            y[:, :-1, :] += c2 * x[:, 1:, :]
+            y[:, 1:, :] += c2 * x[:, :-1, :]
+            y[:, 0, :] = c1 * x[:, 0, :] + c2 * x[:, 1, :]
+            y[:, -1, :] = c1 * x[:, -1, :] + c2 * x[:, -2, :]
+
+            y /= stdev[:, :, None]
+
+            if flatten:
+                y = y[:, :, 0]
+
+            soln.append(y)
+
+        return soln
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = _batch_solve_doc
 
     def summary(self):
 
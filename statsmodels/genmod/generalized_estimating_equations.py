@@ -446,6 +446,36 @@ _gee_nominal_example = """
 """
 
 
+class _ClusterMeans(object):
+    """
+    Sequence of the tuples `(expval, lpr)` of the clusters.
+
+    The means and linear predictors are stored for all observations
+    and split into clusters when a cluster is accessed.
+
+    Parameters
+    ----------
+    expval : ndarray
+        The mean of all observations.
+    lpr : ndarray
+        The linear predictor of all observations.
+    rows : list
+        The row indices of the observations of each cluster.
+    """
+
+    def __init__(self, expval, lpr, rows):
+        self.expval = expval
+        self.lpr = lpr
+        self._rows = rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        rows = self._rows[i]
+        return self.expval[rows], self.lpr[rows]
+
+
 class GEE(base.Model):
 
     __doc__ = (
@@ -552,6 +582,12 @@ class GEE(base.Model):
         dk = [(lb, np.asarray(gb[k])) for k, lb in enumerate(group_labels)]
         self.group_indices = dict(dk)
         self.group_labels = group_labels
+        self._group_ix = ix
+
+        # Cluster sizes, and the row indices of the data sorted by
+        # cluster in the order of the cluster lists.
+        self._cluster_sizes = np.bincount(ix)
+        self._cluster_order = np.argsort(ix, kind="mergesort")
 
         # Convert the data to the internal representation, which is a
         # list of arrays, corresponding to the groups.
@@ -602,6 +638,37 @@ class GEE(base.Model):
         if maxgroup == 1:
             self.update_dep = False
 
+        # Clusters of the same size are stacked into 3d arrays if the
+        # dependence structure can solve for all of them at once.
+        self._batched = (
+            hasattr(self.cov_struct, "covariance_matrix_solve_batch") and
+            self.constraint is None and
+            not isinstance(self.family, _Multinomial))
+        if self._batched:
+            self._size_buckets = self._bucket_clusters()
+            self._cluster_rows = [self.group_indices[k]
+                                  for k in self.group_labels]
+
+    def _bucket_clusters(self):
+        """
+        Returns a list of tuples `(index, rows)` for each distinct
+        cluster size, where `index` contains the indices of the
+        clusters with that size, and the i^th row of the 2d array
+        `rows` contains the row indices in the data of cluster
+        `index[i]`, in the order used by `cluster_list`.
+        """
+
+        order = self._cluster_order
+        sizes = self._cluster_sizes
+        starts = np.cumsum(sizes) - sizes
+
+        buckets = []
+        for size in np.unique(sizes):
+            index = np.flatnonzero(sizes == size)
+            rows = order[starts[index][:, None] + np.arange(size)]
+            buckets.append((index, rows))
+        return buckets
+
     # Override to allow groups and time to be passed as variable
     # names.
     @classmethod
@@ -714,6 +781,18 @@ class GEE(base.Model):
         nobs = self.nobs
         varfunc = self.family.variance
 
+        if self._batched:
+            expval = cached_means.expval
+            resid = (self.endog - expval) / np.sqrt(varfunc(expval))
+            if self.weights is not None:
+                f = self.weights_li[self._group_ix]
+                scale = np.dot(f, resid ** 2)
+                fsum = f.sum()
+            else:
+                scale = np.dot(resid, resid)
+                fsum = float(nobs)
+            return scale / (fsum * (nobs - self.ddof_scale) / float(nobs))
+
         scale = 0.
         fsum = 0.
         for i in range(self.num_group):
@@ -802,6 +881,15 @@ class GEE(base.Model):
             incorporate the scale.
         """
 
+        if self._batched:
+            bmat, score, _ = self._sum_batched()
+            if bmat is None:
+                return None, None
+            update = np.linalg.solve(bmat, score)
+            self._fit_history["cov_adjust"].append(
+                self.cov_struct.cov_adjust)
+            return update, score
+
         endog = self.endog_li
         exog = self.exog_li
 
@@ -843,6 +931,16 @@ class GEE(base.Model):
         keep the cached means up to date.
         """
 
+        if self._batched:
+            # The clusters are extracted with 2d row indices, which
+            # requires arrays (the offset may be a Series)
+            lpr = np.dot(self.exog, mean_params)
+            if self._offset_exposure is not None:
+                lpr += np.asarray(self._offset_exposure)
+            expval = self.family.link.inverse(lpr)
+            self.cached_means = _ClusterMeans(expval, lpr, self._cluster_rows)
+            return
+
         endog = self.endog_li
         exog = self.exog_li
         offset = self.offset_li
@@ -883,6 +981,12 @@ class GEE(base.Model):
            obtaining score test results.
         """
 
+        if self._batched:
+            bmat, _, cmat = self._sum_batched()
+            if bmat is None:
+                return None, None, None
+            return self._cov_from_sums(bmat, cmat)
+
         endog = self.endog_li
         exog = self.exog_li
         varfunc = self.family.variance
@@ -910,6 +1014,14 @@ class GEE(base.Model):
             dvinv_resid = f * np.dot(dmat.T, vinv_resid)
             cmat += np.outer(dvinv_resid, dvinv_resid)
 
+        return self._cov_from_sums(bmat, cmat)
+
+    def _cov_from_sums(self, bmat, cmat):
+        """
+        Returns the robust and naive covariance matrices and `cmat`
+        from the summed bread and center matrices of the sandwich.
+        """
+
         scale = self.estimate_scale()
 
         bmati = np.linalg.inv(bmat)
@@ -920,6 +1032,64 @@ class GEE(base.Model):
         cov_robust *= self.scaling_factor
         return cov_robust, cov_naive, cmat
 
+    def _sum_batched(self):
+        """
+        Sums over the clusters for the estimating equations, processing
+        all clusters of the same size together.
+
+        Returns
+        -------
+        bmat : ndarray
+            The sum of D' V^-1 D over the clusters.
+        score : ndarray
+            The sum of D' V^-1 r over the clusters.
+        cmat : ndarray
+            The sum of the outer products of D' V^-1 r over the
+            clusters.
+
+        All three are None if the covariance solve fails.
+
+        Notes
+        -----
+        D is the derivative of the cluster mean with respect to the
+        parameters, V is the working covariance matrix and r is the
+        residual vector of the cluster.  Weighted clusters contribute
+        with weight f to bmat and score and with weight f^2 to cmat.
+        """
+
+        varfunc = self.family.variance
+        inverse_deriv = self.family.link.inverse_deriv
+        expval_all = self.cached_means.expval
+        lpr_all = self.cached_means.lpr
+        k = self.exog.shape[1]
+
+        bmat, score, cmat = 0, 0, 0
+        for index, rows in self._size_buckets:
+
+            expval = expval_all[rows]
+            resid = self.endog[rows] - expval
+            dmat = self.exog[rows] * inverse_deriv(lpr_all[rows])[:, :, None]
+            sdev = np.sqrt(varfunc(expval))
+
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (dmat, resid))
+            if rslt is None:
+                return None, None, None
+            vinv_d, vinv_resid = tuple(rslt)
+
+            if self.weights is not None:
+                f = self.weights_li[index]
+            else:
+                f = np.ones(len(index))
+
+            fdmat = (dmat * f[:, None, None]).reshape(-1, k)
+            bmat += np.dot(fdmat.T, vinv_d.reshape(-1, k))
+            dvinv_resid = f[:, None] * (dmat * vinv_resid[:, :, None]).sum(1)
+            score += dvinv_resid.sum(0)
+            cmat += np.dot(dvinv_resid.T, dvinv_resid)
+
+        return bmat, score, cmat
+
     # Calculate the bias-corrected sandwich estimate of Mancl and
     # DeRouen.
     def _bc_covmat(self, cov_naive):
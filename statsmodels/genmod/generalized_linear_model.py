@@ -19,6 +19,8 @@ McCullagh, P. and Nelder, J.A.  1989.  "Generalized Linear Models." 2nd ed.
 """
 
 import numpy as np
+from scipy import sparse
+from scipy.linalg import cho_factor, cho_solve
 from . import families
 from statsmodels.tools.decorators import cache_readonly, resettable_cache
 
@@ -26,6 +28,7 @@ import statsmodels.base.model as base
 import statsmodels.regression.linear_model as lm
 import statsmodels.base.wrapper as wrap
 from statsmodels.compat.numpy import np_matrix_rank
+from statsmodels.base.data import _sparse_rank
 
 from statsmodels.graphics._regressionplots_doc import (
     _plot_added_variable_doc,
@@ -46,6 +49,38 @@ def _check_convergence(criterion, iteration, atol, rtol):
                        atol=atol, rtol=rtol)
 
 
+def _solve_wls_normal(exog, weights, wendog, max_cond=1e6):
+    """
+    Solve the weighted normal equations ``X'WX params = X'W z``
+
+    `wendog` is ``weights * z``.  The Cholesky factorization of the k x k
+    cross-product is used.
+
+    Returns
+    -------
+    params : ndarray or None
+    normalized_cov_params : ndarray or None
+        The inverse of ``X'WX``.
+        Both are None if the condition number of ``X'WX`` after scaling to
+        unit diagonal is larger than `max_cond`, or if ``X'WX`` is singular.
+        In this case the normal equations are not accurate enough.
+    """
+    xtwx = lm._cross_product(exog, weights)
+    diag = np.diag(xtwx)
+    if (diag <= 0).any():
+        return None, None
+    scale = 1. / np.sqrt(diag)
+    eigvals = np.linalg.eigvalsh(xtwx * np.outer(scale, scale))
+    if eigvals[0] <= 0 or eigvals[-1] > max_cond * eigvals[0]:
+        return None, None
+    try:
+        cho = cho_factor(xtwx)
+    except np.linalg.LinAlgError:
+        return None, None
+    xtwz = exog.T.dot(wendog)
+    return cho_solve(cho, xtwz), cho_solve(cho, np.eye(xtwx.shape[0]))
+
+
 class GLM(base.LikelihoodModel):
     __doc__ = """
     Generalized Linear Models class
@@ -291,11 +326,18 @@ class GLM(base.LikelihoodModel):
                         'params' : [np.inf],
                         'deviance' : [np.inf]}
 
-        self.pinv_wexog = np.linalg.pinv(self.exog)
-        self.normalized_cov_params = np.dot(self.pinv_wexog,
-                                            np.transpose(self.pinv_wexog))
+        if sparse.issparse(self.exog):
+            # avoid the dense nobs x k pseudoinverse
+            self.pinv_wexog = None
+            self.normalized_cov_params = np.linalg.pinv(
+                lm._cross_product(self.exog))
+            self.df_model = _sparse_rank(self.exog) - 1
+        else:
+            self.pinv_wexog = np.linalg.pinv(self.exog)
+            self.normalized_cov_params = np.dot(self.pinv_wexog,
+                                                np.transpose(self.pinv_wexog))
 
-        self.df_model = np_matrix_rank(self.exog) - 1
+            self.df_model = np_matrix_rank(self.exog) - 1
 
 
         if (self.freq_weights is not None) and \
@@ -359,7 +401,7 @@ class GLM(base.LikelihoodModel):
         """
         Evaluate the log-likelihood for a generalized linear model.
         """
-        lin_pred = np.dot(self.exog, params) + self._offset_exposure
+        lin_pred = self.exog.dot(params) + self._offset_exposure
         expval = self.family.link.inverse(lin_pred)
         if scale is None:
             scale = self.estimate_scale(expval)
@@ -388,6 +430,8 @@ class GLM(base.LikelihoodModel):
         """
 
         score_factor = self.score_factor(params, scale=scale)
+        if sparse.issparse(self.exog):
+            return sparse.diags(score_factor).dot(self.exog)
         return score_factor[:, None] * self.exog
 
 
@@ -410,6 +454,9 @@ class GLM(base.LikelihoodModel):
             the sum of `score_obs`
 
         """
+        if sparse.issparse(self.exog):
+            score_factor = self.score_factor(params, scale=scale)
+            return self.exog.T.dot(score_factor)
         return self.score_obs(params, scale=scale).sum(0)
 
 
@@ -529,7 +576,7 @@ class GLM(base.LikelihoodModel):
         """
 
         factor = self.hessian_factor(params, scale=scale, observed=observed)
-        hess = -np.dot(self.exog.T * factor, self.exog)
+        hess = -lm._cross_product(self.exog, factor)
         return hess
 
     def information(self, params, scale=None):
@@ -613,11 +660,11 @@ class GLM(base.LikelihoodModel):
         return chi2stat, pval, k_constraints
 
 
-    def _update_history(self, tmp_result, mu, history):
+    def _update_history(self, params, mu, history):
         """
         Helper method to update history during iterative fit.
         """
-        history['params'].append(tmp_result.params)
+        history['params'].append(params)
         history['deviance'].append(self.family.deviance(self.endog, mu,
                                                         self.freq_weights))
         return history
@@ -771,7 +818,10 @@ class GLM(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
 
-        linpred = np.dot(exog, params) + offset + exposure
+        if sparse.issparse(exog):
+            linpred = exog.dot(params) + offset + exposure
+        else:
+            linpred = np.dot(exog, params) + offset + exposure
         if linear:
             return linpred
         else:
@@ -894,6 +944,20 @@ class GLM(base.LikelihoodModel):
             :math:`rtol * prior + atol > abs(current - prior)`
         tol_criterion : str, optional
             Defaults to ``'deviance'``. Can optionally be ``'params'``.
+        wls_method : str, optional
+            Defaults to ``'cholesky'`` which solves the normal equations of
+            the weighted least squares problem in each iteration, see Notes.
+            ``'pinv'`` fits a WLS model with the pseudoinverse in each
+            iteration.
+
+        Notes
+        -----
+        The "cholesky" IRLS method reuses the nobs sized arrays for the
+        weights and the working endog in all iterations, only the k x k
+        cross-product is factorized and the results instance is only created
+        after convergence.  Because this squares the condition number of the
+        weighted design matrix, an iteration falls back to the "pinv" WLS fit
+        if the cross-product is ill-conditioned or singular.
         """
         self.scaletype = scale
 
@@ -955,11 +1019,19 @@ class GLM(base.LikelihoodModel):
 
     def _fit_irls(self, start_params=None, maxiter=100, tol=1e-8,
                   scale=None, cov_type='nonrobust', cov_kwds=None,
-                  use_t=None, **kwargs):
+                  use_t=None, wls_method='cholesky', **kwargs):
         """
         Fits a generalized linear model for a given family using
         iteratively reweighted least squares (IRLS).
+
+        With wls_method "cholesky" the weighted least squares problem of
+        each iteration is solved from the k x k normal equations in
+        preallocated nobs sized arrays.  "pinv" fits a WLS model in each
+        iteration, which is also used for ill-conditioned iterations with
+        "cholesky".
         """
+        if wls_method not in ('cholesky', 'pinv'):
+            raise ValueError('wls_method has to be "cholesky" or "pinv"')
         atol = kwargs.get('atol')
         rtol = kwargs.get('rtol', 0.)
         tol_criterion = kwargs.get('tol_criterion', 'deviance')
@@ -972,7 +1044,7 @@ class GLM(base.LikelihoodModel):
             mu = self.family.starting_mu(self.endog)
             lin_pred = self.family.predict(mu)
         else:
-            lin_pred = np.dot(wlsexog, start_params) + self._offset_exposure
+            lin_pred = wlsexog.dot(start_params) + self._offset_exposure
             mu = self.family.fitted(lin_pred)
         dev = self.family.deviance(self.endog, mu, self.freq_weights)
         if np.isnan(dev):
@@ -990,18 +1062,53 @@ class GLM(base.LikelihoodModel):
         if maxiter == 0:
             mu = self.family.fitted(lin_pred)
             self.scale = self.estimate_scale(mu)
-            wls_results = lm.RegressionResults(self, start_params, None)
+            params = start_params
+            normalized_cov_params = None
             iteration = 0
+        if wls_method == 'cholesky':
+            # workspace that is reused in all iterations
+            nobs = endog.shape[0]
+            weights = np.empty(nobs)
+            wlsendog = np.empty(nobs)
+            wendog = np.empty(nobs)
+            dense_exog = not sparse.issparse(wlsexog)
+            if dense_exog:
+                lin_pred = np.array(lin_pred, dtype=np.float64)
         for iteration in range(maxiter):
-            self.weights = (self.freq_weights * self.n_trials *
-                            self.family.weights(mu))
-            wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
-                        - self._offset_exposure)
-            wls_results = lm.WLS(wlsendog, wlsexog, self.weights).fit()
-            lin_pred = np.dot(self.exog, wls_results.params) + self._offset_exposure
+            params = None
+            if wls_method == 'cholesky':
+                np.multiply(self.freq_weights * self.n_trials,
+                            self.family.weights(mu), out=weights)
+                self.weights = weights
+                np.subtract(endog, mu, out=wlsendog)
+                wlsendog *= self.family.link.deriv(mu)
+                wlsendog += lin_pred
+                wlsendog -= self._offset_exposure
+                np.multiply(weights, wlsendog, out=wendog)
+                params, normalized_cov_params = _solve_wls_normal(
+                    wlsexog, weights, wendog)
+                if params is not None:
+                    if dense_exog:
+                        np.dot(wlsexog, params, out=lin_pred)
+                    else:
+                        lin_pred = wlsexog.dot(params)
+                    lin_pred += self._offset_exposure
+                else:
+                    # ill-conditioned or singular, use the pseudoinverse
+                    wls_results = lm.WLS(wlsendog, wlsexog, weights).fit()
+            else:
+                self.weights = (self.freq_weights * self.n_trials *
+                                self.family.weights(mu))
+                wlsendog = (lin_pred + self.family.link.deriv(mu) *
+                            (self.endog-mu) - self._offset_exposure)
+                wls_results = lm.WLS(wlsendog, wlsexog, self.weights).fit()
+            if params is None:
+                params = wls_results.params
+                normalized_cov_params = wls_results.normalized_cov_params
+                lin_pred = (self.exog.dot(params) +
+                            self._offset_exposure)
             mu = self.family.fitted(lin_pred)
-            history = self._update_history(wls_results, mu, history)
-            self.scale = self.estimate_scale(mu)
+            history = self._update_history(params, mu, history)
             if endog.squeeze().ndim == 1 and np.allclose(mu - endog, 0):
                 msg = "Perfect separation detected, results not available"
                 raise PerfectSeparationError(msg)
@@ -1010,9 +1117,12 @@ class GLM(base.LikelihoodModel):
             if converged:
                 break
         self.mu = mu
+        if maxiter > 0:
+            self.weights = np.array(self.weights)
+            self.scale = self.estimate_scale(mu)
 
-        glm_results = GLMResults(self, wls_results.params,
-                                 wls_results.normalized_cov_params,
+        glm_results = GLMResults(self, params,
+                                 normalized_cov_params,
                                  self.scale,
                                  cov_type=cov_type, cov_kwds=cov_kwds,
                                  use_t=use_t)
@@ -1095,6 +1205,43 @@ class GLM(base.LikelihoodModel):
 
         return result
 
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             **kwargs):
+        """
+        Return elastic net regularized fits for a sequence of penalties.
+
+        Parameters
+        ----------
+        alphas : array-like
+            1d array of penalty weights.
+        L1_wt : float
+            Must be in [0, 1].  The L1 penalty has weight L1_wt and the
+            L2 penalty has weight 1 - L1_wt.
+        start_params : array-like
+            Starting values for ``params`` of the largest penalty weight.
+        kwargs : keywords
+            `alpha_wt`, `maxiter`, `cnvrg_tol`, `zero_tol` and `screen`
+            are passed to `fit_elasticnet_path`.
+
+        Returns
+        -------
+        A RegularizedPathResults instance.
+
+        Notes
+        -----
+        The objective function for each penalty weight is the same as
+        in `fit_regularized`.  The fits are computed with warm starts
+        along the decreasing penalty weights.  The quadratic
+        approximations use the expected Hessian ``X'WX``, which is
+        computed once per Newton step, see
+        `statsmodels.base.elastic_net.fit_elasticnet_path`.
+        """
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                   start_params=start_params,
+                                   hess_kwds={"observed": False}, **kwargs)
+
 
     def fit_constrained(self, constraints, start_params=None, **fit_kwds):
         """fit the model subject to linear equality constraints
@@ -1412,6 +1559,23 @@ class GLMResults(base.LikelihoodModelResults):
     get_prediction.__doc__ = pred.get_prediction_glm.__doc__
 
 
+    def get_influence(self):
+        """
+        get an instance of GLMInfluence with influence and outlier measures
+
+        Returns
+        -------
+        infl : GLMInfluence instance
+            the instance has methods to calculate the main influence and
+            outlier measures based on one-step IRLS approximations
+
+        See also
+        --------
+        statsmodels.stats.outliers_influence.GLMInfluence
+        """
+        from statsmodels.stats.outliers_influence import GLMInfluence
+        return GLMInfluence(self)
+
     def remove_data(self):
         #GLM has alias/reference in result instance
         self._data_attr.extend([i for i in self.model._data_attr
@@ -0,0 +1,511 @@
+"""
+Generalized linear models estimated from blocks of data
+
+The data is not held in memory.  Each iteration of iteratively reweighted
+least squares (IRLS) is one pass over the blocks of data, in which the
+weighted least squares problem of the next iteration is accumulated with
+`StreamingWLS`, and the deviance and Pearson's chi-square of the current
+parameters are summed over the blocks.  Only statistics of size O(k^2) are
+kept, where k is the number of regressors.
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+
+from statsmodels.base import model as base
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import (
+    GLMResults, _check_convergence)
+from statsmodels.regression.streaming_ls import StreamingWLS, _block_names
+from statsmodels.tools.decorators import cache_readonly, resettable_cache
+from statsmodels.tools.sm_exceptions import PerfectSeparationError
+from statsmodels.tools.tools import Bunch
+
+__all__ = ['StreamingGLM', 'StreamingGLMResults']
+
+
+class StreamingGLM(object):
+    """
+    Generalized linear model estimated by IRLS from blocks of data
+
+    Parameters
+    ----------
+    blocks : sequence or callable
+        The data as a sequence of tuples ``(endog, exog)``,
+        ``(endog, exog, offset)`` or ``(endog, exog, offset, freq_weights)``
+        where `offset` can be None.  The blocks are iterated over once in
+        each IRLS iteration, so a callable that returns a new iterator over
+        the blocks can be used instead of a sequence, e.g. to read the
+        blocks from disk.  Iterators that can only be consumed once are not
+        allowed.
+    family : family class instance
+        The default is Gaussian.  To specify the binomial distribution
+        family = sm.family.Binomial().  Binomial endog has to be
+        one-dimensional.
+    endog_name : str, optional
+        Name of the dependent variable.  Taken from the first block if that
+        is a pandas Series.
+    exog_names : list of str, optional
+        Names of the regressors.  Taken from the first block if that is a
+        pandas DataFrame.
+
+    Attributes
+    ----------
+    nobs : float
+        Number of observations, available after `fit`.
+    wnobs : float
+        Sum of the frequency weights, available after `fit`.
+
+    Notes
+    -----
+    Memory use is O(k_exog**2) and does not depend on the number of
+    observations, unless the fitted mean is requested with ``keep_mu=True``
+    in `fit`.  Use `from_arrays` for arrays that are not in memory, e.g.
+    numpy memory-mapped arrays.
+
+    Examples
+    --------
+    >>> mod = StreamingGLM(blocks, family=sm.families.Poisson())
+    >>> res = mod.fit()
+    >>> print(res.summary())
+    """
+
+    def __init__(self, blocks, family=None, endog_name=None,
+                 exog_names=None):
+        if family is None:
+            family = families.Gaussian()
+        if not callable(blocks) and iter(blocks) is blocks:
+            raise ValueError('blocks are iterated over in each IRLS '
+                             'iteration, use a sequence or a callable that '
+                             'returns an iterator')
+        self.blocks = blocks
+        self.family = family
+        self.endog_name = endog_name
+        self.exog_names_ = exog_names
+        self.k_exog = None
+        self._has_offset = False
+        self._k_constant = 0
+        self._const_idx = None
+
+    @classmethod
+    def from_arrays(cls, endog, exog, offset=None, freq_weights=None,
+                    chunksize=100000, **kwargs):
+        """
+        Create a model that processes arrays in blocks of rows
+
+        Parameters
+        ----------
+        endog : array-like
+            1-d array of the dependent variable, e.g. a memory-mapped array.
+        exog : array-like
+            2-d array of the regressors with the same number of rows.
+        offset : array-like, optional
+            1-d array of the offset.
+        freq_weights : array-like, optional
+            1-d array of frequency weights.
+        chunksize : int
+            Number of rows in each block.
+        kwargs
+            Additional keyword arguments are passed to the model.
+
+        Returns
+        -------
+        model : StreamingGLM
+
+        Notes
+        -----
+        Only slices of `chunksize` rows of the arrays are converted to
+        in-memory arrays at a time.
+        """
+        nobs = endog.shape[0]
+
+        def _slice(arr, start):
+            if arr is None:
+                return None
+            return arr[start:start + chunksize]
+
+        blocks = [(endog[start:start + chunksize],
+                   exog[start:start + chunksize],
+                   _slice(offset, start), _slice(freq_weights, start))
+                  for start in range(0, nobs, chunksize)]
+        return cls(blocks, **kwargs)
+
+    @property
+    def endog_names(self):
+        """Name of the dependent variable"""
+        if self.endog_name is None:
+            return 'y'
+        return self.endog_name
+
+    @property
+    def exog_names(self):
+        """Names of the regressors"""
+        if self.exog_names_ is None:
+            return ['x%d' % i for i in range(1, self.k_exog + 1)]
+        return self.exog_names_
+
+    @property
+    def k_constant(self):
+        return self._k_constant
+
+    @property
+    def data(self):
+        """lightweight replacement for the model data of in-memory models"""
+        return Bunch(param_names=self.exog_names, xnames=self.exog_names,
+                     ynames=self.endog_names, k_constant=self._k_constant,
+                     const_idx=self._const_idx)
+
+    def _iter_blocks(self):
+        """iterate over the blocks as tuples of float arrays"""
+        blocks = self.blocks() if callable(self.blocks) else self.blocks
+        first = True
+        for block in blocks:
+            if len(block) not in (2, 3, 4):
+                raise ValueError('blocks need to be tuples (endog, exog), '
+                                 '(endog, exog, offset) or '
+                                 '(endog, exog, offset, freq_weights)')
+            block = tuple(block) + (None,) * (4 - len(block))
+            endog, exog, offset, freq_weights = block
+            if first and self.k_exog is None:
+                ynames, xnames = _block_names(endog, exog)
+                if self.endog_name is None:
+                    self.endog_name = ynames
+                if self.exog_names_ is None:
+                    self.exog_names_ = xnames
+            first = False
+
+            endog = np.asarray(endog, dtype=np.float64)
+            exog = np.asarray(exog, dtype=np.float64)
+            if exog.ndim == 1:
+                exog = exog[:, None]
+            if endog.ndim != 1:
+                endog = endog.squeeze()
+                if endog.ndim != 1:
+                    raise ValueError('endog has to be one-dimensional')
+            if self.k_exog is None:
+                self.k_exog = exog.shape[1]
+            if exog.shape != (endog.shape[0], self.k_exog):
+                raise ValueError('exog needs to have shape (%d, %d)' %
+                                 (endog.shape[0], self.k_exog))
+            if offset is None:
+                offset = 0.
+            else:
+                offset = np.asarray(offset, dtype=np.float64)
+                self._has_offset = True
+            if freq_weights is None:
+                freq_weights = np.ones(endog.shape[0])
+            else:
+                freq_weights = np.asarray(freq_weights, dtype=np.float64)
+            yield endog, exog, offset, freq_weights
+
+    def _irls_pass(self, params, keep_mu=False):
+        """
+        One pass over the blocks at params
+
+        The weighted least squares problem for the next IRLS iteration is
+        accumulated, and the deviance and Pearson's chi-square at params
+        are summed.  If params is None, then the starting values for the
+        mean of the family are used.
+        """
+        family = self.family
+        wls = None
+        deviance = pearson_chi2 = 0.
+        nobs = wnobs = 0.
+        max_abs_resid = 0.
+        mu_blocks = [] if keep_mu else None
+        for endog, exog, offset, freq_weights in self._iter_blocks():
+            if wls is None:
+                wls = StreamingWLS(self.k_exog)
+            if params is None:
+                mu = family.starting_mu(endog)
+                lin_pred = family.predict(mu)
+            else:
+                lin_pred = np.dot(exog, params) + offset
+                mu = family.fitted(lin_pred)
+            weights = freq_weights * family.weights(mu)
+            resid = endog - mu
+            wlsendog = lin_pred + family.link.deriv(mu) * resid - offset
+            wls.update(wlsendog, exog, weights)
+
+            deviance += family.deviance(endog, mu, freq_weights)
+            pearson_chi2 += np.sum(freq_weights * resid**2 /
+                                   family.variance(mu))
+            if len(resid):
+                max_abs_resid = max(max_abs_resid, np.abs(resid).max())
+            nobs += endog.shape[0]
+            wnobs += freq_weights.sum()
+            if keep_mu:
+                mu_blocks.append(mu)
+
+        if wls is None:
+            raise ValueError('blocks do not contain any observations')
+        if keep_mu:
+            mu_blocks = np.concatenate(mu_blocks)
+        return Bunch(wls=wls, deviance=deviance, pearson_chi2=pearson_chi2,
+                     nobs=nobs, wnobs=wnobs, max_abs_resid=max_abs_resid,
+                     mu=mu_blocks)
+
+    def _sum_blocks(self, params, func):
+        """
+        Sum of ``func(endog, mu, freq_weights)`` over the blocks
+
+        If params is None, then mu is the weighted mean of endog, which is
+        the fitted mean of the model with only a constant and no offset.
+        """
+        if params is None:
+            if self._has_offset:
+                raise NotImplementedError('the null model with an offset '
+                                          'is not available for streaming '
+                                          'models')
+            sum_y = sum_w = 0.
+            for endog, _, _, freq_weights in self._iter_blocks():
+                sum_y += np.dot(freq_weights, endog)
+                sum_w += freq_weights.sum()
+            mean = sum_y / sum_w
+
+        total = 0.
+        for endog, exog, offset, freq_weights in self._iter_blocks():
+            if params is None:
+                mu = np.repeat(mean, endog.shape[0])
+            else:
+                mu = self.family.fitted(np.dot(exog, params) + offset)
+            total += func(endog, mu, freq_weights)
+        return total
+
+    def loglike(self, params, scale=1.):
+        """
+        Evaluate the log-likelihood in a pass over the blocks
+
+        Parameters
+        ----------
+        params : array-like
+            The parameter vector.
+        scale : float
+            The scale parameter.
+
+        Returns
+        -------
+        llf : float
+        """
+        return self._sum_blocks(np.asarray(params),
+                                lambda endog, mu, freq_weights:
+                                self.family.loglike(endog, mu, freq_weights,
+                                                    scale=scale))
+
+    def predict(self, params, exog, offset=None, linear=False):
+        """
+        Return predicted values for a design matrix
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model.
+        exog : array-like
+            Design matrix for the prediction.
+        offset : array-like, optional
+            Offset for the prediction.
+        linear : bool
+            If True, returns the linear predicted values.  If False (default),
+            returns the predicted mean.
+
+        Returns
+        -------
+        An array of fitted values
+        """
+        lin_pred = np.dot(exog, params)
+        if offset is not None:
+            lin_pred += offset
+        if linear:
+            return lin_pred
+        return self.family.fitted(lin_pred)
+
+    def _estimate_scale(self, scale, stats):
+        if scale is None:
+            if isinstance(self.family, (families.Binomial,
+                                        families.Poisson)):
+                return 1.
+            return stats.pearson_chi2 / self.df_resid
+        if isinstance(scale, float):
+            return scale
+        if isinstance(scale, str):
+            if scale.lower() == 'x2':
+                return stats.pearson_chi2 / self.df_resid
+            elif scale.lower() == 'dev':
+                return stats.deviance / self.df_resid
+        raise ValueError("Scale %s with type %s not understood" %
+                         (scale, type(scale)))
+
+    def fit(self, start_params=None, maxiter=100, tol=1e-8, scale=None,
+            tol_criterion='deviance', rtol=0., keep_mu=False, use_t=None):
+        """
+        Fit the model by IRLS with one pass over the blocks per iteration
+
+        Parameters
+        ----------
+        start_params : array-like, optional
+            Initial guess of the solution.  If None, the starting values for
+            the mean of the family are used.
+        maxiter : int
+            Maximum number of iterations.
+        tol : float
+            Convergence tolerance, used as `atol` of the convergence
+            criterion as in `GLM.fit`.
+        scale : str or float, optional
+            `scale` can be 'X2', 'dev', or a float.  The default is 1 for
+            the Binomial and Poisson families and Pearson's chi-square
+            divided by `df_resid` otherwise.
+        tol_criterion : str
+            Defaults to ``'deviance'``.  Can optionally be ``'params'``.
+        rtol : float
+            Relative tolerance of the convergence criterion.
+        keep_mu : bool
+            If True, the fitted mean of all observations is kept in the
+            results.  The default is to keep only statistics of size
+            O(k_exog**2).
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values.
+
+        Returns
+        -------
+        results : StreamingGLMResults
+
+        Notes
+        -----
+        The parameters and the deviance of each iteration are available in
+        the `fit_history` attribute of the results.  The covariance of the
+        parameter estimates is computed with the IRLS weights at the final
+        parameters.  Only the nonrobust covariance is available.
+        """
+        stats = self._irls_pass(start_params, keep_mu=keep_mu)
+        if start_params is None:
+            start_params = np.zeros(self.k_exog)
+        params = np.asarray(start_params, dtype=np.float64)
+        history = dict(params=[np.inf, params],
+                       deviance=[np.inf, stats.deviance])
+        criterion = history[tol_criterion]
+        converged = False
+        iteration = 0
+        for iteration in range(maxiter):
+            params = stats.wls._solve()[0]
+            stats = self._irls_pass(params, keep_mu=keep_mu)
+            history['params'].append(params)
+            history['deviance'].append(stats.deviance)
+            if np.allclose(stats.max_abs_resid, 0):
+                msg = "Perfect separation detected, results not available"
+                raise PerfectSeparationError(msg)
+            converged = _check_convergence(criterion, iteration + 1, tol,
+                                           rtol)
+            if converged:
+                break
+
+        normalized_cov_params = stats.wls._solve()[1]
+        wls = stats.wls
+        self.rank = wls.rank
+        self._k_constant, self._const_idx = wls._const_info
+        self.nobs = stats.nobs
+        self.wnobs = stats.wnobs
+        self.df_model = self.rank - 1.
+        self.df_resid = self.wnobs - self.rank
+        self.scale = self._estimate_scale(scale, stats)
+
+        results = StreamingGLMResults(self, params, normalized_cov_params,
+                                      self.scale, stats, use_t=use_t)
+        results.method = "IRLS"
+        history['iteration'] = iteration + 1
+        results.fit_history = history
+        results.converged = converged
+        return results
+
+
+class StreamingGLMResults(GLMResults):
+    """
+    Results of a generalized linear model estimated from blocks of data
+
+    The deviance and Pearson's chi-square are summed over the blocks in the
+    last IRLS iteration.  The log-likelihood and the null deviance are
+    computed in an additional pass over the blocks when they are first
+    accessed.  The fitted mean is only available if the model was fit with
+    ``keep_mu=True``, residuals are not available.
+
+    See Also
+    --------
+    GLMResults
+    """
+
+    def __init__(self, model, params, normalized_cov_params, scale, stats,
+                 use_t=None):
+        base.LikelihoodModelResults.__init__(self, model, params,
+                                normalized_cov_params=normalized_cov_params,
+                                scale=scale)
+        self.family = model.family
+        self.nobs = model.nobs
+        self.df_resid = model.df_resid
+        self.df_model = model.df_model
+        self._stats = stats
+        self._cache = resettable_cache()
+        self.use_t = False if use_t is None else use_t
+        self.cov_type = 'nonrobust'
+        self.cov_kwds = {'description': 'Standard Errors assume that the ' +
+                         'covariance matrix of the errors is correctly ' +
+                         'specified.'}
+
+    @cache_readonly
+    def deviance(self):
+        return self._stats.deviance
+
+    @cache_readonly
+    def pearson_chi2(self):
+        return self._stats.pearson_chi2
+
+    @cache_readonly
+    def mu(self):
+        if self._stats.mu is None:
+            raise NotImplementedError('the fitted mean is only available if '
+                                      'the model is fit with keep_mu=True')
+        return self._stats.mu
+
+    @cache_readonly
+    def llf(self):
+        return self.model.loglike(self.params, scale=self.scale)
+
+    @cache_readonly
+    def null_deviance(self):
+        return self.model._sum_blocks(None, self.family.deviance)
+
+    @cache_readonly
+    def llnull(self):
+        family, scale = self.family, self.scale
+        return self.model._sum_blocks(None,
+                                      lambda endog, mu, freq_weights:
+                                      family.loglike(endog, mu, freq_weights,
+                                                     scale=scale))
+
+    def _not_available(self):
+        raise NotImplementedError('residuals are not available for '
+                                  'streaming models')
+
+    @property
+    def resid_response(self):
+        self._not_available()
+
+    @property
+    def resid_pearson(self):
+        self._not_available()
+
+    @property
+    def resid_working(self):
+        self._not_available()
+
+    @property
+    def resid_anscombe(self):
+        self._not_available()
+
+    @property
+    def resid_deviance(self):
+        self._not_available()
+
+    def get_influence(self):
+        self._not_available()
@@ -1659,6 +1659,97 @@ def test_missing():
     assert_almost_equal(res.params.values, res2.params.values)
 
 
+def test_batched_clusters():
+    # Clusters of equal size are stacked, compare to the loop over
+    # clusters, groups are not sorted and have different sizes
+    np.random.seed(3421)
+    ngroup = 100
+    sizes = np.random.randint(1, 6, size=ngroup)
+    groups = np.random.permutation(np.repeat(np.arange(ngroup), sizes))
+    n = len(groups)
+    exog = np.column_stack((np.ones(n), np.random.normal(size=(n, 2))))
+    offset = np.random.uniform(-0.5, 0.5, size=n)
+    weights = np.random.uniform(1, 2, size=ngroup)[groups]
+    group_effect = np.random.normal(size=ngroup)[groups]
+    endog = np.random.poisson(np.exp(0.2 * exog.sum(1) + offset +
+                                     0.3 * group_effect))
+
+    for cov_struct in Independence, Exchangeable, Autoregressive:
+        for kwds in ({}, {"weights": weights},
+                     {"offset": pd.Series(offset),
+                      "exposure": pd.Series(np.ones(n))}):
+            kwds = dict(kwds)
+            kwds.setdefault("offset", offset)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                mod1 = GEE(endog, exog, groups, family=Poisson(),
+                           cov_struct=cov_struct(), **kwds)
+                mod2 = GEE(endog, exog, groups, family=Poisson(),
+                           cov_struct=cov_struct(), **kwds)
+                assert_(mod1._batched)
+                mod2._batched = False
+                res1 = mod1.fit(cov_type="bias_reduced")
+                res2 = mod2.fit(cov_type="bias_reduced")
+
+            assert_allclose(res1.params, res2.params, rtol=1e-8)
+            assert_allclose(res1.scale, res2.scale, rtol=1e-8)
+            if res1.cov_struct.dep_params is not None:
+                assert_allclose(res1.cov_struct.dep_params,
+                                res2.cov_struct.dep_params, rtol=1e-6)
+            assert_allclose(res1.cov_robust, res2.cov_robust, rtol=1e-6)
+            assert_allclose(res1.cov_naive, res2.cov_naive, rtol=1e-6)
+            assert_allclose(res1.cov_robust_bc, res2.cov_robust_bc,
+                            rtol=1e-6)
+            assert_allclose(res1.fittedvalues, res2.fittedvalues,
+                            rtol=1e-8)
+
+
+def test_dep_params_update():
+    # Vectorized dependence parameter updates compared to loops over
+    # the clusters
+    np.random.seed(3421)
+    ngroup = 50
+    sizes = np.random.randint(1, 6, size=ngroup)
+    groups = np.random.permutation(np.repeat(np.arange(ngroup), sizes))
+    n = len(groups)
+    exog = np.column_stack((np.ones(n), np.random.normal(size=n)))
+    weights = np.random.uniform(1, 2, size=ngroup)[groups]
+    endog = (exog.sum(1) + np.random.normal(size=ngroup)[groups] +
+             np.random.normal(size=n))
+
+    mod = GEE(endog, exog, groups, cov_struct=Exchangeable(),
+              weights=weights)
+    mod.fit()
+    mod.cov_struct.update(None)
+
+    scale, fsum1, residsq_sum, fsum2, n_pairs = 0., 0., 0., 0., 0.
+    for i in range(mod.num_group):
+        expval, _ = mod.cached_means[i]
+        resid = mod.endog_li[i] - expval
+        f = mod.weights_li[i]
+        ssr = np.sum(resid ** 2)
+        scale += f * ssr
+        fsum1 += f * len(resid)
+        residsq_sum += f * (resid.sum() ** 2 - ssr) / 2
+        npr = 0.5 * len(resid) * (len(resid) - 1)
+        fsum2 += f * npr
+        n_pairs += npr
+    scale /= fsum1 * (n - mod.ddof_scale) / float(n)
+    dep_params = residsq_sum / scale / (fsum2 * (n_pairs - mod.ddof_scale) /
+                                        n_pairs)
+    assert_allclose(mod.cov_struct.dep_params, dep_params, rtol=1e-10)
+
+    # Distances in the default and in a user provided distance function
+    res1 = GEE(endog, exog, groups, cov_struct=Autoregressive()).fit()
+    dist_func = lambda x, y: np.abs(x - y).sum()
+    res2 = GEE(endog, exog, groups,
+               cov_struct=Autoregressive(dist_func=dist_func)).fit()
+    assert_allclose(res1.cov_struct.designx, res2.cov_struct.designx)
+    assert_allclose(res1.cov_struct.dep_params, res2.cov_struct.dep_params,
+                    rtol=1e-10)
+    assert_allclose(res1.params, res2.params, rtol=1e-10)
+
+
 if __name__ == "__main__":
 
     import nose
@@ -1810,6 +1810,67 @@ class TestConvergence(object):
                      actual_iterations)
 
 
+def test_sparse_exog():
+    from scipy import sparse
+    from statsmodels.tools.grouputils import dummy_sparse
+
+    np.random.seed(987125)
+    nobs = 500
+    groups = np.random.randint(0, 20, size=nobs)
+    x = np.random.randn(nobs, 2)
+    exog = sparse.hstack((x, dummy_sparse(groups))).tocsr()
+    endog = np.random.poisson(np.exp(0.5 * x.sum(1) + 0.05 * groups))
+
+    for kwds in [{}, {'cov_type': 'HC0'},
+                 {'cov_type': 'cluster', 'cov_kwds': {'groups': groups}}]:
+        res1 = GLM(endog, exog, family=sm.families.Poisson()).fit(**kwds)
+        res2 = GLM(endog, exog.toarray(),
+                   family=sm.families.Poisson()).fit(**kwds)
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+        assert_allclose(res1.llf, res2.llf, rtol=1e-12)
+
+    mod = GLM(endog, exog, family=sm.families.Poisson())
+    res1 = mod.fit(method='newton')
+    assert_allclose(res1.params, res2.params, rtol=1e-8)
+    assert_allclose(res1.predict(exog[:5]), res2.predict(exog[:5].toarray()),
+                    rtol=1e-8)
+
+
+def test_irls_wls_method():
+    np.random.seed(987125)
+    nobs = 500
+    exog = add_constant(np.random.randn(nobs, 3))
+    offset = np.random.uniform(-0.5, 0.5, size=nobs)
+    freq_weights = np.random.randint(1, 4, size=nobs)
+    linpred = 0.3 * exog.sum(1) + offset
+    endog_p = np.random.poisson(np.exp(linpred))
+    endog_b = (np.random.rand(nobs) < 1 / (1 + np.exp(-linpred))) * 1.
+
+    for endog, family in [(endog_p, sm.families.Poisson()),
+                          (endog_b, sm.families.Binomial())]:
+        mod = GLM(endog, exog, family=family, offset=offset,
+                  freq_weights=freq_weights)
+        res1 = mod.fit()
+        weights = mod.weights
+        res2 = mod.fit(wls_method='pinv')
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+        assert_allclose(res1.llf, res2.llf, rtol=1e-12)
+        assert_allclose(weights, mod.weights, rtol=1e-10)
+        assert_equal(res1.fit_history['iteration'],
+                     res2.fit_history['iteration'])
+
+    # singular design uses the pseudoinverse
+    exog_s = np.column_stack((exog, exog[:, 1]))
+    mod = GLM(endog_p, exog_s, family=sm.families.Poisson())
+    res1 = mod.fit()
+    res2 = mod.fit(wls_method='pinv')
+    assert_allclose(res1.params, res2.params, rtol=1e-10)
+
+    assert_raises(ValueError, mod.fit, wls_method='qr')
+
+
 if __name__ == "__main__":
     # run_module_suite()
     # taken from Fernando Perez:
@@ -0,0 +1,119 @@
+"""
+Tests for generalized linear models estimated from blocks of data
+"""
+from __future__ import division
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.genmod.streaming_glm import StreamingGLM
+from statsmodels.tools.tools import add_constant
+
+
+def _blocks(arrays, n_blocks):
+    splits = [np.array_split(arr, n_blocks) for arr in arrays]
+    return list(zip(*splits))
+
+
+class CheckStreamingGLM(object):
+
+    def test_params(self):
+        res1, res2 = self.res1, self.res2
+        assert_allclose(res1.params, res2.params, rtol=1e-7)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-5)
+        assert_allclose(res1.scale, res2.scale, rtol=1e-7)
+
+    def test_statistics(self):
+        res1, res2 = self.res1, self.res2
+        assert_equal(res1.nobs, res2.nobs)
+        assert_equal(res1.df_model, res2.df_model)
+        assert_equal(res1.df_resid, res2.df_resid)
+        for attr in ['deviance', 'pearson_chi2', 'llf', 'aic', 'bic']:
+            assert_allclose(getattr(res1, attr), getattr(res2, attr),
+                            rtol=1e-7, err_msg=attr)
+
+    def test_summary(self):
+        txt = self.res1.summary().as_text()
+        for name in self.model.exog_names:
+            assert name in txt
+
+    def test_no_residuals(self):
+        assert_raises(NotImplementedError, getattr, self.res1, 'mu')
+        assert_raises(NotImplementedError, getattr, self.res1,
+                      'resid_pearson')
+
+
+class TestStreamingPoisson(CheckStreamingGLM):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        nobs = 1003
+        exog = add_constant(np.random.randn(nobs, 3))
+        offset = np.random.uniform(-0.5, 0.5, size=nobs)
+        freq_weights = np.random.randint(1, 4, size=nobs)
+        endog = np.random.poisson(np.exp(0.3 * exog.sum(1) + offset))
+        cls.res2 = GLM(endog, exog, family=families.Poisson(), offset=offset,
+                       freq_weights=freq_weights).fit()
+
+        cls.model = StreamingGLM(
+                        _blocks([endog, exog, offset, freq_weights], 7),
+                        family=families.Poisson())
+        cls.res1 = cls.model.fit()
+
+
+class TestStreamingBinomial(CheckStreamingGLM):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        nobs = 1003
+        exog = add_constant(np.random.randn(nobs, 3))
+        prob = 1 / (1 + np.exp(-0.5 * exog.sum(1)))
+        endog = (np.random.rand(nobs) < prob) * 1.
+        cls.res2 = GLM(endog, exog, family=families.Binomial()).fit()
+
+        blocks = _blocks([endog, exog], 5)
+        cls.model = StreamingGLM(lambda: iter(blocks),
+                                 family=families.Binomial())
+        cls.res1 = cls.model.fit()
+
+    def test_null(self):
+        assert_allclose(self.res1.null_deviance, self.res2.null_deviance,
+                        rtol=1e-10)
+        assert_allclose(self.res1.llnull, self.res2.llnull, rtol=1e-10)
+
+
+class TestStreamingGamma(CheckStreamingGLM):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        nobs = 1003
+        exog = add_constant(np.random.randn(nobs, 2))
+        mean = np.exp(0.2 * exog.sum(1))
+        endog = np.random.gamma(2, mean / 2)
+        family = families.Gamma(link=families.links.log)
+        cls.res2 = GLM(endog, exog, family=family).fit()
+
+        cls.model = StreamingGLM.from_arrays(endog, exog, chunksize=100,
+                                             family=family,
+                                             exog_names=['const', 'a', 'b'])
+        cls.res1 = cls.model.fit()
+
+
+def test_keep_mu():
+    np.random.seed(1234)
+    nobs = 200
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = np.random.poisson(np.exp(0.3 * exog.sum(1)))
+    res2 = GLM(endog, exog, family=families.Poisson()).fit()
+
+    mod = StreamingGLM(_blocks([endog, exog], 3), family=families.Poisson())
+    res1 = mod.fit(keep_mu=True)
+    assert_allclose(res1.mu, res2.mu, rtol=1e-7)
+    assert_allclose(res1.fittedvalues, res2.fittedvalues, rtol=1e-7)
+
+    assert_raises(ValueError, StreamingGLM, iter(_blocks([endog, exog], 3)))
@@ -0,0 +1,609 @@
+"""
+Linear mixed models with crossed random intercepts.
+
+The model is
+
+    endog = exog * fe_params + exog_vc * u + e
+
+where `exog_vc` contains the indicator variables of the levels of two
+or more crossed factors, for example the subjects and the items of a
+psycholinguistic experiment.  The random intercepts `u` of factor `k`
+are independent with variance `vcomp[k]`, and `e` has variance
+`scale`.
+
+`MixedLM` can fit this model by putting all observations in a single
+group and specifying the factors as variance components, but then the
+marginal covariance matrix of the single group is handled as a dense
+matrix.  Here the likelihood is evaluated using sparse matrices only,
+following the approach of Bates et al. (lme4).  With the relative
+standard deviations `lam = sqrt(vcomp / scale)` of the columns of
+`exog_vc`, the marginal covariance matrix is `scale * V`, with
+
+    V = I + Z diag(lam**2) Z',    Z = exog_vc,
+
+and
+
+    V^{-1} = I - Z L M^{-1} L Z',    log|V| = log|M|,
+    M = I + L Z'Z L,    L = diag(lam).
+
+`M` is a sparse symmetric positive definite matrix with one row for
+each level of the factors.  It is factorized with the sparse LU solver
+in `scipy.sparse.linalg` using a symmetric fill reducing ordering and no
+row pivoting, which is equivalent to a sparse LDL' factorization and
+does not require CHOLMOD.  The quadratic forms in `exog` and `endog`
+that are needed for the profile likelihood only involve the products
+`Z'Z`, `Z'exog` and `Z'endog`, which are computed once.
+
+The relative standard deviations are estimated by maximizing the
+profile (restricted) likelihood, in which the fixed effects parameters
+and the scale are profiled out, using a numerical gradient.  The memory
+use and the time for one likelihood evaluation are determined by the
+fill-in of the factorization of `M`, not by the number of observations.
+
+References
+----------
+Bates, D., Maechler, M., Bolker, B. and Walker, S. (2015).  Fitting
+linear mixed-effects models using lme4.  Journal of Statistical
+Software 67(1).
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import splu
+from scipy.stats.distributions import norm
+
+import statsmodels.base.model as base
+import statsmodels.base.wrapper as wrap
+from statsmodels.compat.collections import OrderedDict
+from statsmodels.compat.numpy import np_matrix_rank
+from statsmodels.compat.python import string_types
+from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.numdiff import approx_fprime, approx_hess
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+
+
+def _sparse_factor(mat):
+    """
+    Factorize a sparse symmetric positive definite matrix.
+
+    Parameters
+    ----------
+    mat : sparse matrix
+        A symmetric positive definite matrix.
+
+    Returns
+    -------
+    lu : SuperLU
+        The factorization, `lu.solve` solves linear systems in `mat`.
+    logdet : float
+        The log determinant of `mat`.
+
+    Notes
+    -----
+    The rows and columns are permuted symmetrically and no row pivoting
+    is done, so that the factorization is a Cholesky factorization
+    up to the scaling of the triangular factors.
+    """
+    lu = splu(sparse.csc_matrix(mat), permc_spec="MMD_AT_PLUS_A",
+              diag_pivot_thresh=0., options=dict(SymmetricMode=True))
+    logdet = np.log(np.abs(lu.U.diagonal())).sum()
+    return lu, logdet
+
+
+class CrossedMixedLM(base.LikelihoodModel):
+    __doc__ = """
+    Linear mixed model with crossed random intercepts
+
+    %(params)s
+    groups : array-like
+        1d array, or 2d array or DataFrame with one column per factor,
+        with the labels of the crossed factors.  Each factor has a
+        random intercept for each of its levels.
+    %(extra_params)s
+
+    Attributes
+    ----------
+    exog_vc : sparse matrix
+        The indicator variables of the levels of all factors, in csc
+        format.
+    k_fe : int
+        The number of fixed effects parameters.
+    k_vc : int
+        The number of crossed factors.
+    n_levels : list of int
+        The number of levels of each factor.
+    vc_names : list of str
+        The names of the factors.
+
+    Notes
+    -----
+    The likelihood is evaluated with sparse matrices, the memory use
+    grows with the number of levels and the number of observations, but
+    no dense matrix with one row for each observation is created apart
+    from `exog`.  See the module docstring for details.
+
+    `fit` optimizes the profile likelihood in the relative standard
+    deviations of the random effects with a numerical gradient.  The
+    standard errors of the variance components are based on the
+    numerical Hessian of the likelihood in the variance parameters with
+    the fixed effects profiled out.
+
+    Examples
+    --------
+    >>> mod = CrossedMixedLM.from_formula("rt ~ cond", data=df,
+    ...                                   groups=["subject", "item"])
+    >>> res = mod.fit()
+    >>> print(res.summary())
+    """ % {'params' : base._model_params_doc,
+           'extra_params' : base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, groups, missing='none', **kwargs):
+        if isinstance(groups, pd.Series):
+            groups = groups.to_frame()
+        if isinstance(groups, pd.DataFrame):
+            vc_names = [str(name) for name in groups.columns]
+            groups = groups.values
+        else:
+            groups = np.asarray(groups)
+            if groups.ndim == 1:
+                groups = groups[:, None]
+            vc_names = None
+        # with formulas the rows with missing values have already been
+        # removed from endog, they are dropped from groups using missing_idx
+        missing_idx = kwargs.get('missing_idx')
+        nobs = len(endog) if missing_idx is None else len(missing_idx)
+        if groups.ndim != 2 or groups.shape[0] != nobs:
+            raise ValueError('groups must have one row for each observation')
+        if vc_names is None:
+            vc_names = ["G%d" % (j + 1) for j in range(groups.shape[1])]
+        self.vc_names = vc_names
+        self.reml = True
+
+        # row positions go through the missing data handling instead of
+        # the labels, so that rows with missing labels are also dropped
+        group_rows = np.arange(nobs, dtype=np.float64)
+        group_rows[pd.isnull(pd.DataFrame(groups)).any(1).values] = np.nan
+        self._groups_input = groups
+        super(CrossedMixedLM, self).__init__(endog, exog, missing=missing,
+                                             group_rows=group_rows,
+                                             **kwargs)
+        self._init_keys.remove('group_rows')
+        self._init_keys.append('groups')
+        self.data.param_names = (list(self.exog_names) +
+                                 [name + " Var" for name in self.vc_names])
+
+    def initialize(self):
+        rows = self.group_rows.astype(np.intp)
+        self.groups = self._groups_input[rows]
+        del self._groups_input, self.group_rows
+
+        nobs = len(self.endog)
+        self.nobs = float(nobs)
+        self.k_fe = self.exog.shape[1]
+        self.k_vc = self.groups.shape[1]
+
+        mats = []
+        self.n_levels = []
+        self._levels = []
+        for j in range(self.k_vc):
+            codes, levels = pd.factorize(self.groups[:, j], sort=True)
+            mats.append(sparse.csc_matrix((np.ones(nobs),
+                                           (np.arange(nobs), codes)),
+                                          shape=(nobs, len(levels))))
+            self.n_levels.append(len(levels))
+            self._levels.append(levels)
+        self.exog_vc = sparse.hstack(mats).tocsc()
+        self._vc_index = np.repeat(np.arange(self.k_vc), self.n_levels)
+
+        # All cross products that are needed for the likelihood
+        xy = np.column_stack((self.exog, self.endog))
+        self._zz = (self.exog_vc.T * self.exog_vc).tocsc()
+        self._zxy = np.asarray(self.exog_vc.T * xy)
+        self._xxy = np.dot(xy.T, xy)
+
+    @classmethod
+    def from_formula(cls, formula, data, groups, subset=None, **kwargs):
+        """
+        Create a Model from a formula and dataframe.
+
+        Parameters
+        ----------
+        formula : str or generic Formula object
+            The formula specifying the fixed effects of the model
+        data : DataFrame
+            The data for the model.
+        groups : str or list of str
+            The names of the columns of `data` with the labels of the
+            crossed factors.
+        subset : array-like
+            An array-like object of booleans, integers, or index
+            values that indicate the subset of df to use in the
+            model.
+        kwargs : extra keyword arguments
+            These are passed to the model, see `Model.from_formula`.
+
+        Returns
+        -------
+        model : CrossedMixedLM instance
+        """
+        if subset is not None:
+            data = data.ix[subset]
+        if isinstance(groups, string_types):
+            groups = [groups]
+        groups = data[list(groups)]
+        return super(CrossedMixedLM, cls).from_formula(formula, data,
+                                                       groups=groups,
+                                                       **kwargs)
+
+    def _profile(self, params):
+        """
+        Profile out the fixed effects parameters and the scale.
+
+        Parameters
+        ----------
+        params : array-like
+            The relative standard deviations of the random effects,
+            one for each factor.
+
+        Returns
+        -------
+        fe_params : ndarray
+            The GLS estimate of the fixed effects parameters.
+        qf : float
+            The quadratic form of the GLS residuals in the inverse of
+            the relative marginal covariance matrix `V`.
+        logdet : float
+            The log determinant of `V`.
+        xvx : ndarray
+            The matrix exog' V^{-1} exog.
+        """
+        lam = np.asarray(params, dtype=np.float64)[self._vc_index]
+        mmat = sparse.diags(lam).dot(self._zz).dot(sparse.diags(lam))
+        mmat = mmat + sparse.eye(len(lam))
+        lu, logdet = _sparse_factor(mmat)
+
+        rhs = lam[:, None] * self._zxy
+        axy = self._xxy - np.dot(rhs.T, lu.solve(rhs))
+        k = self.k_fe
+        xvx = axy[:k, :k]
+        xvy = axy[:k, k]
+        fe_params = np.linalg.solve(xvx, xvy)
+        qf = axy[k, k] - np.dot(xvy, fe_params)
+        return fe_params, qf, logdet, xvx
+
+    def loglike(self, params):
+        """
+        Evaluate the profile log-likelihood.
+
+        Parameters
+        ----------
+        params : array-like
+            The relative standard deviations `sqrt(vcomp / scale)` of
+            the random effects, one for each factor.
+
+        Returns
+        -------
+        likeval : float
+            The log-likelihood, or the restricted log-likelihood if
+            the model is fit using REML, with the fixed effects
+            parameters and the scale profiled out.
+        """
+        fe_params, qf, logdet, xvx = self._profile(params)
+        nobs = self.nobs
+        if self.reml:
+            logdet += np.linalg.slogdet(xvx)[1]
+            nobs -= self.k_fe
+        return -(logdet + nobs * np.log(qf) +
+                 nobs * np.log(2 * np.pi / nobs) + nobs) / 2.
+
+    def score(self, params):
+        """
+        Gradient of the profile log-likelihood.
+
+        The gradient is computed by numerical differentiation of
+        `loglike`.
+        """
+        return approx_fprime(params, self.loglike, centered=True).ravel()
+
+    def _loglike_var(self, var):
+        """
+        Log-likelihood as a function of `scale` and `vcomp`, with the
+        fixed effects parameters profiled out.
+        """
+        scale, vcomp = var[0], var[1:]
+        if scale <= 0 or np.any(vcomp < 0):
+            return np.nan
+        fe_params, qf, logdet, xvx = self._profile(np.sqrt(vcomp / scale))
+        nobs = self.nobs
+        if self.reml:
+            logdet += np.linalg.slogdet(xvx)[1]
+            nobs -= self.k_fe
+        return -(logdet + nobs * np.log(2 * np.pi * scale) + qf / scale) / 2.
+
+    def get_random_effects(self, params, fe_params):
+        """
+        Predicted (BLUP) random effects.
+
+        Parameters
+        ----------
+        params : array-like
+            The relative standard deviations of the random effects.
+        fe_params : array-like
+            The fixed effects parameters.
+
+        Returns
+        -------
+        ranef : ndarray
+            The predicted random effects of all levels, in the order of
+            the columns of `exog_vc`.
+        """
+        lam = np.asarray(params, dtype=np.float64)[self._vc_index]
+        mmat = sparse.diags(lam).dot(self._zz).dot(sparse.diags(lam))
+        mmat = mmat + sparse.eye(len(lam))
+        lu, _ = _sparse_factor(mmat)
+        resid = self.endog - np.dot(self.exog, fe_params)
+        return lam * lu.solve(lam * (self.exog_vc.T * resid))
+
+    def fit(self, start_params=None, reml=True, method='bfgs', **kwargs):
+        """
+        Fit the model by maximum (restricted) likelihood.
+
+        Parameters
+        ----------
+        start_params : array-like, optional
+            Starting values of the relative standard deviations
+            `sqrt(vcomp / scale)` of the random effects.  The default is
+            one for all factors.
+        reml : bool
+            If true, fit according to the REML likelihood, else fit the
+            standard likelihood using ML.
+        method : string
+            Optimization method, see `LikelihoodModel.fit`.  Methods
+            that require the Hessian are not available.
+        kwargs : keywords
+            `gtol` and `maxiter` are passed to the optimizer.
+
+        Returns
+        -------
+        A CrossedMixedLMResults instance.
+        """
+        _allowed_kwargs = ['gtol', 'maxiter']
+        for x in kwargs.keys():
+            if x not in _allowed_kwargs:
+                raise ValueError("Argument %s not allowed for "
+                                 "CrossedMixedLM.fit" % x)
+        if method.lower() in ["newton", "ncg"]:
+            raise ValueError("method %s not available for CrossedMixedLM"
+                             % method)
+
+        self.reml = reml
+        if start_params is None:
+            start_params = np.ones(self.k_vc)
+
+        rslt = super(CrossedMixedLM, self).fit(start_params=start_params,
+                                               method=method,
+                                               skip_hessian=True,
+                                               disp=False, **kwargs)
+        converged = rslt.mle_retvals['converged']
+        if not converged:
+            msg = "Gradient optimization failed."
+            warnings.warn(msg, ConvergenceWarning)
+
+        vc_params = np.abs(np.atleast_1d(rslt.params))
+        fe_params, qf, logdet, xvx = self._profile(vc_params)
+        scale = qf / (self.nobs - self.k_fe if reml else self.nobs)
+        vcomp = scale * vc_params**2
+        if np.min(vcomp) < 0.01:
+            msg = "The MLE may be on the boundary of the parameter space."
+            warnings.warn(msg, ConvergenceWarning)
+
+        # The fixed effects and the variance parameters are
+        # asymptotically independent, the covariance of the variance
+        # components is obtained from the likelihood with the fixed
+        # effects profiled out.
+        k_fe = self.k_fe
+        pcov = np.nan * np.ones((k_fe + self.k_vc, k_fe + self.k_vc))
+        pcov[:k_fe, :k_fe] = scale * np.linalg.inv(xvx)
+        hess = approx_hess(np.r_[scale, vcomp], self._loglike_var)
+        if np.all(np.isfinite(hess)) and np.all(np.diag(hess) < 0):
+            pcov[k_fe:, k_fe:] = np.linalg.inv(-hess)[1:, 1:]
+        else:
+            msg = ("The Hessian matrix of the variance parameters is not "
+                   "negative definite, no standard errors for the "
+                   "variance components.")
+            warnings.warn(msg, ConvergenceWarning)
+
+        results = CrossedMixedLMResults(self, np.r_[fe_params, vcomp],
+                                        pcov / scale)
+        results.fe_params = fe_params
+        results.vcomp = vcomp
+        results.vc_params = vc_params
+        results.scale = scale
+        results.method = "REML" if reml else "ML"
+        results.reml = reml
+        results.converged = converged
+        results.k_fe = k_fe
+        results.k_vc = self.k_vc
+        results.mle_retvals = rslt.mle_retvals
+
+        return CrossedMixedLMResultsWrapper(results)
+
+
+class CrossedMixedLMResults(base.LikelihoodModelResults):
+    """
+    Class to contain results of fitting a linear mixed model with
+    crossed random intercepts.
+
+    CrossedMixedLMResults inherits from statsmodels.LikelihoodModelResults
+
+    Attributes
+    ----------
+    model : class instance
+        Pointer to the CrossedMixedLM instance that called fit.
+    fe_params : array
+        The fitted fixed-effects coefficients
+    vcomp : array
+        The fitted variances of the random effects of the factors
+    vc_params : array
+        The relative standard deviations `sqrt(vcomp / scale)`
+    scale : float
+        The residual variance
+    bse_fe : array
+        The standard errors of the fitted fixed effects coefficients
+    bse_vc : array
+        The standard errors of the variance components
+
+    See Also
+    --------
+    statsmodels.LikelihoodModelResults
+    """
+
+    def __init__(self, model, params, cov_params):
+
+        super(CrossedMixedLMResults, self).__init__(
+            model, params, normalized_cov_params=cov_params)
+        self.nobs = self.model.nobs
+        self.df_resid = self.nobs - np_matrix_rank(self.model.exog)
+
+    @cache_readonly
+    def bse_fe(self):
+        """
+        Returns the standard errors of the fixed effect regression
+        coefficients.
+        """
+        return self.bse[:self.k_fe]
+
+    @cache_readonly
+    def bse_vc(self):
+        """
+        Returns the standard errors of the variance components.
+        """
+        return self.bse[self.k_fe:]
+
+    @cache_readonly
+    def llf(self):
+        return self.model.loglike(self.vc_params)
+
+    @cache_readonly
+    def random_effects(self):
+        """
+        The conditional means of the random effects.
+
+        Returns
+        -------
+        random_effects : dict
+            Maps the name of each factor to a Series with the predicted
+            random effects of its levels.
+        """
+        ranef = self.model.get_random_effects(self.vc_params,
+                                              self.fe_params)
+        bounds = np.cumsum([0] + self.model.n_levels)
+        effects = OrderedDict()
+        for j, name in enumerate(self.model.vc_names):
+            effects[name] = pd.Series(ranef[bounds[j]:bounds[j + 1]],
+                                      index=self.model._levels[j])
+        return effects
+
+    @cache_readonly
+    def fittedvalues(self):
+        """
+        Returns the fitted values including the predicted random
+        effects.
+        """
+        ranef = np.concatenate([np.asarray(x) for x in
+                                self.random_effects.values()])
+        return (np.dot(self.model.exog, self.fe_params) +
+                self.model.exog_vc * ranef)
+
+    @cache_readonly
+    def resid(self):
+        """
+        Returns the residuals of the model conditional on the
+        predicted random effects.
+        """
+        return self.model.endog - self.fittedvalues
+
+    def summary(self, yname=None, title=None, alpha=.05):
+        """
+        Summarize the mixed model regression results.
+
+        Parameters
+        -----------
+        yname : string, optional
+            Default is `y`
+        title : string, optional
+            Title for the top table. If not None, then this replaces
+            the default title
+        alpha : float
+            significance level for the confidence intervals
+
+        Returns
+        -------
+        smry : Summary instance
+            this holds the summary tables and text, which can be
+            printed or converted to various output formats.
+
+        See Also
+        --------
+        statsmodels.iolib.summary.Summary : class to hold summary
+            results
+        """
+
+        from statsmodels.iolib import summary2
+        smry = summary2.Summary()
+
+        info = OrderedDict()
+        info["Model:"] = "CrossedMixedLM"
+        if yname is None:
+            yname = self.model.endog_names
+        info["No. Observations:"] = str(int(self.nobs))
+        for name, n_levels in zip(self.model.vc_names,
+                                  self.model.n_levels):
+            info["No. %s:" % name] = str(n_levels)
+        info["Dependent Variable:"] = yname
+        info["Method:"] = self.method
+        info["Scale:"] = self.scale
+        info["Likelihood:"] = self.llf
+        info["Converged:"] = "Yes" if self.converged else "No"
+        smry.add_dict(info)
+        if title is None:
+            title = "Crossed Mixed Linear Model Regression Results"
+        smry.add_title(title)
+
+        float_fmt = "%.3f"
+        k_fe = self.k_fe
+        sdf = np.nan * np.ones((k_fe + self.k_vc, 6))
+        sdf[:, 0] = self.params
+        sdf[:, 1] = self.bse
+        sdf[:k_fe, 2] = sdf[:k_fe, 0] / sdf[:k_fe, 1]
+        sdf[:k_fe, 3] = 2 * norm.cdf(-np.abs(sdf[:k_fe, 2]))
+        qm = -norm.ppf(alpha / 2)
+        sdf[:k_fe, 4] = sdf[:k_fe, 0] - qm * sdf[:k_fe, 1]
+        sdf[:k_fe, 5] = sdf[:k_fe, 0] + qm * sdf[:k_fe, 1]
+
+        sdf = pd.DataFrame(index=self.model.data.param_names, data=sdf)
+        sdf.columns = ['Coef.', 'Std.Err.', 'z', 'P>|z|',
+                       '[' + str(alpha/2), str(1-alpha/2) + ']']
+        for col in sdf.columns:
+            sdf[col] = [float_fmt % x if np.isfinite(x) else ""
+                        for x in sdf[col]]
+
+        smry.add_df(sdf, align='r')
+
+        return smry
+
+
+class CrossedMixedLMResultsWrapper(base.LikelihoodResultsWrapper):
+    _attrs = {'fe_params': ('generic_columns', 'xnames'),
+              'bse_fe': ('generic_columns', 'xnames'),
+              }
+    _upstream_attrs = base.LikelihoodResultsWrapper._wrap_attrs
+    _wrap_attrs = wrap.union_dicts(_attrs, _upstream_attrs)
+
+    _methods = {}
+    _upstream_methods = base.LikelihoodResultsWrapper._wrap_methods
+    _wrap_methods = wrap.union_dicts(_methods, _upstream_methods)
+wrap.populate_wrapper(CrossedMixedLMResultsWrapper, CrossedMixedLMResults)
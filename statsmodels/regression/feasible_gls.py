@@ -184,8 +184,7 @@ class GLSHet(WLS):
         res_resid = None  #if maxiter < 2 no updating
         for i in range(maxiter):
             #pinv_wexog is cached
-            if hasattr(self, 'pinv_wexog'):
-                del self.pinv_wexog
+            self._reset_fit_cache()
             #self.initialize()
             #print 'wls self',
             results = self.fit()
@@ -36,15 +36,18 @@ from __future__ import print_function
 from statsmodels.compat.python import lrange, lzip, range
 __docformat__ = 'restructuredtext en'
 
-__all__ = ['GLS', 'WLS', 'OLS', 'GLSAR']
+__all__ = ['GLS', 'WLS', 'OLS', 'GLSAR', 'AbsorbingLS']
 
 import numpy as np
 import pandas as pd
-from scipy.linalg import toeplitz
+from scipy.linalg import toeplitz, cho_factor, cho_solve
 from scipy import stats
 from scipy import optimize
+from scipy import sparse
+from scipy.sparse.linalg import lsqr
 
 from statsmodels.compat.numpy import np_matrix_rank
+from statsmodels.base.data import _r_factor, _rank_tol, _sparse_rank
 from statsmodels.tools.data import _is_using_pandas
 from statsmodels.tools.tools import add_constant, chain_dot, pinv_extended
 from statsmodels.tools.decorators import (resettable_cache,
@@ -54,11 +57,69 @@ import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
 from statsmodels.emplike.elregress import _ELRegOpts
 import warnings
-from statsmodels.tools.sm_exceptions import InvalidTestWarning
+from statsmodels.tools.sm_exceptions import (InvalidTestWarning,
+                                             ConvergenceWarning)
 
 # need import in module instead of lazily to copy `__doc__`
 from . import _prediction as pred
 
+# the Cholesky factor of the cross-product is used if the ratio of the
+# smallest to the largest singular value of wexog is above eps**(1/3)
+_CHOLESKY_COND_TOL = np.finfo(np.float64).eps ** (1. / 3)
+
+def _hat_matrix_diag(wexog, normalized_cov_params, chunksize=100000):
+    """
+    Diagonal of the hat matrix, ``wexog (X'X)^{-1} wexog'``
+
+    The rows of `wexog` are processed in chunks so that temporary arrays are
+    at most ``chunksize x k`` and the ``nobs x nobs`` hat matrix is never
+    created.  `wexog` can be a scipy.sparse matrix.
+    """
+    nobs = wexog.shape[0]
+    hat = np.empty(nobs)
+    for start in range(0, nobs, chunksize):
+        x = wexog[start:start + chunksize]
+        if sparse.issparse(x):
+            h = x.multiply(x.dot(normalized_cov_params)).sum(1)
+            hat[start:start + chunksize] = np.asarray(h).ravel()
+        else:
+            hat[start:start + chunksize] = (np.dot(x, normalized_cov_params) *
+                                            x).sum(1)
+    return hat
+
+
+def _cross_product(wexog, scale=None, chunksize=100000):
+    """
+    Cross-product ``wexog' diag(scale) wexog`` as a dense k x k array
+
+    `wexog` can be a scipy.sparse matrix.  Dense arrays are processed in
+    chunks of rows so that temporary arrays are at most ``chunksize x k``.
+    """
+    if sparse.issparse(wexog):
+        if scale is not None:
+            wexog_s = sparse.diags(scale).dot(wexog)
+        else:
+            wexog_s = wexog
+        return wexog.T.dot(wexog_s).toarray()
+
+    if scale is None:
+        return np.dot(wexog.T, wexog)
+    k = wexog.shape[1]
+    xtx = np.zeros((k, k))
+    for start in range(0, wexog.shape[0], chunksize):
+        x = wexog[start:start + chunksize]
+        xtx += np.dot(x.T, scale[start:start + chunksize, None] * x)
+    return xtx
+
+
+def _lsqr_iter_lim(k_vars, cond):
+    """
+    Iteration limit for lsqr, the default ``2 * k_vars`` increased with the
+    number of digits of the condition number of wexog.
+    """
+    return int(k_vars * max(2, np.ceil(np.log10(max(cond, 1)))))
+
+
 def _get_sigma(sigma, nobs):
     """
     Returns sigma (matrix, nobs by nobs) for GLS and the inverse of its
@@ -113,7 +174,7 @@ class RegressionModel(base.LikelihoodModel):
         """
         if self._df_model is None:
             if self.rank is None:
-                self.rank = np_matrix_rank(self.exog)
+                self.rank = self._exog_rank()
             self._df_model = float(self.rank - self.k_constant)
         return self._df_model
 
@@ -130,7 +191,7 @@ class RegressionModel(base.LikelihoodModel):
 
         if self._df_resid is None:
             if self.rank is None:
-                self.rank = np_matrix_rank(self.exog)
+                self.rank = self._exog_rank()
             self._df_resid = self.nobs - self.rank
         return self._df_resid
 
@@ -138,10 +199,22 @@ class RegressionModel(base.LikelihoodModel):
     def df_resid(self, value):
         self._df_resid = value
 
+    def _exog_rank(self):
+        if sparse.issparse(self.exog):
+            return _sparse_rank(self.exog)
+        return np_matrix_rank(self.exog)
+
 
     def whiten(self, X):
         raise NotImplementedError("Subclasses should implement.")
 
+    def _reset_fit_cache(self):
+        """remove cached decompositions of wexog after it has changed"""
+        for attr in ['pinv_wexog', 'exog_Q', 'exog_R', '_wexog_cho_factor',
+                     '_wexog_svd', 'normalized_cov_params']:
+            if hasattr(self, attr):
+                delattr(self, attr)
+
     def fit(self, method="pinv", cov_type='nonrobust', cov_kwds=None,
             use_t=None, **kwargs):
         """
@@ -153,9 +226,14 @@ class RegressionModel(base.LikelihoodModel):
         Parameters
         ----------
         method : str, optional
-            Can be "pinv", "qr".  "pinv" uses the Moore-Penrose pseudoinverse
-            to solve the least squares problem. "qr" uses the QR
-            factorization.
+            Can be "pinv", "qr", "cholesky" or "lsqr".  "pinv" uses the
+            Moore-Penrose pseudoinverse to solve the least squares problem.
+            "qr" uses the QR factorization.  "cholesky" solves the normal
+            equations with the Cholesky factorization of the cross-product
+            of the whitened design matrix and keeps only arrays of size
+            k x k, see Notes.  "lsqr" computes the parameters with the
+            iterative solver `scipy.sparse.linalg.lsqr` and the covariance
+            from the cross-product as in "cholesky".
         cov_type : str, optional
             See `regression.linear_model.RegressionResults` for a description
             of the available covariance estimators
@@ -181,7 +259,33 @@ class RegressionModel(base.LikelihoodModel):
         -----
         The fit method uses the pseudoinverse of the design/exogenous variables
         to solve the least squares minimization.
-        """
+
+        The "pinv" method stores the k x nobs pseudoinverse `pinv_wexog` and
+        the "qr" method the nobs x k matrix `exog_Q` in the model, which
+        doubles the memory requirements for tall design matrices.  The
+        "cholesky" method does not store any nobs sized array.  It uses the
+        Cholesky factor of the cross-product if the condition number of the
+        design matrix is below ``eps**(-1/3)``.  Otherwise the R factor of
+        the QR decomposition of the design matrix is computed over blocks of
+        rows, and the rank and the pseudoinverse are obtained from its
+        singular values as in "pinv".
+        Leverage, i.e. the diagonal of the hat matrix, is only computed if
+        it is needed, for example for the HC2 and HC3 covariances.
+
+        If `exog` is a scipy.sparse matrix, then the whitened design matrix
+        stays sparse and only the k x k cross-product is dense.  "pinv" is
+        replaced by "cholesky" in this case, and "qr" is not available.
+        The nonrobust, HC0 - HC3 and cluster robust covariances are
+        supported for sparse `exog`.
+        """
+        if sparse.issparse(self.wexog):
+            if method == "qr":
+                raise ValueError('method "qr" is not available for sparse '
+                                 'exog')
+            elif method == "pinv":
+                # no dense pseudoinverse, use the normal equations
+                method = "cholesky"
+
         if method == "pinv":
             if ((not hasattr(self, 'pinv_wexog')) or
                 (not hasattr(self, 'normalized_cov_params')) or
@@ -216,6 +320,73 @@ class RegressionModel(base.LikelihoodModel):
             self.effects = effects = np.dot(Q.T, self.wendog)
             beta = np.linalg.solve(R, effects)
 
+        elif method in ("cholesky", "lsqr"):
+            k_vars = self.wexog.shape[1]
+            effects = None
+            if ((not hasattr(self, '_wexog_cho_factor')) or
+                (not hasattr(self, 'normalized_cov_params')) or
+                (getattr(self, 'rank', None) is None)):
+                xtx = _cross_product(self.wexog)
+                singular_values = np.sqrt(np.clip(np.linalg.eigvalsh(xtx),
+                                                  0, np.inf))[::-1]
+                self._wexog_cho_factor = None
+                # the cross-product squares the condition number, it only
+                # resolves the singular values of well conditioned wexog
+                if (singular_values[-1] >
+                        singular_values[0] * _CHOLESKY_COND_TOL):
+                    try:
+                        self._wexog_cho_factor = cho_factor(xtx)
+                    except np.linalg.LinAlgError:
+                        pass
+                if self._wexog_cho_factor is not None:
+                    self.wexog_singular_values = singular_values
+                    self.rank = k_vars
+                    self.normalized_cov_params = cho_solve(
+                        self._wexog_cho_factor, np.eye(k_vars))
+                else:
+                    # use the R factor of wexog, computed over blocks of
+                    # rows, for ill-conditioned or singular wexog
+                    r = _r_factor(self.wexog, self.wendog)
+                    effects = r[:k_vars, k_vars]
+                    u, s, vt = np.linalg.svd(r[:k_vars, :k_vars],
+                                             full_matrices=False)
+                    self.wexog_singular_values = s
+                    keep = s > _rank_tol(s, self.wexog.shape[0])
+                    self.rank = int(keep.sum())
+                    self._wexog_svd = u[:, keep], s[keep], vt[keep]
+                    vt = vt[keep] / s[keep, None]
+                    self.normalized_cov_params = np.dot(vt.T, vt)
+
+            if method == "lsqr":
+                # iterative solution on wexog, does not square the
+                # condition number
+                singular_values = self.wexog_singular_values
+                cond = singular_values[0] / max(singular_values[-1],
+                                                np.finfo(np.float64).tiny)
+                beta, istop, itn = lsqr(self.wexog, self.wendog, atol=1e-14,
+                                        btol=1e-14, conlim=1e16,
+                                        iter_lim=_lsqr_iter_lim(k_vars,
+                                                                cond))[:3]
+                # 3 and 6: condition number limit, 7: iteration limit
+                if istop in (3, 6, 7):
+                    warnings.warn('lsqr stopped with istop=%d after %d '
+                                  'iterations, the parameters might not be '
+                                  'the least squares solution' % (istop, itn),
+                                  ConvergenceWarning)
+            elif self._wexog_cho_factor is not None:
+                xty = self.wexog.T.dot(self.wendog)
+                beta = cho_solve(self._wexog_cho_factor, xty)
+            else:
+                if effects is None:
+                    effects = _r_factor(self.wexog,
+                                        self.wendog)[:k_vars, k_vars]
+                u, s, vt = self._wexog_svd
+                beta = np.dot(vt.T, np.dot(u.T, effects) / s)
+
+        else:
+            raise ValueError('method has to be "pinv", "qr", "cholesky" or '
+                             '"lsqr"')
+
         if self._df_model is None:
             self._df_model = float(self.rank - self.k_constant)
         if self._df_resid is None:
@@ -225,6 +396,11 @@ class RegressionModel(base.LikelihoodModel):
             lfit = OLSResults(self, beta,
                        normalized_cov_params=self.normalized_cov_params,
                        cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t)
+        elif isinstance(self, AbsorbingLS):
+            lfit = AbsorbingLSResults(self, beta,
+                       normalized_cov_params=self.normalized_cov_params,
+                       cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t,
+                       **kwargs)
         else:
             lfit = RegressionResults(self, beta,
                        normalized_cov_params=self.normalized_cov_params,
@@ -258,6 +434,8 @@ class RegressionModel(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
 
+        if sparse.issparse(exog):
+            return exog.dot(params)
         return np.dot(exog, params)
 
     def get_distribution(self, params, scale, exog=None, dist_class=None):
@@ -404,6 +582,13 @@ class GLS(RegressionModel):
         --------
         regression.GLS
         """
+        if sparse.issparse(X):
+            if self.sigma is None or self.sigma.shape == ():
+                return X
+            elif self.sigma.ndim == 1:
+                return sparse.diags(self.cholsigmainv).dot(X)
+            else:
+                raise ValueError('sparse exog requires a diagonal sigma')
         X = np.asarray(X)
         if self.sigma is None or self.sigma.shape == ():
             return X
@@ -446,7 +631,7 @@ class GLS(RegressionModel):
         """
         #TODO: combine this with OLS/WLS loglike and add _det_sigma argument
         nobs2 = self.nobs / 2.0
-        SSR = np.sum((self.wendog - np.dot(self.wexog, params))**2, axis=0)
+        SSR = np.sum((self.wendog - self.wexog.dot(params))**2, axis=0)
         llf = -np.log(SSR) * nobs2      # concentrated likelihood
         llf -= (1+np.log(np.pi/nobs2))*nobs2  # with likelihood constant
         if np.any(self.sigma):
@@ -545,6 +730,8 @@ class WLS(RegressionModel):
         sqrt(weights)*X
         """
         #print(self.weights.var()))
+        if sparse.issparse(X):
+            return sparse.diags(np.sqrt(self.weights)).dot(X)
         X = np.asarray(X)
         if X.ndim == 1:
             return X * np.sqrt(self.weights)
@@ -575,7 +762,7 @@ class WLS(RegressionModel):
         where :math:`W` is a diagonal matrix
         """
         nobs2 = self.nobs / 2.0
-        SSR = np.sum((self.wendog - np.dot(self.wexog,params))**2, axis=0)
+        SSR = np.sum((self.wendog - self.wexog.dot(params))**2, axis=0)
         llf = -np.log(SSR) * nobs2      # concentrated likelihood
         llf -= (1+np.log(np.pi/nobs2))*nobs2  # with constant
         llf += 0.5 * np.sum(np.log(self.weights))
@@ -651,7 +838,7 @@ class OLS(WLS):
         """
         nobs2 = self.nobs / 2.0
         nobs = float(self.nobs)
-        resid = self.endog - np.dot(self.exog, params)
+        resid = self.endog - self.exog.dot(params)
         if hasattr(self, 'offset'):
             resid -= self.offset
         ssr = np.sum(resid**2)
@@ -713,8 +900,8 @@ class OLS(WLS):
         if hasattr(self, 'offset'):
             y = y - self.offset
         self._wendog_xprod = np.sum(y * y)
-        self._wexog_xprod = np.dot(self.wexog.T, self.wexog)
-        self._wexog_x_wendog = np.dot(self.wexog.T, y)
+        self._wexog_xprod = _cross_product(self.wexog)
+        self._wexog_x_wendog = self.wexog.T.dot(y)
 
 
     def hessian(self, params, scale=None):
@@ -852,6 +1039,247 @@ class OLS(WLS):
                               refit=refit,
                               **defaults)
 
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             profile_scale=False, **kwargs):
+        """
+        Return elastic net regularized fits for a sequence of penalties.
+
+        Parameters
+        ----------
+        alphas : array-like
+            1d array of penalty weights.
+        L1_wt : float
+            Must be in [0, 1].  The L1 penalty has weight L1_wt and the
+            L2 penalty has weight 1 - L1_wt.
+        start_params : array-like
+            Starting values for ``params`` of the largest penalty weight.
+        profile_scale : bool
+            If True the penalized fit is computed using the profile
+            (concentrated) log-likelihood for the Gaussian model.
+            Otherwise the fit uses the residual sum of squares.
+        kwargs : keywords
+            `alpha_wt`, `maxiter`, `cnvrg_tol`, `zero_tol` and `screen`
+            are passed to `fit_elasticnet_path`.
+
+        Returns
+        -------
+        A RegularizedPathResults instance.
+
+        Notes
+        -----
+        The objective function for each penalty weight is the same as
+        in `fit_regularized`.  The fits are computed with warm starts
+        along the decreasing penalty weights and use the cached cross
+        product of `wexog`, see
+        `statsmodels.base.elastic_net.fit_elasticnet_path`.
+        """
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        if profile_scale:
+            kwds = {}
+        else:
+            kwds = {"scale": 1}
+
+        return fit_elasticnet_path(self, alphas, L1_wt=L1_wt,
+                                   start_params=start_params,
+                                   loglike_kwds=kwds, score_kwds=kwds,
+                                   hess_kwds=kwds, **kwargs)
+
+
+class AbsorbingLS(WLS):
+    __doc__ = """
+    Weighted least squares with absorbed categorical effects
+
+    The effects of one or more categorical variables, for example firm and
+    time effects in a panel, are removed from `endog` and `exog` by
+    subtracting weighted group means.  This gives the same parameters for
+    `exog` as a regression that includes a dummy variable for every level
+    of the categorical variables, without creating the dummy columns.
+
+    %(params)s
+    absorb : array-like
+        1d array, or 2d array or DataFrame with one column per effect, with
+        the group labels of the categorical variables that are absorbed.
+    weights : array-like, optional
+        1d array of weights as in `WLS`.  Default is one for all
+        observations.
+    tol : float
+        Convergence tolerance for the alternating projections if more than
+        one effect is absorbed.  The iterations stop when the largest change
+        in a sweep is smaller than `tol` times the largest absolute value
+        of the data.
+    maxiter : int
+        Maximum number of sweeps of the alternating projections.
+    %(extra_params)s
+
+    Attributes
+    ----------
+    k_absorbed : int
+        The number of linearly independent absorbed dummy variables,
+        including the intercept.  It is subtracted from the residual degrees
+        of freedom.
+
+    Notes
+    -----
+    `exog` should not include a constant, the intercept is part of the
+    absorbed effects.  Variables in `exog` that are constant within the
+    groups of an absorbed effect are collinear with it and are not
+    identified.
+
+    With one absorbed effect the demeaning is exact.  With several effects
+    the method of alternating projections is used, that is the means of
+    each effect are subtracted in turn until convergence.  `k_absorbed` is
+    exact for one and two effects, the latter uses the number of connected
+    components of the groups.  With more than two effects one redundant
+    level is assumed for each additional effect.
+
+    The results include the within transformed data in `wexog` and
+    `wendog`.  `resid` are the residuals of the regression with the
+    absorbed effects and `rsquared` is the R-squared of that regression,
+    `rsquared_within` is based on the within transformed data.  The F test
+    in `fvalue` only tests the parameters of `exog`.  Cluster robust
+    standard errors do not count the absorbed effects in the small sample
+    correction, which is appropriate if the effects are nested within the
+    clusters.  HC2 and HC3 are only available with one absorbed effect.
+
+    Examples
+    --------
+    >>> mod = AbsorbingLS(endog, exog, absorb=df[['firm', 'year']])
+    >>> res = mod.fit(cov_type='cluster', cov_kwds={'groups': df['firm']})
+    """ % {'params' : base._model_params_doc,
+           'extra_params' : base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, absorb, weights=1., missing='none',
+                 hasconst=None, tol=1e-10, maxiter=1000, **kwargs):
+        absorb = np.asarray(absorb)
+        if absorb.ndim == 1:
+            absorb = absorb[:, None]
+        if absorb.ndim != 2 or absorb.shape[0] != len(endog):
+            raise ValueError('absorb must have one row for each observation')
+        self.tol = tol
+        self.maxiter = maxiter
+        # row positions go through the missing data handling instead of
+        # the labels, so that rows with missing labels are also dropped
+        absorb_rows = np.arange(len(endog), dtype=np.float64)
+        absorb_rows[pd.isnull(pd.DataFrame(absorb)).any(1).values] = np.nan
+        self._absorb_input = absorb
+        super(AbsorbingLS, self).__init__(endog, exog, weights=weights,
+                                          missing=missing, hasconst=hasconst,
+                                          absorb_rows=absorb_rows, **kwargs)
+        self._init_keys.remove('absorb_rows')
+        self._init_keys.append('absorb')
+        if self.data.const_idx is not None:
+            raise ValueError('exog must not include a constant, the '
+                             'intercept is part of the absorbed effects')
+
+    def initialize(self):
+        from statsmodels.tools.grouputils import Group
+        rows = self.absorb_rows.astype(np.intp)
+        self.absorb = self._absorb_input[rows]
+        del self._absorb_input, self.absorb_rows
+        self._groups = [Group(self.absorb[:, i])
+                        for i in range(self.absorb.shape[1])]
+        self.k_absorbed = self._count_absorbed()
+        # the absorbed effects include the intercept
+        self.k_constant = 1
+        super(AbsorbingLS, self).initialize()
+
+        # columns that are constant within groups are only roundoff after
+        # demeaning, set them to zero so that they are not identified
+        norm_within = np.sqrt((self.wexog**2).sum(0))
+        norm_orig = np.sqrt((self.weights[:, None] * self.exog**2).sum(0))
+        rtol = max(np.sqrt(np.finfo(np.float64).eps), 100 * self.tol)
+        self.wexog[:, norm_within <= rtol * norm_orig] = 0
+
+        self.rank = np_matrix_rank(self.wexog)
+        self._df_model = float(self.rank)
+        self._df_resid = self.nobs - self.rank - self.k_absorbed
+
+    def _count_absorbed(self):
+        n_levels = [g.n_groups for g in self._groups]
+        if len(n_levels) == 2:
+            # redundant levels are the connected components of the
+            # bipartite graph of the two effects
+            from scipy.sparse.csgraph import connected_components
+            g0, g1 = self._groups
+            nobs = len(g0.group_int)
+            n_total = sum(n_levels)
+            adj = sparse.csr_matrix((np.ones(nobs),
+                                     (g0.group_int,
+                                      g1.group_int + n_levels[0])),
+                                    shape=(n_total, n_total))
+            n_comp = connected_components(adj, directed=False)[0]
+            return n_total - n_comp
+        return sum(n_levels) - len(n_levels) + 1
+
+    def demean(self, x):
+        """
+        Subtract the weighted means of the absorbed effects
+
+        Parameters
+        ----------
+        x : array-like
+            1d or 2d array with one row for each observation.
+
+        Returns
+        -------
+        x_demeaned : ndarray
+            The residuals of the weighted projection of `x` on the dummy
+            variables of the absorbed effects.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        weights = self.weights
+        if len(self._groups) == 1:
+            return self._groups[0].group_demean(x, weights=weights)[0]
+
+        x_scale = max(np.abs(x).max(), 1.)
+        for iteration in range(self.maxiter):
+            x_old = x
+            for group in self._groups:
+                x = group.group_demean(x, weights=weights)[0]
+            if np.abs(x - x_old).max() <= self.tol * x_scale:
+                break
+        else:
+            warnings.warn('alternating projections did not converge in '
+                          'maxiter=%d sweeps' % self.maxiter,
+                          ConvergenceWarning)
+        return x
+
+    def whiten(self, X):
+        """
+        Within transformation and weighting
+
+        Parameters
+        ----------
+        X : array-like
+            Data to be whitened
+
+        Returns
+        -------
+        sqrt(weights) * demean(X)
+        """
+        return super(AbsorbingLS, self).whiten(self.demean(X))
+
+    def fit(self, method="pinv", cov_type='nonrobust', cov_kwds=None,
+            use_t=None, **kwargs):
+        """
+        Full fit of the model.
+
+        See `RegressionModel.fit` for the description of the options.
+
+        Returns
+        -------
+        An AbsorbingLSResults instance.
+        """
+        if cov_type.upper() in ('HC2', 'HC3') and len(self._groups) > 1:
+            raise NotImplementedError('%s requires the leverage of the '
+                                      'absorbed effects, which is only '
+                                      'available with a single absorbed '
+                                      'effect' % cov_type)
+        return super(AbsorbingLS, self).fit(method=method, cov_type=cov_type,
+                                            cov_kwds=cov_kwds, use_t=use_t,
+                                            **kwargs)
+
 
 class GLSAR(GLS):
     __doc__ = """
@@ -950,8 +1378,7 @@ class GLSAR(GLS):
         i = -1  # need to initialize for maxiter < 1 (skip loop)
         history = {'params': [], 'rho':[self.rho]}
         for i in range(maxiter - 1):
-            if hasattr(self, 'pinv_wexog'):
-                del self.pinv_wexog
+            self._reset_fit_cache()
             self.initialize()
             results = self.fit()
             history['params'].append(results.params)
@@ -971,8 +1398,7 @@ class GLSAR(GLS):
         # Use kwarg to insert history
         if not converged and maxiter > 0:
             # maxiter <= 0 just does OLS
-            if hasattr(self, 'pinv_wexog'):
-                del self.pinv_wexog
+            self._reset_fit_cache()
             self.initialize()
 
         # if converged then this is a duplicate fit, because we didn't update rho
@@ -1439,8 +1865,14 @@ class RegressionResults(base.LikelihoodModelResults):
 
     #TODO: make these properties reset bse
     def _HCCM(self, scale):
-        H = np.dot(self.model.pinv_wexog,
-            scale[:,None]*self.model.pinv_wexog.T)
+        if getattr(self.model, 'pinv_wexog', None) is not None:
+            H = np.dot(self.model.pinv_wexog,
+                scale[:,None]*self.model.pinv_wexog.T)
+        else:
+            # pinv(X) = pinv(X'X) X', avoids nobs x k pseudoinverse
+            meat = _cross_product(self.model.wexog, scale)
+            H = chain_dot(self.normalized_cov_params, meat,
+                          self.normalized_cov_params)
         return H
 
 
@@ -1472,10 +1904,7 @@ class RegressionResults(base.LikelihoodModelResults):
         See statsmodels.RegressionResults
         """
 
-        # probably could be optimized
-        h = np.diag(chain_dot(self.model.wexog,
-                              self.normalized_cov_params,
-                              self.model.wexog.T))
+        h = _hat_matrix_diag(self.model.wexog, self.normalized_cov_params)
         self.het_scale = self.wresid**2/(1-h)
         cov_HC2 = self._HCCM(self.het_scale)
         return cov_HC2
@@ -1486,9 +1915,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         See statsmodels.RegressionResults
         """
-        h = np.diag(chain_dot(self.model.wexog,
-                              self.normalized_cov_params,
-                              self.model.wexog.T))
+        h = _hat_matrix_diag(self.model.wexog, self.normalized_cov_params)
         self.het_scale=(self.wresid/(1-h))**2
         cov_HC3 = self._HCCM(self.het_scale)
         return cov_HC3
@@ -2572,6 +2999,74 @@ class OLSResults(RegressionResults):
         return (lowerl, upperl)
 
 
+class AbsorbingLSResults(RegressionResults):
+    """
+    Results class for a regression with absorbed effects
+
+    See `AbsorbingLS` for the definition of the statistics that differ from
+    `RegressionResults`.
+    """
+
+    @cache_readonly
+    def resid(self):
+        return self.wresid / np.sqrt(self.model.weights)
+
+    @cache_readonly
+    def fittedvalues(self):
+        return self.model.endog - self.resid
+
+    @cache_readonly
+    def ess(self):
+        # explained by exog, the within sum of squares is uncentered_tss
+        return self.uncentered_tss - self.ssr
+
+    @cache_readonly
+    def rsquared_within(self):
+        return 1 - self.ssr / self.uncentered_tss
+
+    @cache_readonly
+    def fvalue(self):
+        if self.cov_type != 'nonrobust':
+            k_params = self.normalized_cov_params.shape[0]
+            ft = self.f_test(np.eye(k_params))
+            self._cache['f_pvalue'] = ft.pvalue
+            return ft.fvalue
+        return self.mse_model / self.mse_resid
+
+    @cache_readonly
+    def aic(self):
+        k_params = self.nobs - self.df_resid
+        return -2 * self.llf + 2 * k_params
+
+    @cache_readonly
+    def bic(self):
+        k_params = self.nobs - self.df_resid
+        return -2 * self.llf + np.log(self.nobs) * k_params
+
+    def _leverage(self):
+        # leverage of the regression that includes the dummy variables
+        if len(self.model._groups) > 1:
+            raise NotImplementedError('HC2 and HC3 require a single absorbed '
+                                      'effect')
+        group_int = self.model._groups[0].group_int
+        weights = self.model.weights
+        sum_w = np.bincount(group_int, weights=weights)
+        h = _hat_matrix_diag(self.model.wexog, self.normalized_cov_params)
+        return h + weights / sum_w[group_int]
+
+    @cache_readonly
+    def cov_HC2(self):
+        h = self._leverage()
+        self.het_scale = self.wresid**2 / (1 - h)
+        return self._HCCM(self.het_scale)
+
+    @cache_readonly
+    def cov_HC3(self):
+        h = self._leverage()
+        self.het_scale = (self.wresid / (1 - h))**2
+        return self._HCCM(self.het_scale)
+
+
 class RegressionResultsWrapper(wrap.ResultsWrapper):
 
     _attrs = {
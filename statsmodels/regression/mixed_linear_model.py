@@ -716,6 +716,19 @@ class MixedLM(base.LikelihoodModel):
         # Precompute this
         self._lin, self._quad = self._reparam()
 
+        # Without variance components, the likelihood and its score
+        # only depend on the data through cross products within each
+        # group, these are stacked to handle all groups at once.
+        self._grouped = (self.k_vc == 0) and (self.k_re > 0)
+        if self._grouped:
+            self._zz = np.array(self.exog_re2_li)
+            self._zxy = np.array([np.dot(z.T, np.column_stack((x, y)))
+                                  for z, x, y in zip(self.exog_re_li,
+                                                     self.exog_li,
+                                                     self.endog_li)])
+            self._xxy = np.dot(self.exog.T, np.column_stack((self.exog,
+                                                             self.endog)))
+
 
     def _setup_vcomp(self, exog_vc):
         if exog_vc is None:
@@ -1137,6 +1150,45 @@ class MixedLM(base.LikelihoodModel):
         return MixedLMResultsWrapper(results)
 
 
+    def _grouped_solve(self, cov_re_inv, rhs):
+        """
+        Solves `Q_g * x = rhs_g` for all groups g at once, where
+        `Q_g = cov_re^{-1} + Z_g' Z_g` and Z_g is the random effects
+        design matrix of group g.
+
+        Returns the solutions and the stacked matrices Q_g.  The
+        marginal covariance matrix of group g is `I + Z_g cov_re Z_g'`
+        with inverse `I - Z_g Q_g^{-1} Z_g'`.
+        """
+        qmat = self._zz + cov_re_inv
+        if rhs.ndim == 2:
+            return np.linalg.solve(qmat, rhs[:, :, None])[:, :, 0], qmat
+        return np.linalg.solve(qmat, rhs), qmat
+
+
+    def _grouped_resid(self, fe_params):
+        """
+        Returns the residual sum of squares, the residuals and the
+        stacked products Z_g' r_g of the groups.
+        """
+        resid = self.endog
+        if self.k_fe > 0:
+            resid = resid - np.dot(self.exog, fe_params)
+        zr = np.dot(self._zxy, np.concatenate((-fe_params, [1.])))
+        return np.dot(resid, resid), resid, zr
+
+
+    def _grouped_xvx(self, qzx):
+        """
+        Returns exog' V^{-1} exog summed over the groups, where qzx
+        contains the stacked solutions Q_g^{-1} Z_g' exog_g.
+        """
+        zx = self._zxy[:, :, :-1]
+        k = self._zxy.shape[1] * self._zxy.shape[0]
+        return (self._xxy[:, :-1] -
+                np.dot(zx.reshape(k, -1).T, qzx.reshape(k, -1)))
+
+
     def get_fe_params(self, cov_re, vcomp):
         """
         Use GLS to update the fixed effects parameter estimates.
@@ -1166,6 +1218,13 @@ class MixedLM(base.LikelihoodModel):
                 mat = np.concatenate((self.exog_li[group_ix], self.endog_li[group_ix][:, None]), axis=1)
                 self._endex_li.append(mat)
 
+        if self._grouped:
+            u, _ = self._grouped_solve(cov_re_inv, self._zxy)
+            zx = self._zxy[:, :, :-1]
+            k = u.shape[0] * u.shape[1]
+            xtxy = self._xxy - np.dot(zx.reshape(k, -1).T, u.reshape(k, -1))
+            return np.linalg.solve(xtxy[:, 0:-1], xtxy[:, -1])
+
         xtxy = 0.
         for group_ix, group in enumerate(self.group_labels):
             vc_var = self._expand_vcomp(vcomp, group)
@@ -1363,7 +1422,21 @@ class MixedLM(base.LikelihoodModel):
             likeval -= self.fe_pen.func(fe_params)
 
         xvx, qf = 0., 0.
-        for k, group in enumerate(self.group_labels):
+        if self._grouped and cov_re_inv is not None:
+            rr, _, zr = self._grouped_resid(fe_params)
+            qzr, qmat = self._grouped_solve(cov_re_inv, zr)
+            qf = rr - np.sum(zr * qzr)
+            _, ld = np.linalg.slogdet(qmat)
+            likeval -= (self.n_groups * cov_re_logdet + ld.sum()) / 2.
+            if self.reml:
+                qzx, _ = self._grouped_solve(cov_re_inv,
+                                             self._zxy[:, :, :-1])
+                xvx = self._grouped_xvx(qzx)
+            groups = []
+        else:
+            groups = self.group_labels
+
+        for k, group in enumerate(groups):
 
             vc_var = self._expand_vcomp(vcomp, group)
             cov_aug_logdet = cov_re_logdet + np.sum(np.log(vc_var))
@@ -1541,6 +1614,10 @@ class MixedLM(base.LikelihoodModel):
         if calc_fe and (self.fe_pen is not None):
             score_fe -= self.fe_pen.grad(fe_params)
 
+        if self._grouped and cov_re_inv is not None:
+            return self._score_full_grouped(params, calc_fe, cov_re_inv,
+                                            score_fe, score_re, score_vc)
+
         # resid' V^{-1} resid, summed over the groups (a scalar)
         rvir = 0.
 
@@ -1636,6 +1713,77 @@ class MixedLM(base.LikelihoodModel):
         return score_fe, score_re, score_vc
 
 
+    def _score_full_grouped(self, params, calc_fe, cov_re_inv, score_fe,
+                            score_re, score_vc):
+        """
+        `score_full` for models without variance components, with the
+        terms of all groups computed at once from the stacked cross
+        products.
+
+        `score_fe`, `score_re` and `score_vc` contain the penalty
+        contributions.
+        """
+
+        fe_params = params.fe_params
+        zz = self._zz
+        zx = self._zxy[:, :, :-1]
+
+        rr, resid, zr = self._grouped_resid(fe_params)
+        qzr, _ = self._grouped_solve(cov_re_inv, zr)
+
+        # Z' V^{-1} Z and Z' V^{-1} resid of each group
+        qzz, _ = self._grouped_solve(cov_re_inv, zz)
+        zvz = zz - np.einsum('gij,gjk->gik', zz, qzz)
+        zvr = zr - np.einsum('gij,gj->gi', zz, qzr)
+
+        rvir = rr - np.sum(zr * qzr)
+
+        if self.reml:
+            # Z' V^{-1} exog of each group
+            qzx, _ = self._grouped_solve(cov_re_inv, zx)
+            xtvix = self._grouped_xvx(qzx)
+            zvx = zx - np.einsum('gij,gjk->gik', zz, qzx)
+            zvx_outer = np.einsum('gip,gjq->ijpq', zvx, zvx)
+
+        zvz_sum = zvz.sum(0)
+        zvr_outer = np.dot(zvr.T, zvr)
+
+        # The derivatives with respect to the lower triangle of cov_re
+        xtax = []
+        dlv = np.zeros(self.k_re2)
+        rvavr = np.zeros(self.k_re2)
+        for jj, (j1, j2) in enumerate(zip(*np.tril_indices(self.k_re))):
+            sym = j1 == j2
+            dlv[jj] = zvz_sum[j2, j1]
+            rvavr[jj] = zvr_outer[j1, j2]
+            if not sym:
+                dlv[jj] += zvz_sum[j1, j2]
+                rvavr[jj] += zvr_outer[j2, j1]
+            if self.reml:
+                ulr = zvx_outer[j1, j2]
+                xtax.append(ulr if sym else ulr + ulr.T)
+
+        score_re -= 0.5 * dlv
+
+        fac = self.n_totobs
+        if self.reml:
+            fac -= self.k_fe
+
+        if calc_fe and self.k_fe > 0:
+            xtvir = np.dot(self.exog.T, resid) - np.dot(
+                zx.reshape(-1, self.k_fe).T, qzr.reshape(-1))
+            score_fe += fac * xtvir / rvir
+
+        score_re += 0.5 * fac * rvavr / rvir
+
+        if self.reml:
+            xtvixi = np.linalg.inv(xtvix)
+            for j in range(self.k_re2):
+                score_re[j] += 0.5 * _dotsum(xtvixi.T, xtax[j])
+
+        return score_fe, score_re, score_vc
+
+
     def score_sqrt(self, params, calc_fe=True):
         """
         Returns the score with respect to transformed parameters.
@@ -1864,7 +2012,15 @@ class MixedLM(base.LikelihoodModel):
             cov_re_inv = None
 
         qf = 0.
-        for group_ix, group in enumerate(self.group_labels):
+        if self._grouped and cov_re_inv is not None:
+            rr, _, zr = self._grouped_resid(fe_params)
+            qzr, _ = self._grouped_solve(cov_re_inv, zr)
+            qf = rr - np.sum(zr * qzr)
+            groups = []
+        else:
+            groups = self.group_labels
+
+        for group_ix, group in enumerate(groups):
 
             vc_var = self._expand_vcomp(vcomp, group)
 
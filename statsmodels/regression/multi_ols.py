@@ -0,0 +1,368 @@
+"""
+Ordinary least squares for many dependent variables with a common design
+
+All columns of a two-dimensional `endog` are regressed on the same `exog`.
+The design matrix is factored once and the parameters, residuals and
+standard errors for all columns are computed with matrix products instead
+of a loop over separate OLS models.
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+from scipy import stats
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+
+from statsmodels.compat.numpy import np_matrix_rank
+import statsmodels.base.model as base
+import statsmodels.base.wrapper as wrap
+from statsmodels.regression.linear_model import OLS, _hat_matrix_diag
+from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.tools import pinv_extended
+
+__all__ = ['MultiOLS', 'MultiOLSResults']
+
+
+class MultiOLS(base.Model):
+    __doc__ = """
+    Ordinary least squares for several dependent variables with common exog
+
+    Parameters
+    ----------
+    endog : array-like
+        2-d array of shape (nobs, k_endog).  Each column is a separate
+        dependent variable.
+    exog : array-like
+        nobs x k array of regressors shared by all dependent variables.
+        An intercept is not included by default and should be added by the
+        user. See :func:`statsmodels.tools.add_constant`.
+    %(extra_params)s
+
+    Notes
+    -----
+    The results are identical to fitting ``OLS(endog[:, i], exog)``
+    separately for each column ``i``, but ``exog`` is only factored once and
+    all columns are solved in a single matrix product.
+
+    The results attributes are arrays of shape (k_exog, k_endog) for
+    parameter statistics and of shape (k_endog,) for the statistics that
+    summarize the fit of each column, for example `rsquared`.  An `OLS`
+    results instance for a single column is available from
+    `MultiOLSResults.get_ols_results`.
+
+    Examples
+    --------
+    >>> mod = MultiOLS(endog, sm.add_constant(exog))
+    >>> res = mod.fit()
+    >>> res.params, res.bse, res.rsquared
+    """ % {'extra_params' : base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, missing='none', hasconst=None, **kwargs):
+        super(MultiOLS, self).__init__(endog, exog, missing=missing,
+                                       hasconst=hasconst, **kwargs)
+        if self.endog.ndim == 1:
+            self.endog = self.endog[:, None]
+        if self.endog.ndim != 2:
+            raise ValueError('endog has to be two-dimensional')
+        self.nobs, self.k_endog = self.endog.shape
+        self.k_exog = self.exog.shape[1]
+        self._data_attr.extend(['pinv_wexog', 'exog_Q'])
+
+    def _factor(self, method):
+        """factor exog once, results are cached for repeated fits"""
+        if getattr(self, '_method', None) == method:
+            return
+        exog = self.exog
+        self.pinv_wexog = self.exog_Q = self.exog_R = None
+        self._wexog_cho_factor = None
+        if method == 'pinv':
+            self.pinv_wexog, singular_values = pinv_extended(exog)
+            self.normalized_cov_params = np.dot(self.pinv_wexog,
+                                                self.pinv_wexog.T)
+            self.wexog_singular_values = singular_values
+            self.rank = np_matrix_rank(np.diag(singular_values))
+        elif method == 'qr':
+            self.exog_Q, self.exog_R = np.linalg.qr(exog)
+            r_inv = solve_triangular(self.exog_R, np.eye(self.k_exog))
+            self.normalized_cov_params = np.dot(r_inv, r_inv.T)
+            self.wexog_singular_values = np.linalg.svd(self.exog_R, 0, 0)
+            self.rank = np_matrix_rank(self.exog_R)
+        elif method == 'cholesky':
+            xtx = np.dot(exog.T, exog)
+            eigvals = np.clip(np.linalg.eigvalsh(xtx), 0, np.inf)
+            self.wexog_singular_values = np.sqrt(eigvals)[::-1]
+            self.rank = np_matrix_rank(np.diag(eigvals))
+            if self.rank < self.k_exog:
+                raise ValueError('exog is singular, use method="pinv"')
+            self._wexog_cho_factor = cho_factor(xtx)
+            self.normalized_cov_params = cho_solve(self._wexog_cho_factor,
+                                                   np.eye(self.k_exog))
+        else:
+            raise ValueError('method has to be "pinv", "qr" or "cholesky"')
+        self._method = method
+        self.df_model = float(self.rank - self.k_constant)
+        self.df_resid = self.nobs - self.rank
+
+    def fit(self, method='pinv', cov_type='nonrobust', use_t=None):
+        """
+        Fit the regressions for all columns of endog
+
+        Parameters
+        ----------
+        method : str
+            "pinv" (default), "qr" or "cholesky", see `RegressionModel.fit`.
+            The factorization of exog is cached and reused if `fit` is
+            called again with the same method.
+        cov_type : str
+            'nonrobust' (default) or one of the heteroscedasticity robust
+            covariances 'HC0', 'HC1', 'HC2' or 'HC3'.
+        use_t : bool, optional
+            If True, the t distribution is used for p-values, otherwise the
+            normal distribution.  The default is True for the nonrobust
+            covariance and False otherwise, as in `RegressionResults`.
+
+        Returns
+        -------
+        results : MultiOLSResults instance
+        """
+        if cov_type not in ('nonrobust', 'HC0', 'HC1', 'HC2', 'HC3'):
+            raise ValueError('cov_type has to be nonrobust, HC0, HC1, HC2 '
+                             'or HC3')
+        self._factor(method)
+        if use_t is None:
+            use_t = (cov_type == 'nonrobust')
+
+        if method == 'pinv':
+            params = np.dot(self.pinv_wexog, self.endog)
+        elif method == 'qr':
+            effects = np.dot(self.exog_Q.T, self.endog)
+            params = solve_triangular(self.exog_R, effects)
+        else:
+            params = cho_solve(self._wexog_cho_factor,
+                               np.dot(self.exog.T, self.endog))
+
+        res = MultiOLSResults(self, params, cov_type=cov_type, use_t=use_t)
+        return MultiOLSResultsWrapper(res)
+
+    def predict(self, params, exog=None):
+        """
+        Return linear predicted values for all columns of endog
+
+        Parameters
+        ----------
+        params : array-like
+            k_exog x k_endog array of parameters.
+        exog : array-like, optional
+            Design matrix, model exog is used if None.
+
+        Returns
+        -------
+        An nobs x k_endog array of predicted values
+        """
+        if exog is None:
+            exog = self.exog
+        return np.dot(exog, params)
+
+
+class MultiOLSResults(base.Results):
+    """
+    Results of regressing several dependent variables on a common design
+
+    Parameter statistics, `params`, `bse`, `tvalues` and `pvalues`, are
+    arrays of shape (k_exog, k_endog), one column for each dependent
+    variable.  Statistics of the fit, e.g. `ssr`, `scale`, `rsquared`,
+    `fvalue` and `llf`, are arrays of shape (k_endog,).
+
+    Notes
+    -----
+    `fvalue` and `f_pvalue` are the classical F test that all slope
+    coefficients are zero.  They do not use the heteroscedasticity robust
+    covariance.
+    """
+
+    def __init__(self, model, params, cov_type='nonrobust', use_t=True):
+        super(MultiOLSResults, self).__init__(model, params)
+        self._cache = {}
+        self.normalized_cov_params = model.normalized_cov_params
+        self.df_model = model.df_model
+        self.df_resid = model.df_resid
+        self.nobs = model.nobs
+        self.cov_type = cov_type
+        self.use_t = use_t
+
+    @cache_readonly
+    def fittedvalues(self):
+        return self.model.predict(self.params)
+
+    @cache_readonly
+    def resid(self):
+        return self.model.endog - self.fittedvalues
+
+    @cache_readonly
+    def ssr(self):
+        return (self.resid**2).sum(0)
+
+    @cache_readonly
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def centered_tss(self):
+        endog = self.model.endog
+        return ((endog - endog.mean(0))**2).sum(0)
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return (self.model.endog**2).sum(0)
+
+    @cache_readonly
+    def ess(self):
+        if self.k_constant:
+            return self.centered_tss - self.ssr
+        else:
+            return self.uncentered_tss - self.ssr
+
+    @cache_readonly
+    def rsquared(self):
+        if self.k_constant:
+            return 1 - self.ssr / self.centered_tss
+        else:
+            return 1 - self.ssr / self.uncentered_tss
+
+    @cache_readonly
+    def rsquared_adj(self):
+        return 1 - (np.divide(self.nobs - self.k_constant, self.df_resid) *
+                    (1 - self.rsquared))
+
+    @cache_readonly
+    def fvalue(self):
+        return (self.ess / self.df_model) / (self.ssr / self.df_resid)
+
+    @cache_readonly
+    def f_pvalue(self):
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    @cache_readonly
+    def llf(self):
+        nobs2 = self.nobs / 2.
+        return (-nobs2 * np.log(2 * np.pi) - nobs2 * np.log(self.ssr /
+                self.nobs) - nobs2)
+
+    @cache_readonly
+    def aic(self):
+        return -2 * self.llf + 2 * (self.df_model + self.k_constant)
+
+    @cache_readonly
+    def bic(self):
+        return (-2 * self.llf + np.log(self.nobs) * (self.df_model +
+                                                     self.k_constant))
+
+    @cache_readonly
+    def hat_matrix_diag(self):
+        return _hat_matrix_diag(self.model.exog, self.normalized_cov_params)
+
+    def _het_scale(self, cov_type):
+        resid2 = self.resid**2
+        if cov_type == 'HC0':
+            return resid2
+        elif cov_type == 'HC1':
+            return self.nobs / self.df_resid * resid2
+        elif cov_type == 'HC2':
+            return resid2 / (1 - self.hat_matrix_diag)[:, None]
+        else:
+            return resid2 / ((1 - self.hat_matrix_diag)**2)[:, None]
+
+    @cache_readonly
+    def bse(self):
+        if self.cov_type == 'nonrobust':
+            var = np.outer(np.diag(self.normalized_cov_params), self.scale)
+        else:
+            # diag(P diag(s_j) P') for all columns j, with P = pinv(exog)
+            het_scale = self._het_scale(self.cov_type)
+            exog = self.model.exog
+            chunksize = 100000
+            var = 0
+            for start in range(0, exog.shape[0], chunksize):
+                x = exog[start:start + chunksize]
+                pinv_sq = np.dot(x, self.normalized_cov_params)**2
+                var += np.dot(pinv_sq.T, het_scale[start:start + chunksize])
+        return np.sqrt(var)
+
+    @cache_readonly
+    def tvalues(self):
+        return self.params / self.bse
+
+    @cache_readonly
+    def pvalues(self):
+        if self.use_t:
+            return stats.t.sf(np.abs(self.tvalues), self.df_resid) * 2
+        else:
+            return stats.norm.sf(np.abs(self.tvalues)) * 2
+
+    def get_ols_results(self, idx):
+        """
+        OLS results instance for one column of endog
+
+        Parameters
+        ----------
+        idx : int
+            Index of the column of endog.
+
+        Returns
+        -------
+        results : RegressionResultsWrapper
+            The results of `OLS` for the column, which provide all
+            post-estimation methods like `summary`, `t_test` and
+            `get_influence`.  The factorization of exog is reused.
+        """
+        model = self.model
+        data = model.data
+        endog = data.orig_endog
+        if hasattr(endog, 'iloc'):
+            endog = endog.iloc[:, idx]
+        else:
+            endog = model.endog[:, idx]
+        mod = OLS(endog, data.orig_exog, hasconst=(model.k_constant > 0))
+        mod.normalized_cov_params = model.normalized_cov_params
+        mod.wexog_singular_values = model.wexog_singular_values
+        mod.rank = model.rank
+        method = model._method
+        if method == 'pinv':
+            mod.pinv_wexog = model.pinv_wexog
+        elif method == 'qr':
+            mod.exog_Q, mod.exog_R = model.exog_Q, model.exog_R
+        else:
+            mod._wexog_cho_factor = model._wexog_cho_factor
+        cov_type = self.cov_type
+        return mod.fit(method=method, cov_type=cov_type, use_t=self.use_t)
+
+
+class MultiOLSResultsWrapper(wrap.ResultsWrapper):
+    _by_endog = ('generic_columns', 'ynames')
+    _attrs = {
+        'params': 'columns_eq',
+        'bse': 'columns_eq',
+        'tvalues': 'columns_eq',
+        'pvalues': 'columns_eq',
+        'fittedvalues': 'rows',
+        'resid': 'rows',
+        'hat_matrix_diag': 'rows',
+        'ssr': _by_endog,
+        'scale': _by_endog,
+        'centered_tss': _by_endog,
+        'uncentered_tss': _by_endog,
+        'ess': _by_endog,
+        'rsquared': _by_endog,
+        'rsquared_adj': _by_endog,
+        'fvalue': _by_endog,
+        'f_pvalue': _by_endog,
+        'llf': _by_endog,
+        'aic': _by_endog,
+        'bic': _by_endog,
+    }
+    _wrap_attrs = _attrs
+    _methods = {}
+    _wrap_methods = _methods
+
+wrap.populate_wrapper(MultiOLSResultsWrapper, MultiOLSResults)
@@ -0,0 +1,533 @@
+"""
+Rolling and expanding window least squares
+
+The cross-product matrices of the windows are updated by adding the outer
+product of the observation that enters the window and subtracting the one
+that leaves it.  The updates are vectorized over blocks of consecutive
+windows, and the cross-products are recomputed directly at the start of
+each block to limit the accumulation of rounding errors.
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+import statsmodels.base.model as base
+from statsmodels.tools.decorators import cache_readonly
+
+__all__ = ['RollingOLS', 'RollingWLS', 'RollingRegressionResults']
+
+
+_rolling_params_doc = """
+    endog : array-like
+        1-d endogenous response variable.
+    exog : array-like
+        A nobs x k array.  An intercept is not included by default and
+        should be added by the user.
+    window : int, optional
+        Length of the rolling window.  Must be at least k_exog + 1.  If None,
+        the window is the full sample and the results are the expanding
+        window estimates.
+"""
+
+_rolling_extra_doc = """
+    min_nobs : int, optional
+        Minimum number of observations required to estimate a model when
+        the window is not yet full, only used if `expanding` is True.
+        Default is k_exog + 1.
+    expanding : bool
+        If True, then the windows at the start of the sample that contain
+        fewer than `window` observations are estimated as long as they
+        contain at least `min_nobs` observations.  Default is False, and
+        the results for windows that are not full are nan.
+    missing : str
+        Available options are 'none' and 'raise'.  Missing values are not
+        dropped since that would break the alignment of the windows.  With
+        'none', the results of the windows that contain a missing value
+        are nan.
+    hasconst : None or bool
+        Indicates whether the design matrix includes a user-supplied
+        constant.
+
+    Notes
+    -----
+    The results at position ``t`` are estimated with the observations in
+    the window that ends at ``t`` including ``t``.
+
+    The cross-product matrix and the cross-product of exog and endog are
+    updated with a rank-one update when an observation enters the window
+    and a rank-one downdate when an observation leaves it, so the cost of
+    the updates does not depend on the window length.  The parameters are
+    obtained with a vectorized solve of the k x k normal equations of each
+    window, windows with a singular cross-product use the pseudoinverse.
+    The sum of squared residuals is computed from the residuals of each
+    window at a cost of O(window * k) per window, since computing it from
+    the cross-products cancels badly if endog has a large level.
+    Heteroscedasticity robust covariances cost O(window * k**2) per window.
+"""
+
+
+class RollingWLS(base.Model):
+    __doc__ = """
+    Rolling window weighted least squares
+
+    Parameters
+    ----------%(params)s    weights : array-like, optional
+        1-d array of weights as in `WLS`.  Default is one for all
+        observations.%(extra)s
+    """ % {'params': _rolling_params_doc, 'extra': _rolling_extra_doc}
+
+    def __init__(self, endog, exog, window=None, weights=None, min_nobs=None,
+                 expanding=False, missing='none', hasconst=None, **kwargs):
+        if missing not in ('none', 'raise'):
+            raise ValueError("missing has to be 'none' or 'raise'")
+        if weights is None:
+            weights = np.ones(len(endog))
+        super(RollingWLS, self).__init__(endog, exog, weights=weights,
+                                         missing=missing, hasconst=hasconst,
+                                         **kwargs)
+        self.weights = np.asarray(self.weights, dtype=np.float64)
+        if self.exog.ndim == 1:
+            self.exog = self.exog[:, None]
+        self.nobs, self.k_exog = self.exog.shape
+        if self.weights.shape != (self.nobs,):
+            raise ValueError('weights must have the same length as endog')
+
+        self.window = self.nobs if window is None else int(window)
+        if self.window < self.k_exog + 1 or self.window > self.nobs:
+            raise ValueError('window must be between k_exog + 1 and nobs')
+        self.expanding = expanding or window is None
+        if min_nobs is None:
+            min_nobs = self.k_exog + 1
+        self.min_nobs = int(min_nobs)
+        if self.min_nobs < self.k_exog + 1 or self.min_nobs > self.window:
+            raise ValueError('min_nobs must be between k_exog + 1 and window')
+
+        sqrt_w = np.sqrt(self.weights)
+        self.wexog = self.exog * sqrt_w[:, None]
+        self.wendog = self.endog * sqrt_w
+        # observations with missing values are excluded from the window
+        # sums and invalidate the windows that contain them
+        self._missing_obs = (np.isnan(self.wendog) |
+                             np.isnan(self.wexog).any(1))
+
+    def _nan_to_zero(self, arr):
+        """copy of arr with zeros in the rows of missing observations"""
+        arr = arr.copy()
+        arr[self._missing_obs] = 0
+        return arr
+
+    def _window_stats(self, blocksize):
+        """cross-products for all windows, in blocks of consecutive windows"""
+        nobs, k = self.nobs, self.k_exog
+        window = self.window
+        missing = self._missing_obs
+        wexog = self._nan_to_zero(self.wexog)
+        wendog = self._nan_to_zero(self.wendog)
+
+        first = self.min_nobs - 1 if self.expanding else window - 1
+
+        xtx = np.empty((nobs, k, k))
+        xty = np.empty((nobs, k))
+        yty = np.empty(nobs)
+        nobs_window = np.minimum(np.arange(1, nobs + 1), window)
+
+        for start in range(first, nobs, blocksize):
+            stop = min(start + blocksize, nobs)
+            # direct computation for the first window of the block
+            lo = max(0, start - window + 1)
+            x = wexog[lo:start + 1]
+            y = wendog[lo:start + 1]
+            base_stats = [np.dot(x.T, x), np.dot(x.T, y), np.dot(y, y)]
+
+            # rank one updates, entering minus leaving observations
+            idx_in = np.arange(start + 1, stop)
+            idx_out = idx_in - window
+            keep = (idx_out >= 0).astype(np.float64)
+            idx_out = np.maximum(idx_out, 0)
+            x_in, x_out = wexog[idx_in], wexog[idx_out] * keep[:, None]
+            y_in, y_out = wendog[idx_in], wendog[idx_out] * keep
+
+            updates = [x_in[:, :, None] * x_in[:, None, :] -
+                       x_out[:, :, None] * x_out[:, None, :],
+                       x_in * y_in[:, None] - x_out * y_out[:, None],
+                       y_in**2 - y_out**2]
+
+            for arr, base_value, upd in zip([xtx, xty, yty], base_stats,
+                                            updates):
+                arr[start] = base_value
+                arr[start + 1:stop] = base_value + np.cumsum(upd, axis=0)
+
+        valid = np.zeros(nobs, bool)
+        valid[first:] = True
+        # number of missing observations in each window
+        cum_missing = np.concatenate(([0], np.cumsum(missing)))
+        idx = np.arange(1, nobs + 1)
+        n_missing = cum_missing[idx] - cum_missing[np.maximum(idx - window,
+                                                              0)]
+        valid &= n_missing == 0
+        return valid, nobs_window, xtx, xty, yty
+
+    def _solve(self, xtx, xty):
+        """parameters and inverse cross-products for a stack of windows"""
+        k = self.k_exog
+        rcond = k * np.finfo(np.float64).eps
+        sv = np.linalg.svd(xtx, compute_uv=False)
+        rank = (sv > rcond * sv[:, :1]).sum(1)
+        full = rank == k
+        xtx_inv = np.empty_like(xtx)
+        if full.any():
+            xtx_inv[full] = np.linalg.inv(xtx[full])
+        # singular windows use the pseudoinverse
+        for i in np.nonzero(~full)[0]:
+            xtx_inv[i] = np.linalg.pinv(xtx[i], rcond)
+        params = np.einsum('ijk,ik->ij', xtx_inv, xty)
+        return params, xtx_inv, rank
+
+    def _window_data(self, idx):
+        """
+        observations of the windows ending at idx, in chunks of windows
+
+        Yields the slice of idx of the chunk and the weighted exog, the
+        weighted endog and the square root of the weights, gathered into
+        arrays with one row for each window.  The observations of the
+        chunks are about 2**16.
+        """
+        window = self.window
+        chunksize = max(1, 2**16 // window)
+        offsets = np.arange(1 - window, 1)
+        sqrt_w = np.sqrt(self.weights)
+        for start in range(0, len(idx), chunksize):
+            sl = slice(start, start + chunksize)
+            rows = idx[sl, None] + offsets
+            # positions before the start of the sample, in windows that
+            # are not full, are zero and do not contribute
+            inside = rows >= 0
+            rows = np.where(inside, rows, 0)
+            yield (sl, self.wexog[rows] * inside[:, :, None],
+                   self.wendog[rows] * inside, sqrt_w[rows] * inside)
+
+    def _resid_stats(self, idx, params, xtx_inv, cov_type):
+        """
+        sum of squared residuals, centered total sum of squares and HC meat
+        matrices from the residuals of each window
+
+        The sums of squares are not computed from the cross-products since
+        that cancels badly if endog has a large level.
+        """
+        k = self.k_exog
+        ssr = np.empty(len(idx))
+        centered_tss = np.empty(len(idx))
+        meat = None if cov_type == 'nonrobust' else np.empty((len(idx), k, k))
+        for sl, x, y, sqrt_w in self._window_data(idx):
+            resid = y - np.einsum('ijk,ik->ij', x, params[sl])
+            ssr[sl] = (resid**2).sum(1)
+            mean = (sqrt_w * y).sum(1) / (sqrt_w**2).sum(1)
+            centered_tss[sl] = ((y - sqrt_w * mean[:, None])**2).sum(1)
+            if meat is None:
+                continue
+            resid2 = resid**2
+            if cov_type in ('HC2', 'HC3'):
+                hat = np.einsum('ijk,ikl,ijl->ij', x, xtx_inv[sl], x)
+                if cov_type == 'HC2':
+                    resid2 = resid2 / (1 - hat)
+                else:
+                    resid2 = resid2 / (1 - hat)**2
+            meat[sl] = np.einsum('ijk,ij,ijl->ikl', x, resid2, x)
+        return ssr, centered_tss, meat
+
+    def fit(self, cov_type='nonrobust', params_only=False, blocksize=1000):
+        """
+        Estimate the model for all windows
+
+        Parameters
+        ----------
+        cov_type : str
+            'nonrobust' (default) or one of the heteroscedasticity robust
+            covariances 'HC0', 'HC1', 'HC2', 'HC3'.
+        params_only : bool
+            If True, only the parameters are computed and returned in the
+            results instance.  The other statistics are not available.
+        blocksize : int
+            Number of consecutive windows that are updated in one vectorized
+            step.  The cross-products are recomputed directly at the start
+            of each block.
+
+        Returns
+        -------
+        results : RollingRegressionResults
+        """
+        if cov_type not in ('nonrobust', 'HC0', 'HC1', 'HC2', 'HC3'):
+            raise ValueError('cov_type has to be nonrobust, HC0, HC1, HC2 '
+                             'or HC3')
+        nobs, k = self.nobs, self.k_exog
+        valid, nobs_window, xtx, xty, yty = self._window_stats(int(blocksize))
+
+        idx = np.nonzero(valid)[0]
+        params = np.empty((nobs, k))
+        params.fill(np.nan)
+        cov_params = np.empty((nobs, k, k))
+        cov_params.fill(np.nan)
+        rank = np.zeros(nobs, int)
+        ssr = np.empty(nobs)
+        ssr.fill(np.nan)
+        centered_tss = np.empty(nobs)
+        centered_tss.fill(np.nan)
+
+        for start in range(0, len(idx), int(blocksize)):
+            ii = idx[start:start + int(blocksize)]
+            p, xtx_inv, rank[ii] = self._solve(xtx[ii], xty[ii])
+            params[ii] = p
+            if params_only:
+                continue
+            ssr[ii], centered_tss[ii], meat = self._resid_stats(
+                ii, p, xtx_inv, cov_type)
+            if cov_type == 'nonrobust':
+                scale = ssr[ii] / (nobs_window[ii] - rank[ii])
+                cov_params[ii] = xtx_inv * scale[:, None, None]
+            else:
+                cov = np.einsum('ijk,ikl,ilm->ijm', xtx_inv, meat, xtx_inv)
+                if cov_type == 'HC1':
+                    df_resid = nobs_window[ii] - rank[ii]
+                    cov *= (nobs_window[ii] / df_resid)[:, None, None]
+                cov_params[ii] = cov
+
+        yty[~valid] = np.nan
+        return RollingRegressionResults(self, params, cov_params=cov_params,
+                                        ssr=ssr,
+                                        centered_tss=centered_tss,
+                                        uncentered_tss=yty,
+                                        nobs_window=nobs_window, rank=rank,
+                                        cov_type=cov_type,
+                                        params_only=params_only)
+
+
+class RollingOLS(RollingWLS):
+    __doc__ = """
+    Rolling window ordinary least squares
+
+    Parameters
+    ----------%(params)s%(extra)s
+    Examples
+    --------
+    >>> mod = RollingOLS(endog, sm.add_constant(exog), window=60)
+    >>> res = mod.fit()
+    >>> res.params[-1], res.bse[-1], res.rsquared[-1]
+    """ % {'params': _rolling_params_doc, 'extra': _rolling_extra_doc}
+
+    def __init__(self, endog, exog, window=None, min_nobs=None,
+                 expanding=False, missing='none', hasconst=None):
+        super(RollingOLS, self).__init__(endog, exog, window=window,
+                                         weights=None, min_nobs=min_nobs,
+                                         expanding=expanding,
+                                         missing=missing, hasconst=hasconst)
+
+
+class RollingRegressionResults(object):
+    """
+    Results of rolling window least squares
+
+    The attributes are arrays with one entry, row or matrix for each window.
+    Position ``t`` corresponds to the window ending at observation ``t``.
+    Windows that are not estimated contain nan.  If the data are pandas
+    objects, then the attributes are pandas objects indexed by the row
+    labels of the data.
+
+    Notes
+    -----
+    `fvalue` and `f_pvalue` are the classical F test that all slope
+    coefficients are zero, they do not use the robust covariance.
+    """
+
+    def __init__(self, model, params, cov_params, ssr, centered_tss,
+                 uncentered_tss, nobs_window, rank, cov_type, params_only):
+        self.model = model
+        self._params = params
+        self._cov_params = cov_params
+        self._ssr = ssr
+        self._centered_tss = centered_tss
+        self._uncentered_tss = uncentered_tss
+        self._nobs = nobs_window.astype(np.float64)
+        self.k_constant = model.k_constant
+        self.rank = rank
+        self.cov_type = cov_type
+        self.params_only = params_only
+        self._cache = {}
+        self.use_t = cov_type == 'nonrobust'
+
+    def _wrap(self, arr):
+        data = self.model.data
+        row_labels = data.row_labels
+        if row_labels is None:
+            return arr
+        if arr.ndim == 1:
+            return pd.Series(arr, index=row_labels)
+        elif arr.ndim == 2:
+            return pd.DataFrame(arr, index=row_labels,
+                                columns=data.param_names)
+        else:
+            return arr
+
+    def _check_full(self):
+        if self.params_only:
+            raise ValueError('only params are available if the model was '
+                             'fit with params_only=True')
+
+    @property
+    def params(self):
+        return self._wrap(self._params)
+
+    @cache_readonly
+    def _df(self):
+        self._check_full()
+        df_resid = self._nobs - self.rank
+        df_model = self.rank - self.k_constant
+        return df_resid, df_model.astype(np.float64)
+
+    @property
+    def nobs(self):
+        return self._wrap(self._nobs)
+
+    @property
+    def df_resid(self):
+        return self._wrap(self._df[0])
+
+    @property
+    def df_model(self):
+        return self._wrap(self._df[1])
+
+    def cov_params(self):
+        """
+        Covariance of the parameters for all windows
+
+        Returns
+        -------
+        cov_params : ndarray
+            nobs x k_exog x k_exog array.
+        """
+        self._check_full()
+        return self._cov_params
+
+    @cache_readonly
+    def _bse(self):
+        self._check_full()
+        return np.sqrt(np.diagonal(self._cov_params, axis1=1, axis2=2))
+
+    @property
+    def bse(self):
+        return self._wrap(self._bse)
+
+    @property
+    def tvalues(self):
+        return self._wrap(self._params / self._bse)
+
+    @property
+    def pvalues(self):
+        tvalues = np.abs(self._params / self._bse)
+        if self.use_t:
+            df_resid = self._df[0][:, None]
+            pvalues = stats.t.sf(tvalues, df_resid) * 2
+        else:
+            pvalues = stats.norm.sf(tvalues) * 2
+        return self._wrap(pvalues)
+
+    @property
+    def ssr(self):
+        self._check_full()
+        return self._wrap(self._ssr)
+
+    @property
+    def mse_resid(self):
+        self._check_full()
+        return self._wrap(self._ssr / self._df[0])
+
+    scale = mse_resid
+
+    @property
+    def centered_tss(self):
+        self._check_full()
+        return self._wrap(self._centered_tss)
+
+    @property
+    def uncentered_tss(self):
+        self._check_full()
+        return self._wrap(self._uncentered_tss)
+
+    @cache_readonly
+    def _ess(self):
+        self._check_full()
+        if self.k_constant:
+            return self._centered_tss - self._ssr
+        else:
+            return self._uncentered_tss - self._ssr
+
+    @property
+    def ess(self):
+        return self._wrap(self._ess)
+
+    @cache_readonly
+    def _rsquared(self):
+        if self.k_constant:
+            return 1 - self._ssr / self._centered_tss
+        else:
+            return 1 - self._ssr / self._uncentered_tss
+
+    @property
+    def rsquared(self):
+        self._check_full()
+        return self._wrap(self._rsquared)
+
+    @property
+    def rsquared_adj(self):
+        self._check_full()
+        df_resid = self._df[0]
+        adj = 1 - ((self._nobs - self.k_constant) / df_resid *
+                   (1 - self._rsquared))
+        return self._wrap(adj)
+
+    @cache_readonly
+    def _fvalue(self):
+        df_resid, df_model = self._df
+        return (self._ess / df_model) / (self._ssr / df_resid)
+
+    @property
+    def fvalue(self):
+        return self._wrap(self._fvalue)
+
+    @property
+    def f_pvalue(self):
+        df_resid, df_model = self._df
+        return self._wrap(stats.f.sf(self._fvalue, df_model, df_resid))
+
+    @cache_readonly
+    def _llf(self):
+        self._check_full()
+        nobs = self._nobs
+        nobs2 = nobs / 2.
+        llf = -nobs2 * np.log(2 * np.pi) - nobs2 * np.log(self._ssr / nobs)
+        llf -= nobs2
+        # add log-determinant of the weights of each window
+        logw = self.model._nan_to_zero(np.log(self.model.weights))
+        cum_logw = np.concatenate(([0], np.cumsum(logw)))
+        window = self.model.window
+        idx = np.arange(1, len(logw) + 1)
+        sum_logw = cum_logw[idx] - cum_logw[np.maximum(idx - window, 0)]
+        return llf + 0.5 * sum_logw
+
+    @property
+    def llf(self):
+        return self._wrap(self._llf)
+
+    @property
+    def aic(self):
+        df_model = self._df[1]
+        return self._wrap(-2 * self._llf + 2 * (df_model + self.k_constant))
+
+    @property
+    def bic(self):
+        df_model = self._df[1]
+        return self._wrap(-2 * self._llf + np.log(self._nobs) *
+                          (df_model + self.k_constant))
@@ -0,0 +1,660 @@
+"""
+Least squares estimation from streamed blocks of data
+
+The models in this module never hold the full data in memory.  The data is
+passed in blocks of rows and only sufficient statistics of size O(k^2) are
+kept, where k is the number of regressors.  The triangular factor of the
+augmented, whitened design matrix ``[wexog, wendog]`` is updated by a QR
+decomposition of each new block stacked below the current factor, which is
+numerically more stable than accumulating the cross-product matrix
+``X'X`` directly.
+
+Heteroscedasticity robust covariance matrices require the residuals and
+therefore a second pass over the data after the parameters are estimated.
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+from scipy import stats
+
+import statsmodels.base.model as base
+from statsmodels.compat.numpy import np_matrix_rank
+from statsmodels.tools.decorators import (cache_readonly, cache_writable,
+                                          resettable_cache)
+from statsmodels.tools.tools import Bunch
+
+__all__ = ['StreamingOLS', 'StreamingWLS', 'StreamingRegressionResults']
+
+
+def _block_names(endog, exog):
+    """get variable names from pandas blocks, None for ndarrays"""
+    ynames = getattr(endog, 'name', None)
+    xnames = getattr(exog, 'columns', None)
+    if xnames is not None:
+        xnames = [str(name) for name in xnames]
+    return ynames, xnames
+
+
+class StreamingOLS(object):
+    """
+    Ordinary least squares estimated from blocks of data
+
+    Parameters
+    ----------
+    k_exog : int
+        Number of columns of the design matrix.
+    hasconst : None or bool
+        Indicates whether the design matrix includes a user-supplied
+        constant.  If None (default), a column is treated as the constant if
+        all its values seen so far are identical and nonzero.
+    endog_name : str, optional
+        Name of the dependent variable.  Taken from the first block if that
+        is a pandas Series.
+    exog_names : list of str, optional
+        Names of the regressors.  Taken from the first block if that is a
+        pandas DataFrame.
+
+    Attributes
+    ----------
+    nobs : float
+        Number of observations that have been added.
+    factor : ndarray
+        (k_exog + 1) x (k_exog + 1) upper triangular factor ``R`` of the
+        augmented whitened data, ``[wexog, wendog] = Q R``.
+
+    Notes
+    -----
+    Observations are added with `update`.  The state is independent of the
+    order and the blocking of the observations, except for rounding error.
+    Memory use is O(k_exog**2) and does not depend on the number of
+    observations.
+
+    Only the nonrobust and the heteroscedasticity robust 'HC0', 'HC1',
+    'HC2' and 'HC3' covariance types are available.  The heteroscedasticity
+    robust covariances need a second pass over the data, see `fit`.
+
+    Examples
+    --------
+    >>> mod = StreamingOLS(k_exog=3)
+    >>> for endog, exog in blocks:
+    ...     mod.update(endog, exog)
+    >>> res = mod.fit()
+    >>> res_hc = mod.fit(cov_type='HC1', blocks=blocks)
+    """
+
+    def __init__(self, k_exog, hasconst=None, endog_name=None,
+                 exog_names=None):
+        self.k_exog = k = int(k_exog)
+        self.hasconst = hasconst
+        self.endog_name = endog_name
+        self.exog_names_ = exog_names
+
+        self.factor = np.zeros((k + 1, k + 1))
+        self.nobs = 0.
+        self._sum_weights = 0.
+        self._mean_endog = 0.
+        self._ssq_endog = 0.   # weighted sum of squared deviations from mean
+        self._sum_log_weights = 0.
+        self._exog_min = np.empty(k)
+        self._exog_min.fill(np.inf)
+        self._exog_max = np.empty(k)
+        self._exog_max.fill(-np.inf)
+
+    @property
+    def endog_names(self):
+        """Name of the dependent variable"""
+        if self.endog_name is None:
+            return 'y'
+        return self.endog_name
+
+    @property
+    def exog_names(self):
+        """Names of the regressors"""
+        if self.exog_names_ is None:
+            return ['x%d' % i for i in range(1, self.k_exog + 1)]
+        return self.exog_names_
+
+    def _check_block(self, endog, exog, weights=None):
+        if self.nobs == 0:
+            ynames, xnames = _block_names(endog, exog)
+            if self.endog_name is None:
+                self.endog_name = ynames
+            if self.exog_names_ is None:
+                self.exog_names_ = xnames
+
+        endog = np.asarray(endog, dtype=np.float64)
+        exog = np.asarray(exog, dtype=np.float64)
+        if exog.ndim == 1:
+            exog = exog[:, None]
+        if endog.ndim != 1:
+            endog = endog.squeeze()
+            if endog.ndim != 1:
+                raise ValueError('endog has to be one-dimensional')
+        if exog.shape != (endog.shape[0], self.k_exog):
+            raise ValueError('exog needs to have shape (%d, %d)' %
+                             (endog.shape[0], self.k_exog))
+        if weights is None:
+            weights = np.ones(endog.shape[0])
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+            if weights.ndim == 0:
+                weights = np.repeat(weights, endog.shape[0])
+            if weights.shape != endog.shape:
+                raise ValueError('weights must be scalar or have the same '
+                                 'length as endog')
+        return endog, exog, weights
+
+    def _whiten(self, endog, exog, weights):
+        sqrt_w = np.sqrt(weights)
+        return endog * sqrt_w, exog * sqrt_w[:, None]
+
+    def _update(self, endog, exog, weights):
+        endog, exog, weights = self._check_block(endog, exog, weights)
+        nobs = endog.shape[0]
+        if nobs == 0:
+            return self
+        wendog, wexog = self._whiten(endog, exog, weights)
+
+        augmented = np.column_stack((wexog, wendog))
+        self.factor = np.linalg.qr(np.vstack((self.factor, augmented)),
+                                   mode='r')
+
+        # weighted mean and sum of squared deviations of endog, combined
+        # with the running values (Chan et al. pairwise update)
+        sum_w = weights.sum()
+        if sum_w > 0:
+            mean_b = np.dot(weights, endog) / sum_w
+            ssq_b = np.dot(weights, (endog - mean_b)**2)
+            total_w = self._sum_weights + sum_w
+            delta = mean_b - self._mean_endog
+            self._mean_endog += delta * sum_w / total_w
+            self._ssq_endog += (ssq_b +
+                                delta**2 * self._sum_weights * sum_w / total_w)
+            self._sum_weights = total_w
+
+        self._sum_log_weights += np.log(weights).sum()
+        self._exog_min = np.minimum(self._exog_min, exog.min(0))
+        self._exog_max = np.maximum(self._exog_max, exog.max(0))
+        self.nobs += nobs
+        return self
+
+    def update(self, endog, exog):
+        """
+        Add a block of observations
+
+        Parameters
+        ----------
+        endog : array-like
+            1-d array of the dependent variable for the block.
+        exog : array-like
+            2-d array of the regressors for the block with `k_exog` columns.
+
+        Returns
+        -------
+        self : the instance with updated sufficient statistics
+        """
+        return self._update(endog, exog, None)
+
+    def _iter_block(self, block):
+        if len(block) != 2:
+            raise ValueError('blocks for StreamingOLS need to be tuples '
+                             '(endog, exog)')
+        return block[0], block[1], None
+
+    @property
+    def _const_info(self):
+        """k_constant and const_idx from the observed data range"""
+        is_const = ((self._exog_min == self._exog_max) &
+                    (self._exog_max != 0))
+        const_idx = np.nonzero(is_const)[0]
+        if self.hasconst is False:
+            return 0, None
+        if len(const_idx) > 0:
+            return 1, const_idx[0]
+        if self.hasconst:
+            return 1, None
+        return 0, None
+
+    @property
+    def k_constant(self):
+        return self._const_info[0]
+
+    @property
+    def data(self):
+        """lightweight replacement for the model data of in-memory models"""
+        k_constant, const_idx = self._const_info
+        return Bunch(param_names=self.exog_names, xnames=self.exog_names,
+                     ynames=self.endog_names, k_constant=k_constant,
+                     const_idx=const_idx)
+
+    def _solve(self):
+        """parameters and normalized covariance from the triangular factor"""
+        k = self.k_exog
+        r_exog = self.factor[:k, :k]
+        effects = self.factor[:k, k]
+        r_inv = np.linalg.pinv(r_exog)
+        params = np.dot(r_inv, effects)
+        normalized_cov_params = np.dot(r_inv, r_inv.T)
+
+        singular_values = np.linalg.svd(r_exog, compute_uv=False)
+        self.wexog_singular_values = singular_values
+        self.rank = np_matrix_rank(np.diag(singular_values))
+        return params, normalized_cov_params
+
+    def ssr(self, params):
+        """
+        Sum of squared (whitened) residuals evaluated at params
+
+        Parameters
+        ----------
+        params : array-like
+            The parameter vector.
+
+        Returns
+        -------
+        ssr : float
+        """
+        k = self.k_exog
+        resid_effects = self.factor[:k, k] - np.dot(self.factor[:k, :k],
+                                                    params)
+        return (np.dot(resid_effects, resid_effects) +
+                self.factor[k, k]**2)
+
+    def loglike(self, params):
+        """
+        Profile (concentrated) Gaussian log-likelihood at params
+
+        Parameters
+        ----------
+        params : array-like
+            The parameter vector.
+
+        Returns
+        -------
+        llf : float
+        """
+        nobs2 = self.nobs / 2.
+        ssr = self.ssr(params)
+        llf = -nobs2 * np.log(2 * np.pi) - nobs2 * np.log(ssr / self.nobs)
+        llf -= nobs2
+        llf += 0.5 * self._sum_log_weights
+        return llf
+
+    def predict(self, params, exog):
+        """
+        Return linear predicted values from a design matrix.
+
+        Parameters
+        ----------
+        params : array-like
+            Parameters of the linear model.
+        exog : array-like
+            Design matrix for the prediction.
+
+        Returns
+        -------
+        An array of fitted values
+        """
+        return np.dot(exog, params)
+
+    def _robust_meat(self, params, normalized_cov_params, blocks):
+        """outer product of scores for HC0 to HC3 in a pass over blocks"""
+        k = self.k_exog
+        meat = np.zeros((4, k, k))
+        nobs = 0
+        for block in blocks:
+            endog, exog, weights = self._check_block(
+                                            *self._iter_block(block))
+            wendog, wexog = self._whiten(endog, exog, weights)
+            wresid = wendog - np.dot(wexog, params)
+            hat = (np.dot(wexog, normalized_cov_params) * wexog).sum(1)
+            resid2 = wresid**2
+            for i, het_scale in enumerate([resid2, resid2,
+                                           resid2 / (1 - hat),
+                                           resid2 / (1 - hat)**2]):
+                meat[i] += np.dot(wexog.T, het_scale[:, None] * wexog)
+            nobs += endog.shape[0]
+
+        if nobs != self.nobs:
+            raise ValueError('blocks used for the robust covariance contain '
+                             '%d observations, but %d observations were used '
+                             'in the estimation' % (nobs, self.nobs))
+        return meat
+
+    def fit(self, cov_type='nonrobust', blocks=None, use_t=None):
+        """
+        Compute the least squares estimates from the accumulated statistics
+
+        Parameters
+        ----------
+        cov_type : str
+            'nonrobust' (default) or one of the heteroscedasticity robust
+            covariances 'HC0', 'HC1', 'HC2', 'HC3'.
+        blocks : iterable, optional
+            Required if `cov_type` is one of the HC covariances.  An
+            iterable of the same blocks ``(endog, exog)``, or for weighted
+            models ``(endog, exog, weights)``, that were added with
+            `update`.  It is iterated over once to compute the residuals.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values.
+
+        Returns
+        -------
+        results : StreamingRegressionResults
+        """
+        if self.nobs == 0:
+            raise ValueError('no observations have been added')
+
+        hc_types = ('HC0', 'HC1', 'HC2', 'HC3')
+        if cov_type not in ('nonrobust',) + hc_types:
+            raise ValueError('cov_type has to be nonrobust or one of HC0, '
+                             'HC1, HC2, HC3 for streaming models')
+        if cov_type in hc_types and blocks is None:
+            raise ValueError('heteroscedasticity robust covariances require '
+                             'a second pass over the data in `blocks`')
+
+        params, normalized_cov_params = self._solve()
+        self.df_model = float(self.rank - self.k_constant)
+        self.df_resid = self.nobs - self.rank
+
+        het_meat = None
+        if blocks is not None:
+            het_meat = self._robust_meat(params, normalized_cov_params,
+                                         blocks)
+
+        return StreamingRegressionResults(self, params,
+                            normalized_cov_params=normalized_cov_params,
+                            cov_type=cov_type, use_t=use_t,
+                            het_meat=het_meat)
+
+
+class StreamingWLS(StreamingOLS):
+    __doc__ = StreamingOLS.__doc__.replace(
+        'Ordinary least squares', 'Weighted least squares').replace(
+        'mod.update(endog, exog)', 'mod.update(endog, exog, weights)')
+
+    def update(self, endog, exog, weights):
+        """
+        Add a block of observations
+
+        Parameters
+        ----------
+        endog : array-like
+            1-d array of the dependent variable for the block.
+        exog : array-like
+            2-d array of the regressors for the block with `k_exog` columns.
+        weights : array-like
+            1-d array of weights for the block, proportional to the inverse
+            of the variance of the observations as in `WLS`.
+
+        Returns
+        -------
+        self : the instance with updated sufficient statistics
+        """
+        return self._update(endog, exog, weights)
+
+    def _iter_block(self, block):
+        if len(block) != 3:
+            raise ValueError('blocks for StreamingWLS need to be tuples '
+                             '(endog, exog, weights)')
+        return block
+
+
+class StreamingRegressionResults(base.LikelihoodModelResults):
+    """
+    Results of a least squares model estimated from blocks of data
+
+    Only the statistics that can be computed from the sufficient statistics
+    of the model are available, the parameter estimates, their covariance
+    and the statistics based on the sums of squares as in
+    `RegressionResults`.  Residuals, fitted values and statistics that are
+    based on them, e.g. residual diagnostics, are not available because the
+    data is not kept in memory.
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.RegressionResults
+    """
+
+    def __init__(self, model, params, normalized_cov_params=None,
+                 cov_type='nonrobust', use_t=None, het_meat=None):
+        self._cache = resettable_cache()
+        super(StreamingRegressionResults, self).__init__(model, params,
+                                normalized_cov_params=normalized_cov_params)
+        # scale is estimated, the value set by the base class is dropped
+        self._cache = resettable_cache()
+        self._het_meat = het_meat
+        self.df_model = model.df_model
+        self.df_resid = model.df_resid
+
+        if cov_type == 'nonrobust':
+            self.cov_type = 'nonrobust'
+            self.cov_kwds = {'description': 'Standard Errors assume that the '
+                             'covariance matrix of the errors is correctly '
+                             'specified.'}
+            self.use_t = True if use_t is None else use_t
+        else:
+            self._set_robustcov(cov_type, use_t)
+
+    def _set_robustcov(self, cov_type, use_t):
+        if cov_type not in ('HC0', 'HC1', 'HC2', 'HC3'):
+            raise ValueError('only HC0, HC1, HC2 and HC3 are available for '
+                             'streaming models')
+        if use_t is None:
+            use_t = self.use_t
+        self.cov_type = cov_type
+        self.use_t = use_t
+        self.cov_kwds = {'use_t': use_t, 'adjust_df': False,
+                         'description': 'Standard Errors are '
+                         'heteroscedasticity robust (%s)' % cov_type}
+        self.cov_params_default = getattr(self, 'cov_' + cov_type)
+
+    @cache_readonly
+    def nobs(self):
+        return float(self.model.nobs)
+
+    @cache_readonly
+    def ssr(self):
+        return self.model.ssr(self.params)
+
+    @cache_writable()
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def centered_tss(self):
+        return self.model._ssq_endog
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return self.model.ssr(np.zeros_like(self.params))
+
+    @cache_readonly
+    def ess(self):
+        if self.k_constant:
+            return self.centered_tss - self.ssr
+        else:
+            return self.uncentered_tss - self.ssr
+
+    @cache_readonly
+    def rsquared(self):
+        if self.k_constant:
+            return 1 - self.ssr / self.centered_tss
+        else:
+            return 1 - self.ssr / self.uncentered_tss
+
+    @cache_readonly
+    def rsquared_adj(self):
+        return 1 - (np.divide(self.nobs - self.k_constant, self.df_resid) *
+                    (1 - self.rsquared))
+
+    @cache_readonly
+    def mse_model(self):
+        return self.ess / self.df_model
+
+    @cache_readonly
+    def mse_resid(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def mse_total(self):
+        if self.k_constant:
+            return self.centered_tss / (self.df_resid + self.df_model)
+        else:
+            return self.uncentered_tss / (self.df_resid + self.df_model)
+
+    @cache_readonly
+    def fvalue(self):
+        if self.cov_type == 'nonrobust':
+            return self.mse_model / self.mse_resid
+        # Wald test that all slope coefficients are zero
+        k_params = self.normalized_cov_params.shape[0]
+        mat = np.eye(k_params)
+        const_idx = self.model.data.const_idx
+        if self.model.data.k_constant == 1:
+            # implicit constant, see RegressionResults.fvalue
+            if const_idx is None:
+                return np.nan
+            mat = np.delete(mat, const_idx, axis=0)
+        ft = self.f_test(mat)
+        self._cache['f_pvalue'] = ft.pvalue
+        return ft.fvalue
+
+    @cache_readonly
+    def f_pvalue(self):
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    @cache_readonly
+    def aic(self):
+        return -2 * self.llf + 2 * (self.df_model + self.k_constant)
+
+    @cache_readonly
+    def bic(self):
+        return (-2 * self.llf + np.log(self.nobs) * (self.df_model +
+                                                     self.k_constant))
+
+    @cache_readonly
+    def eigenvals(self):
+        """
+        Return eigenvalues of the whitened design moment matrix sorted in
+        decreasing order.
+        """
+        return np.sort(self.model.wexog_singular_values**2)[::-1]
+
+    @cache_readonly
+    def condition_number(self):
+        """
+        Return condition number of exogenous matrix.
+
+        Calculated as ratio of largest to smallest eigenvalue.
+        """
+        eigvals = self.eigenvals
+        return np.sqrt(eigvals[0] / eigvals[-1])
+
+    def _HCCM_meat(self, idx):
+        if self._het_meat is None:
+            raise ValueError('heteroscedasticity robust covariances require '
+                             'that `fit` was called with `blocks`')
+        cov_p = self.normalized_cov_params
+        return np.dot(cov_p, np.dot(self._het_meat[idx], cov_p))
+
+    @cache_readonly
+    def cov_HC0(self):
+        return self._HCCM_meat(0)
+
+    @cache_readonly
+    def cov_HC1(self):
+        return self.nobs / self.df_resid * self._HCCM_meat(1)
+
+    @cache_readonly
+    def cov_HC2(self):
+        return self._HCCM_meat(2)
+
+    @cache_readonly
+    def cov_HC3(self):
+        return self._HCCM_meat(3)
+
+    @cache_readonly
+    def HC0_se(self):
+        return np.sqrt(np.diag(self.cov_HC0))
+
+    @cache_readonly
+    def HC1_se(self):
+        return np.sqrt(np.diag(self.cov_HC1))
+
+    @cache_readonly
+    def HC2_se(self):
+        return np.sqrt(np.diag(self.cov_HC2))
+
+    @cache_readonly
+    def HC3_se(self):
+        return np.sqrt(np.diag(self.cov_HC3))
+
+    def get_robustcov_results(self, cov_type='HC1', use_t=None):
+        """
+        Create new results instance with robust covariance as default
+
+        Parameters
+        ----------
+        cov_type : str
+            One of the heteroscedasticity robust covariances 'HC0', 'HC1',
+            'HC2', 'HC3'.  They are only available if `fit` was called with
+            `blocks`.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values.  The default is the setting of this
+            instance.
+
+        Returns
+        -------
+        results : StreamingRegressionResults
+        """
+        if use_t is None:
+            use_t = self.use_t
+        return self.__class__(self.model, self.params,
+                              normalized_cov_params=self.normalized_cov_params,
+                              cov_type=cov_type, use_t=use_t,
+                              het_meat=self._het_meat)
+
+    def summary(self, yname=None, xname=None, title=None, alpha=.05):
+        """
+        Summarize the Regression Results
+
+        Residual diagnostics are not included.  See
+        `RegressionResults.summary` for a description of the parameters.
+        """
+        top_left = [('Dep. Variable:', None),
+                    ('Model:', None),
+                    ('Method:', ['Least Squares']),
+                    ('Date:', None),
+                    ('Time:', None),
+                    ('No. Observations:', None),
+                    ('Df Residuals:', None),
+                    ('Df Model:', None),
+                    ('Covariance Type:', [self.cov_type])
+                    ]
+
+        top_right = [('R-squared:', ["%#8.3f" % self.rsquared]),
+                     ('Adj. R-squared:', ["%#8.3f" % self.rsquared_adj]),
+                     ('F-statistic:', ["%#8.4g" % self.fvalue]),
+                     ('Prob (F-statistic):', ["%#6.3g" % self.f_pvalue]),
+                     ('Log-Likelihood:', None),
+                     ('AIC:', ["%#8.4g" % self.aic]),
+                     ('BIC:', ["%#8.4g" % self.bic])
+                     ]
+
+        if title is None:
+            title = self.model.__class__.__name__ + ' ' + "Regression Results"
+
+        from statsmodels.iolib.summary import Summary
+        smry = Summary()
+        smry.add_table_2cols(self, gleft=top_left, gright=top_right,
+                             yname=yname, xname=xname, title=title)
+        smry.add_table_params(self, yname=yname, xname=xname, alpha=alpha,
+                              use_t=self.use_t)
+        smry.add_extra_txt(['Warnings:',
+                            '[1] ' + self.cov_kwds['description']])
+        return smry
@@ -0,0 +1,159 @@
+"""
+Tests for least squares with absorbed categorical effects
+"""
+from __future__ import division
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.testing import (assert_, assert_allclose, assert_equal,
+                           assert_raises)
+
+from statsmodels.datasets import grunfeld
+from statsmodels.regression.linear_model import AbsorbingLS, WLS
+from statsmodels.tools.tools import add_constant, categorical
+
+
+class CheckAbsorbing(object):
+
+    def test_params(self):
+        res1, res2 = self.res1, self.res2
+        k = len(res1.params)
+        assert_equal(res1.df_resid, res2.df_resid)
+        assert_equal(res1.df_model, k)
+        assert_allclose(res1.params, res2.params[:k], rtol=1e-9)
+        assert_allclose(res1.bse, res2.bse[:k], rtol=1e-9)
+        assert_allclose(res1.resid, res2.resid, rtol=1e-7, atol=1e-9)
+        assert_allclose(res1.fittedvalues, res2.fittedvalues, rtol=1e-9)
+        for attr in ['ssr', 'rsquared', 'rsquared_adj', 'llf', 'aic', 'bic']:
+            assert_allclose(getattr(res1, attr), getattr(res2, attr),
+                            rtol=1e-9, err_msg=attr)
+        ft = res2.f_test(np.eye(len(res2.params))[:k])
+        assert_allclose(res1.fvalue, ft.fvalue, rtol=1e-9)
+        assert_allclose(res1.f_pvalue, ft.pvalue, rtol=1e-7)
+
+    def test_robust(self):
+        for cov_type in self.cov_types:
+            res1 = self.model.fit(cov_type=cov_type)
+            res2 = self.res2.get_robustcov_results(cov_type)
+            k = len(res1.params)
+            assert_allclose(res1.bse, res2.bse[:k], rtol=1e-9,
+                            err_msg=cov_type)
+
+    def test_cluster(self):
+        kwds = dict(cov_type='cluster', cov_kwds={'groups': self.firm})
+        res1 = self.model.fit(**kwds)
+        res2 = self.model_dummy.fit(**kwds)
+        # the absorbed effects are not counted in the small sample
+        # correction
+        k1, k2 = len(res1.params), len(res2.params)
+        nobs = res1.nobs
+        correction = (nobs - k1) / (nobs - k2)
+        assert_allclose(res1.bse * np.sqrt(correction), res2.bse[:k1],
+                        rtol=1e-9)
+
+
+class TestAbsorbingOneWay(CheckAbsorbing):
+
+    cov_types = ['HC0', 'HC1', 'HC2', 'HC3']
+
+    @classmethod
+    def setupClass(cls):
+        data = grunfeld.load_pandas().data
+        endog = data['invest'].values
+        x = data[['value', 'capital']].values
+        firm = np.unique(data['firm'], return_inverse=True)[1]
+        weights = 1. / data['value'].values
+        cls.firm = firm
+        cls.model = AbsorbingLS(endog, x, absorb=firm, weights=weights)
+        cls.res1 = cls.model.fit()
+        exog = np.column_stack((x, categorical(firm, drop=True)))
+        cls.model_dummy = WLS(endog, exog, weights=weights)
+        cls.res2 = cls.model_dummy.fit()
+
+
+class TestAbsorbingTwoWay(CheckAbsorbing):
+
+    cov_types = ['HC0', 'HC1']
+
+    @classmethod
+    def setupClass(cls):
+        # unbalanced panel, without the first five years of the last firm
+        data = grunfeld.load_pandas().data[:-5]
+        endog = data['invest'].values
+        x = data[['value', 'capital']].values
+        firm = np.unique(data['firm'], return_inverse=True)[1]
+        year = data['year'].values.astype(int)
+        cls.firm = firm
+        absorb = pd.DataFrame({'firm': firm, 'year': year})
+        cls.model = AbsorbingLS(endog, x, absorb=absorb, tol=1e-12)
+        cls.res1 = cls.model.fit()
+        exog = np.column_stack((x, categorical(firm, drop=True),
+                                categorical(year, drop=True)[:, 1:]))
+        cls.model_dummy = WLS(endog, exog)
+        cls.res2 = cls.model_dummy.fit()
+
+    def test_hc3(self):
+        assert_raises(NotImplementedError, self.model.fit, cov_type='HC3')
+        assert_raises(NotImplementedError, self.model.fit, cov_type='HC2')
+        assert_raises(NotImplementedError, self.res1.get_robustcov_results,
+                      'HC3')
+
+
+def test_disconnected():
+    # two effects in separate blocks have two redundant levels
+    firm = np.repeat(np.arange(6), 5)
+    year = np.tile(np.arange(5), 6)
+    year[firm >= 3] += 5
+    np.random.seed(1234)
+    x = np.random.randn(30)
+    endog = x + firm + year + np.random.randn(30)
+    mod = AbsorbingLS(endog, x, absorb=np.column_stack((firm, year)))
+    assert_equal(mod.k_absorbed, 6 + 10 - 2)
+    exog = np.column_stack((x, categorical(firm, drop=True),
+                            categorical(year, drop=True)))
+    res2 = WLS(endog, exog).fit()
+    res1 = mod.fit()
+    assert_equal(res1.df_resid, res2.df_resid)
+    assert_allclose(res1.params, res2.params[:1], rtol=1e-8)
+
+
+def test_collinear_and_missing():
+    data = grunfeld.load_pandas().data
+    endog = data['invest'].values
+    x = data[['value', 'capital']].values
+    firm = np.unique(data['firm'], return_inverse=True)[1]
+    # firm level variable is absorbed
+    exog = np.column_stack((x, 0.5 * firm))
+    res = AbsorbingLS(endog, exog, absorb=firm).fit()
+    res2 = AbsorbingLS(endog, x, absorb=firm).fit()
+    assert_equal(res.df_resid, res2.df_resid)
+    assert_allclose(res.params[:2], res2.params, rtol=1e-9)
+    assert_equal(res.params[2], 0)
+
+    assert_raises(ValueError, AbsorbingLS, endog, add_constant(x), firm)
+
+    firm = firm.astype(float)
+    firm[3] = np.nan
+    endog = endog.copy()
+    endog[7] = np.nan
+    mod = AbsorbingLS(endog, x, absorb=firm, missing='drop')
+    keep = np.ones(len(endog), bool)
+    keep[[3, 7]] = False
+    res2 = AbsorbingLS(endog[keep], x[keep], absorb=firm[keep]).fit()
+    assert_equal(mod.nobs, len(endog) - 2)
+    assert_allclose(mod.fit().params, res2.params, rtol=1e-12)
+
+
+def test_maxiter_warning():
+    data = grunfeld.load_pandas().data[:-5]
+    endog = data['invest'].values
+    x = data[['value', 'capital']].values
+    firm = np.unique(data['firm'], return_inverse=True)[1]
+    year = data['year'].values.astype(int)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        AbsorbingLS(endog, x, absorb=np.column_stack((firm, year)),
+                    maxiter=1)
+    assert_(any('did not converge' in str(warning.message) for warning in w))
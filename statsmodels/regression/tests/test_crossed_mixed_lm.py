@@ -0,0 +1,129 @@
+"""
+Tests for linear mixed models with crossed random intercepts
+"""
+from __future__ import division
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.regression.crossed_mixed_lm import CrossedMixedLM
+from statsmodels.regression.mixed_linear_model import MixedLM
+from statsmodels.tools.tools import add_constant
+
+
+def _dummies(labels):
+    levels = np.unique(labels)
+    return (labels[:, None] == levels).astype(np.float64)
+
+
+class CheckCrossed(object):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        subject = np.random.randint(0, 30, size=400)
+        item = np.random.randint(0, 20, size=400)
+        x = np.random.randn(400, 2)
+        endog = (x.sum(1) + np.random.randn(30)[subject] +
+                 0.7 * np.random.randn(20)[item] + np.random.randn(400))
+        df = pd.DataFrame({"y": endog, "x1": x[:, 0], "x2": x[:, 1],
+                           "subject": subject, "item": item})
+        cls.df = df
+        exog = add_constant(df[["x1", "x2"]].values)
+        cls.model = CrossedMixedLM(df["y"].values, exog,
+                                   df[["item", "subject"]])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cls.res1 = cls.model.fit(reml=cls.reml)
+
+        # all observations in a single group, the crossed factors are
+        # variance components (the names are sorted by MixedLM)
+        exog_vc = {"item": {0: _dummies(df["item"].values)},
+                   "subject": {0: _dummies(df["subject"].values)}}
+        cls.model2 = MixedLM(df["y"].values, exog, np.zeros(len(df)),
+                             exog_vc=exog_vc)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cls.res2 = cls.model2.fit(reml=cls.reml)
+
+    def test_loglike(self):
+        for vc_params in [[0.3, 1.2], [1., 1.], [0.05, 2.]]:
+            assert_allclose(self.model.loglike(np.array(vc_params)),
+                            self.model2.loglike(np.array(vc_params)),
+                            rtol=1e-10)
+
+    def test_params(self):
+        res1, res2 = self.res1, self.res2
+        assert_allclose(res1.fe_params, res2.fe_params, rtol=1e-4)
+        assert_allclose(res1.vcomp, res2.vcomp, rtol=1e-3)
+        assert_allclose(res1.scale, res2.scale, rtol=1e-4)
+        assert_allclose(res1.llf, res2.llf, rtol=1e-8)
+        assert_allclose(res1.bse_fe, res2.bse_fe, rtol=1e-3)
+        assert np.all(np.isfinite(res1.bse_vc))
+        assert np.all(res1.bse_vc > 0)
+
+    def test_random_effects(self):
+        res1 = self.res1
+        ranef = res1.random_effects
+        assert_equal(list(ranef.keys()), ["item", "subject"])
+        assert_equal(len(ranef["subject"]), 30)
+
+        # BLUP from the dense marginal covariance matrix
+        model = self.model
+        lam2 = res1.vc_params[model._vc_index]**2
+        zmat = model.exog_vc.toarray()
+        vmat = np.eye(int(model.nobs)) + np.dot(zmat * lam2, zmat.T)
+        resid = model.endog - np.dot(model.exog, res1.fe_params)
+        blup = lam2 * np.dot(zmat.T, np.linalg.solve(vmat, resid))
+        assert_allclose(np.concatenate([ranef["item"], ranef["subject"]]),
+                        blup, rtol=1e-8, atol=1e-10)
+        assert_allclose(res1.fittedvalues + res1.resid, model.endog)
+
+    def test_summary(self):
+        txt = self.res1.summary().as_text()
+        assert "subject Var" in txt
+        assert "No. item:" in txt
+
+
+class TestCrossedREML(CheckCrossed):
+    reml = True
+
+
+class TestCrossedML(CheckCrossed):
+    reml = False
+
+
+def test_formula():
+    np.random.seed(987125)
+    subject = np.random.randint(0, 30, size=200)
+    item = np.random.randint(0, 20, size=200)
+    x = np.random.randn(200, 2)
+    endog = (x.sum(1) + np.random.randn(30)[subject] +
+             0.7 * np.random.randn(20)[item] + np.random.randn(200))
+    df = pd.DataFrame({"y": endog, "x1": x[:, 0], "x2": x[:, 1],
+                       "subject": subject, "item": item})
+    df.loc[3, "item"] = np.nan
+    df.loc[5, "x1"] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        mod1 = CrossedMixedLM.from_formula("y ~ x1 + x2", data=df,
+                                           groups=["subject", "item"])
+        res1 = mod1.fit()
+
+        df1 = df.dropna()
+        exog = add_constant(df1[["x1", "x2"]].values)
+        mod2 = CrossedMixedLM(df1["y"].values, exog,
+                              df1[["subject", "item"]])
+        res2 = mod2.fit()
+
+    assert_equal(mod1.nobs, len(df) - 2)
+    assert_equal(mod1.data.param_names,
+                 ["Intercept", "x1", "x2", "subject Var", "item Var"])
+    assert_allclose(res1.params, res2.params, rtol=1e-10)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+
+    assert_raises(ValueError, CrossedMixedLM, df1["y"].values, exog,
+                  df["subject"].values)
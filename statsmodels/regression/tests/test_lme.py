@@ -157,6 +157,58 @@ class TestMixedLM(object):
                         nhess = nd.approx_hess(params_vec, loglike_h)
                         assert_allclose(hess, nhess, rtol=1e-3)
 
+    def test_grouped(self):
+        # The likelihood and score for all groups at once compared to
+        # the loop over the groups, groups of unequal size
+
+        np.random.seed(3558)
+        n_grp = 100
+        grpsize = np.random.randint(1, 8, size=n_grp)
+        groups = np.repeat(np.arange(n_grp), grpsize)
+        n = len(groups)
+        exog_fe = np.random.normal(size=(n, 3))
+        exog_re = np.random.normal(size=(n, 2))
+        exog_re[:, 0] = 1
+        slopes = np.random.normal(size=(n_grp, 2))[groups]
+        endog = (exog_fe.sum(1) + (slopes * exog_re).sum(1) +
+                 np.random.normal(size=n))
+
+        for reml in False, True:
+            model1 = MixedLM(endog, exog_fe, groups, exog_re)
+            model2 = MixedLM(endog, exog_fe, groups, exog_re)
+            assert_(model1._grouped)
+            model2._grouped = False
+            model1.reml = model2.reml = reml
+            model1.cov_pen = model2.cov_pen = None
+            model1.fe_pen = model2.fe_pen = None
+            model1._freepat = model2._freepat = None
+
+            for kr in range(3):
+                fe_params = np.random.normal(size=3)
+                cov_re = np.random.normal(size=(2, 2))
+                cov_re = np.dot(cov_re.T, cov_re)
+                params = MixedLMParams.from_components(
+                    fe_params, cov_re=cov_re, vcomp=np.zeros(0))
+                for profile_fe in False, True:
+                    assert_allclose(model1.loglike(params, profile_fe),
+                                    model2.loglike(params, profile_fe),
+                                    rtol=1e-10)
+                    assert_allclose(model1.score(params.copy(), profile_fe),
+                                    model2.score(params.copy(), profile_fe),
+                                    rtol=1e-8)
+                assert_allclose(model1.get_fe_params(cov_re, []),
+                                model2.get_fe_params(cov_re, []),
+                                rtol=1e-10)
+                assert_allclose(model1.get_scale(fe_params, cov_re, []),
+                                model2.get_scale(fe_params, cov_re, []),
+                                rtol=1e-10)
+
+            rslt1 = model1.fit(reml=reml)
+            rslt2 = model2.fit(reml=reml)
+            assert_allclose(rslt1.params, rslt2.params, rtol=1e-6)
+            assert_allclose(rslt1.bse, rslt2.bse, rtol=1e-5)
+            assert_allclose(rslt1.llf, rslt2.llf, rtol=1e-8)
+
     def test_default_re(self):
 
         np.random.seed(3235)
@@ -0,0 +1,113 @@
+"""
+Tests for OLS with several dependent variables and a common design
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import (assert_, assert_allclose, assert_equal,
+                           assert_raises)
+
+from statsmodels.regression.linear_model import OLS
+from statsmodels.regression.multi_ols import MultiOLS
+from statsmodels.tools.tools import add_constant
+
+
+class CheckMultiOLS(object):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(98765)
+        nobs, k_endog = 150, 6
+        x = np.random.randn(nobs, 3)
+        exog = add_constant(x)
+        beta = np.random.randn(4, k_endog)
+        endog = (np.dot(exog, beta) +
+                 np.random.randn(nobs, k_endog) * (1 + np.abs(x[:, :1])))
+        cls.exog, cls.endog = exog, endog
+        cls.res1 = MultiOLS(endog, exog).fit(method=cls.method,
+                                              cov_type=cls.cov_type)
+        cls.res2 = [OLS(endog[:, i], exog).fit(cov_type=cls.cov_type)
+                    for i in range(k_endog)]
+
+    def _stack(self, attr):
+        return np.column_stack([getattr(res, attr) for res in self.res2])
+
+    def test_params(self):
+        res1 = self.res1
+        for attr in ['params', 'bse', 'tvalues', 'pvalues', 'resid',
+                     'fittedvalues']:
+            assert_allclose(getattr(res1, attr), self._stack(attr),
+                            rtol=1e-9, atol=1e-13, err_msg=attr)
+
+    def test_fit_statistics(self):
+        res1 = self.res1
+        for attr in ['ssr', 'centered_tss', 'ess', 'rsquared',
+                     'rsquared_adj', 'llf', 'aic', 'bic']:
+            assert_allclose(getattr(res1, attr),
+                            [getattr(res, attr) for res in self.res2],
+                            rtol=1e-9, err_msg=attr)
+        if self.cov_type == 'nonrobust':
+            assert_allclose(res1.scale, [res.scale for res in self.res2],
+                            rtol=1e-9)
+            assert_allclose(res1.fvalue, [res.fvalue for res in self.res2],
+                            rtol=1e-9)
+        assert_equal(res1.df_resid, self.res2[0].df_resid)
+        assert_equal(res1.df_model, self.res2[0].df_model)
+
+    def test_get_ols_results(self):
+        res = self.res1.get_ols_results(2)
+        assert_allclose(res.params, self.res2[2].params, rtol=1e-10)
+        assert_allclose(res.bse, self.res2[2].bse, rtol=1e-10)
+        assert_equal(res.cov_type, self.cov_type)
+
+
+class TestMultiOLSPinv(CheckMultiOLS):
+    method = 'pinv'
+    cov_type = 'nonrobust'
+
+
+class TestMultiOLSQR(CheckMultiOLS):
+    method = 'qr'
+    cov_type = 'HC1'
+
+
+class TestMultiOLSCholeskyHC2(CheckMultiOLS):
+    method = 'cholesky'
+    cov_type = 'HC2'
+
+
+class TestMultiOLSHC3(CheckMultiOLS):
+    method = 'pinv'
+    cov_type = 'HC3'
+
+
+def test_pandas():
+    np.random.seed(98765)
+    nobs = 50
+    index = pd.date_range('2000-01-01', periods=nobs)
+    exog = add_constant(pd.DataFrame(np.random.randn(nobs, 2),
+                                     columns=['a', 'b'], index=index))
+    endog = pd.DataFrame(np.random.randn(nobs, 3), columns=['u', 'v', 'w'],
+                         index=index)
+    res = MultiOLS(endog, exog).fit()
+    assert_equal(list(res.params.index), ['const', 'a', 'b'])
+    assert_equal(list(res.params.columns), ['u', 'v', 'w'])
+    assert_equal(list(res.rsquared.index), ['u', 'v', 'w'])
+    assert_(res.resid.index.equals(index))
+
+    res_v = res.get_ols_results(1)
+    res2 = OLS(endog['v'], exog).fit()
+    assert_allclose(res_v.params, res2.params, rtol=1e-10)
+    assert_equal(res_v.model.endog_names, 'v')
+
+
+def test_singular():
+    np.random.seed(98765)
+    x = np.random.randn(30, 2)
+    exog = add_constant(np.column_stack((x, x[:, 0])))
+    endog = np.random.randn(30, 2)
+    res1 = MultiOLS(endog, exog).fit()
+    res2 = OLS(endog[:, 1], exog).fit()
+    assert_allclose(res1.params[:, 1], res2.params, rtol=1e-8)
+    assert_raises(ValueError, MultiOLS(endog, exog).fit, method='cholesky')
@@ -1091,6 +1091,80 @@ def test_fvalue_implicit_constant():
     res.summary()
 
 
+def test_fit_cholesky():
+    # memory-lean solver without pinv_wexog
+    np.random.seed(12345)
+    nobs = 200
+    exog = add_constant(np.random.randn(nobs, 3))
+    endog = exog.sum(1) + np.random.randn(nobs) * (1 + np.abs(exog[:, 1]))
+    weights = np.random.uniform(0.5, 2, size=nobs)
+
+    for mod in [OLS(endog, exog), WLS(endog, exog, weights=weights)]:
+        res1 = mod.fit(method='cholesky')
+        assert_(not hasattr(mod, 'pinv_wexog'))
+        res2 = mod.__class__(endog, exog, **mod._get_init_kwds()).fit()
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_allclose(res1.normalized_cov_params,
+                        res2.normalized_cov_params, rtol=1e-10)
+        assert_allclose(res1.eigenvals, res2.eigenvals, rtol=1e-10)
+        for cov_type in ['HC0', 'HC1', 'HC2', 'HC3']:
+            assert_allclose(getattr(res1, cov_type + '_se'),
+                            getattr(res2, cov_type + '_se'), rtol=1e-10)
+        assert_allclose(res1.get_robustcov_results('cluster',
+                            groups=np.arange(nobs) // 4).bse,
+                        res2.get_robustcov_results('cluster',
+                            groups=np.arange(nobs) // 4).bse, rtol=1e-10)
+        assert_(not hasattr(mod, 'pinv_wexog'))
+
+    infl1 = OLS(endog, exog).fit(method='cholesky').get_influence()
+    infl2 = OLS(endog, exog).fit().get_influence()
+    assert_allclose(infl1.hat_matrix_diag, infl2.hat_matrix_diag, rtol=1e-10)
+
+    # singular design matrix uses the pseudoinverse of the cross-product
+    exog_s = np.column_stack((exog, exog[:, 1]))
+    res1 = OLS(endog, exog_s).fit(method='cholesky')
+    res2 = OLS(endog, exog_s).fit()
+    assert_equal(res1.model.rank, 4)
+    assert_allclose(res1.params, res2.params, rtol=1e-8)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-8)
+
+    assert_raises(ValueError, OLS(endog, exog).fit, method='bad')
+
+
+def test_fit_cholesky_longley():
+    # full rank but ill-conditioned, condition number about 5e9
+    data = longley.load()
+    exog = add_constant(data.exog, prepend=False)
+    res2 = OLS(data.endog, exog).fit()
+    for method in ['cholesky', 'lsqr']:
+        res1 = OLS(data.endog, exog).fit(method=method)
+        assert_equal(res1.model.rank, 7)
+        assert_equal(res1.df_resid, res2.df_resid)
+        assert_allclose(res1.params, res2.params, rtol=1e-6)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-6)
+        assert_allclose(res1.model.wexog_singular_values,
+                        res2.model.wexog_singular_values, rtol=1e-8)
+
+
+def test_fit_lsqr_convergence():
+    from statsmodels.tools.sm_exceptions import ConvergenceWarning
+    np.random.seed(1234)
+    x = np.random.randn(100, 3)
+    endog = x.sum(1) + np.random.randn(100)
+    res1 = OLS(endog, x).fit(method='lsqr')
+    assert_allclose(res1.params, OLS(endog, x).fit().params, rtol=1e-10)
+
+    # graded singular values down to 1e-10 exceed the iteration limit
+    u = np.linalg.qr(np.random.randn(300, 20))[0]
+    v = np.linalg.qr(np.random.randn(20, 20))[0]
+    exog = np.dot(u * np.logspace(0, -10, 20), v.T)
+    endog = exog.sum(1) + np.random.randn(300)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always', ConvergenceWarning)
+        OLS(endog, exog).fit(method='lsqr')
+    assert_(any(issubclass(wi.category, ConvergenceWarning) for wi in w))
+
+
 if __name__=="__main__":
 
     import nose
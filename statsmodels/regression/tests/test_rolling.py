@@ -0,0 +1,205 @@
+"""
+Tests for rolling window least squares
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import (assert_, assert_allclose, assert_equal,
+                           assert_raises)
+
+from statsmodels.datasets import macrodata
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.rolling import RollingOLS, RollingWLS
+from statsmodels.tools.tools import add_constant
+
+
+class CheckRolling(object):
+
+    window = 25
+    expanding = False
+    min_nobs = None
+    cov_type = 'nonrobust'
+    weighted = False
+    blocksize = 7
+
+    @classmethod
+    def setupClass(cls):
+        # growth rates of investment and GDP, and the real interest rate
+        data = macrodata.load_pandas().data
+        endog = 400 * np.diff(np.log(data['realinv'].values))
+        exog = add_constant(np.column_stack(
+            (400 * np.diff(np.log(data['realgdp'].values)),
+             data['realint'].values[1:])))
+        weights = 1. / data['unemp'].values[1:]
+        cls.endog, cls.exog, cls.weights = endog, exog, weights
+        if cls.weighted:
+            mod = RollingWLS(endog, exog, window=cls.window, weights=weights,
+                             min_nobs=cls.min_nobs, expanding=cls.expanding)
+        else:
+            mod = RollingOLS(endog, exog, window=cls.window,
+                             min_nobs=cls.min_nobs, expanding=cls.expanding)
+        cls.res1 = mod.fit(cov_type=cls.cov_type, blocksize=cls.blocksize)
+
+    def _ols(self, t):
+        window = self.window or len(self.endog)
+        lo = max(0, t - window + 1)
+        sl = slice(lo, t + 1)
+        if self.weighted:
+            mod = WLS(self.endog[sl], self.exog[sl], weights=self.weights[sl])
+        else:
+            mod = OLS(self.endog[sl], self.exog[sl])
+        return mod.fit(cov_type=self.cov_type)
+
+    def test_windows(self):
+        res1 = self.res1
+        nobs = len(self.endog)
+        window = self.window or nobs
+        if self.expanding or self.window is None:
+            first = (self.min_nobs or 4) - 1
+        else:
+            first = window - 1
+        assert_(np.isnan(res1.params[:first]).all())
+        assert_(not np.isnan(res1.params[first:]).any())
+
+        for t in [first, first + 1, first + 8, min(window, nobs - 2),
+                  nobs - 1]:
+            res2 = self._ols(t)
+            assert_allclose(res1.params[t], res2.params, rtol=1e-9)
+            assert_allclose(res1.bse[t], res2.bse, rtol=1e-8)
+            assert_allclose(res1.pvalues[t], res2.pvalues, rtol=1e-7)
+            assert_allclose(res1.cov_params()[t], res2.cov_params(),
+                            rtol=1e-8)
+            for attr in ['nobs', 'df_resid', 'ssr', 'centered_tss',
+                         'uncentered_tss', 'rsquared', 'rsquared_adj',
+                         'llf', 'aic', 'bic']:
+                assert_allclose(getattr(res1, attr)[t], getattr(res2, attr),
+                                rtol=1e-8, err_msg=attr)
+            if self.cov_type == 'nonrobust':
+                assert_allclose(res1.fvalue[t], res2.fvalue, rtol=1e-8)
+                assert_allclose(res1.scale[t], res2.scale, rtol=1e-8)
+
+
+class TestRollingOLS(CheckRolling):
+    pass
+
+
+class TestRollingWLS(CheckRolling):
+    weighted = True
+
+
+class TestRollingOLSExpanding(CheckRolling):
+    expanding = True
+    min_nobs = 10
+
+
+class TestRollingOLSFullExpanding(CheckRolling):
+    window = None
+    blocksize = 1000
+
+
+class TestRollingOLSHC0(CheckRolling):
+    cov_type = 'HC0'
+
+
+class TestRollingWLSHC1(CheckRolling):
+    cov_type = 'HC1'
+    weighted = True
+
+
+class TestRollingOLSHC3(CheckRolling):
+    cov_type = 'HC3'
+    expanding = True
+
+
+def test_large_level():
+    # the sums of squares cancel if they are computed from the
+    # cross-products and the intercept is much larger than the noise
+    np.random.seed(1234)
+    exog = add_constant(np.random.randn(200))
+    endog = 1e6 + 3 * exog[:, 1] + np.random.randn(200) * 1e-2
+    for cov_type in ['nonrobust', 'HC1']:
+        res = RollingOLS(endog, exog, window=50).fit(cov_type=cov_type)
+        for t in range(49, 200, 10):
+            res2 = OLS(endog[t - 49:t + 1],
+                       exog[t - 49:t + 1]).fit(cov_type=cov_type)
+            assert_allclose(res.ssr[t], res2.ssr, rtol=1e-6)
+            assert_allclose(res.centered_tss[t], res2.centered_tss,
+                            rtol=1e-6)
+            assert_allclose(res.bse[t], res2.bse, rtol=1e-6)
+
+
+class TestRollingOLSOptions(object):
+
+    @classmethod
+    def setupClass(cls):
+        data = macrodata.load_pandas().data
+        cls.endog = 400 * np.diff(np.log(data['realinv'].values))
+        cls.exog = add_constant(np.column_stack(
+            (400 * np.diff(np.log(data['realgdp'].values)),
+             data['realint'].values[1:])))
+
+    def test_params_only(self):
+        endog, exog = self.endog, self.exog
+        res = RollingOLS(endog, exog, window=30).fit(params_only=True)
+        res2 = RollingOLS(endog, exog, window=30).fit()
+        assert_allclose(res.params, res2.params, rtol=1e-12)
+        assert_raises(ValueError, getattr, res, 'bse')
+
+    def test_pandas(self):
+        endog, exog = self.endog, self.exog
+        index = pd.date_range('1959-06-30', periods=len(endog), freq='Q')
+        endog = pd.Series(endog, index=index, name='y')
+        exog = pd.DataFrame(exog, index=index, columns=['const', 'a', 'b'])
+        res = RollingOLS(endog, exog, window=30).fit()
+        assert_(isinstance(res.params, pd.DataFrame))
+        assert_equal(list(res.params.columns), ['const', 'a', 'b'])
+        assert_(res.rsquared.index.equals(index))
+        res2 = OLS(endog.iloc[10:40], exog.iloc[10:40]).fit()
+        assert_allclose(res.params.iloc[39], res2.params, rtol=1e-9)
+
+    def test_singular_window(self):
+        # dummy variable that is zero in some windows
+        endog, exog = self.endog, self.exog
+        exog = np.column_stack((exog, np.zeros(len(endog))))
+        exog[60:70, 3] = 1
+        res = RollingOLS(endog, exog, window=20).fit()
+        res2 = OLS(endog[10:30], exog[10:30]).fit()
+        assert_equal(res.rank[29], 3)
+        assert_allclose(res.params[29], res2.params, rtol=1e-8, atol=1e-12)
+        assert_allclose(res.bse[29, :3], res2.bse[:3], rtol=1e-8)
+        res2 = OLS(endog[50:70], exog[50:70]).fit()
+        assert_equal(res.rank[69], 4)
+        assert_allclose(res.params[69], res2.params, rtol=1e-8)
+        # only the windows without the dummy are singular
+        assert_equal(res.rank[60:89], 4)
+        assert_equal(res.rank[89:], 3)
+
+    def test_missing(self):
+        # windows with a missing value are nan, the others are not affected
+        endog, exog = self.endog.copy(), self.exog.copy()
+        endog[50] = np.nan
+        exog[80, 1] = np.nan
+        for cov_type in ['nonrobust', 'HC3']:
+            res = RollingOLS(endog, exog, window=20).fit(cov_type=cov_type,
+                                                         blocksize=7)
+            nan_windows = np.zeros(len(endog), bool)
+            nan_windows[:19] = nan_windows[50:70] = nan_windows[80:100] = True
+            assert_(np.isnan(res.params[nan_windows]).all())
+            assert_(np.isnan(res.rsquared[nan_windows]).all())
+            assert_(not np.isnan(res.bse[~nan_windows]).any())
+            for t in [49, 70, 79, 100, 119]:
+                res2 = OLS(endog[t - 19:t + 1], exog[t - 19:t + 1]).fit(
+                    cov_type=cov_type)
+                assert_allclose(res.params[t], res2.params, rtol=1e-9)
+                assert_allclose(res.bse[t], res2.bse, rtol=1e-8)
+                assert_allclose(res.rsquared[t], res2.rsquared, rtol=1e-8)
+                assert_allclose(res.llf[t], res2.llf, rtol=1e-8)
+
+    def test_errors(self):
+        endog, exog = self.endog, self.exog
+        assert_raises(ValueError, RollingOLS, endog, exog, window=3)
+        assert_raises(ValueError, RollingOLS, endog, exog, window=20,
+                      min_nobs=30)
+        assert_raises(ValueError, RollingOLS(endog, exog, window=20).fit,
+                      cov_type='HAC')
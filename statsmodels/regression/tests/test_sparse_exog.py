@@ -0,0 +1,109 @@
+"""
+Tests for linear regression with a scipy.sparse design matrix
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import (assert_, assert_allclose, assert_equal,
+                           assert_raises)
+from scipy import sparse
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.tools.grouputils import dummy_sparse
+
+
+class CheckSparse(object):
+
+    def test_params(self):
+        res1, res2 = self.res1, self.res2
+        assert_equal(res1.k_constant, res2.k_constant)
+        assert_equal(res1.df_model, res2.df_model)
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+        assert_allclose(res1.resid, res2.resid, rtol=1e-8, atol=1e-12)
+        for attr in ['ssr', 'rsquared', 'fvalue', 'llf', 'aic']:
+            assert_allclose(getattr(res1, attr), getattr(res2, attr),
+                            rtol=1e-10, err_msg=attr)
+
+    def test_robust(self):
+        for cov_type in ['HC0', 'HC1', 'HC2', 'HC3']:
+            res1 = self.res1.get_robustcov_results(cov_type)
+            res2 = self.res2.get_robustcov_results(cov_type)
+            assert_allclose(res1.bse, res2.bse, rtol=1e-10, err_msg=cov_type)
+
+        kwds = dict(cov_type='cluster', cov_kwds={'groups': self.groups})
+        res1 = self.model1.fit(**kwds)
+        res2 = self.model2.fit(**kwds)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+
+    def test_predict(self):
+        exog = self.model1.exog[:10]
+        assert_(sparse.issparse(exog))
+        assert_allclose(self.res1.predict(exog),
+                        self.res2.predict(exog.toarray()), rtol=1e-10)
+
+    def test_lsqr(self):
+        res1 = self.model1.fit(method='lsqr')
+        assert_allclose(res1.params, self.res2.params, rtol=1e-8)
+        assert_allclose(res1.bse, self.res2.bse, rtol=1e-10)
+        assert_raises(ValueError, self.model1.fit, method='qr')
+
+
+class TestSparseOLS(CheckSparse):
+
+    @classmethod
+    def setupClass(cls):
+        # two regressors and group fixed effects without a constant column
+        np.random.seed(987125)
+        cls.groups = np.random.randint(0, 30, size=500)
+        x = np.random.randn(500, 2)
+        exog = sparse.hstack((x, dummy_sparse(cls.groups))).tocsr()
+        endog = (x.sum(1) + 0.1 * cls.groups +
+                 np.random.randn(500) * (1 + np.abs(x[:, 0])))
+        cls.model1 = OLS(endog, exog)
+        cls.model2 = OLS(endog, exog.toarray())
+        cls.res1 = cls.model1.fit()
+        cls.res2 = cls.model2.fit()
+
+
+class TestSparseWLS(CheckSparse):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        cls.groups = np.random.randint(0, 30, size=500)
+        x = np.random.randn(500, 2)
+        exog = sparse.hstack((x, dummy_sparse(cls.groups))).tocsr()
+        endog = (x.sum(1) + 0.1 * cls.groups +
+                 np.random.randn(500) * (1 + np.abs(x[:, 0])))
+        weights = np.random.uniform(0.5, 2, size=500)
+        cls.model1 = WLS(endog, exog, weights=weights)
+        cls.model2 = WLS(endog, exog.toarray(), weights=weights)
+        cls.res1 = cls.model1.fit()
+        cls.res2 = cls.model2.fit()
+
+
+def test_data_handling():
+    np.random.seed(987125)
+    groups = np.random.randint(0, 30, size=100)
+    x = np.random.randn(100, 2)
+    exog = sparse.hstack((x, dummy_sparse(groups))).tocsr()
+    endog = pd.Series(x.sum(1) + np.random.randn(100), name='y')
+    mod = OLS(endog, exog)
+    assert_(sparse.isspmatrix_csr(mod.exog))
+    assert_equal(mod.k_constant, 1)
+    assert_equal(mod.exog_names, OLS(endog, exog.toarray()).exog_names)
+    res = mod.fit()
+    assert_(isinstance(res.params, pd.Series))
+
+    # missing values in the stored elements of exog
+    exog = exog.tolil()
+    exog[5, 0] = np.nan
+    exog = exog.tocsr()
+    assert_raises(Exception, OLS, endog, exog, missing='raise')
+    mod = OLS(endog, exog, missing='drop')
+    assert_equal(mod.nobs, 99)
+    assert_(sparse.issparse(mod.exog))
+    res2 = OLS(endog.drop(5), exog[np.arange(100) != 5].toarray()).fit()
+    assert_allclose(mod.fit().params, res2.params, rtol=1e-10, atol=1e-12)
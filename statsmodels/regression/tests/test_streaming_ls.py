@@ -0,0 +1,145 @@
+"""
+Tests for least squares estimated from blocks of data
+"""
+from __future__ import division
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.streaming_ls import StreamingOLS, StreamingWLS
+from statsmodels.tools.tools import add_constant
+
+
+def _blocks(arrays, n_blocks):
+    splits = [np.array_split(arr, n_blocks) for arr in arrays]
+    return list(zip(*splits))
+
+
+class CheckStreaming(object):
+
+    def test_params(self):
+        res1, res2 = self.res1, self.res2
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+        assert_allclose(res1.normalized_cov_params,
+                        res2.normalized_cov_params, rtol=1e-10)
+        assert_allclose(res1.pvalues, res2.pvalues, rtol=1e-8)
+
+    def test_sums_of_squares(self):
+        res1, res2 = self.res1, self.res2
+        assert_equal(res1.nobs, res2.nobs)
+        assert_equal(res1.df_model, res2.df_model)
+        assert_equal(res1.df_resid, res2.df_resid)
+        for attr in ['ssr', 'centered_tss', 'uncentered_tss', 'ess',
+                     'rsquared', 'rsquared_adj', 'fvalue', 'scale',
+                     'llf', 'aic', 'bic', 'condition_number']:
+            assert_allclose(getattr(res1, attr), getattr(res2, attr),
+                            rtol=1e-9, err_msg=attr)
+
+    def test_robust(self):
+        res2 = self.res2
+        for cov_type in ['HC0', 'HC1', 'HC2', 'HC3']:
+            res1 = self.model.fit(cov_type=cov_type, blocks=self.blocks)
+            assert_equal(res1.cov_type, cov_type)
+            assert_allclose(res1.bse, getattr(res2, cov_type + '_se'),
+                            rtol=1e-9)
+            assert_allclose(res1.fvalue,
+                            res2.get_robustcov_results(cov_type).fvalue,
+                            rtol=1e-9)
+
+    def test_summary(self):
+        txt = self.res1.summary().as_text()
+        for name in self.model.exog_names:
+            assert name in txt
+
+    def test_robustcov_results(self):
+        res1 = self.model.fit(blocks=self.blocks)
+        res_hc = res1.get_robustcov_results('HC3')
+        assert_equal(res_hc.cov_type, 'HC3')
+        assert_allclose(res_hc.bse, self.res2.HC3_se, rtol=1e-9)
+        assert_allclose(res_hc.params, res1.params, rtol=0)
+        assert_raises(ValueError, res1.get_robustcov_results, 'HAC')
+
+    def test_no_residuals(self):
+        for attr in ['resid', 'wresid', 'fittedvalues']:
+            assert not hasattr(self.res1, attr)
+        assert_raises(ValueError, self.model.fit, cov_type='HC1')
+        assert_raises(ValueError, self.model.fit, cov_type='HAC')
+
+
+class TestStreamingOLS(CheckStreaming):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        nobs, k = 1003, 4
+        exog = add_constant(np.random.randn(nobs, k - 1))
+        endog = (exog.sum(1) + np.random.randn(nobs) *
+                 (1 + np.abs(exog[:, 1])))
+        cls.res2 = OLS(endog, exog).fit()
+
+        cls.blocks = _blocks([endog, exog], 7)
+        cls.model = StreamingOLS(k)
+        for block in cls.blocks:
+            cls.model.update(*block)
+        cls.res1 = cls.model.fit()
+
+    def test_weights_block(self):
+        blocks = [block + (np.ones(len(block[0])),) for block in self.blocks]
+        assert_raises(ValueError, self.model.fit, cov_type='HC0',
+                      blocks=blocks)
+
+
+class TestStreamingWLS(CheckStreaming):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        nobs, k = 1003, 4
+        exog = add_constant(np.random.randn(nobs, k - 1))
+        weights = np.random.uniform(0.5, 2, size=nobs)
+        endog = exog.sum(1) + np.random.randn(nobs) / np.sqrt(weights)
+        cls.res2 = WLS(endog, exog, weights=weights).fit()
+
+        cls.blocks = _blocks([endog, exog, weights], 5)
+        cls.model = StreamingWLS(k, exog_names=['const', 'a', 'b', 'c'])
+        for block in cls.blocks:
+            cls.model.update(*block)
+        cls.res1 = cls.model.fit()
+
+
+def test_singular():
+    # duplicated column, minimum norm solution as in pinv
+    np.random.seed(1234)
+    nobs = 200
+    x = np.random.randn(nobs, 2)
+    exog = add_constant(np.column_stack((x, x[:, 0])))
+    endog = exog.sum(1) + np.random.randn(nobs)
+    res2 = OLS(endog, exog).fit()
+
+    mod = StreamingOLS(4)
+    for block in _blocks([endog, exog], 3):
+        mod.update(*block)
+    res1 = mod.fit()
+    assert_equal(mod.rank, 3)
+    assert_equal(res1.df_resid, res2.df_resid)
+    assert_allclose(res1.params, res2.params, rtol=1e-8)
+    assert_allclose(res1.ssr, res2.ssr, rtol=1e-8)
+
+
+def test_small_blocks():
+    # blocks with fewer rows than columns, no constant
+    np.random.seed(1234)
+    nobs = 50
+    exog = np.random.randn(nobs, 5)
+    endog = exog.sum(1) + np.random.randn(nobs)
+    res2 = OLS(endog, exog).fit()
+
+    mod = StreamingOLS(5)
+    for block in _blocks([endog, exog], 25):
+        mod.update(*block)
+    res1 = mod.fit()
+    assert_equal(res1.k_constant, 0)
+    assert_allclose(res1.params, res2.params, rtol=1e-10)
+    assert_allclose(res1.rsquared, res2.rsquared, rtol=1e-10)
@@ -10,7 +10,7 @@ from statsmodels.compat.python import lzip
 from collections import defaultdict
 import numpy as np
 
-from statsmodels.regression.linear_model import OLS
+from statsmodels.regression.linear_model import OLS, _hat_matrix_diag
 from statsmodels.tools.decorators import cache_readonly
 from statsmodels.stats.multitest import multipletests
 from statsmodels.tools.tools import maybe_unwrap_results
@@ -180,15 +180,12 @@ class OLSInfluence(object):
     -----
     One part of the results can be calculated without any auxiliary regression
     (some of which have the `_internal` postfix in the name. Other statistics
-    require leave-one-observation-out (LOOO) auxiliary regression, and will be
-    slower (mainly results with `_external` postfix in the name).
-    The auxiliary LOOO regression only the required results are stored.
+    require leave-one-observation-out (LOOO) results (mainly results with
+    `_external` postfix in the name).
 
-    Using the LOO measures is currently only recommended if the data set
-    is not too large. One possible approach for LOOO measures would be to
-    identify possible problem observations with the _internal measures, and
-    then run the leave-one-observation-out only with observations that are
-    possible outliers. (However, this is not yet available in an automized way.)
+    The leave-one-observation-out (LOOO) measures are computed in closed
+    form from the residuals and the diagonal of the hat matrix without
+    refitting the model, so they are also available for large data sets.
 
     This should be extended to general least squares.
 
@@ -218,7 +215,11 @@ class OLSInfluence(object):
         -----
         temporarily calculated here, this should go to model class
         '''
-        return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        pinv_wexog = getattr(self.results.model, 'pinv_wexog', None)
+        if pinv_wexog is not None:
+            return (self.exog * pinv_wexog.T).sum(1)
+        return _hat_matrix_diag(self.exog,
+                                self.results.normalized_cov_params)
 
     @cache_readonly
     def resid_press(self):
@@ -530,31 +531,40 @@ class OLSInfluence(object):
 
     @cache_readonly
     def _res_looo(self):
-        '''collect required results from the LOOO loop
+        '''collect required results for leave-one-observation-out (LOOO)
 
         all results will be attached.
         currently only 'params', 'mse_resid', 'det_cov_params' are stored
 
-        regresses endog on exog dropping one observation at a time
+        The results of the regressions that drop one observation at a time
+        are computed in closed form with the Sherman-Morrison updating
+        formula, the regressions are not refit.  With e the residuals, h the
+        diagonal of the hat matrix and ``B = (X'X)^{-1}``::
 
-        this uses a nobs loop, only attributes of the OLS instance are stored.
-        '''
-        from statsmodels.sandbox.tools.cross_val import LeaveOneOut
-        get_det_cov_params = lambda res: np.linalg.det(res.cov_params())
+            params_(i) = params - B x_i e_i / (1 - h_i)
+            ssr_(i) = ssr - e_i**2 / (1 - h_i)
+            det(B_(i)) = det(B) / (1 - h_i)
 
-        endog = self.endog
+        The rows are processed in chunks so that temporary arrays are at
+        most of size 100000 x k_vars.
+        '''
+        results = self.results
         exog = self.exog
+        ncp = results.normalized_cov_params
+        hii = self.hat_matrix_diag
+        resid_h = results.resid / (1 - hii)
 
-        params = np.zeros(exog.shape, dtype=np.float)
-        mse_resid = np.zeros(endog.shape, dtype=np.float)
-        det_cov_params = np.zeros(endog.shape, dtype=np.float)
+        params = np.empty(exog.shape, dtype=np.float)
+        chunksize = 100000
+        for start in range(0, self.nobs, chunksize):
+            sl = slice(start, start + chunksize)
+            params[sl] = results.params - (np.dot(exog[sl], ncp) *
+                                           resid_h[sl, None])
 
-        cv_iter = LeaveOneOut(self.nobs)
-        for inidx, outidx in cv_iter:
-            res_i = self.model_class(endog[inidx], exog[inidx]).fit()
-            params[outidx] = res_i.params
-            mse_resid[outidx] = res_i.mse_resid
-            det_cov_params[outidx] = get_det_cov_params(res_i)
+        df_resid = results.df_resid - 1
+        mse_resid = (results.ssr - results.resid * resid_h) / df_resid
+        det_cov_params = (mse_resid**self.k_vars * np.linalg.det(ncp) /
+                          (1 - hii))
 
         return dict(params=params, mse_resid=mse_resid,
                        det_cov_params=det_cov_params)
@@ -664,6 +674,179 @@ class OLSInfluence(object):
                            html_fmt=fmt_html)
 
 
+class GLMInfluence(object):
+    '''class to calculate influence measures for GLM and discrete models
+
+    Parameters
+    ----------
+    results : GLMResults or DiscreteResults instance
+        The model needs to be a single index model that provides
+        `score_factor` and `hessian_factor` methods, e.g. GLM, Logit,
+        Probit and Poisson.
+
+    Notes
+    -----
+    The measures are based on the weighted design of the final iteration of
+    iteratively reweighted least squares, ``W**0.5 X``, where ``W`` are the
+    weights of the (expected) Hessian, ``-d**2 loglike_i / d linpred**2``.
+    The leave-one-observation-out (LOOO) changes in the parameters are
+    one-step approximations that take a single IRLS step from the full
+    sample estimate, the model is not refit. For the linear model with
+    gaussian family the one-step approximation is exact.
+
+    The residuals are Pearson residuals for canonical links, the scale is
+    the GLM scale, and one for discrete models.
+    '''
+
+    def __init__(self, results):
+        self.results = maybe_unwrap_results(results)
+        model = self.results.model
+        if not hasattr(model, 'hessian_factor'):
+            raise NotImplementedError('influence measures require a model '
+                                      'with hessian_factor')
+        self.nobs, self.k_vars = model.exog.shape
+        self.endog = model.endog
+        self.exog = model.exog
+        self.scale = getattr(self.results, 'scale', 1.)
+
+    @cache_readonly
+    def _weights(self):
+        model = self.results.model
+        params = self.results.params
+        if hasattr(model, 'family'):
+            return model.hessian_factor(params, scale=1., observed=False)
+        return model.hessian_factor(params)
+
+    @cache_readonly
+    def _score_factor(self):
+        model = self.results.model
+        params = self.results.params
+        if hasattr(model, 'family'):
+            return model.score_factor(params, scale=1.)
+        return model.score_factor(params)
+
+    @cache_readonly
+    def _normalized_cov_params(self):
+        # inverse of X' W X, the IRLS covariance without scale
+        from statsmodels.regression.linear_model import _cross_product
+        return np.linalg.pinv(_cross_product(self.exog, self._weights))
+
+    @cache_readonly
+    def hat_matrix_diag(self):
+        '''(cached attribute) diagonal of the hat matrix
+
+        uses the weighted design of the IRLS iterations
+        '''
+        return self._weights * _hat_matrix_diag(self.exog,
+                                                self._normalized_cov_params)
+
+    @cache_readonly
+    def resid_pearson(self):
+        '''(cached attribute) Pearson residuals
+
+        working residuals scaled by the square root of the weights
+        '''
+        return self._score_factor / np.sqrt(self._weights)
+
+    @cache_readonly
+    def resid_studentized(self):
+        '''(cached attribute) standardized Pearson residuals
+
+        Pearson residuals divided by ``sqrt(scale * (1 - h))``
+        '''
+        hii = self.hat_matrix_diag
+        return self.resid_pearson / np.sqrt(self.scale * (1 - hii))
+
+    @cache_readonly
+    def d_params(self):
+        '''(cached attribute) one-step change of params when dropping obs
+
+        ``params - params_(i)``, where ``params_(i)`` are the one-step IRLS
+        estimates without observation i
+        '''
+        ncp = self._normalized_cov_params
+        factor = self._score_factor / (1 - self.hat_matrix_diag)
+        exog = self.exog
+        dparams = np.empty((self.nobs, self.k_vars))
+        chunksize = 100000
+        for start in range(0, self.nobs, chunksize):
+            sl = slice(start, start + chunksize)
+            x = exog[sl]
+            dparams[sl] = np.asarray(x.dot(ncp)) * factor[sl, None]
+        return dparams
+
+    @cache_readonly
+    def params_one(self):
+        '''(cached attribute) one-step LOOO parameter estimates
+        '''
+        return np.asarray(self.results.params) - self.d_params
+
+    @cache_readonly
+    def dfbetas(self):
+        '''(cached attribute) dfbetas
+
+        one-step change in params divided by the standard errors of the
+        full sample estimate, both based on the IRLS covariance
+        '''
+        bse = np.sqrt(self.scale * np.diag(self._normalized_cov_params))
+        return self.d_params / bse
+
+    @cache_readonly
+    def cooks_distance(self):
+        '''(cached attribute) Cooks distance
+
+        based on the standardized Pearson residuals, this is equal to the
+        one-step ``d_params' X'WX d_params / (k_vars * scale)``
+        '''
+        hii = self.hat_matrix_diag
+        cooks_d2 = self.resid_studentized**2 / self.k_vars
+        cooks_d2 *= hii / (1 - hii)
+
+        from scipy import stats
+        pvals = stats.f.sf(cooks_d2, self.k_vars, self.results.df_resid)
+
+        return cooks_d2, pvals
+
+    def summary_frame(self):
+        """
+        Creates a DataFrame with all available influence results.
+
+        Returns
+        -------
+        frame : DataFrame
+            A DataFrame with all results.
+
+        Notes
+        -----
+        The resultant DataFrame contains three variables in addition to the
+        DFBETAS. These are:
+
+        * cooks_d : Cook's Distance defined in `cooks_distance`
+        * standard_resid : Standardized Pearson residuals defined in
+          `resid_studentized`
+        * hat_diag : The diagonal of the hat matrix defined in
+          `hat_matrix_diag`
+        """
+        from pandas import DataFrame
+
+        data = self.results.model.data
+        row_labels = data.row_labels
+        beta_labels = ['dfb_' + i for i in data.xnames]
+
+        summary_data = DataFrame(dict(
+                            cooks_d = self.cooks_distance[0],
+                            standard_resid = self.resid_studentized,
+                            hat_diag = self.hat_matrix_diag,
+                                        ),
+                            index = row_labels,
+                            columns = ['cooks_d', 'standard_resid',
+                                       'hat_diag'])
+        dfbeta = DataFrame(self.dfbetas, columns=beta_labels,
+                            index=row_labels)
+
+        return dfbeta.join(summary_data)
+
+
 def summary_table(res, alpha=0.05):
     '''generate summary table of outlier and influence similar to SAS
 
@@ -104,6 +104,7 @@ Statistics 90, no. 3 (2008): 414–427.
 from statsmodels.compat.python import range
 import pandas as pd
 import numpy as np
+from scipy import sparse
 
 from statsmodels.tools.grouputils import Group
 from statsmodels.stats.moment_helpers import se_cov
@@ -166,8 +167,14 @@ def _HCCM(results, scale):
     where pinv(x) = (X'X)^(-1) X
     and scale is (nobs,)
     '''
-    H = np.dot(results.model.pinv_wexog,
-        scale[:,None]*results.model.pinv_wexog.T)
+    if getattr(results.model, 'pinv_wexog', None) is not None:
+        H = np.dot(results.model.pinv_wexog,
+            scale[:,None]*results.model.pinv_wexog.T)
+    else:
+        # model fit without storing pinv_wexog, pinv(x) = (X'X)^(-1) X'
+        from statsmodels.regression.linear_model import _cross_product
+        H = _HCCM2(results.normalized_cov_params,
+                   _cross_product(results.model.wexog, scale))
     return H
 
 def cov_hc0(results):
@@ -194,10 +201,8 @@ def cov_hc2(results):
     See statsmodels.RegressionResults
     """
 
-    # probably could be optimized
-    h = np.diag(np.dot(results.model.exog,
-                          np.dot(results.normalized_cov_params,
-                          results.model.exog.T)))
+    from statsmodels.regression.linear_model import _hat_matrix_diag
+    h = _hat_matrix_diag(results.model.exog, results.normalized_cov_params)
     het_scale = results.resid**2/(1-h)
     cov_hc2_ = _HCCM(results, het_scale)
     return cov_hc2_
@@ -207,10 +212,8 @@ def cov_hc3(results):
     See statsmodels.RegressionResults
     """
 
-    # above probably could be optimized to only calc the diag
-    h = np.diag(np.dot(results.model.exog,
-                          np.dot(results.normalized_cov_params,
-                          results.model.exog.T)))
+    from statsmodels.regression.linear_model import _hat_matrix_diag
+    h = _hat_matrix_diag(results.model.exog, results.normalized_cov_params)
     het_scale=(results.resid/(1-h))**2
     cov_hc3_ = _HCCM(results, het_scale)
     return cov_hc3_
@@ -240,6 +243,9 @@ def _get_sandwich_arrays(results, cov_type=''):
         elif hasattr(results.model, 'score_obs'):
             xu = results.model.score_obs(results.params)
             hessian_inv = np.linalg.inv(results.model.hessian(results.params))
+        elif sparse.issparse(results.model.wexog):
+            xu = sparse.diags(results.wresid).dot(results.model.wexog)
+            hessian_inv = np.asarray(results.normalized_cov_params)
         else:
             xu = results.model.wexog * results.wresid[:, None]
 
@@ -251,7 +257,11 @@ def _get_sandwich_arrays(results, cov_type=''):
             # assumes that freq_weights are incorporated in score_obs or equivalent
             # assumes xu/score_obs is 2D
             # temporary asarray
-            xu /= np.sqrt(np.asarray(results.model.freq_weights)[:, None])
+            freq_weights = np.asarray(results.model.freq_weights)
+            if sparse.issparse(xu):
+                xu = sparse.diags(1 / np.sqrt(freq_weights)).dot(xu)
+            else:
+                xu /= np.sqrt(freq_weights[:, None])
 
     else:
         raise ValueError('need either tuple of (jac, hessian_inv) or results' +
@@ -280,6 +290,14 @@ def _HCCM1(results, scale):
         robust covariance matrix for the parameter estimates
 
     '''
+    if getattr(results.model, 'pinv_wexog', None) is None:
+        exog = results.model.wexog
+        if scale.ndim == 1:
+            from statsmodels.regression.linear_model import _cross_product
+            meat = _cross_product(exog, scale)
+        else:
+            meat = np.dot(exog.T, np.dot(scale, exog))
+        return _HCCM2(results.normalized_cov_params, meat)
     if scale.ndim == 1:
         H = np.dot(results.model.pinv_wexog,
                    scale[:,None]*results.model.pinv_wexog.T)
@@ -419,9 +437,11 @@ def S_white_simple(x):
 
     Notes
     -----
-    this is just dot(X.T, X)
+    this is just dot(X.T, X), x can also be a scipy.sparse matrix
 
     '''
+    if sparse.issparse(x):
+        return x.T.dot(x).toarray()
     if x.ndim == 1:
         x = x[:,None]
 
@@ -448,6 +468,13 @@ def group_sums(x, group):
     if np.max(group) > 2 * x.shape[0]:
         group = pd.factorize(group)[0]
 
+    if sparse.issparse(x):
+        # sparse group indicator, the sums stay sparse
+        nobs = x.shape[0]
+        indicator = sparse.csr_matrix((np.ones(nobs),
+                                       (group, np.arange(nobs))))
+        return indicator.dot(x).T
+
     return np.array([np.bincount(group, weights=x[:, col])
                             for col in range(x.shape[1])])
 
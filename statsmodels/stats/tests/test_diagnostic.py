@@ -786,6 +786,38 @@ def test_influence_dtype():
     assert_almost_equal(cr1, cr3, decimal=8)
 
 
+def _res_looo_loop(infl):
+    # leave-one-out results by refitting the model once for each
+    # observation
+    endog, exog = infl.endog, infl.exog
+    params = np.zeros(exog.shape)
+    mse_resid = np.zeros(len(endog))
+    det_cov_params = np.zeros(len(endog))
+    for i in range(len(endog)):
+        keep = np.arange(len(endog)) != i
+        res_i = infl.model_class(endog[keep], exog[keep]).fit()
+        params[i] = res_i.params
+        mse_resid[i] = res_i.mse_resid
+        det_cov_params[i] = np.linalg.det(res_i.cov_params())
+    return dict(params=params, mse_resid=mse_resid,
+                det_cov_params=det_cov_params)
+
+
+def test_influence_looo_closed_form():
+    # compare closed form leave-one-out results with explicit refits
+    d = macrodata.load().data
+    y = np.log(d['realinv'])
+    x = add_constant(np.column_stack((np.log(d['realgdp']),
+                                      d['realint'])))
+    infl = OLS(y, x).fit().get_influence()
+    res1 = infl._res_looo
+    res2 = _res_looo_loop(infl)
+    assert_allclose(res1['params'], res2['params'], rtol=1e-10)
+    assert_allclose(res1['mse_resid'], res2['mse_resid'], rtol=1e-10)
+    assert_allclose(res1['det_cov_params'], res2['det_cov_params'],
+                    rtol=1e-9)
+
+
 def test_outlier_test():
     # results from R with NA -> 1. Just testing interface here because
     # outlier_test is just a wrapper
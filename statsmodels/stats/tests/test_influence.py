@@ -0,0 +1,172 @@
+"""
+Tests for influence measures of GLM and discrete models
+"""
+from __future__ import division
+
+import numpy as np
+from numpy.testing import assert_, assert_allclose
+
+from statsmodels.regression.linear_model import OLS
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.genmod import families
+from statsmodels.discrete.discrete_model import (Logit, Poisson, Probit,
+                                                 MNLogit, NegativeBinomial)
+from statsmodels.tools.tools import add_constant
+
+
+def test_gaussian_ols():
+    # one-step approximation is exact for the linear model
+    np.random.seed(987125)
+    exog = add_constant(np.random.randn(100, 2))
+    endog = 0.5 + 0.3 * exog[:, 1:].sum(1) + np.random.randn(100)
+    infl1 = GLM(endog, exog).fit().get_influence()
+    infl2 = OLS(endog, exog).fit().get_influence()
+    assert_allclose(infl1.hat_matrix_diag, infl2.hat_matrix_diag, rtol=1e-10)
+    assert_allclose(infl1.resid_studentized,
+                    infl2.resid_studentized_internal, rtol=1e-10)
+    assert_allclose(infl1.cooks_distance[0], infl2.cooks_distance[0],
+                    rtol=1e-10)
+    assert_allclose(infl1.cooks_distance[1], infl2.cooks_distance[1],
+                    rtol=1e-10)
+    assert_allclose(infl1.params_one, infl2.params_not_obsi, rtol=1e-10)
+
+
+def _one_step(exog, weights, score_factor, params, idx):
+    # one IRLS step from params on the sample without observation idx
+    mask = np.arange(len(exog)) != idx
+    x = exog[mask]
+    hess = np.dot(x.T * weights[mask], x)
+    score = np.dot(score_factor[mask], x)
+    return params + np.linalg.solve(hess, score)
+
+
+class CheckInfluence(object):
+
+    def test_one_step(self):
+        infl = self.infl
+        res = infl.results
+        for idx in [0, 5, np.argmax(infl.hat_matrix_diag)]:
+            params_i = _one_step(infl.exog, infl._weights, infl._score_factor,
+                                 res.params, idx)
+            assert_allclose(infl.params_one[idx], params_i, rtol=1e-7)
+
+        # close to the actual refit
+        idx = np.argmax(infl.cooks_distance[0])
+        mask = np.arange(infl.nobs) != idx
+        res_i = self.refit(mask)
+        assert_allclose(infl.params_one[idx], res_i.params, rtol=0.05)
+
+    def test_cooks(self):
+        infl = self.infl
+        ncp = infl._normalized_cov_params
+        xtwx = np.linalg.inv(ncp)
+        cooks = (np.dot(infl.d_params, xtwx) * infl.d_params).sum(1)
+        cooks /= infl.k_vars * infl.scale
+        assert_allclose(infl.cooks_distance[0], cooks, rtol=1e-10)
+        assert_allclose(infl.hat_matrix_diag.sum(), infl.k_vars, rtol=1e-10)
+
+    def test_summary_frame(self):
+        df = self.infl.summary_frame()
+        assert_(df.shape == (self.infl.nobs, self.infl.k_vars + 3))
+        assert_allclose(df['hat_diag'].values, self.infl.hat_matrix_diag)
+
+
+class TestInfluencePoisson(CheckInfluence):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        cls.exog = add_constant(np.random.randn(100, 2))
+        linpred = 0.5 + 0.3 * cls.exog[:, 1:].sum(1)
+        cls.endog = np.random.poisson(np.exp(linpred))
+        cls.infl = GLM(cls.endog, cls.exog,
+                       family=families.Poisson()).fit().get_influence()
+
+    def refit(self, mask):
+        return GLM(self.endog[mask], self.exog[mask],
+                   family=families.Poisson()).fit()
+
+    def test_discrete(self):
+        res = Poisson(self.endog, self.exog).fit(disp=0)
+        infl = res.get_influence()
+        assert_allclose(infl.hat_matrix_diag, self.infl.hat_matrix_diag,
+                        rtol=1e-6)
+        assert_allclose(infl.dfbetas, self.infl.dfbetas, rtol=1e-5)
+        resid_pearson = ((self.endog - res.predict()) /
+                         np.sqrt(res.predict()))
+        assert_allclose(infl.resid_pearson, resid_pearson, rtol=1e-10)
+
+
+class TestInfluenceGamma(CheckInfluence):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        cls.exog = add_constant(np.random.randn(100, 2))
+        mu = np.exp(0.5 + 0.3 * cls.exog[:, 1:].sum(1))
+        cls.endog = np.random.gamma(2, mu / 2)
+        cls.family = families.Gamma(link=families.links.log)
+        res = GLM(cls.endog, cls.exog, family=cls.family).fit(tol=1e-12)
+        cls.infl = res.get_influence()
+        cls.res = res
+
+    def refit(self, mask):
+        return GLM(self.endog[mask], self.exog[mask],
+                   family=self.family).fit()
+
+    def test_resid(self):
+        assert_allclose(self.infl.resid_pearson, self.res.resid_pearson,
+                        rtol=1e-10)
+
+
+class TestInfluenceLogit(CheckInfluence):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        cls.exog = add_constant(np.random.randn(200, 2))
+        linpred = 0.5 + 0.3 * cls.exog[:, 1:].sum(1)
+        cls.endog = (np.random.rand(200) <
+                     1 / (1 + np.exp(-linpred))).astype(float)
+        cls.infl = Logit(cls.endog, cls.exog).fit(disp=0).get_influence()
+
+    def refit(self, mask):
+        return Logit(self.endog[mask], self.exog[mask]).fit(disp=0)
+
+    def test_glm(self):
+        res = GLM(self.endog, self.exog, family=families.Binomial()).fit()
+        infl = res.get_influence()
+        assert_allclose(infl.hat_matrix_diag, self.infl.hat_matrix_diag,
+                        rtol=1e-6)
+        assert_allclose(infl.cooks_distance[0], self.infl.cooks_distance[0],
+                        rtol=1e-5)
+
+
+class TestInfluenceProbit(CheckInfluence):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        cls.exog = add_constant(np.random.randn(200, 2))
+        linpred = 0.5 + 0.3 * cls.exog[:, 1:].sum(1)
+        cls.endog = (np.random.randn(200) < linpred).astype(float)
+        cls.infl = Probit(cls.endog, cls.exog).fit(disp=0).get_influence()
+
+    def refit(self, mask):
+        return Probit(self.endog[mask], self.exog[mask]).fit(disp=0)
+
+    def test_hessian(self):
+        res = self.infl.results
+        assert_allclose(np.linalg.inv(self.infl._normalized_cov_params),
+                        -res.model.hessian(res.params), rtol=1e-10)
+
+
+def test_not_available():
+    # only single index models with hessian_factor have influence measures
+    np.random.seed(987125)
+    exog = add_constant(np.random.randn(100, 2))
+    endog = np.random.randint(0, 3, size=100)
+    res = MNLogit(endog, exog).fit(disp=0)
+    assert_(not hasattr(res, 'get_influence'))
+    res = NegativeBinomial(endog, exog).fit(disp=0)
+    assert_(not hasattr(res, 'get_influence'))
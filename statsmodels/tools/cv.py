@@ -0,0 +1,234 @@
+"""
+K-fold cross-validation of elastic net regularized models.
+
+The penalty weight of `fit_regularized` is chosen by fitting the whole
+path of penalty weights on the training data of each fold with
+`fit_regularized_path`, and evaluating the log-likelihood of the test
+data.  The models of a fold are created once and used for all penalty
+weights, so that cached cross products of the design matrix are shared
+along the path.  The folds can be fit in parallel processes using
+joblib.
+"""
+
+import numpy as np
+
+from statsmodels.tools.decorators import cache_readonly
+
+
+def _kfold_indices(nobs, n_folds, seed=None):
+    """
+    Return the test indices of a random partition into folds.
+
+    Parameters
+    ----------
+    nobs : int
+        The number of observations.
+    n_folds : int
+        The number of folds.
+    seed : int or None
+        Seed for the random permutation of the observations.  If None,
+        the observations are split into contiguous blocks.
+
+    Returns
+    -------
+    folds : list of ndarray
+        The indices of the test observations of each fold.
+    """
+    if n_folds < 2 or n_folds > nobs:
+        raise ValueError("n_folds must be between 2 and the number of "
+                         "observations")
+    if seed is None:
+        ix = np.arange(nobs)
+    else:
+        ix = np.random.RandomState(seed).permutation(nobs)
+    return [np.sort(f) for f in np.array_split(ix, n_folds)]
+
+
+def _model_subset(model, rows):
+    """
+    Create a model of the same class for a subset of the observations.
+
+    Extra arrays of the model with one element per observation, for
+    example `offset` or `weights`, are subset as well.
+    """
+    nobs = model.exog.shape[0]
+    init_kwds = model._get_init_kwds()
+    for key in ['formula', 'design_info', 'missing_idx']:
+        init_kwds.pop(key, None)
+    for key, value in init_kwds.items():
+        if isinstance(value, np.ndarray) and value.ndim > 0 and \
+                value.shape[0] == nobs:
+            init_kwds[key] = value[rows]
+    return model.__class__(model.endog[rows], model.exog[rows], **init_kwds)
+
+
+def _fit_fold(model_train, model_test, alphas, L1_wt, path_kwds):
+    """
+    Fit the path on the training data and return the test deviances.
+    """
+    path = model_train.fit_regularized_path(alphas, L1_wt=L1_wt, **path_kwds)
+    nobs_test = model_test.exog.shape[0]
+    return np.array([-2 * model_test.loglike(params, **path.loglike_kwds) /
+                     nobs_test for params in path.params])
+
+
+def fit_regularized_cv(model, alphas, L1_wt=1., folds=5, seed=None,
+                       n_jobs=1, verbose=0, **path_kwds):
+    """
+    Select the penalty weight of an elastic net fit by cross-validation.
+
+    Parameters
+    ----------
+    model : model instance
+        A model with a `fit_regularized_path` method, for example `OLS`,
+        `GLM`, `Logit` or `Poisson`.
+    alphas : array-like
+        1d array of penalty weights.
+    L1_wt : float
+        Must be in [0, 1].  The L1 penalty has weight L1_wt and the L2
+        penalty has weight 1 - L1_wt.
+    folds : int or list of array-like
+        The number of folds, or a list with the indices of the test
+        observations of each fold.
+    seed : int or None
+        Seed for the random assignment of the observations to the folds
+        if `folds` is an integer.  If None, the folds are contiguous
+        blocks of observations.
+    n_jobs : int
+        The number of parallel processes that are used to fit the folds.
+        Requires joblib if not equal to one, -1 uses all cores.
+    verbose : int
+        Verbosity level of joblib.
+    path_kwds : keywords
+        Additional keywords for `fit_regularized_path`, for example
+        `alpha_wt` or `profile_scale`.
+
+    Returns
+    -------
+    A RegularizedCVResults instance.
+
+    Notes
+    -----
+    The cross-validation criterion is the deviance, minus two times the
+    log-likelihood, per test observation.  The log-likelihood is
+    evaluated with the same keywords as the objective function of the
+    penalized fit, for example with `scale=1` for `OLS` it is the mean
+    squared prediction error up to a constant.
+
+    The selected penalty weight `alpha_min` minimizes the mean deviance
+    over the folds, `alpha_1se` is the largest penalty weight with a
+    mean deviance within one standard error of the minimum.  The final
+    fit uses all observations.
+    """
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+    nobs = model.exog.shape[0]
+    if np.isscalar(folds):
+        folds = _kfold_indices(nobs, int(folds), seed=seed)
+    else:
+        folds = [np.asarray(f) for f in folds]
+
+    jobs = []
+    for test_ix in folds:
+        train = np.ones(nobs, dtype=bool)
+        train[test_ix] = False
+        jobs.append((_model_subset(model, train),
+                     _model_subset(model, ~train)))
+
+    if n_jobs == 1:
+        cv_dev = [_fit_fold(mod_train, mod_test, alphas, L1_wt, path_kwds)
+                  for mod_train, mod_test in jobs]
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_fit_fold, n_jobs=n_jobs,
+                                                 verbose=verbose)
+        cv_dev = parallel(p_func(mod_train, mod_test, alphas, L1_wt,
+                                 path_kwds)
+                          for mod_train, mod_test in jobs)
+
+    path = model.fit_regularized_path(alphas, L1_wt=L1_wt, **path_kwds)
+    return RegularizedCVResults(path, np.asarray(cv_dev), folds)
+
+
+class RegularizedCVResults(object):
+    """
+    Results of the cross-validation of an elastic net fit.
+
+    Attributes
+    ----------
+    path : RegularizedPathResults
+        The fits for all penalty weights using all observations.
+    alphas : ndarray
+        The penalty weights.
+    cv_deviance : ndarray
+        2d array with the deviance per test observation for each fold in
+        rows and each penalty weight in columns.
+    folds : list of ndarray
+        The indices of the test observations of each fold.
+    """
+
+    def __init__(self, path, cv_deviance, folds):
+        self.path = path
+        self.model = path.model
+        self.alphas = path.alphas
+        self.cv_deviance = cv_deviance
+        self.folds = folds
+
+    @cache_readonly
+    def cv_mean(self):
+        """
+        The mean deviance over the folds for each penalty weight.
+        """
+        return self.cv_deviance.mean(0)
+
+    @cache_readonly
+    def cv_se(self):
+        """
+        The standard error of the mean deviance over the folds.
+        """
+        n_folds = self.cv_deviance.shape[0]
+        return self.cv_deviance.std(0, ddof=1) / np.sqrt(n_folds)
+
+    @cache_readonly
+    def alpha_min(self):
+        """
+        The penalty weight with the smallest mean deviance.
+        """
+        return self.alphas[np.argmin(self.cv_mean)]
+
+    @cache_readonly
+    def alpha_1se(self):
+        """
+        The largest penalty weight with a mean deviance within one
+        standard error of the smallest mean deviance.
+        """
+        ix = np.argmin(self.cv_mean)
+        bound = self.cv_mean[ix] + self.cv_se[ix]
+        return self.alphas[self.cv_mean <= bound].max()
+
+    @cache_readonly
+    def params(self):
+        """
+        The coefficients of the fit with penalty weight `alpha_min`.
+        """
+        return self.path.params[np.argmin(self.cv_mean)]
+
+    def get_fit(self, rule='min'):
+        """
+        Return the fit of the selected penalty weight.
+
+        Parameters
+        ----------
+        rule : {'min', '1se'}
+            Use `alpha_min` or `alpha_1se`.
+
+        Returns
+        -------
+        A RegularizedResults instance.
+        """
+        if rule == 'min':
+            alpha = self.alpha_min
+        elif rule == '1se':
+            alpha = self.alpha_1se
+        else:
+            raise ValueError("rule must be 'min' or '1se'")
+        return self.path.get_fit(np.flatnonzero(self.alphas == alpha)[0])
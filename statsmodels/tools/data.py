@@ -4,6 +4,7 @@ Compatibility tools for various data structure inputs
 from statsmodels.compat.python import range
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 
 def _check_period_index(x, freq="M"):
@@ -115,6 +116,11 @@ def _is_using_patsy(endog, exog):
             (is_design_matrix(exog) or exog is None))
 
 
+def _is_using_sparse(endog, exog):
+    # sparse exog is only supported with an ndarray endog
+    return isinstance(endog, np.ndarray) and sparse.issparse(exog)
+
+
 def _is_recarray(data):
     """
     Returns true if data is a recarray
@@ -111,7 +111,7 @@ def group_sums(x, group, use_bincount=True):
         uniques = np.unique(group)
         result = np.zeros([len(uniques)] + list(x.shape[1:]))
         for ii, cat in enumerate(uniques):
-            result[ii] = x[g == cat].sum(0)
+            result[ii] = x[group == cat].sum(0)
         return result
 
 
@@ -177,7 +177,7 @@ def dummy_sparse(groups):
 
     indptr = np.arange(len(groups)+1)
     data = np.ones(len(groups), dtype=np.int8)
-    indi = sparse.csr_matrix((data, g, indptr))
+    indi = sparse.csr_matrix((data, groups, indptr))
 
     return indi
 
@@ -246,11 +246,40 @@ class Group(object):
     def group_sums(self, x, use_bincount=True):
         return group_sums(x, self.group_int, use_bincount=use_bincount)
 
-    def group_demean(self, x, use_bincount=True):
-        nobs = float(len(x))
-        means_g = group_sums(x / nobs, self.group_int,
-                             use_bincount=use_bincount)
-        x_demeaned = x - means_g[self.group_int]  # check reverse_index?
+    def group_demean(self, x, use_bincount=True, weights=None):
+        """subtract the group means from x
+
+        Parameters
+        ----------
+        x : ndarray, 1d or 2d
+            data, the columns are demeaned separately
+        use_bincount : bool
+            passed on to `group_sums`
+        weights : None or ndarray, 1d
+            If not None, then weighted group means are subtracted.
+
+        Returns
+        -------
+        x_demeaned : ndarray
+            x minus the mean of the group of each observation
+        means_g : ndarray
+            group means, one row per group
+        """
+        x = np.asarray(x)
+        if weights is None:
+            sum_w = self.counts()
+            xw = x
+        else:
+            sum_w = np.bincount(self.group_int, weights=weights)
+            xw = x * (weights if x.ndim == 1 else weights[:, None])
+        sums_g = group_sums(xw, self.group_int, use_bincount=use_bincount)
+        if use_bincount:
+            # bincount version returns groups in columns
+            sums_g = sums_g.T
+        means_g = sums_g / sum_w[:, None]
+        if x.ndim == 1:
+            means_g = means_g[:, 0]
+        x_demeaned = x - means_g[self.group_int]
         return x_demeaned, means_g
 
 
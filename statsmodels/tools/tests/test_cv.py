@@ -0,0 +1,82 @@
+from __future__ import division
+
+import warnings
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.discrete.discrete_model import Poisson
+from statsmodels.genmod import families
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.regression.linear_model import OLS
+from statsmodels.tools.cv import (_kfold_indices, _model_subset,
+                                  fit_regularized_cv)
+
+
+def test_kfold_indices():
+    folds = _kfold_indices(23, 4, seed=1234)
+    assert_equal(len(folds), 4)
+    assert_equal(np.sort(np.concatenate(folds)), np.arange(23))
+    assert_equal(_kfold_indices(10, 2)[1], np.arange(5, 10))
+    assert_raises(ValueError, _kfold_indices, 10, 1)
+
+
+def test_model_subset():
+    np.random.seed(987125)
+    exog = np.random.randn(200, 6)
+    exposure = np.random.uniform(1, 2, size=200)
+    endog = np.random.poisson(exposure * np.exp(0.2 * exog[:, 0]))
+    rows = np.arange(200) % 3 == 0
+    params = np.r_[0.2, np.zeros(exog.shape[1] - 1)]
+
+    for klass, kwds in [(Poisson, {}),
+                        (GLM, {"family": families.Poisson()})]:
+        mod = klass(endog, exog, exposure=exposure, **kwds)
+        mod1 = _model_subset(mod, rows)
+        mod2 = klass(endog[rows], exog[rows], exposure=exposure[rows],
+                     **kwds)
+        assert_allclose(mod1.loglike(params), mod2.loglike(params),
+                        rtol=1e-12)
+
+
+class TestOLSCV(object):
+
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        exog = np.random.randn(200, 6)
+        endog = exog[:, :2].sum(1) + np.random.randn(200)
+        cls.model = OLS(endog, exog)
+        cls.alphas = np.exp(np.linspace(0, -6, 12))
+        cls.res = fit_regularized_cv(cls.model, cls.alphas, folds=4,
+                                     seed=1234)
+
+    def test_deviance(self):
+        res = self.res
+        assert_equal(res.cv_deviance.shape, (4, len(self.alphas)))
+        test_ix = res.folds[0]
+        train = np.ones(len(self.model.endog), dtype=bool)
+        train[test_ix] = False
+        mod = OLS(self.model.endog[train], self.model.exog[train])
+        path = mod.fit_regularized_path(self.alphas)
+        resid = (self.model.endog[test_ix][:, None] -
+                 np.dot(self.model.exog[test_ix], path.params.T))
+        dev = np.log(2 * np.pi) + (resid**2).mean(0)
+        assert_allclose(res.cv_deviance[0], dev, rtol=1e-8)
+
+    def test_selection(self):
+        res = self.res
+        ix = np.argmin(res.cv_mean)
+        assert_equal(res.alpha_min, self.alphas[ix])
+        assert res.alpha_1se >= res.alpha_min
+        assert_allclose(res.params, res.path.params[ix])
+        assert_allclose(res.get_fit().params, res.params)
+        # the first two variables are selected
+        assert np.all(res.get_fit('1se').params[:2] != 0)
+
+    def test_parallel(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            res = fit_regularized_cv(self.model, self.alphas,
+                                     folds=self.res.folds, n_jobs=2)
+        assert_allclose(res.cv_deviance, self.res.cv_deviance, rtol=1e-10)
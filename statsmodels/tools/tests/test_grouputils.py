@@ -248,3 +248,23 @@ def test_init_api():
     grouping = Grouping(list_groups)
     np.testing.assert_array_equal(grouping.group_names,
                                   ['group0', 'group1', 'group2'])
+
+
+def test_group_demean():
+    from statsmodels.tools.grouputils import Group
+    np.random.seed(1234)
+    g = np.random.randint(0, 5, size=50)
+    x = np.random.randn(50, 2)
+    weights = np.random.uniform(0.5, 2, size=50)
+    group = Group(g)
+    for w in [None, weights]:
+        x_dm, means = group.group_demean(x, weights=w)
+        for i in range(5):
+            mask = g == i
+            expected = np.average(x[mask], axis=0, weights=None if w is None
+                                  else w[mask])
+            np.testing.assert_allclose(means[i], expected, rtol=1e-12)
+            np.testing.assert_allclose(x_dm[mask], x[mask] - expected,
+                                       rtol=1e-12)
+        x_dm1, _ = group.group_demean(x[:, 0], weights=w)
+        np.testing.assert_allclose(x_dm1, x_dm[:, 0], rtol=1e-12)
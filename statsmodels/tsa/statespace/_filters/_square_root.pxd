@@ -0,0 +1,36 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Square root Kalman filter declarations
+
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from statsmodels.tsa.statespace._representation cimport (
+    sStatespace, dStatespace
+)
+from statsmodels.tsa.statespace._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter
+)
+
+# Single precision
+cdef int sfactorize_square_root(sKalmanFilter kfilter, int n, np.float32_t * cov, int ldcov, np.float32_t * fac, int ldfac)
+cdef int scopy_triangular_factor(int n, np.float32_t * prearray, int ldprearray, np.float32_t * fac, int ldfac, np.float32_t * cov, int ldcov)
+cdef int supdating_missing_square_root(sKalmanFilter kfilter, sStatespace model)
+
+cdef int sforecast_square_root(sKalmanFilter kfilter, sStatespace model)
+cdef np.float32_t sinverse_square_root(sKalmanFilter kfilter, sStatespace model, np.float32_t determinant) except *
+cdef int supdating_square_root(sKalmanFilter kfilter, sStatespace model)
+cdef int sprediction_square_root(sKalmanFilter kfilter, sStatespace model)
+
+# Double precision
+cdef int dfactorize_square_root(dKalmanFilter kfilter, int n, np.float64_t * cov, int ldcov, np.float64_t * fac, int ldfac)
+cdef int dcopy_triangular_factor(int n, np.float64_t * prearray, int ldprearray, np.float64_t * fac, int ldfac, np.float64_t * cov, int ldcov)
+cdef int dupdating_missing_square_root(dKalmanFilter kfilter, dStatespace model)
+
+cdef int dforecast_square_root(dKalmanFilter kfilter, dStatespace model)
+cdef np.float64_t dinverse_square_root(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) except *
+cdef int dupdating_square_root(dKalmanFilter kfilter, dStatespace model)
+cdef int dprediction_square_root(dKalmanFilter kfilter, dStatespace model)
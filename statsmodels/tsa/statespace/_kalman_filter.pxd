@@ -101,6 +101,13 @@ cdef class sKalmanFilter(object):
 
     cdef readonly np.float32_t determinant
 
+    # ### Square root filter
+    # Factors of the current state covariance matrices and work arrays
+    cdef readonly np.float32_t [::1,:] predicted_state_cov_fac, filtered_state_cov_fac
+    cdef readonly np.float32_t [::1,:] sqrt_prearray
+    cdef readonly np.float32_t [:] sqrt_tau, sqrt_work
+    cdef readonly int sqrt_ldwork
+
     # ### Pointers to current-iteration arrays
     # cdef np.float32_t * _obs
     # cdef np.float32_t * _design
@@ -229,6 +236,13 @@ cdef class dKalmanFilter(object):
 
     cdef readonly np.float64_t determinant
 
+    # ### Square root filter
+    # Factors of the current state covariance matrices and work arrays
+    cdef readonly np.float64_t [::1,:] predicted_state_cov_fac, filtered_state_cov_fac
+    cdef readonly np.float64_t [::1,:] sqrt_prearray
+    cdef readonly np.float64_t [:] sqrt_tau, sqrt_work
+    cdef readonly int sqrt_ldwork
+
     # ### Pointers to current-iteration arrays
     # cdef np.float64_t * _obs
     # cdef np.float64_t * _design
@@ -357,6 +371,13 @@ cdef class cKalmanFilter(object):
 
     cdef readonly np.complex64_t determinant
 
+    # ### Square root filter
+    # Factors of the current state covariance matrices and work arrays
+    cdef readonly np.complex64_t [::1,:] predicted_state_cov_fac, filtered_state_cov_fac
+    cdef readonly np.complex64_t [::1,:] sqrt_prearray
+    cdef readonly np.complex64_t [:] sqrt_tau, sqrt_work
+    cdef readonly int sqrt_ldwork
+
     # ### Pointers to current-iteration arrays
     # cdef np.complex64_t * _obs
     # cdef np.complex64_t * _design
@@ -485,6 +506,13 @@ cdef class zKalmanFilter(object):
 
     cdef readonly np.complex128_t determinant
 
+    # ### Square root filter
+    # Factors of the current state covariance matrices and work arrays
+    cdef readonly np.complex128_t [::1,:] predicted_state_cov_fac, filtered_state_cov_fac
+    cdef readonly np.complex128_t [::1,:] sqrt_prearray
+    cdef readonly np.complex128_t [:] sqrt_tau, sqrt_work
+    cdef readonly int sqrt_ldwork
+
     # ### Pointers to current-iteration arrays
     # cdef np.complex128_t * _obs
     # cdef np.complex128_t * _design
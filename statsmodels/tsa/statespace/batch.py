@@ -0,0 +1,707 @@
+"""
+Batched State Space Models
+
+Kalman filtering and maximum likelihood estimation of the same state space
+model specification (e.g. a SARIMAX order) for a panel of independent
+series, each with its own parameters.
+
+A single template model is used to compute the system matrices and the
+initialization of each series, which are stacked into arrays with the
+series in the last dimension. The Kalman filter of all series then runs in
+a single call of compiled code, without creating models, filters and
+results objects for each series.
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import warnings
+
+import numpy as np
+
+from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.parallel import parallel_func
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from . import tools
+
+
+class BatchModel(object):
+    """
+    State space model for a batch of independent series
+
+    Parameters
+    ----------
+    model_class : MLEModel subclass
+        The state space model class, e.g. `SARIMAX`.
+    endog : array_like
+        The observed series, shaped (nobs, n_series) for univariate models
+        or (nobs, k_endog, n_series) for multivariate models. Missing
+        observations are NaN.
+    **kwargs
+        Keyword arguments for `model_class`, shared by all series (e.g.
+        `order`). Exogenous regressors, if any, are shared by all series.
+
+    Attributes
+    ----------
+    model : MLEModel
+        The template model, constructed for the first series.
+    nobs : int
+        The number of observations of each series.
+    n_series : int
+        The number of series.
+    k_params : int
+        The number of parameters of each series.
+
+    Notes
+    -----
+    The system matrices of the model must be time-invariant, only the
+    intercepts may vary over time. Models that transform the data, e.g.
+    `SARIMAX` with `simple_differencing=True`, are not supported.
+
+    The template model is updated with the parameters of each series in
+    turn to compute the system matrices, while the initial state and the
+    Kalman filter of all series are computed at once. The model's `update`
+    is a Python call for each series in every filter call, i.e. in every
+    evaluation of the loglikelihood and `k_params + 1` times for each
+    gradient in `fit`. For small models this costs more than the filter
+    itself (with `SARIMAX` ARMA(1, 1) models and 200 observations more
+    than half of the time of a loglikelihood evaluation), so that the
+    gain over separate models is smaller for short series.
+    """
+
+    def __init__(self, model_class, endog, **kwargs):
+        if tools.compatibility_mode:
+            raise NotImplementedError('Batched Kalman filtering requires'
+                                      ' Cython BLAS and LAPACK (Scipy >= '
+                                      '0.16).')
+        endog = np.asarray(endog, dtype=float)
+        if endog.ndim == 2:
+            self._univariate = True
+            endog = endog[:, None, :]
+        elif endog.ndim == 3:
+            self._univariate = False
+        else:
+            raise ValueError('Invalid endog array; must be 2-dim or 3-dim,'
+                             ' with the series in the last axis.')
+        self.endog = endog
+        self.nobs, self.k_endog, self.n_series = endog.shape
+        self.model_class = model_class
+        self.model_kwargs = kwargs
+
+        endog0 = endog[:, :, 0]
+        self.model = model_class(endog0[:, 0] if self._univariate else endog0,
+                                 **kwargs)
+        ssm = self.model.ssm
+        if (not ssm.nobs == self.nobs or
+                not np.allclose(ssm.endog.T, endog0, equal_nan=True)):
+            raise ValueError('The model transforms the data, which is not'
+                             ' supported for batches of series.')
+        if ssm.prefix not in ('s', 'd'):
+            raise ValueError('Batched Kalman filtering requires real valued'
+                             ' data.')
+        self.param_names = self.model.param_names
+        self.k_params = len(self.param_names)
+
+        # Observations in (k_endog, nobs, n_series) order
+        self._obs = np.ascontiguousarray(
+            np.transpose(endog, (1, 0, 2)).astype(ssm.dtype))
+
+    def _series_params(self, params):
+        params = np.array(params, ndmin=2)
+        if params.shape[0] == 1 and self.n_series > 1:
+            params = np.repeat(params, self.n_series, axis=0)
+        if not params.shape == (self.n_series, self.k_params):
+            raise ValueError('Invalid params array; requires shape (%d, %d),'
+                             ' got %s.' % (self.n_series, self.k_params,
+                                           params.shape))
+        return params
+
+    def _stack_system(self, params, transformed=True):
+        """
+        System matrices and initialization of the series with `params`
+
+        The arrays have the series in the last dimension. The returned
+        parameters are the constrained parameters of the series.
+
+        Only the model's `update` is called for each series, the initial
+        states are computed for all series at once. The loop over the
+        series is the main cost of a batched filter call for small models,
+        see the notes of `BatchModel`.
+        """
+        mod = self.model
+        ssm = mod.ssm
+        n = params.shape[0]
+        k_endog, k_states = ssm.k_endog, ssm.k_states
+
+        for name in ['design', 'obs_cov', 'transition', 'selection',
+                     'state_cov']:
+            if getattr(ssm, '_' + name).shape[-1] > 1:
+                raise ValueError('Batched Kalman filtering requires a'
+                                 ' time-invariant %s matrix.' % name)
+
+        def stack(shape):
+            return np.zeros(shape + (n,), dtype=ssm.dtype)
+
+        constrained = np.zeros((n, self.k_params))
+        system = {
+            'design': stack((k_endog, k_states)),
+            'obs_intercept': stack((k_endog, ssm._obs_intercept.shape[-1])),
+            'obs_cov': stack((k_endog, k_endog)),
+            'transition': stack((k_states, k_states)),
+            'state_intercept': stack((k_states,
+                                      ssm._state_intercept.shape[-1])),
+            'selected_state_cov': stack((k_states, k_states)),
+            'initial_state': stack((k_states,)),
+            'initial_state_cov': stack((k_states, k_states)),
+        }
+        stationary = np.zeros(n, dtype=bool)
+        for s in range(n):
+            constrained[s] = (params[s] if transformed else
+                              mod.transform_params(params[s]))
+            mod.update(constrained[s], transformed=True)
+
+            selection = ssm._selection[:, :, 0]
+            system['design'][..., s] = ssm._design[:, :, 0]
+            system['obs_intercept'][..., s] = ssm._obs_intercept
+            system['obs_cov'][..., s] = ssm._obs_cov[:, :, 0]
+            system['transition'][..., s] = ssm._transition[:, :, 0]
+            system['state_intercept'][..., s] = ssm._state_intercept
+            system['selected_state_cov'][..., s] = np.dot(
+                np.dot(selection, ssm._state_cov[:, :, 0]), selection.T)
+
+            # (the update may change the initialization, e.g. to a known
+            # initialization computed from the parameters)
+            if ssm.initialization == 'known':
+                system['initial_state'][..., s] = ssm._initial_state
+                system['initial_state_cov'][..., s] = ssm._initial_state_cov
+            elif ssm.initialization == 'approximate_diffuse':
+                system['initial_state'][..., s] = ssm._initial_state
+                system['initial_state_cov'][..., s] = (
+                    np.eye(k_states) * ssm._initial_variance)
+            elif ssm.initialization == 'stationary':
+                stationary[s] = True
+            else:
+                raise RuntimeError('Statespace model not initialized.')
+
+        if np.any(stationary):
+            system['initial_state_cov'][..., stationary] = (
+                _stationary_cov(system['transition'][..., stationary],
+                                system['selected_state_cov'][...,
+                                                             stationary]))
+
+        if ssm.timing_init_filtered:
+            transition = system['transition']
+            system['initial_state'] = np.ascontiguousarray(
+                system['state_intercept'][:, 0] +
+                np.einsum('ijs,js->is', transition, system['initial_state']))
+            tmp = np.einsum('ijs,jks->iks', transition,
+                            system['initial_state_cov'])
+            system['initial_state_cov'] = np.ascontiguousarray(
+                np.einsum('iks,lks->ils', tmp, transition) +
+                system['selected_state_cov'])
+
+        return constrained, system
+
+    def _filter(self, params, transformed=True, series=None):
+        from . import _batch
+        if series is None:
+            params = self._series_params(params)
+            obs = self._obs
+        else:
+            obs = np.ascontiguousarray(self._obs[..., series])
+        constrained, system = self._stack_system(params, transformed)
+        func = getattr(_batch, self.model.ssm.prefix + 'batch_filter')
+        output = func(obs, system['design'], system['obs_intercept'],
+                      system['obs_cov'], system['transition'],
+                      system['state_intercept'],
+                      system['selected_state_cov'], system['initial_state'],
+                      system['initial_state_cov'])
+        return constrained, system, output
+
+    def loglikeobs(self, params, transformed=True):
+        """
+        Loglikelihood of each observation of each series
+
+        Parameters
+        ----------
+        params : array_like
+            The parameters of all series, shaped (n_series, k_params). A
+            1-dim array is used for all series.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+
+        Returns
+        -------
+        llf_obs : array
+            The loglikelihood of each observation, shaped
+            (nobs, n_series). The entries of the first `loglikelihood_burn`
+            observations are set to zero.
+        """
+        return self._loglikeobs(params, transformed)
+
+    def _loglikeobs(self, params, transformed=True, series=None):
+        llf_obs = self._filter(params, transformed, series)[2][0]
+        llf_obs[:self.model.ssm.loglikelihood_burn] = 0
+        return llf_obs
+
+    def loglike(self, params, transformed=True):
+        """
+        Loglikelihood of each series
+
+        Parameters
+        ----------
+        params : array_like
+            The parameters of all series, shaped (n_series, k_params). A
+            1-dim array is used for all series.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+
+        Returns
+        -------
+        llf : array
+            The loglikelihood of each series, excluding the first
+            `loglikelihood_burn` observations.
+        """
+        return self._loglikeobs(params, transformed).sum(0)
+
+    def score(self, params, transformed=True):
+        """
+        Gradient of the loglikelihood of each series
+
+        The gradient is computed by central differences, where the same
+        parameter of all series is perturbed at once, so that it requires
+        `2 * k_params` batched filter calls.
+
+        Parameters
+        ----------
+        params : array_like
+            The parameters of all series, shaped (n_series, k_params).
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+
+        Returns
+        -------
+        score : array
+            The gradient of the loglikelihood of each series with respect to
+            its parameters, shaped (n_series, k_params).
+        """
+        return self._score(self._series_params(params), transformed)
+
+    def _score(self, params, transformed=True, series=None):
+        score = np.zeros(params.shape)
+        epsilon = np.finfo(float).eps**(1. / 3)
+        for j in range(self.k_params):
+            step = epsilon * np.maximum(np.abs(params[:, j]), 0.1)
+            params_upper = params.copy()
+            params_upper[:, j] += step
+            params_lower = params.copy()
+            params_lower[:, j] -= step
+            # use the actual steps to reduce rounding error
+            step = params_upper[:, j] - params_lower[:, j]
+            score[:, j] = (
+                self._loglikeobs(params_upper, transformed, series).sum(0) -
+                self._loglikeobs(params_lower, transformed, series).sum(0)
+            ) / step
+        return score
+
+    @cache_readonly
+    def start_params(self):
+        """
+        (array) Starting parameters of all series, shaped
+        (n_series, k_params).
+
+        The starting parameters of each series are computed by a model for
+        this series, they are cached after the first call. If they cannot be
+        computed for a series (e.g. `SARIMAX` with non-stationary starting
+        autoregressive parameters), the starting parameters of the series
+        are the transformed mean of the untransformed starting parameters of
+        the other series.
+        """
+        start_params = np.zeros((self.n_series, self.k_params))
+        failed = []
+        for s in range(self.n_series):
+            endog = self.endog[:, :, s]
+            if self._univariate:
+                endog = endog[:, 0]
+            mod = self.model_class(endog, **self.model_kwargs)
+            try:
+                start_params[s] = mod.start_params
+            except ValueError:
+                failed.append(s)
+
+        if len(failed) == self.n_series:
+            raise ValueError('Starting parameters could not be computed for'
+                             ' any series.')
+        elif len(failed) > 0:
+            mod = self.model
+            valid = np.setdiff1d(np.arange(self.n_series), failed)
+            unconstrained = np.mean([mod.untransform_params(start_params[s])
+                                     for s in valid], axis=0)
+            start_params[failed] = mod.transform_params(unconstrained)
+            warnings.warn('Starting parameters could not be computed for %d'
+                          ' of %d series, the mean starting parameters of'
+                          ' the other series are used.'
+                          % (len(failed), self.n_series))
+        return start_params
+
+    def filter(self, params, transformed=True):
+        """
+        Kalman filtering of all series
+
+        Parameters
+        ----------
+        params : array_like
+            The parameters of all series, shaped (n_series, k_params). A
+            1-dim array is used for all series.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+
+        Returns
+        -------
+        BatchResults
+        """
+        constrained, system, output = self._filter(params, transformed)
+        return BatchResults(self, constrained, system, output)
+
+    def fit(self, start_params=None, transformed=True, maxiter=500,
+            gtol=1e-5, ftol=1e-9, disp=False, n_jobs=1):
+        """
+        Fits the models of all series by maximum likelihood
+
+        Parameters
+        ----------
+        start_params : array_like, optional
+            The starting parameters of all series, shaped
+            (n_series, k_params). Default is `start_params`.
+        transformed : boolean, optional
+            Whether or not `start_params` is already transformed. Default is
+            True.
+        maxiter : int, optional
+            The maximum number of iterations of each series. Default is 500.
+        gtol : float, optional
+            A series has converged when the largest absolute gradient of its
+            average loglikelihood is below `gtol`. Default is 1e-5.
+        ftol : float, optional
+            A series has also converged when the relative change of its
+            average loglikelihood in an iteration is below `ftol`. Default is
+            1e-9.
+        disp : boolean, optional
+            Set to True to print the number of converged series.
+        n_jobs : int, optional
+            The number of jobs. The series are split into `n_jobs` chunks
+            that are estimated in parallel using joblib. Default is 1, -1
+            uses all CPUs.
+
+        Returns
+        -------
+        BatchResults
+
+        Notes
+        -----
+        The loglikelihood of each series is maximized with respect to its
+        unconstrained parameters by BFGS with a backtracking line search.
+        The iterations of all series run in lockstep, so that each
+        evaluation of the loglikelihood requires one batched filter call and
+        each evaluation of the gradient (by forward differences) `k_params`
+        batched filter calls, but each series has its own step lengths and
+        Hessian approximation and is dropped from the batch when it has
+        converged.
+        """
+        if start_params is None:
+            start_params = self.start_params
+            transformed = True
+        start_params = self._series_params(start_params)
+        if transformed:
+            start_params = np.array([self.model.untransform_params(p)
+                                     for p in start_params])
+
+        if n_jobs == 1:
+            params, mle_retvals = _fit_batch(self, start_params, maxiter,
+                                             gtol, ftol)
+        else:
+            parallel, p_func, n_jobs = parallel_func(_fit_chunk, n_jobs,
+                                                     verbose=0)
+            chunks = np.array_split(np.arange(self.n_series), n_jobs)
+            chunks = [chunk for chunk in chunks if len(chunk) > 0]
+            fitted = parallel(
+                p_func(self.model_class, self.endog[..., chunk],
+                       self._univariate, self.model_kwargs,
+                       start_params[chunk], maxiter, gtol, ftol)
+                for chunk in chunks)
+            params = np.concatenate([chunk_params for chunk_params, _ in
+                                     fitted])
+            mle_retvals = dict(
+                (key, np.concatenate([retvals[key] for _, retvals in fitted]))
+                for key in fitted[0][1])
+
+        converged = mle_retvals['converged']
+        if disp:
+            print('%d of %d series converged.' % (converged.sum(),
+                                                  self.n_series))
+        if not np.all(converged):
+            warnings.warn('Maximum Likelihood optimization failed to converge'
+                          ' for %d of %d series. Check mle_retvals.'
+                          % ((~converged).sum(), self.n_series),
+                          ConvergenceWarning)
+
+        results = self.filter(params, transformed=False)
+        results.mle_retvals = mle_retvals
+        return results
+
+
+def _stationary_cov(transition, selected_state_cov, maxiter=64):
+    # Solves P = T P T' + R Q R' for all series at once by the doubling
+    # algorithm, P_{j+1} = P_j + A_j P_j A_j' and A_{j+1} = A_j A_j, so that
+    # P_j sums the first 2^j terms of the series sum_i T^i R Q R' T^i'
+    cov = np.array(selected_state_cov, dtype=float)
+    power = np.array(transition, dtype=float)
+    for i in range(maxiter):
+        increment = np.einsum('iks,lks->ils',
+                              np.einsum('ijs,jks->iks', power, cov), power)
+        cov += increment
+        if not np.any(np.abs(increment) > 1e-15 * np.abs(cov)):
+            break
+        power = np.einsum('ijs,jks->iks', power, power)
+    return cov
+
+
+def _minimize_batch(func, x0, maxiter=500, gtol=1e-5, ftol=1e-9):
+    """
+    Minimizes a batch of independent objective functions by BFGS
+
+    Parameters
+    ----------
+    func : callable
+        `func(x, series)` returns the objective values of the series with
+        the indices `series` at `x`, which is shaped (len(series), k).
+    x0 : array
+        The starting values of all series, shaped (n_series, k).
+    maxiter : int, optional
+        The maximum number of iterations of each series.
+    gtol : float, optional
+        A series has converged when the largest absolute gradient is below
+        `gtol`.
+    ftol : float, optional
+        A series has also converged when the relative decrease of the
+        objective in an iteration is below `ftol`.
+
+    Returns
+    -------
+    x : array
+        The minimizers, shaped (n_series, k).
+    fval : array
+        The objective values at `x`.
+    converged : array
+        Boolean array, whether each series has converged.
+    iterations : array
+        The number of iterations of each series.
+
+    Notes
+    -----
+    Each series has its own inverse Hessian approximation and step length,
+    the gradient is computed by forward differences and the step length by
+    backtracking until the Armijo condition holds. The iterations of the
+    series that have not converged run in lockstep, so that each call of
+    `func` evaluates all of them.
+    """
+    n, k = x0.shape
+    epsilon = np.finfo(float).eps**0.5
+
+    def grad(x, series, fval):
+        gval = np.zeros(x.shape)
+        for j in range(k):
+            x_upper = x.copy()
+            x_upper[:, j] += epsilon * np.maximum(np.abs(x[:, j]), 0.1)
+            gval[:, j] = ((func(x_upper, series) - fval) /
+                          (x_upper[:, j] - x[:, j]))
+        return gval
+
+    x = np.array(x0, dtype=float)
+    fval = func(x, np.arange(n))
+    gval = grad(x, np.arange(n), fval)
+    hinv = np.zeros((n, k, k))
+    hinv[:] = np.eye(k)
+    # (whether the inverse Hessian approximation is the identity)
+    identity = np.ones(n, dtype=bool)
+    converged = np.max(np.abs(gval), axis=1) < gtol
+    active = np.where(~converged & np.isfinite(fval))[0]
+    iterations = np.zeros(n, dtype=int)
+
+    for i in range(maxiter):
+        if len(active) == 0:
+            break
+        iterations[active] += 1
+        direction = -np.einsum('sij,sj->si', hinv[active], gval[active])
+        slope = np.sum(direction * gval[active], axis=1)
+
+        # Backtracking line search with the Armijo condition
+        step = np.ones(len(active))
+        x_new = x[active].copy()
+        fval_new = fval[active].copy()
+        accepted = np.zeros(len(active), dtype=bool)
+        pending = np.where(slope < 0)[0]
+        for j in range(30):
+            if len(pending) == 0:
+                break
+            trial = (x[active[pending]] +
+                     step[pending, None] * direction[pending])
+            ftrial = func(trial, active[pending])
+            ok = ftrial <= (fval[active[pending]] +
+                            1e-4 * step[pending] * slope[pending])
+            x_new[pending[ok]] = trial[ok]
+            fval_new[pending[ok]] = ftrial[ok]
+            accepted[pending[ok]] = True
+            pending = pending[~ok]
+            step[pending] *= 0.5
+
+        # A series without a step restarts from the steepest descent
+        # direction, or stops if it already used it
+        failed = active[~accepted]
+        hinv[failed] = np.eye(k)
+        restart = failed[~identity[failed]]
+        identity[failed] = True
+
+        moved = active[accepted]
+        x_new, fval_new = x_new[accepted], fval_new[accepted]
+        gval_new = grad(x_new, moved, fval_new)
+
+        # BFGS update, skipped if the curvature condition does not hold;
+        # the first update scales the identity (Nocedal and Wright 6.20)
+        s = x_new - x[moved]
+        y = gval_new - gval[moved]
+        sy = np.sum(s * y, axis=1)
+        update = sy > 1e-10 * np.sqrt(np.sum(s**2, axis=1) *
+                                      np.sum(y**2, axis=1))
+        ix, s, y, sy = moved[update], s[update], y[update], sy[update]
+        hinv[ix[identity[ix]]] *= (
+            sy / np.sum(y**2, axis=1))[identity[ix], None, None]
+        identity[ix] = False
+        hy = np.einsum('sij,sj->si', hinv[ix], y)
+        hinv[ix] += (((sy + np.sum(y * hy, axis=1)) / sy**2)[:, None, None] *
+                     np.einsum('si,sj->sij', s, s) -
+                     (np.einsum('si,sj->sij', hy, s) +
+                      np.einsum('si,sj->sij', s, hy)) / sy[:, None, None])
+
+        fscale = np.maximum(np.abs(fval[moved]), 1)
+        done = ((np.max(np.abs(gval_new), axis=1) < gtol) |
+                (fval[moved] - fval_new <= ftol * fscale))
+        x[moved], fval[moved], gval[moved] = x_new, fval_new, gval_new
+        converged[moved[done]] = True
+        active = np.sort(np.concatenate([moved[~done], restart]))
+
+    return x, fval, converged, iterations
+
+
+def _fit_batch(model, start_params, maxiter, gtol, ftol):
+    # Minimizes the negative average loglikelihood of each series with
+    # respect to the unconstrained parameters
+    nobs = model.nobs - model.model.ssm.loglikelihood_burn
+
+    def func(params, series):
+        return -model._loglikeobs(params, False, series).sum(0) / nobs
+
+    params, fval, converged, iterations = _minimize_batch(
+        func, start_params, maxiter, gtol, ftol)
+    mle_retvals = {'converged': converged, 'iterations': iterations,
+                   'fopt': -fval * nobs}
+    return params, mle_retvals
+
+
+def _fit_chunk(model_class, endog, univariate, model_kwargs, start_params,
+               maxiter, gtol, ftol):
+    # Estimation of a chunk of series in a separate process, the model is
+    # created in the process since the statespace objects are not picklable
+    if univariate:
+        endog = endog[:, 0]
+    model = BatchModel(model_class, endog, **model_kwargs)
+    return _fit_batch(model, start_params, maxiter, gtol, ftol)
+
+
+class BatchResults(object):
+    """
+    Results of the Kalman filter for a batch of series
+
+    Parameters
+    ----------
+    model : BatchModel
+        The model.
+    params : array
+        The constrained parameters of all series, shaped
+        (n_series, k_params).
+    system : dict
+        The stacked system matrices and initialization.
+    output : tuple
+        The output of the batched Kalman filter.
+
+    Attributes
+    ----------
+    params : array
+        The parameters of all series, shaped (n_series, k_params).
+    llf_obs : array
+        The loglikelihood of each observation, shaped (nobs, n_series). The
+        entries of the first `loglikelihood_burn` observations are zero.
+    forecasts_error : array
+        The one-step-ahead forecast errors, shaped (k_endog, nobs, n_series).
+    predicted_state : array
+        The predicted state of the period after the last observation,
+        shaped (k_states, n_series).
+    predicted_state_cov : array
+        The predicted state covariance matrix of the period after the last
+        observation, shaped (k_states, k_states, n_series).
+    mle_retvals : dict
+        Only after `fit`, the convergence information of each series, with
+        the arrays 'converged', 'iterations' and 'fopt' (the maximized
+        loglikelihood) of length `n_series`.
+    """
+
+    def __init__(self, model, params, system, output):
+        self.model = model
+        self.params = params
+        self._system = system
+        (self.llf_obs, self.forecasts_error, self.predicted_state,
+         self.predicted_state_cov) = output
+        self.nobs = model.nobs
+        self.n_series = model.n_series
+        self.loglikelihood_burn = model.model.ssm.loglikelihood_burn
+        self.llf_obs[:self.loglikelihood_burn] = 0
+
+    @cache_readonly
+    def llf(self):
+        """
+        (array) The loglikelihood of each series.
+        """
+        return self.llf_obs.sum(0)
+
+    def forecast(self, steps=1):
+        """
+        Out-of-sample forecasts of all series
+
+        Parameters
+        ----------
+        steps : int, optional
+            The number of steps to forecast. Default is 1.
+
+        Returns
+        -------
+        forecast : array
+            The forecasts, shaped (steps, n_series) for univariate models
+            or (steps, k_endog, n_series) for multivariate models.
+        """
+        system = self._system
+        if (system['obs_intercept'].shape[1] > 1 or
+                system['state_intercept'].shape[1] > 1):
+            raise ValueError('Forecasting is not available for models with'
+                             ' time-varying intercepts (e.g. with exogenous'
+                             ' regressors).')
+
+        state = self.predicted_state
+        forecasts = np.zeros((steps, self.model.k_endog, self.n_series))
+        for h in range(steps):
+            forecasts[h] = (system['obs_intercept'][:, 0] +
+                            np.einsum('ijs,js->is', system['design'], state))
+            state = (system['state_intercept'][:, 0] +
+                     np.einsum('ijs,js->is', system['transition'], state))
+
+        if self.model._univariate:
+            forecasts = forecasts[:, 0]
+        return forecasts
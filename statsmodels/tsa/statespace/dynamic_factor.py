@@ -223,6 +223,11 @@ class DynamicFactor(MLEModel):
             endog, exog=exog, k_states=k_states, k_posdef=k_posdef, **kwargs
         )
 
+        # update _init_keys attached by super
+        self._init_keys += ['k_factors', 'factor_order', 'error_order',
+                            'error_var', 'error_cov_type',
+                            'enforce_stationarity'] + list(kwargs.keys())
+
         # Set as time-varying model if we have exog
         if self.k_exog > 0:
             self.ssm._time_invariant = False
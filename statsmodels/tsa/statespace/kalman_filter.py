@@ -151,7 +151,7 @@ class KalmanFilter(Representation):
     """
     filter_square_root = OptionWrapper('filter_method', FILTER_SQUARE_ROOT)
     """
-    (bool) Flag for square-root Kalman filtering. Not implemented.
+    (bool) Flag for square-root Kalman filtering.
     """
     filter_univariate = OptionWrapper('filter_method', FILTER_UNIVARIATE)
     """
@@ -349,6 +349,15 @@ class KalmanFilter(Representation):
         # Initialize the representation matrices
         prefix, dtype, create_statespace = self._initialize_representation()
 
+        # If only the first k_posdef states enter the observation equation
+        # (e.g. in models with a VAR transition, where the other states are
+        # lags), the observations can be collapsed to dimension k_posdef
+        self._statespaces[prefix].subset_design = bool(
+            filter_method & FILTER_COLLAPSED and
+            self.k_posdef < self.k_states and
+            not np.any(self.design[:, self.k_posdef:])
+        )
+
         # Determine if we need to (re-)create the filter
         # (definitely need to recreate if we recreated the _statespace object)
         create_filter = create_statespace or prefix not in self._kalman_filters
@@ -408,6 +417,13 @@ class KalmanFilter(Representation):
 
         FILTER_CONVENTIONAL = 0x01
             Conventional Kalman filter.
+        FILTER_SQUARE_ROOT = 0x08
+            Square-root Kalman filter, which propagates Cholesky factors of
+            the state covariance matrices. Overrides conventional method if
+            both are specified. More stable in single precision and with
+            nearly singular covariance matrices. For complex data types, as
+            used in complex step differentiation, the conventional method is
+            used.
         FILTER_UNIVARIATE = 0x10
             Univariate approach to Kalman filtering. Overrides conventional
             method if both are specified.
@@ -1451,12 +1467,16 @@ class FilterResults(FrozenRepresentation):
         if self.filter_collapsed:
             # Copy the provided arrays (which are from the collapsed dataset)
             # into new variables
-            self.collapsed_forecasts = self.forecasts[:self.k_states, :]
+            # (with a subset design the collapsed dimension is k_posdef)
+            k_collapsed = self.k_states
+            if kalman_filter.model.subset_design:
+                k_collapsed = self.k_posdef
+            self.collapsed_forecasts = self.forecasts[:k_collapsed, :]
             self.collapsed_forecasts_error = (
-                self.forecasts_error[:self.k_states, :]
+                self.forecasts_error[:k_collapsed, :]
             )
             self.collapsed_forecasts_error_cov = (
-                self.forecasts_error_cov[:self.k_states, :self.k_states, :]
+                self.forecasts_error_cov[:k_collapsed, :k_collapsed, :]
             )
             # Recreate the original arrays (which should be from the original
             # dataset) in the appropriate dimension
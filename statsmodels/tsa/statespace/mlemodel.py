@@ -12,9 +12,11 @@ import pandas as pd
 from scipy.stats import norm
 
 from .simulation_smoother import SimulationSmoother
-from .kalman_smoother import KalmanSmoother, SmootherResults
+from .kalman_smoother import (KalmanSmoother, SmootherResults,
+                              SMOOTHER_STATE, SMOOTHER_STATE_COV)
 from .kalman_filter import (KalmanFilter, FilterResults, INVERT_UNIVARIATE,
-                            SOLVE_LU)
+                            SOLVE_LU, FILTER_CONVENTIONAL)
+from .tools import solve_discrete_lyapunov
 import statsmodels.tsa.base.tsa_model as tsbase
 import statsmodels.base.wrapper as wrap
 from statsmodels.tools.numdiff import (_get_epsilon, approx_hess_cs,
@@ -22,6 +24,7 @@ from statsmodels.tools.numdiff import (_get_epsilon, approx_hess_cs,
 from statsmodels.tools.decorators import cache_readonly, resettable_cache
 from statsmodels.tools.eval_measures import aic, bic, hqic
 from statsmodels.tools.tools import pinv_extended, Bunch
+from statsmodels.tools.data import _is_using_pandas
 from statsmodels.tools.sm_exceptions import PrecisionWarning
 import statsmodels.genmod._prediction as pred
 from statsmodels.genmod.families.links import identity
@@ -141,6 +144,53 @@ class MLEModel(tsbase.TimeSeriesModel):
     def __getitem__(self, key):
         return self.ssm.__getitem__(key)
 
+    def _get_init_kwds(self):
+        kwds = super(MLEModel, self)._get_init_kwds()
+
+        # Keyword arguments of the state space representation are stored
+        # as attributes of `ssm`
+        for key, value in kwds.items():
+            if value is None and hasattr(self.ssm, key):
+                kwds[key] = getattr(self.ssm, key)
+
+        return kwds
+
+    def clone(self, endog, exog=None, **kwargs):
+        """
+        Create a new model of the same specification with new data
+
+        Parameters
+        ----------
+        endog : array_like
+            The observed time-series process :math:`y`
+        exog : array_like, optional
+            Array of exogenous regressors.
+        **kwargs
+            Keyword arguments that replace the specification arguments of
+            this model.
+
+        Returns
+        -------
+        model : MLEModel
+            A model of the same class as this model.
+
+        Notes
+        -----
+        The specification of the model is recovered from `_get_init_kwds`,
+        so that subclasses must register their constructor arguments in
+        `_init_keys`.
+        """
+        kwds = self._get_init_kwds()
+        kwds.update(kwargs)
+        kwds['exog'] = exog
+        model = self.__class__(endog, **kwds)
+        if (model.k_params != self.k_params or
+                list(model.param_names) != list(self.param_names)):
+            raise ValueError('The cloned model does not have the parameters'
+                             ' of this model. Expected %s, got %s.'
+                             % (self.param_names, model.param_names))
+        return model
+
     def set_filter_method(self, filter_method=None, **kwargs):
         """
         Set the filtering method
@@ -370,13 +420,18 @@ class MLEModel(tsbase.TimeSeriesModel):
         return_params : boolean, optional
             Whether or not to return only the array of maximizing parameters.
             Default is False.
-        optim_score : {'harvey', 'approx'} or None, optional
+        optim_score : {'harvey', 'approx', 'analytic'} or None, optional
             The method by which the score vector is calculated. 'harvey' uses
             the method from Harvey (1989), 'approx' uses either finite
             difference or complex step differentiation depending upon the
-            value of `optim_complex_step`, and None uses the built-in gradient
-            approximation of the optimizer. Default is None. This keyword is
-            only relevant if the optimization method uses the score.
+            value of `optim_complex_step`, 'analytic' uses a single pass of
+            the Kalman filter and smoother (see `system_derivatives`), and
+            None uses the built-in gradient approximation of the optimizer.
+            Default is None. This keyword is only relevant if the
+            optimization method uses the score. 'analytic' is faster than
+            'approx' for multivariate models with many parameters, for
+            univariate models and models with few parameters the complex
+            step approximation is usually faster.
         optim_complex_step : bool, optional
             Whether or not to use complex step differentiation when
             approximating the score; if False, finite difference approximation
@@ -1009,6 +1064,338 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return -partials / 2.
 
+    def _score_analytic(self, params, **kwargs):
+        """
+        Score from a single pass of the Kalman filter and smoother
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters at which to evaluate the score.
+        **kwargs
+            Additional keyword arguments to pass to the Kalman filter. See
+            `KalmanFilter.filter` for more details.
+
+        Notes
+        -----
+        The gradient of the loglikelihood with respect to each of the system
+        matrices is computed by a backwards (smoothing) recursion over the
+        output of one pass of the Kalman filter (see Koopman and Shephard,
+        1992, and Durbin and Koopman, 2012, section 7.3.3). It is then
+        combined with the partial derivatives of the system matrices with
+        respect to the parameters, given by `system_derivatives`.
+
+        References
+        ----------
+        Koopman, S. J., and N. Shephard. 1992.
+        "Exact Score for Time Series Models in State Space Form."
+        Biometrika 79 (4): 823-26.
+        Durbin, James, and Siem Jan Koopman. 2012.
+        Time Series Analysis by State Space Methods: Second Edition.
+        Oxford University Press.
+        """
+        params = np.array(params, ndmin=1)
+        if self.ssm._complex_endog:
+            raise ValueError('Cannot compute the analytic score when data or'
+                             ' parameters are complex.')
+
+        derivatives = self.system_derivatives(params)
+        self.update(params, transformed=True)
+
+        # The recursion requires the full history of predicted states. With
+        # the conventional filter and the default timing, the scaled smoothed
+        # estimator and its covariance (r and N) are computed by the smoother.
+        # The output is read from the filter and smoother objects, so that
+        # it is not copied into results objects.
+        kwargs.pop('complex_step', None)
+        kwargs['conserve_memory'] = 0
+        ssm = self.ssm
+        kfilter = ssm._filter(**kwargs)
+        smoothed = None
+        if (ssm.filter_method == FILTER_CONVENTIONAL and
+                not ssm.timing_init_filtered and
+                not ssm._compatibility_mode):
+            smoother = ssm._smooth(SMOOTHER_STATE | SMOOTHER_STATE_COV,
+                                   **kwargs)
+            # r_{-1} is stored in the first column
+            smoothed = (np.asarray(smoother.scaled_smoothed_estimator)[:, 1:],
+                        np.asarray(
+                            smoother.scaled_smoothed_estimator_cov)[:, :, 1:])
+        predicted_state = np.asarray(kfilter.predicted_state)
+        predicted_state_cov = np.asarray(kfilter.predicted_state_cov)
+        statespace = ssm._statespaces[ssm.prefix]
+        initial_state = np.array(statespace.initial_state)
+        initial_state_cov = np.array(statespace.initial_state_cov)
+
+        names = list(derivatives)
+        gradients = self._system_gradients(
+            predicted_state, predicted_state_cov, initial_state,
+            initial_state_cov, names=names, smoothed=smoothed)
+        burn = ssm.loglikelihood_burn
+        if burn > 0:
+            gradients_burn = self._system_gradients(
+                predicted_state, predicted_state_cov, initial_state,
+                initial_state_cov, start=burn, names=names)
+            for name in gradients:
+                gradients[name] -= gradients_burn[name]
+
+        # The initial state covariance of a stationary initialization solves
+        # P = T P T' + R Q R', so that its derivative solves the same
+        # equation with the derivative of T P T' + R Q R' in place of R Q R'
+        if (self.ssm.initialization == 'stationary' and
+                'initial_state_cov' not in derivatives):
+            derivatives['initial_state_cov'] = (
+                self._stationary_cov_derivatives(initial_state_cov,
+                                                 derivatives, len(params)))
+
+        score = np.zeros(len(params))
+        for name, partials in derivatives.items():
+            gradient = gradients[name]
+            if name not in ['initial_state', 'initial_state_cov']:
+                if partials.shape[-2] == 1:
+                    gradient = gradient.sum(-1)
+                    partials = partials[..., 0, :]
+            score += np.tensordot(gradient, partials, axes=gradient.ndim)
+
+        return score
+
+    def _stationary_cov_derivatives(self, initial_state_cov, derivatives,
+                                    k_params):
+        ssm = self.ssm
+        transition = ssm._transition[:, :, 0]
+        selection = ssm._selection[:, :, 0]
+        state_cov = ssm._state_cov[:, :, 0]
+
+        partials = np.zeros((ssm.k_states, ssm.k_states, k_params))
+        for i in range(k_params):
+            cov = np.zeros((ssm.k_states, ssm.k_states))
+            if 'transition' in derivatives:
+                tmp = np.dot(np.dot(derivatives['transition'][:, :, 0, i],
+                                    initial_state_cov), transition.T)
+                cov += tmp + tmp.T
+            if 'selection' in derivatives:
+                tmp = np.dot(np.dot(derivatives['selection'][:, :, 0, i],
+                                    state_cov), selection.T)
+                cov += tmp + tmp.T
+            if 'state_cov' in derivatives:
+                cov += np.dot(np.dot(selection,
+                                     derivatives['state_cov'][:, :, 0, i]),
+                              selection.T)
+            if np.any(cov):
+                partials[:, :, i] = solve_discrete_lyapunov(transition, cov)
+        return partials
+
+    def _system_gradients(self, predicted_state, predicted_state_cov,
+                          initial_state, initial_state_cov, start=None,
+                          names=None, smoothed=None):
+        # Gradients of the loglikelihood of the periods before `start` with
+        # respect to each element of the system matrices (at each period)
+        # and of the initial state mean and covariance. `r` and `N` are as in
+        # the smoothing recursions, so that the gradients with respect to the
+        # predicted state and its covariance are r and (r r' - N) / 2.
+        # Only the backward recursion for r and N is a loop over periods,
+        # all quantities that do not depend on them are computed for all
+        # periods at once from the predicted states of the filter. If
+        # `smoothed` holds r_t and N_t for all periods from the smoother,
+        # the loop is skipped.
+        ssm = self.ssm
+        endog = ssm.endog
+        k_endog, nobs = endog.shape
+        k_states = ssm.k_states
+        k_posdef = ssm.k_posdef
+        if start is None:
+            start = nobs
+        if names is None:
+            names = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                     'state_intercept', 'selection', 'state_cov']
+        offset = 1 if ssm.timing_init_filtered else 0
+        periods = np.arange(start)
+
+        def get(name, t):
+            matrix = getattr(ssm, '_' + name)
+            return matrix[..., t if matrix.shape[-1] > 1 else 0]
+
+        def stack(name, index):
+            # matrices at the periods in `index` along the first axis, or a
+            # single matrix if the matrix is not time-varying
+            matrix = getattr(ssm, '_' + name)
+            if matrix.shape[-1] == 1:
+                return np.rollaxis(matrix, -1)
+            return np.rollaxis(matrix[..., index], -1)
+
+        def transpose(x):
+            return x.swapaxes(-1, -2)
+
+        def dot(x, y):
+            # matrix products of stacked matrices
+            return np.einsum('...ij,...jk->...ik', x, y)
+
+        a = predicted_state[:, :start].T
+        P = np.rollaxis(predicted_state_cov[:, :, :start], -1)
+        # Index of the transition to the next predicted state
+        transition = stack('transition', np.minimum(periods + offset,
+                                                    nobs - 1))
+        transition = np.zeros((start, k_states, k_states)) + transition
+
+        # Periods by their missing observations
+        missing = np.isnan(endog[:, :start])
+        nmissing = missing.sum(0)
+        full = np.flatnonzero(nmissing == 0)
+        partial = np.flatnonzero((nmissing > 0) & (nmissing < k_endog))
+
+        # Terms of the recursions r_{t-1} = Z'F^{-1}v + L'r_t and
+        # N_{t-1} = Z'F^{-1}Z + L'N_t L, with L = T - KZ
+        ZFv = np.zeros((start, k_states))
+        ZFZ = np.zeros((start, k_states, k_states))
+        L = transition.copy()
+
+        # Fully observed periods
+        design = stack('design', full)
+        obs_intercept = stack('obs_intercept', full)
+        forecasts_error = (endog[:, full].T - obs_intercept -
+                           np.einsum('tij,tj->ti', design, a[full]))
+        PZ = dot(P[full], transpose(design))
+        inv_forecasts_error_cov = np.linalg.inv(
+            dot(design, PZ) + stack('obs_cov', full))
+        gain = dot(dot(transition[full], PZ),
+                         inv_forecasts_error_cov)
+        FiZ = dot(inv_forecasts_error_cov, design)
+        L[full] -= dot(gain, design)
+        ZFv[full] = np.einsum('tij,ti->tj', FiZ, forecasts_error)
+        ZFZ[full] = dot(transpose(design), FiZ)
+
+        # Partially observed periods
+        partial_terms = []
+        for t in partial:
+            mask = ~missing[:, t]
+            design_t = get('design', t)[mask]
+            v = (endog[mask, t] - get('obs_intercept', t)[mask] -
+                 np.dot(design_t, a[t]))
+            PZ_t = np.dot(P[t], design_t.T)
+            Fi = np.linalg.inv(np.dot(design_t, PZ_t) +
+                               get('obs_cov', t)[np.ix_(mask, mask)])
+            K = np.dot(np.dot(transition[t], PZ_t), Fi)
+            FiZ_t = np.dot(Fi, design_t)
+            L[t] -= np.dot(K, design_t)
+            ZFv[t] = np.dot(FiZ_t.T, v)
+            ZFZ[t] = np.dot(design_t.T, FiZ_t)
+            partial_terms.append((t, mask, v, Fi, K, FiZ_t))
+
+        LT = transpose(L)
+        if smoothed is not None and start == nobs:
+            r = smoothed[0].T
+            N = np.rollaxis(smoothed[1], -1)
+            r_prev = ZFv + np.einsum('tij,tj->ti', LT, r)
+            N_prev = ZFZ + dot(dot(LT, N), L)
+        else:
+            # Backward recursion, r[t + 1] and N[t + 1] are r_t and N_t
+            r = np.zeros((start + 1, k_states))
+            N = np.zeros((start + 1, k_states, k_states))
+            for t in range(start - 1, -1, -1):
+                r[t] = ZFv[t] + np.dot(LT[t], r[t + 1])
+                N[t] = ZFZ[t] + np.dot(np.dot(LT[t], N[t + 1]), L[t])
+            r_prev, N_prev = r[:-1], N[:-1]
+            r, N = r[1:], N[1:]
+
+        smoothed_state = a + np.einsum('tij,tj->ti', P, r_prev)
+        NL = dot(N, L)
+
+        gradients = {}
+        obs_names = [name for name in ['design', 'obs_intercept', 'obs_cov']
+                     if name in names]
+        if obs_names:
+            gradients['design'] = np.zeros((k_endog, k_states, nobs))
+            gradients['obs_intercept'] = np.zeros((k_endog, nobs))
+            gradients['obs_cov'] = np.zeros((k_endog, k_endog, nobs))
+
+            # u is the smoothing error F^{-1}v - K'r_t and D its variance
+            # F^{-1} + K'N_t K
+            gainT = transpose(gain)
+            u = (np.einsum('tij,tj->ti', inv_forecasts_error_cov,
+                           forecasts_error) -
+                 np.einsum('tij,tj->ti', gainT, r[full]))
+            gradients['obs_intercept'][:, full] = u.T
+            if 'obs_cov' in names:
+                D = inv_forecasts_error_cov + dot(
+                    dot(gainT, N[full]), gain)
+                gradients['obs_cov'][:, :, full] = np.rollaxis(
+                    0.5 * (u[:, :, None] * u[:, None, :] - D), 0, 3)
+            if 'design' in names:
+                gradients['design'][:, :, full] = np.rollaxis(
+                    u[:, :, None] * smoothed_state[full][:, None, :] -
+                    dot(FiZ - dot(gainT, NL[full]), P[full]),
+                    0, 3)
+
+            for t, mask, v, Fi, K, FiZ_t in partial_terms:
+                u = np.dot(Fi, v) - np.dot(K.T, r[t])
+                D = Fi + np.dot(np.dot(K.T, N[t]), K)
+                gradients['obs_intercept'][mask, t] += u
+                gradients['obs_cov'][np.ix_(mask, mask, [t])] += (
+                    0.5 * (np.outer(u, u) - D))[:, :, None]
+                gradients['design'][mask, :, t] += (
+                    np.outer(u, smoothed_state[t]) -
+                    np.dot(FiZ_t - np.dot(K.T, NL[t]), P[t]))
+
+        # Gradients from the prediction of the state at period s = t + offset
+        # from the smoothed state at period t
+        periods = periods[periods + offset < nobs]
+        s = periods + offset
+        r_s, N_s = r[periods], N[periods]
+        gradient_cov = 0.5 * (r_s[:, :, None] * r_s[:, None, :] - N_s)
+        selection = stack('selection', s)
+        state_cov = stack('state_cov', s)
+        state_names = [name for name in ['transition', 'state_intercept',
+                                         'selection', 'state_cov']
+                       if name in names]
+        if state_names:
+            gradients['transition'] = np.zeros((k_states, k_states, nobs))
+            gradients['state_intercept'] = np.zeros((k_states, nobs))
+            gradients['selection'] = np.zeros((k_states, k_posdef, nobs))
+            gradients['state_cov'] = np.zeros((k_posdef, k_posdef, nobs))
+
+            gradients['state_intercept'][:, s] = r_s.T
+            if 'transition' in names:
+                gradients['transition'][:, :, s] = np.rollaxis(
+                    r_s[:, :, None] * smoothed_state[periods][:, None, :] -
+                    dot(NL[periods], P[periods]), 0, 3)
+            if 'selection' in names:
+                gradients['selection'][:, :, s] = np.rollaxis(
+                    dot(dot(gradient_cov, selection),
+                              state_cov + transpose(state_cov)), 0, 3)
+            if 'state_cov' in names:
+                gradients['state_cov'][:, :, s] = np.rollaxis(
+                    dot(dot(transpose(selection), gradient_cov),
+                              selection), 0, 3)
+
+        r, N = r_prev[0], N_prev[0]
+
+        # With the alternate timing, the initial state is the filtered state
+        # at period zero, and so the first predicted state depends on it
+        # through the transition at period zero
+        if offset:
+            transition = get('transition', 0)
+            r_prev = np.dot(transition.T, r)
+            N_prev = np.dot(np.dot(transition.T, N), transition)
+            if state_names:
+                selection = get('selection', 0)
+                state_cov = get('state_cov', 0)
+                gradient_cov = 0.5 * (np.outer(r, r) - N)
+                gradients['state_intercept'][:, 0] += r
+                gradients['transition'][:, :, 0] += (
+                    np.outer(r, initial_state +
+                             np.dot(initial_state_cov, r_prev)) -
+                    np.dot(np.dot(N, transition), initial_state_cov))
+                gradients['selection'][:, :, 0] += np.dot(
+                    np.dot(gradient_cov, selection), state_cov + state_cov.T)
+                gradients['state_cov'][:, :, 0] += np.dot(
+                    np.dot(selection.T, gradient_cov), selection)
+            r, N = r_prev, N_prev
+
+        gradients['initial_state'] = r
+        gradients['initial_state_cov'] = 0.5 * (np.outer(r, r) - N)
+
+        return gradients
+
     def score(self, params, *args, **kwargs):
         """
         Compute the score function at params.
@@ -1028,7 +1415,14 @@ class MLEModel(tsbase.TimeSeriesModel):
         Notes
         -----
         This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglike` method.
+        step differentiation on the `loglike` method. If the keyword argument
+        `method` is 'analytic', the score is instead computed from a single
+        pass of the Kalman filter and smoother, using the partial derivatives
+        of the system matrices given by `system_derivatives`. The complex
+        step approximation requires one pass of the Kalman filter for each
+        parameter, but each pass is cheaper, so that the analytic score is
+        only faster for multivariate models with many parameters; for
+        univariate models it is usually slower.
 
         Both \*args and \*\*kwargs are necessary because the optimizer from
         `fit` must call this function and only supports passing arguments via
@@ -1076,6 +1470,8 @@ class MLEModel(tsbase.TimeSeriesModel):
         if method == 'harvey':
             score = self._score_harvey(
                 params, approx_complex_step=approx_complex_step, **kwargs)
+        elif method == 'analytic':
+            score = self._score_analytic(params, **kwargs)
         elif method == 'approx' and approx_complex_step:
             score = self._score_complex_step(params, **kwargs)
         elif method == 'approx':
@@ -1401,6 +1797,70 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return params
 
+    def system_derivatives(self, params):
+        """
+        Partial derivatives of the system matrices with respect to parameters
+
+        Parameters
+        ----------
+        params : array_like
+            Array of (constrained) parameters at which to evaluate the
+            derivatives.
+
+        Returns
+        -------
+        derivatives : dict
+            Dictionary with an entry for each of the state space system
+            matrices (for example 'design' or 'transition') that depends on
+            the parameters, and optionally 'initial_state' and
+            'initial_state_cov'. Each entry is an array of the shape of the
+            corresponding matrix, including its time dimension, with an
+            additional last dimension of length `k_params`.
+
+        Notes
+        -----
+        These are used by `score` (and by `fit` with `optim_score` set to
+        'analytic'). By default they are computed by complex step
+        differentiation of the `update` method, which does not require
+        running the Kalman filter and is exact up to rounding error.
+        Subclasses may override this method with closed-form expressions.
+
+        If the state is initialized as stationary and 'initial_state_cov' is
+        not included, the derivatives of the initial state covariance matrix
+        are computed from those of the transition, selection and state
+        covariance matrices.
+        """
+        params = np.array(params, ndmin=1)
+        k_params = len(params)
+        if self.ssm._complex_endog:
+            raise ValueError('Cannot use complex step derivatives when data'
+                             ' or parameters are complex.')
+
+        names = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                 'state_intercept', 'selection', 'state_cov']
+        epsilon = _get_epsilon(params, 2., None, k_params)
+        derivatives = {}
+        for i in range(k_params):
+            increment = np.zeros(k_params, dtype=complex)
+            increment[i] = epsilon[i] * 1j
+            self.update(params + increment, transformed=True,
+                        complex_step=True)
+
+            values = [(name, getattr(self.ssm, '_' + name)) for name in names]
+            if self.ssm.initialization == 'known':
+                values += [('initial_state', self.ssm._initial_state),
+                           ('initial_state_cov', self.ssm._initial_state_cov)]
+            for name, value in values:
+                if name not in derivatives:
+                    derivatives[name] = np.zeros(value.shape + (k_params,))
+                derivatives[name][..., i] = value.imag / epsilon[i]
+
+        # Reset the model to the (real) parameters
+        self.update(params, transformed=True)
+
+        return dict([(name, value) for name, value in derivatives.items()
+                     if np.any(value)])
+
     def simulate(self, params, nsimulations, measurement_shocks=None,
                  state_shocks=None, initial_state=None):
         r"""
@@ -2414,6 +2874,150 @@ class MLEResults(tsbase.TimeSeriesModelResults):
             end = steps
         return self.predict(start=self.nobs, end=end, **kwargs)
 
+    def extend(self, endog, exog=None, **kwargs):
+        """
+        Continue the Kalman filter with new observations
+
+        Parameters
+        ----------
+        endog : array_like
+            New observations of the modeled time series, which directly
+            follow the end of the sample.
+        exog : array_like, optional
+            New observations of the exogenous regressors, if the model has
+            any.
+        **kwargs
+            Keyword arguments that replace specification arguments of the
+            model for the new observations, see `MLEModel.clone`.
+
+        Returns
+        -------
+        results : MLEResults
+            Results of the Kalman filter applied to the new observations
+            only, with the parameters of this results object.
+
+        Notes
+        -----
+        The Kalman filter of the new observations is initialized with the
+        predicted state and state covariance matrix of the first period
+        after the end of the sample, so that the computational cost grows
+        with the number of new observations and not with the length of the
+        sample. The log-likelihood, forecasts and filtered states of the new
+        results are the same as those of the last observations of a model
+        for the full sample. The covariance matrix of the parameters is not
+        computed.
+
+        See Also
+        --------
+        append
+        """
+        model = self.model.clone(endog, exog=exog, **kwargs)
+        predicted_state = self.predicted_state[:, -1]
+        predicted_state_cov = self.predicted_state_cov[:, :, -1]
+
+        # With the alternate timing the filter does not compute the
+        # prediction for the first new period, and the filtered state
+        # covariance matrix of the last period can be singular, so the new
+        # observations are filtered with the default timing starting from
+        # the one-step-ahead prediction
+        if model.ssm.timing_init_filtered:
+            model.update(self.params)
+            ssm = model.ssm
+            transition = ssm._transition[:, :, 0]
+            selection = ssm._selection[:, :, 0]
+            predicted_state = (
+                ssm._state_intercept[:, 0] +
+                np.dot(transition, self.filtered_state[:, -1]))
+            predicted_state_cov = (
+                np.dot(np.dot(transition, self.filtered_state_cov[:, :, -1]),
+                       transition.T) +
+                np.dot(np.dot(selection, ssm._state_cov[:, :, 0]),
+                       selection.T))
+            ssm.timing_init_filtered = False
+        model.initialize_known(predicted_state, predicted_state_cov)
+        model.loglikelihood_burn = max(
+            self.model.loglikelihood_burn - self.nobs, 0)
+
+        return model.filter(self.params, cov_type='none')
+
+    def append(self, endog, exog=None, refit=False, fit_kwargs=None,
+               **kwargs):
+        """
+        Recreate the results for the sample extended by new observations
+
+        Parameters
+        ----------
+        endog : array_like
+            New observations of the modeled time series, which directly
+            follow the end of the sample.
+        exog : array_like, optional
+            New observations of the exogenous regressors, if the model has
+            any.
+        refit : boolean, optional
+            Whether to re-estimate the parameters with the extended sample,
+            starting from the parameters of this results object. Default is
+            False.
+        fit_kwargs : dict, optional
+            Keyword arguments for `fit` if `refit` is True.
+        **kwargs
+            Keyword arguments that replace specification arguments of the
+            model, see `MLEModel.clone`.
+
+        Returns
+        -------
+        results : MLEResults
+            Results for the full sample, including the new observations.
+
+        Notes
+        -----
+        The full sample is filtered again, which is required for in-sample
+        statistics and for re-estimation. When only the updated forecasts
+        are needed, `extend` continues the Kalman filter with the new
+        observations instead.
+
+        See Also
+        --------
+        extend
+        """
+        def concat(values, new_values):
+            if (_is_using_pandas(values, None) and
+                    _is_using_pandas(new_values, None)):
+                return pd.concat([values, new_values])
+            values = np.asarray(values)
+            new_values = np.asarray(new_values)
+            return np.r_[values.reshape(values.shape[0], -1),
+                         new_values.reshape(new_values.shape[0], -1)]
+
+        orig_exog = self.model.data.orig_exog
+        if orig_exog is not None:
+            if exog is None:
+                raise ValueError('New observations of the exogenous'
+                                 ' regressors are required, via the `exog`'
+                                 ' argument.')
+            exog = concat(orig_exog, exog)
+        model = self.model.clone(concat(self.model.data.orig_endog, endog),
+                                 exog=exog, **kwargs)
+
+        # Carry over an initialization that was set by the user
+        ssm = self.model.ssm
+        if getattr(self.model, '_manual_initialization', True):
+            if ssm.initialization == 'known':
+                model.initialize_known(ssm._initial_state,
+                                       ssm._initial_state_cov)
+            elif ssm.initialization == 'approximate_diffuse':
+                model.initialize_approximate_diffuse(ssm._initial_variance)
+            elif ssm.initialization == 'stationary':
+                model.initialize_stationary()
+
+        if refit:
+            fit_kwargs = {} if fit_kwargs is None else fit_kwargs.copy()
+            fit_kwargs.setdefault('cov_type', self.cov_type)
+            return model.fit(start_params=self.params, **fit_kwargs)
+        elif self.smoother_results is not None:
+            return model.smooth(self.params, cov_type=self.cov_type)
+        else:
+            return model.filter(self.params, cov_type=self.cov_type)
+
     def simulate(self, nsimulations, measurement_shocks=None,
                  state_shocks=None, initial_state=None):
         r"""
@@ -1927,6 +1927,21 @@ class SARIMAXResults(MLEResults):
             start=start, end=end, dynamic=dynamic, exog=exog, **kwargs
         )
 
+    def extend(self, endog, exog=None, **kwargs):
+        # A time trend of the new model would restart at the first new
+        # observation, and simple differencing would drop the first new
+        # observations
+        if np.any(self.model.polynomial_trend[1:]):
+            raise NotImplementedError('Extending the results of a model with'
+                                      ' a time trend is not supported.')
+        if self.model.simple_differencing and (
+                self.model.orig_k_diff + self.model.orig_k_seasonal_diff > 0):
+            raise NotImplementedError('Extending the results of a model with'
+                                      ' simple differencing is not'
+                                      ' supported.')
+        return super(SARIMAXResults, self).extend(endog, exog=exog, **kwargs)
+    extend.__doc__ = MLEResults.extend.__doc__
+
     def summary(self, alpha=.05, start=None):
         # Create the model name
 
@@ -20,7 +20,8 @@ from statsmodels.tools.tools import Bunch
 from statsmodels.tools.sm_exceptions import ValueWarning, OutputWarning, SpecificationWarning
 from .tools import (
     companion_matrix, constrain_stationary_univariate,
-    unconstrain_stationary_univariate
+    unconstrain_stationary_univariate,
+    solve_discrete_lyapunov as solve_discrete_lyapunov_cs
 )
 import statsmodels.base.wrapper as wrap
 
@@ -490,6 +491,10 @@ class UnobservedComponents(MLEModel):
         )
         self.setup()
 
+        # Internal flag for whether the default initialization has been
+        # overridden with a user-supplied initialization
+        self._manual_initialization = False
+
         # Set as time-varying model if we have exog
         if self.k_exog > 0:
             self.ssm._time_invariant = False
@@ -516,6 +521,7 @@ class UnobservedComponents(MLEModel):
                 # cycle frequency to be between 0 and pi
                 cycle_period_bounds = (2, np.inf)
 
+        self.cycle_period_bounds = cycle_period_bounds
         self.cycle_frequency_bound = (
             2*np.pi / cycle_period_bounds[1], 2*np.pi / cycle_period_bounds[0]
         )
@@ -536,6 +542,11 @@ class UnobservedComponents(MLEModel):
             if value is None and hasattr(self.ssm, key):
                 kwds[key] = getattr(self.ssm, key)
 
+        # `seasonal` and `autoregressive` are stored as booleans, the
+        # constructor arguments are the seasonal period and the AR order
+        kwds['seasonal'] = self.seasonal_period if self.seasonal else None
+        kwds['autoregressive'] = self.ar_order if self.autoregressive else None
+
         return kwds
 
     def setup(self):
@@ -636,7 +647,7 @@ class UnobservedComponents(MLEModel):
         idx = np.diag_indices(self.ssm.k_posdef)
         self._idx_state_cov = ('state_cov', idx[0], idx[1])
 
-    def initialize_state(self):
+    def initialize_state(self, complex_step=False):
         # Initialize the AR component as stationary, the rest as approximately
         # diffuse
         initial_state = np.zeros(self.k_states)
@@ -658,17 +669,24 @@ class UnobservedComponents(MLEModel):
                 np.dot(selection_stationary, self.ssm.state_cov[:, :, 0]),
                 selection_stationary.T
             )
-            try:
-                initial_state_cov_stationary = solve_discrete_lyapunov(
+            if complex_step:
+                # The Scipy solver conjugates the (complex) transition matrix
+                initial_state_cov_stationary = solve_discrete_lyapunov_cs(
                     self.ssm.transition[start:end, start:end, 0],
-                    selected_state_cov_stationary
-                )
-            except:
-                initial_state_cov_stationary = solve_discrete_lyapunov(
-                    self.ssm.transition[start:end, start:end, 0],
-                    selected_state_cov_stationary,
-                    method='direct'
+                    selected_state_cov_stationary, complex_step=True
                 )
+            else:
+                try:
+                    initial_state_cov_stationary = solve_discrete_lyapunov(
+                        self.ssm.transition[start:end, start:end, 0],
+                        selected_state_cov_stationary
+                    )
+                except:
+                    initial_state_cov_stationary = solve_discrete_lyapunov(
+                        self.ssm.transition[start:end, start:end, 0],
+                        selected_state_cov_stationary,
+                        method='direct'
+                    )
 
             initial_state_cov[start:end, start:end] = (
                 initial_state_cov_stationary
@@ -676,6 +694,23 @@ class UnobservedComponents(MLEModel):
 
         self.ssm.initialize_known(initial_state, initial_state_cov)
 
+    def initialize_known(self, initial_state, initial_state_cov):
+        self._manual_initialization = True
+        self.ssm.initialize_known(initial_state, initial_state_cov)
+    initialize_known.__doc__ = MLEModel.initialize_known.__doc__
+
+    def initialize_approximate_diffuse(self, variance=None):
+        self._manual_initialization = True
+        self.ssm.initialize_approximate_diffuse(variance)
+    initialize_approximate_diffuse.__doc__ = (
+        MLEModel.initialize_approximate_diffuse.__doc__
+    )
+
+    def initialize_stationary(self):
+        self._manual_initialization = True
+        self.ssm.initialize_stationary()
+    initialize_stationary.__doc__ = MLEModel.initialize_stationary.__doc__
+
     def filter(self, params, **kwargs):
         kwargs.setdefault('results_class', UnobservedComponentsResults)
         kwargs.setdefault('results_wrapper_class',
@@ -957,7 +992,9 @@ class UnobservedComponents(MLEModel):
             offset += self.k_exog
 
         # Initialize the state
-        self.initialize_state()
+        if not self._manual_initialization:
+            self.initialize_state(
+                complex_step=kwargs.get('complex_step', False))
 
 
 class UnobservedComponentsResults(MLEResults):
@@ -0,0 +1,218 @@
+"""
+Tests for batched state space models
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import warnings
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.datasets import macrodata
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.varmax import VARMAX
+from statsmodels.tsa.statespace.tools import compatibility_mode
+from nose.exc import SkipTest
+
+if compatibility_mode:
+    raise SkipTest('Batched Kalman filter not available.')
+
+from statsmodels.tsa.statespace.batch import BatchModel, _minimize_batch
+
+
+# Log levels and quarterly growth rates (in percent) of GDP, consumption,
+# investment and government spending, with missing observations
+dta = macrodata.load_pandas().data[['realgdp', 'realcons', 'realinv',
+                                    'realgovt']]
+levels = 100 * np.log(dta.values[1:101])
+growth = np.diff(100 * np.log(dta.values[:101]), axis=0)
+for values in [levels, growth]:
+    values[10, 0] = np.nan
+    values[50:55, 2] = np.nan
+
+
+def _setup_batch(cls, endog, params, **kwargs):
+    cls.batch = BatchModel(SARIMAX, endog, **kwargs)
+    cls.params = params
+    cls.results = cls.batch.filter(params)
+    cls.individual = [SARIMAX(endog[:, s], **kwargs).filter(params[s])
+                      for s in range(endog.shape[1])]
+
+
+class CheckBatch(object):
+
+    def test_loglike(self):
+        llf = [res.llf for res in self.individual]
+        assert_allclose(self.batch.loglike(self.params), llf)
+        assert_allclose(self.results.llf, llf)
+
+    def test_loglikeobs(self):
+        llf_obs = np.column_stack([res.llf_obs for res in self.individual])
+        assert_allclose(self.results.llf_obs, llf_obs, atol=1e-10)
+
+    def test_predicted_state(self):
+        for s, res in enumerate(self.individual):
+            assert_allclose(self.results.predicted_state[:, s],
+                            res.predicted_state[:, -1])
+            assert_allclose(self.results.predicted_state_cov[:, :, s],
+                            res.predicted_state_cov[:, :, -1], atol=1e-12)
+
+    def test_forecast(self):
+        forecasts = np.column_stack([res.forecast(5)
+                                     for res in self.individual])
+        assert_allclose(self.results.forecast(5), forecasts)
+
+    def test_score(self):
+        score = np.array([res.model.score(self.params[s])
+                          for s, res in enumerate(self.individual)])
+        assert_allclose(self.batch.score(self.params), score, rtol=1e-4,
+                        atol=1e-4)
+
+
+class TestBatchARMA(CheckBatch):
+
+    @classmethod
+    def setupClass(cls):
+        params = np.array([[0.0, 0.3, 1.],
+                           [0.2, 0.3, 1.2],
+                           [0.4, 0.1, 0.8],
+                           [0.6, 0.3, 1.]])
+        _setup_batch(cls, growth, params, order=(1, 0, 1))
+
+
+class TestBatchARIMA(CheckBatch):
+    # approximate diffuse initialization and a burn-in period
+
+    @classmethod
+    def setupClass(cls):
+        params = np.array([[0.5, 1.],
+                           [-0.2, 2.],
+                           [0.1, 0.5],
+                           [0.3, 1.]])
+        _setup_batch(cls, levels, params, order=(1, 1, 0))
+
+
+def test_fit():
+    endog = growth[:, :3]
+    res = BatchModel(SARIMAX, endog, order=(1, 0, 0)).fit()
+    assert_equal(res.mle_retvals['converged'], [True] * 3)
+    for s in range(3):
+        res_s = SARIMAX(endog[:, s], order=(1, 0, 0)).fit(disp=False)
+        assert_allclose(res.params[s], res_s.params, rtol=1e-3, atol=1e-3)
+        assert_allclose(res.llf[s], res_s.llf, rtol=1e-5)
+        assert_allclose(res.mle_retvals['fopt'][s], res.llf[s])
+
+
+def test_fit_arma():
+    # each series has its own convergence, the loglikelihood is at least
+    # the one of the individual fits
+    endog = growth
+    res = BatchModel(SARIMAX, endog, order=(1, 0, 1)).fit()
+    assert_equal(res.mle_retvals['converged'], [True] * 4)
+    assert len(np.unique(res.mle_retvals['iterations'])) > 1
+    for s in range(4):
+        res_s = SARIMAX(endog[:, s], order=(1, 0, 1)).fit(disp=False)
+        assert res.llf[s] > res_s.llf - 1e-4
+
+
+def test_fit_chunks():
+    mod = BatchModel(SARIMAX, growth, order=(1, 0, 0))
+    res1 = mod.fit()
+    # without joblib all series are estimated in one chunk
+    res2 = mod.fit(n_jobs=2)
+    assert_equal(res2.mle_retvals['converged'], [True] * 4)
+    assert_equal(res2.mle_retvals['iterations'].shape, (4,))
+    assert_allclose(res2.params, res1.params, rtol=1e-3, atol=1e-3)
+
+
+def test_start_params_fallback():
+    # the starting autoregressive parameters of the log level are
+    # non-stationary
+    endog = growth[:, :3].copy()
+    endog[:, 1] = levels[:, 1]
+    mod = BatchModel(SARIMAX, endog, order=(1, 0, 1))
+    assert_raises(ValueError, getattr, SARIMAX(endog[:, 1], order=(1, 0, 1)),
+                  'start_params')
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        start_params = mod.start_params
+        messages = [str(warning.message) for warning in w]
+        assert_equal(sum('1 of 3 series' in m for m in messages), 1)
+
+    template = mod.model
+    desired = template.transform_params(np.mean(
+        [template.untransform_params(start_params[s]) for s in [0, 2]],
+        axis=0))
+    assert_allclose(start_params[1], desired)
+    for s in [0, 2]:
+        assert_allclose(start_params[s],
+                        SARIMAX(endog[:, s], order=(1, 0, 1)).start_params)
+
+
+def test_minimize_batch():
+    # separable Rosenbrock functions with the minima (a, a**2), the last
+    # objective is not finite at its starting values
+    a = np.array([1., 2., 0.5, 1.])
+    calls = []
+
+    def func(x, series):
+        calls.append(series)
+        fval = (a[series] - x[:, 0])**2 + 10 * (x[:, 1] - x[:, 0]**2)**2
+        return np.where(x[:, 0] > 5, np.nan, fval)
+
+    x0 = np.array([[-1., 1.], [0., 0.], [2., -1.], [10., 0.]])
+    x, fval, converged, iterations = _minimize_batch(func, x0, gtol=1e-8)
+    assert_equal(converged, [True, True, True, False])
+    assert_allclose(x[:3], np.column_stack([a[:3], a[:3]**2]), atol=1e-4)
+    assert_allclose(fval[:3], 0, atol=1e-8)
+    assert_equal(iterations[3], 0)
+    assert len(np.unique(iterations[:3])) > 1
+    # the objective and the gradient at the starting values are evaluated
+    # for all series, afterwards only the active series are evaluated
+    assert_equal(len(calls[0]), 4)
+    assert 3 not in np.concatenate(calls[3:])
+    n_calls = np.bincount(np.concatenate(calls), minlength=4)
+    assert_equal(np.argsort(n_calls[:3]), np.argsort(iterations[:3]))
+
+
+def test_alternate_timing():
+    endog = growth
+    params = np.array([[0.0, 0.3, 1.],
+                       [0.2, 0.3, 1.2],
+                       [0.4, 0.1, 0.8],
+                       [0.6, 0.3, 1.]])
+    batch = BatchModel(SARIMAX, endog, order=(1, 0, 1),
+                       timing_init_filtered=True)
+    llf = [SARIMAX(endog[:, s], order=(1, 0, 1),
+                   timing_init_filtered=True).loglike(params[s])
+           for s in range(4)]
+    assert_allclose(batch.loglike(params), llf)
+
+
+def test_multivariate():
+    np.random.seed(1234)
+    endog = np.random.normal(size=(50, 2, 3))
+    # partially and fully missing periods
+    endog[5, 0, 1] = np.nan
+    endog[20, 1, 1] = np.nan
+    endog[7, :, 2] = np.nan
+    params = [0.5, 0., 0.1, 0.3, 1., 0.2, 1.]
+    batch = BatchModel(VARMAX, endog, order=(1, 0), trend='nc')
+    res = batch.filter(params)
+    for s in range(3):
+        mod_s = VARMAX(endog[:, :, s], order=(1, 0), trend='nc')
+        assert_allclose(res.llf[s], mod_s.loglike(params))
+    assert res.forecast(2).shape == (2, 2, 3)
+
+
+def test_invalid():
+    endog = growth
+    assert_raises(ValueError, BatchModel, SARIMAX, endog[:, 0],
+                  order=(1, 0, 0))
+    # the model differences the data
+    assert_raises(ValueError, BatchModel, SARIMAX, endog, order=(1, 1, 0),
+                  simple_differencing=True)
+    mod = BatchModel(SARIMAX, endog, order=(1, 0, 0))
+    assert_raises(ValueError, mod.loglike, np.zeros((2, 2)))
@@ -693,3 +693,54 @@ class TestDFMClassicalSmoothing(TestDFM):
                      SMOOTH_CLASSICAL)
         assert_equal(self.model._kalman_smoother._smooth_method,
                      SMOOTH_CLASSICAL)
+
+
+class TestDynamicFactorSubsetDesign(object):
+    """
+    Tests collapsing the observations of a dynamic factor model with a
+    second order factor VAR, where the lagged factors do not enter the
+    observation equation and the observations are collapsed to dimension
+    k_posdef = 1 rather than k_states = 2.
+    """
+    @classmethod
+    def setup_class(cls):
+        from statsmodels.tsa.statespace.dynamic_factor import DynamicFactor
+
+        np.random.seed(1234)
+        nobs, k_endog = 100, 10
+        factor = np.zeros(nobs + 2)
+        eps = np.random.normal(size=nobs + 2)
+        for t in range(2, nobs + 2):
+            factor[t] = 0.5 * factor[t - 1] + 0.2 * factor[t - 2] + eps[t]
+        loadings = np.random.uniform(0.5, 1.5, size=k_endog)
+        endog = (factor[2:, None] * loadings +
+                 np.random.normal(scale=0.5, size=(nobs, k_endog)))
+        cls.params = np.r_[loadings, np.ones(k_endog) * 0.25, 0.5, 0.2]
+
+        mod_a = DynamicFactor(endog, k_factors=1, factor_order=2)
+        mod_b = DynamicFactor(endog, k_factors=1, factor_order=2,
+                              filter_collapsed=True)
+        cls.results_a = mod_a.smooth(cls.params, return_ssm=True)
+        cls.results_b = mod_b.smooth(cls.params, return_ssm=True)
+
+    def test_using_collapsed(self):
+        assert self.results_b.filter_collapsed
+        assert_equal(self.results_b.collapsed_forecasts.shape[0], 1)
+
+    def test_loglike(self):
+        assert_allclose(self.results_a.llf_obs, self.results_b.llf_obs)
+
+    def test_forecasts(self):
+        assert_allclose(self.results_a.forecasts, self.results_b.forecasts)
+
+    def test_filtered_state(self):
+        assert_allclose(self.results_a.filtered_state,
+                        self.results_b.filtered_state)
+        assert_allclose(self.results_a.filtered_state_cov,
+                        self.results_b.filtered_state_cov)
+
+    def test_smoothed_state(self):
+        assert_allclose(self.results_a.smoothed_state,
+                        self.results_b.smoothed_state)
+        assert_allclose(self.results_a.smoothed_state_cov,
+                        self.results_b.smoothed_state_cov, atol=1e-8)
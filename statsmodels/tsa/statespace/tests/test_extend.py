@@ -0,0 +1,173 @@
+"""
+Tests for extending and appending to state space results
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.datasets import macrodata
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.structural import UnobservedComponents
+from statsmodels.tsa.statespace.varmax import VARMAX
+
+# The first 100 quarters, with a missing observation of inflation
+dta = macrodata.load_pandas().data[['infl', 'realint']].iloc[:100].copy()
+dta.index = pd.date_range(start='1959-01-01', periods=100, freq='QS')
+dta.iloc[20, 0] = np.nan
+
+
+class CheckExtend(object):
+    # Compare the results of the last observations of a model for the full
+    # sample with the extended results of a model for the first observations
+
+    @classmethod
+    def setup_class(cls, model_class, endog, params, exog=None, nobs=80,
+                    **kwargs):
+        exog1 = exog2 = None
+        if exog is not None:
+            exog1, exog2 = exog[:nobs], exog[nobs:]
+        cls.nobs = nobs
+        mod_full = model_class(endog, exog=exog, **kwargs)
+        cls.res_full = mod_full.smooth(params)
+        mod = model_class(endog[:nobs], exog=exog1, **kwargs)
+        cls.res = mod.smooth(params)
+        cls.res_extend = cls.res.extend(endog[nobs:], exog=exog2)
+        cls.res_append = cls.res.append(endog[nobs:], exog=exog2)
+        cls.exog_forecast = None if exog is None else exog[-5:] + 1
+
+    def test_extend(self):
+        nobs = self.nobs
+        res, res_full = self.res_extend, self.res_full
+        assert_equal(res.nobs, res_full.nobs - nobs)
+        assert_allclose(res.llf_obs, res_full.llf_obs[nobs:])
+        assert_allclose(res.llf, res_full.llf_obs[nobs:].sum())
+        assert_allclose(res.forecasts, res_full.forecasts[:, nobs:])
+        assert_allclose(res.filtered_state, res_full.filtered_state[:, nobs:])
+        assert_allclose(res.filtered_state_cov,
+                        res_full.filtered_state_cov[:, :, nobs:], atol=1e-10)
+
+    def test_extend_forecast(self):
+        kwargs = {}
+        if self.exog_forecast is not None:
+            kwargs['exog'] = self.exog_forecast
+        assert_allclose(self.res_extend.forecast(5, **kwargs),
+                        self.res_full.forecast(5, **kwargs))
+
+    def test_append(self):
+        res, res_full = self.res_append, self.res_full
+        assert_equal(res.nobs, res_full.nobs)
+        assert_allclose(res.llf, res_full.llf)
+        assert_allclose(res.smoothed_state, res_full.smoothed_state)
+
+
+class TestSARIMAX(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestSARIMAX, cls).setup_class(
+            SARIMAX, dta['infl'].values, [0.5, 0.2, 1.], order=(1, 0, 1))
+
+
+class TestSARIMAXDiffuse(CheckExtend):
+    # The first observation of the model for the full sample is excluded
+    # from the likelihood
+
+    @classmethod
+    def setup_class(cls):
+        super(TestSARIMAXDiffuse, cls).setup_class(
+            SARIMAX, dta['infl'].values, [0.5, 1.], order=(1, 1, 0))
+
+
+class TestSARIMAXExog(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestSARIMAXExog, cls).setup_class(
+            SARIMAX, dta['infl'].values, [0.5, 0.5, 1.],
+            exog=dta[['realint']].values, order=(1, 0, 0))
+
+
+class TestSARIMAXAlternateTiming(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestSARIMAXAlternateTiming, cls).setup_class(
+            SARIMAX, dta['infl'].values, [0.5, 0.2, 1.], order=(1, 0, 1),
+            timing_init_filtered=True)
+
+
+class TestUnobservedComponents(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestUnobservedComponents, cls).setup_class(
+            UnobservedComponents, dta['infl'].values, [0.5, 1.],
+            level='llevel')
+
+
+class TestUnobservedComponentsSeasonal(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestUnobservedComponentsSeasonal, cls).setup_class(
+            UnobservedComponents, dta['infl'].values, [0.5, 1., 0.1],
+            level='llevel', seasonal=4)
+
+
+class TestUnobservedComponentsAR(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestUnobservedComponentsAR, cls).setup_class(
+            UnobservedComponents, dta['infl'].values,
+            [0.5, 1., 0.3, 0.5, 0.2], level='llevel', autoregressive=2)
+
+
+class TestVARMAX(CheckExtend):
+
+    @classmethod
+    def setup_class(cls):
+        params = [0.5, 0., 0.1, 0.3, 1., 0.2, 1.]
+        super(TestVARMAX, cls).setup_class(
+            VARMAX, dta.values, params, order=(1, 0), trend='nc')
+
+
+def test_append_pandas():
+    endog = dta['infl']
+    res = SARIMAX(endog[:80], order=(1, 1, 0)).smooth([0.5, 1.])
+    res_append = res.append(endog[80:])
+    assert_equal(res_append.model.data.dates[-1], dta.index[-1])
+    res_full = SARIMAX(endog, order=(1, 1, 0)).smooth([0.5, 1.])
+    assert_allclose(res_append.llf, res_full.llf)
+
+
+def test_append_refit():
+    endog = dta['realint'].values
+    res = SARIMAX(endog[:80], order=(1, 0, 0)).fit(disp=False)
+    res_append = res.append(endog[80:], refit=True,
+                            fit_kwargs={'disp': False})
+    res_full = SARIMAX(endog, order=(1, 0, 0)).fit(disp=False)
+    assert_allclose(res_append.params, res_full.params, rtol=1e-4)
+
+
+def test_extend_invalid():
+    endog = dta['infl'].values
+    res = SARIMAX(endog[:80], order=(1, 0, 0), trend='ct').filter(
+        [0.1, 0.01, 0.5, 1.])
+    assert_raises(NotImplementedError, res.extend, endog[80:])
+
+    exog = dta['realint'].values
+    res = SARIMAX(endog[:80], exog=exog[:80], order=(1, 0, 0)).filter(
+        [2., 0.5, 1.])
+    assert_raises(ValueError, res.append, endog[80:])
+
+    # the new observations need a model with the same parameters
+    res = UnobservedComponents(endog[:80], 'llevel',
+                               autoregressive=2).filter([0.5, 1., 0.3, 0.5,
+                                                         0.2])
+    assert_raises(ValueError, res.extend, endog[80:], autoregressive=1)
+    assert_raises(ValueError, res.append, endog[80:], autoregressive=1)
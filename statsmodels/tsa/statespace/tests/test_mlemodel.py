@@ -12,7 +12,8 @@ import os
 import re
 
 import warnings
-from statsmodels.tsa.statespace import sarimax, kalman_filter, kalman_smoother
+from statsmodels.tsa.statespace import (sarimax, structural, kalman_filter,
+                                       kalman_smoother, varmax)
 from statsmodels.tsa.statespace.mlemodel import MLEModel, MLEResultsWrapper
 from statsmodels.tsa.statespace.tools import compatibility_mode
 from statsmodels.datasets import nile
@@ -211,6 +212,108 @@ def test_score_misc():
     mod.score(res.params)
 
 
+class StationaryAR1(MLEModel):
+    # AR(1) model with measurement error and the state initialized (in the
+    # Kalman filter) from its stationary distribution
+    def __init__(self, endog):
+        super(StationaryAR1, self).__init__(
+            endog, k_states=1, initialization='stationary')
+        self['design', 0, 0] = 1.
+        self['selection', 0, 0] = 1.
+
+    def update(self, params, **kwargs):
+        params = super(StationaryAR1, self).update(params, **kwargs)
+        self['transition', 0, 0] = params[0]
+        self['obs_cov', 0, 0] = params[1]
+        self['state_cov', 0, 0] = params[2]
+
+
+def check_score_method_analytic(mod, params):
+    desired = mod.score(params, approx_complex_step=True)
+    actual = mod.score(params, method='analytic')
+    assert_allclose(actual, desired, rtol=1e-6, atol=1e-8)
+
+    uparams = mod.untransform_params(np.array(params))
+    desired = mod.score(uparams, transformed=False, approx_complex_step=True)
+    actual = mod.score(uparams, transformed=False, method='analytic')
+    assert_allclose(actual, desired, rtol=1e-6, atol=1e-8)
+
+
+def test_score_method_analytic():
+    np.random.seed(1234)
+    endog = np.random.normal(size=60).cumsum()
+    endog[[10, 11, 40]] = np.nan
+    exog = np.random.normal(size=(60, 1))
+
+    # ARMA, with missing data
+    mod = sarimax.SARIMAX(np.diff(endog), order=(1, 0, 1))
+    check_score_method_analytic(mod, [0.5, 0.2, 1.5])
+
+    # Higher order autoregression (companion transition matrix)
+    mod = sarimax.SARIMAX(np.diff(endog), order=(10, 0, 0))
+    params = np.r_[0.3 / np.arange(1, 11)**2, 1.5]
+    assert_allclose(mod.score(params, method='analytic'),
+                    mod.score(params, approx_complex_step=True), rtol=1e-6)
+
+    # Integrated model with a trend and regression coefficients (the
+    # observation intercept is time-varying and the first observation is
+    # burned)
+    mod = sarimax.SARIMAX(endog, exog=exog, order=(1, 1, 1), trend='c')
+    check_score_method_analytic(mod, [0.1, 0.5, 0.5, 0.2, 1.5])
+
+    # Seasonal model with measurement error and the alternate timing
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0),
+                          seasonal_order=(1, 0, 0, 4),
+                          measurement_error=True, timing_init_filtered=True)
+    check_score_method_analytic(mod, [0.5, -0.3, 0.5, 1.5])
+
+    # Time-varying regression coefficients (time-varying design matrix)
+    mod = sarimax.SARIMAX(endog, exog=exog, order=(1, 0, 0),
+                          mle_regression=False, time_varying_regression=True)
+    check_score_method_analytic(mod, [0.5, 0.1, 1.5])
+
+    # Unobserved components with a stationary autoregressive component
+    mod = structural.UnobservedComponents(endog, exog=exog, level='llevel',
+                                          autoregressive=1)
+    check_score_method_analytic(mod, [0.5, 1.2, 0.3, 0.4, 1.])
+
+    # Stationary initialization computed by the Kalman filter
+    mod = StationaryAR1(np.diff(endog))
+    check_score_method_analytic(mod, [0.5, 0.5, 1.5])
+
+    # Bivariate model with partially and fully missing observations
+    endog2 = np.random.normal(size=(60, 2))
+    endog2[5, 0] = np.nan
+    endog2[[20, 21], 1] = np.nan
+    endog2[30] = np.nan
+    params = [0.5, 0.1, -0.2, 0.3, 1., 0.2, 1.5]
+    mod = varmax.VARMAX(endog2, order=(1, 0), trend='nc')
+    check_score_method_analytic(mod, params)
+
+    # The same without the smoother output, the recursion for r and N is
+    # computed by the model
+    mod = varmax.VARMAX(endog2, order=(1, 0), trend='nc',
+                        timing_init_filtered=True)
+    check_score_method_analytic(mod, params)
+
+
+def test_fit_optim_score_analytic():
+    endog = np.log(nile.data.load_pandas().data['volume'].values)
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 1), trend='c')
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res_analytic = mod.fit(optim_score='analytic', method='bfgs',
+                               gtol=1e-8, maxiter=1000, disp=False)
+        # tightly converged reference that does not use the score
+        res_nm = mod.fit(method='nm', xtol=1e-10, ftol=1e-12, maxiter=10000,
+                         disp=False)
+    # the AR root is close to one, so the score is only approximately zero
+    assert_allclose(mod.score(res_analytic.params, method='analytic'), 0,
+                    atol=1e-2)
+    assert_allclose(res_analytic.llf, res_nm.llf, rtol=1e-9)
+    assert_allclose(res_analytic.params, res_nm.params, rtol=1e-4)
+
+
 def test_from_formula():
     assert_raises(NotImplementedError, lambda: MLEModel.from_formula(1,2,3))
 
@@ -257,6 +360,9 @@ def test_score_analytic_ar1():
                                    approx_centered=True)
     assert_allclose(harvey_fd_centered, analytic_score, atol=1e-5)
 
+    smoother = mod.score(params, transformed=True, method='analytic')
+    assert_allclose(smoother, analytic_score)
+
     # Check the approximations for untransformed parameters. The analytic
     # check now comes from chain rule with the analytic derivative of the
     # transformation
@@ -302,6 +408,9 @@ def test_score_analytic_ar1():
                                    approx_centered=True)
     assert_allclose(harvey_fd_centered, analytic_score, atol=1e-5)
 
+    smoother = mod.score(uparams, transformed=False, method='analytic')
+    assert_allclose(smoother, analytic_score)
+
     # Check the Hessian: these approximations are not very good, particularly
     # when phi is close to 0
     params = np.r_[0.5, 1.]
@@ -0,0 +1,140 @@
+"""
+Tests for the square root Kalman filter
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from statsmodels.tsa.statespace.kalman_filter import (
+    FILTER_CONVENTIONAL, FILTER_SQUARE_ROOT)
+from statsmodels.tsa.statespace.kalman_smoother import KalmanSmoother
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.tools import compatibility_mode
+from nose.exc import SkipTest
+
+if compatibility_mode:
+    raise SkipTest('Square root filter not available.')
+
+
+def _gen_model(dtype=np.float64, **kwargs):
+    # three states, the last one is not driven by a shock, and two
+    # observations with correlated measurement errors
+    np.random.seed(1234)
+    nobs = 50
+    endog = np.random.normal(size=(nobs, 2)).cumsum(0)
+    endog[10, :] = np.nan
+    endog[20, 1] = np.nan
+
+    mod = KalmanSmoother(k_endog=2, k_states=3, k_posdef=2, dtype=dtype,
+                         **kwargs)
+    mod.bind(endog.astype(dtype))
+    mod['design'] = np.array([[1., 0.5, 0.],
+                              [0.2, 1., 1.]], dtype=dtype)
+    mod['obs_cov'] = np.array([[1., 0.3],
+                               [0.3, 0.5]], dtype=dtype)
+    mod['transition'] = np.array([[0.9, 0.1, 0.],
+                                  [0., 0.5, 0.],
+                                  [0., 0., 1.]], dtype=dtype)
+    mod['selection'] = np.array([[1., 0.],
+                                 [0., 1.],
+                                 [0., 0.]], dtype=dtype)
+    mod['state_cov'] = np.array([[1., 0.5],
+                                 [0.5, 2.]], dtype=dtype)
+    mod.initialize_known(np.zeros(3, dtype=dtype),
+                         np.diag([10., 10., 1.]).astype(dtype))
+    return mod
+
+
+class CheckSquareRoot(object):
+
+    @classmethod
+    def setup_class(cls, **kwargs):
+        mod = _gen_model(**kwargs)
+        mod.filter_method = FILTER_CONVENTIONAL
+        cls.results_a = mod.smooth()
+        mod.filter_method = FILTER_SQUARE_ROOT
+        cls.results_b = mod.smooth()
+
+    def test_using_square_root(self):
+        assert not self.results_a.filter_square_root
+        assert self.results_b.filter_square_root
+
+    def test_loglike(self):
+        assert_allclose(self.results_b.llf_obs, self.results_a.llf_obs)
+
+    def test_forecasts(self):
+        assert_allclose(self.results_b.forecasts, self.results_a.forecasts)
+        assert_allclose(self.results_b.forecasts_error_cov,
+                        self.results_a.forecasts_error_cov)
+
+    def test_filtered_state(self):
+        assert_allclose(self.results_b.filtered_state,
+                        self.results_a.filtered_state)
+        assert_allclose(self.results_b.filtered_state_cov,
+                        self.results_a.filtered_state_cov, atol=1e-12)
+
+    def test_predicted_state(self):
+        assert_allclose(self.results_b.predicted_state,
+                        self.results_a.predicted_state)
+        assert_allclose(self.results_b.predicted_state_cov,
+                        self.results_a.predicted_state_cov, atol=1e-12)
+
+    def test_smoothed_state(self):
+        assert_allclose(self.results_b.smoothed_state,
+                        self.results_a.smoothed_state)
+        assert_allclose(self.results_b.smoothed_state_cov,
+                        self.results_a.smoothed_state_cov, atol=1e-12)
+
+
+class TestSquareRoot(CheckSquareRoot):
+    pass
+
+
+class TestSquareRootAlternateTiming(CheckSquareRoot):
+
+    @classmethod
+    def setup_class(cls):
+        super(TestSquareRootAlternateTiming, cls).setup_class(
+            timing_init_filtered=True)
+
+
+def test_sarimax():
+    # ARMA models have no measurement error and a singular selected state
+    # covariance matrix
+    np.random.seed(1234)
+    endog = np.random.normal(size=100).cumsum()
+    params = [0.5, -0.2, 0.3, 1.2]
+
+    mod_a = SARIMAX(endog, order=(2, 0, 1))
+    mod_b = SARIMAX(endog, order=(2, 0, 1), filter_square_root=True)
+    res_a = mod_a.smooth(params)
+    res_b = mod_b.smooth(params)
+    assert mod_b.ssm.filter_square_root
+    assert_allclose(res_b.llf, res_a.llf)
+    assert_allclose(res_b.smoothed_state, res_a.smoothed_state)
+    # complex step differentiation uses the conventional recursions
+    assert_allclose(mod_b.score(params), mod_a.score(params))
+
+
+def test_single_precision():
+    # A nearly singular state covariance matrix. The covariance matrices of
+    # the square root filter stay positive semi-definite in single precision
+    state_cov = np.array([[1., 1. - 1e-6],
+                          [1. - 1e-6, 1.]])
+    mod = _gen_model(dtype=np.float32)
+    mod['state_cov'] = state_cov.astype(np.float32)
+    res32 = mod.filter(filter_method=FILTER_SQUARE_ROOT)
+    assert_equal(res32.filtered_state.dtype, np.float32)
+
+    mod = _gen_model()
+    mod['state_cov'] = state_cov
+    res64 = mod.filter(filter_method=FILTER_CONVENTIONAL)
+    assert_allclose(res32.llf_obs, res64.llf_obs, rtol=1e-3, atol=1e-4)
+    assert_allclose(res32.filtered_state, res64.filtered_state, rtol=1e-3,
+                    atol=1e-4)
+    for t in range(res32.nobs):
+        eigvals = np.linalg.eigvalsh(res32.predicted_state_cov[:, :, t])
+        assert np.all(eigvals > -1e-6)
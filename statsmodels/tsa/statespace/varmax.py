@@ -197,6 +197,11 @@ class VARMAX(MLEModel):
             endog, exog=exog, k_states=k_states, k_posdef=k_posdef, **kwargs
         )
 
+        # update _init_keys attached by super
+        self._init_keys += ['order', 'trend', 'error_cov_type',
+                            'measurement_error', 'enforce_stationarity',
+                            'enforce_invertibility'] + list(kwargs.keys())
+
         # Set as time-varying model if we have time-trend or exog
         if self.k_exog > 0 or self.k_trend > 1:
             self.ssm._time_invariant = False